@@ -8,7 +8,7 @@ import os
 from datetime import datetime
 from typing import Optional, Dict, Any
 from .models import AuditLogCreate, AuditLevel, AuditCategory
-from .storage import AuditLogStorage
+from .storage import get_audit_storage
 
 
 class AuditLogger:
@@ -22,15 +22,18 @@ class AuditLogger:
     """
 
     _instance = None
-    _storage = None
 
     def __new__(cls):
         """Singleton pattern to ensure single instance"""
         if cls._instance is None:
             cls._instance = super(AuditLogger, cls).__new__(cls)
-            cls._storage = AuditLogStorage()
         return cls._instance
 
+    @property
+    def _storage(self):
+        # Opened on the first logged event, so importing the app creates no store
+        return get_audit_storage()
+
     def log(
         self,
         category: AuditCategory,
@@ -81,6 +81,7 @@ class AuditLogFilter(BaseModel):
     search: Optional[str] = None  # Search in action, details, error_message
     limit: int = Field(default=100, le=1000)
     offset: int = Field(default=0, ge=0)
+    cursor: Optional[str] = None  # Seek past this log instead of offset (AuditLogStorage.cursor_for)
     sort_by: str = Field(default="timestamp")
     sort_order: str = Field(default="desc", pattern="^(asc|desc)$")
 
@@ -4,7 +4,7 @@ Audit Log API Router
 Endpoints for querying, viewing, and exporting audit logs.
 """
 
-from fastapi import APIRouter, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Response
 from typing import List
 from datetime import datetime, timedelta
 
@@ -16,22 +16,34 @@ from .models import (
     AuditLevel,
     AuditCategory
 )
-from .storage import AuditLogStorage
+from .storage import AuditLogStorage, get_audit_storage
 from .audit_logger import audit_logger
 
 router = APIRouter(prefix="/audit", tags=["Audit Logs"])
-storage = AuditLogStorage()
+
+
+def get_storage() -> AuditLogStorage:
+    """Audit store dependency (opened on the first request, not on import)"""
+    return get_audit_storage()
 
 
 @router.post("/logs/query", response_model=List[AuditLog])
-async def query_audit_logs(filters: AuditLogFilter):
+async def query_audit_logs(
+    filters: AuditLogFilter,
+    response: Response,
+    storage: AuditLogStorage = Depends(get_storage)
+):
     """
     Query audit logs with filters.
 
     Returns paginated list of audit logs matching the filter criteria.
+    Full pages of timestamp-sorted queries carry an X-Next-Cursor header;
+    pass it as filters.cursor to fetch the next page.
     """
     try:
         logs = storage.query_logs(filters)
+        if logs and len(logs) == filters.limit and storage.supports_cursor(filters):
+            response.headers["X-Next-Cursor"] = storage.cursor_for(logs[-1])
         return logs
     except Exception as e:
         audit_logger.log_error(
@@ -44,7 +56,8 @@ async def query_audit_logs(filters: AuditLogFilter):
 @router.get("/logs/summary", response_model=AuditLogSummary)
 async def get_audit_summary(
     start_date: datetime = None,
-    end_date: datetime = None
+    end_date: datetime = None,
+    storage: AuditLogStorage = Depends(get_storage)
 ):
     """
     Get summary statistics for audit logs.
@@ -79,7 +92,7 @@ async def get_audit_summary(
 
 
 @router.post("/logs/export")
-async def export_audit_logs(export_config: AuditLogExport):
+async def export_audit_logs(export_config: AuditLogExport, storage: AuditLogStorage = Depends(get_storage)):
     """
     Export audit logs to CSV or JSON format.
 
@@ -127,7 +140,11 @@ async def export_audit_logs(export_config: AuditLogExport):
 
 
 @router.get("/logs/recent", response_model=List[AuditLog])
-async def get_recent_logs(limit: int = 100, level: AuditLevel = None):
+async def get_recent_logs(
+    limit: int = 100,
+    level: AuditLevel = None,
+    storage: AuditLogStorage = Depends(get_storage)
+):
     """
     Get recent audit logs.
 
@@ -153,7 +170,7 @@ async def get_recent_logs(limit: int = 100, level: AuditLevel = None):
 
 
 @router.get("/logs/errors", response_model=List[AuditLog])
-async def get_error_logs(limit: int = 50):
+async def get_error_logs(limit: int = 50, storage: AuditLogStorage = Depends(get_storage)):
     """
     Get recent error and critical logs.
 
@@ -194,7 +211,7 @@ async def get_error_logs(limit: int = 50):
 
 
 @router.get("/logs/user/{user_id}", response_model=List[AuditLog])
-async def get_user_logs(user_id: str, limit: int = 100):
+async def get_user_logs(user_id: str, limit: int = 100, storage: AuditLogStorage = Depends(get_storage)):
     """
     Get audit logs for a specific user.
 
@@ -220,7 +237,12 @@ async def get_user_logs(user_id: str, limit: int = 100):
 
 
 @router.get("/logs/resource/{resource_type}/{resource_id}", response_model=List[AuditLog])
-async def get_resource_logs(resource_type: str, resource_id: str, limit: int = 100):
+async def get_resource_logs(
+    resource_type: str,
+    resource_id: str,
+    limit: int = 100,
+    storage: AuditLogStorage = Depends(get_storage)
+):
     """
     Get audit logs for a specific resource.
 
@@ -247,7 +269,7 @@ async def get_resource_logs(resource_type: str, resource_id: str, limit: int = 1
 
 
 @router.delete("/logs/cleanup")
-async def cleanup_old_logs(days_to_keep: int = 90):
+async def cleanup_old_logs(days_to_keep: int = 90, storage: AuditLogStorage = Depends(get_storage)):
     """
     Delete audit logs older than specified days.
 
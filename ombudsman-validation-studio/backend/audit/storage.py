@@ -1,164 +1,355 @@
 """
 Audit Log Storage
 
-Handles persistence of audit logs to JSON files.
-In production, this could be replaced with a proper database.
+Handles persistence of audit logs in an indexed SQLite store:
+- Buffered write-behind: add_log only queues the entry; a background thread
+  inserts queued entries in batches
+- Indexes on time, user, action, resource, level and category, so filters
+  and sorting run in the database
+- Seekable pagination with a (timestamp, id) cursor besides offset/limit
+- One-time import of the daily JSONL files written by earlier versions
 """
 
 import os
 import json
 import uuid
-from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+import atexit
+import sqlite3
+import logging
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 
 from config.paths import paths
-from .models import AuditLog, AuditLogCreate, AuditLogFilter, AuditLogSummary
+from .models import AuditLog, AuditLogCreate, AuditLogFilter, AuditLogSummary, AuditLevel
+
+logger = logging.getLogger(__name__)
+
+DB_FILE = "audit.db"
+
+# Queued entries that trigger an immediate flush
+FLUSH_ROWS = int(os.getenv("AUDIT_FLUSH_ROWS", "200"))
+
+# Seconds between background flushes
+FLUSH_INTERVAL_SECONDS = float(os.getenv("AUDIT_FLUSH_INTERVAL_SECONDS", "1.0"))
+
+COLUMNS = (
+    "id", "timestamp", "level", "category", "action", "user_id", "username", "ip_address",
+    "user_agent", "resource_type", "resource_id", "details", "request_id", "session_id",
+    "duration_ms", "status_code", "error_message"
+)
+
+# Fields queries may sort by (anything else sorts by timestamp)
+SORTABLE_COLUMNS = {
+    "timestamp", "level", "category", "action", "user_id", "username",
+    "resource_type", "resource_id", "duration_ms", "status_code"
+}
+
+# Filters matched exactly, served by the indexes below
+EXACT_FILTERS = (
+    "level", "category", "user_id", "username", "resource_type", "resource_id", "ip_address"
+)
+
+
+def default_storage_dir() -> str:
+    """Directory of the application's audit store"""
+    return str(paths.audit_logs_dir)
+
+
+def _timestamp_key(value: datetime) -> str:
+    """Sortable ISO text of a timestamp (naive UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat()
+
+
+def _like_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
 
 
 class AuditLogStorage:
     """
-    Stores audit logs in JSON files organized by date.
-    Each day gets its own file for efficient querying and rotation.
+    Stores audit logs in an indexed SQLite database.
+
+    Writes are buffered and inserted in batches by a background thread;
+    queries flush the buffer first so they always see every logged event.
     """
 
-    def __init__(self, storage_dir: str = None):
+    def __init__(self, storage_dir: str = None, flush_rows: int = FLUSH_ROWS,
+                 flush_interval: float = FLUSH_INTERVAL_SECONDS):
         """
         Initialize audit log storage.
 
         Args:
             storage_dir: Directory to store audit logs
+            flush_rows: Queued entries that trigger an immediate flush
+            flush_interval: Seconds between background flushes
         """
         if storage_dir is None:
-            storage_dir = str(paths.audit_logs_dir)
+            storage_dir = default_storage_dir()
 
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.storage_dir / DB_FILE
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+
+        self._pending: List[Tuple] = []
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+
+        self._create_tables()
+        self._import_legacy_files()
+
+        self._flusher = threading.Thread(target=self._flush_loop, name="audit-flush", daemon=True)
+        self._flusher.start()
+        atexit.register(self.flush)
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection"""
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        return conn
+
+    def _create_tables(self):
+        """Create audit tables and indexes if they don't exist"""
+        conn = self._get_connection()
+        try:
+            # Readers don't block the background writer
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS audit_logs (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    action TEXT NOT NULL,
+                    user_id TEXT,
+                    username TEXT,
+                    ip_address TEXT,
+                    user_agent TEXT,
+                    resource_type TEXT,
+                    resource_id TEXT,
+                    details TEXT,
+                    request_id TEXT,
+                    session_id TEXT,
+                    duration_ms INTEGER,
+                    status_code INTEGER,
+                    error_message TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_logs(timestamp, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_user ON audit_logs(user_id, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_username ON audit_logs(username, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_logs(action, timestamp)")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_audit_resource ON audit_logs(resource_type, resource_id, timestamp)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_level ON audit_logs(level, timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_category ON audit_logs(category, timestamp)")
+            conn.execute("CREATE TABLE IF NOT EXISTS imported_files (file_name TEXT PRIMARY KEY)")
+            conn.commit()
+        finally:
+            conn.close()
 
     def _get_log_file(self, date: datetime) -> Path:
-        """Get the log file path for a specific date"""
+        """Get the legacy JSONL log file path for a specific date"""
         return self.storage_dir / f"audit_{date.strftime('%Y%m%d')}.jsonl"
 
+    def _import_legacy_files(self):
+        """Load daily JSONL files from earlier versions into the database (once per file)"""
+        conn = self._get_connection()
+        try:
+            imported = {row["file_name"] for row in conn.execute("SELECT file_name FROM imported_files")}
+            for log_file in sorted(self.storage_dir.glob("audit_*.jsonl")):
+                if log_file.name in imported:
+                    continue
+                rows = []
+                with open(log_file, "r") as f:
+                    for line in f:
+                        try:
+                            rows.append(self._to_row(AuditLog(**json.loads(line.strip()))))
+                        except Exception as e:
+                            print(f"Error parsing log line: {e}")
+                conn.executemany(self._insert_sql("INSERT OR IGNORE"), rows)
+                conn.execute("INSERT INTO imported_files (file_name) VALUES (?)", (log_file.name,))
+                conn.commit()
+                logger.info(f"[AUDIT] Imported {len(rows)} logs from {log_file.name}")
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _insert_sql(verb: str = "INSERT") -> str:
+        return f"{verb} INTO audit_logs ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)})"
+
+    @staticmethod
+    def _to_row(log: AuditLog) -> Tuple:
+        values = log.model_dump(mode="json")
+        values["timestamp"] = _timestamp_key(log.timestamp)
+        values["details"] = json.dumps(log.details, default=str) if log.details is not None else None
+        return tuple(values[col] for col in COLUMNS)
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> AuditLog:
+        values = dict(row)
+        values["details"] = json.loads(values["details"]) if values["details"] else None
+        return AuditLog(**values)
+
     def add_log(self, log: AuditLogCreate) -> AuditLog:
         """
         Add a new audit log entry.
 
+        The entry is queued and written by the next flush.
+
         Args:
             log: Audit log data to store
 
         Returns:
             AuditLog: The stored log with generated ID
         """
-        # Generate unique ID
-        log_id = str(uuid.uuid4())
+        stored = AuditLog(**log.model_dump(), id=str(uuid.uuid4()))
+
+        with self._pending_lock:
+            self._pending.append(self._to_row(stored))
+            full = len(self._pending) >= self.flush_rows
+        if full:
+            self._wakeup.set()
+
+        return stored
+
+    def flush(self) -> int:
+        """
+        Write all queued entries in one transaction.
+
+        Returns:
+            Number of entries written
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+
+            try:
+                conn = self._get_connection()
+                try:
+                    conn.executemany(self._insert_sql("INSERT OR IGNORE"), rows)
+                    conn.commit()
+                finally:
+                    conn.close()
+            except Exception:
+                # Keep the entries for the next flush
+                with self._pending_lock:
+                    self._pending[:0] = rows
+                raise
+            return len(rows)
+
+    def _flush_loop(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"Failed to write audit logs: {e}")
+
+    @staticmethod
+    def supports_cursor(filters: AuditLogFilter) -> bool:
+        """Whether query_logs() pages this filter by cursor (timestamp order only)"""
+        return filters.sort_by not in SORTABLE_COLUMNS or filters.sort_by == "timestamp"
+
+    @staticmethod
+    def cursor_for(log: AuditLog) -> str:
+        """Pagination cursor pointing after this log (for timestamp-sorted queries)"""
+        return f"{_timestamp_key(log.timestamp)}|{log.id}"
+
+    def _where(self, filters: AuditLogFilter) -> Tuple[List[str], List[Any]]:
+        """SQL conditions and parameters for a filter"""
+        # Whole days, like the daily files scanned before
+        start_date = filters.start_date or datetime.utcnow() - timedelta(days=30)
+        end_date = filters.end_date or datetime.utcnow()
+        clauses = ["timestamp >= ?", "timestamp < ?"]
+        params: List[Any] = [
+            _timestamp_key(datetime.combine(start_date.date(), datetime.min.time())),
+            _timestamp_key(datetime.combine(end_date.date() + timedelta(days=1), datetime.min.time()))
+        ]
 
-        # Create full log entry
-        log_dict = log.model_dump()
-        log_dict["id"] = log_id
+        for field in EXACT_FILTERS:
+            value = getattr(filters, field)
+            if value:
+                clauses.append(f"{field} = ?")
+                params.append(value.value if hasattr(value, "value") else value)
 
-        # Convert datetime to ISO format
-        if isinstance(log_dict.get("timestamp"), datetime):
-            log_dict["timestamp"] = log_dict["timestamp"].isoformat()
+        if filters.action:
+            clauses.append("action LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(filters.action))
 
-        # Get appropriate log file
-        log_file = self._get_log_file(log.timestamp)
+        # Search filter (search in action, details, error_message)
+        if filters.search:
+            pattern = _like_pattern(filters.search)
+            clauses.append(
+                "(action LIKE ? ESCAPE '\\' OR details LIKE ? ESCAPE '\\' OR error_message LIKE ? ESCAPE '\\')"
+            )
+            params.extend([pattern, pattern, pattern])
 
-        # Append to log file (JSONL format)
-        with open(log_file, "a") as f:
-            f.write(json.dumps(log_dict) + "\n")
+        return clauses, params
 
-        return AuditLog(**log_dict)
+    def _query(self, query: str, params=()) -> List[sqlite3.Row]:
+        self.flush()
+        conn = self._get_connection()
+        try:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
 
     def query_logs(self, filters: AuditLogFilter) -> List[AuditLog]:
         """
         Query audit logs with filters.
 
+        Pages are selected by offset, or by filters.cursor (from cursor_for()
+        of the last log of the previous page) which seeks through the
+        timestamp index instead of skipping rows.
+
         Args:
             filters: Filter criteria
 
         Returns:
             List of matching audit logs
         """
-        logs = []
-
-        # Determine date range to scan
-        start_date = filters.start_date or datetime.utcnow() - timedelta(days=30)
-        end_date = filters.end_date or datetime.utcnow()
-
-        # Scan all relevant log files
-        current_date = start_date
-        while current_date <= end_date:
-            log_file = self._get_log_file(current_date)
-
-            if log_file.exists():
-                with open(log_file, "r") as f:
-                    for line in f:
-                        try:
-                            log_dict = json.loads(line.strip())
-                            log = AuditLog(**log_dict)
-
-                            # Apply filters
-                            if self._matches_filters(log, filters):
-                                logs.append(log)
-                        except Exception as e:
-                            print(f"Error parsing log line: {e}")
-
-            current_date += timedelta(days=1)
-
-        # Sort logs
-        reverse = filters.sort_order == "desc"
-        logs.sort(
-            key=lambda x: getattr(x, filters.sort_by, x.timestamp),
-            reverse=reverse
+        clauses, params = self._where(filters)
+        sort_by = filters.sort_by if filters.sort_by in SORTABLE_COLUMNS else "timestamp"
+        direction = "DESC" if filters.sort_order == "desc" else "ASC"
+
+        offset = filters.offset
+        if filters.cursor and self.supports_cursor(filters):
+            timestamp, _, log_id = filters.cursor.partition("|")
+            clauses.append(f"(timestamp, id) {'<' if direction == 'DESC' else '>'} (?, ?)")
+            params.extend([timestamp, log_id])
+            offset = 0
+
+        rows = self._query(
+            f"SELECT * FROM audit_logs WHERE {' AND '.join(clauses)} "
+            f"ORDER BY {sort_by} {direction}, id {direction} LIMIT ? OFFSET ?",
+            params + [filters.limit, offset]
         )
+        return [self._from_row(row) for row in rows]
 
-        # Apply pagination
-        start_idx = filters.offset
-        end_idx = filters.offset + filters.limit
-        return logs[start_idx:end_idx]
-
-    def _matches_filters(self, log: AuditLog, filters: AuditLogFilter) -> bool:
-        """Check if a log entry matches the filter criteria"""
-        # Level filter
-        if filters.level and log.level != filters.level:
-            return False
-
-        # Category filter
-        if filters.category and log.category != filters.category:
-            return False
-
-        # User filters
-        if filters.user_id and log.user_id != filters.user_id:
-            return False
-        if filters.username and log.username != filters.username:
-            return False
-
-        # Action filter
-        if filters.action and filters.action.lower() not in log.action.lower():
-            return False
-
-        # Resource filters
-        if filters.resource_type and log.resource_type != filters.resource_type:
-            return False
-        if filters.resource_id and log.resource_id != filters.resource_id:
-            return False
-
-        # IP address filter
-        if filters.ip_address and log.ip_address != filters.ip_address:
-            return False
-
-        # Search filter (search in action, details, error_message)
-        if filters.search:
-            search_lower = filters.search.lower()
-            search_fields = [
-                log.action.lower() if log.action else "",
-                str(log.details).lower() if log.details else "",
-                log.error_message.lower() if log.error_message else ""
-            ]
-            if not any(search_lower in field for field in search_fields):
-                return False
+    def count_logs(self, filters: AuditLogFilter) -> int:
+        """Number of logs matching a filter (ignoring pagination)"""
+        clauses, params = self._where(filters)
+        return self._query(f"SELECT COUNT(*) FROM audit_logs WHERE {' AND '.join(clauses)}", params)[0][0]
 
-        return True
+    def _counts(self, column: str, clauses: List[str], params: List[Any], limit: Optional[int] = None):
+        query = (
+            f"SELECT {column} AS value, COUNT(*) AS count FROM audit_logs "
+            f"WHERE {' AND '.join(clauses)} AND {column} IS NOT NULL GROUP BY {column} ORDER BY count DESC"
+        )
+        if limit:
+            query += f" LIMIT {int(limit)}"
+        return [(row["value"], row["count"]) for row in self._query(query, params)]
 
     def get_summary(self, filters: AuditLogFilter) -> AuditLogSummary:
         """
@@ -170,67 +361,38 @@ class AuditLogStorage:
         Returns:
             AuditLogSummary with statistics
         """
-        # Get all matching logs
-        logs = self.query_logs(AuditLogFilter(
-            start_date=filters.start_date,
-            end_date=filters.end_date,
-            limit=10000  # Get more logs for summary
-        ))
-
-        # Count by level
-        by_level = {}
-        for log in logs:
-            by_level[log.level] = by_level.get(log.level, 0) + 1
+        clauses, params = self._where(AuditLogFilter(start_date=filters.start_date, end_date=filters.end_date))
 
-        # Count by category
-        by_category = {}
-        for log in logs:
-            by_category[log.category] = by_category.get(log.category, 0) + 1
-
-        # Count by user
-        by_user = {}
-        for log in logs:
-            if log.username:
-                by_user[log.username] = by_user.get(log.username, 0) + 1
+        by_user = dict(self._counts("username", clauses, params))
 
         # Recent errors
-        recent_errors = [
-            log for log in logs
-            if log.level in [AuditLevel.ERROR, AuditLevel.CRITICAL]
-        ][:10]
-
-        # Most active users
-        most_active_users = [
-            {"username": username, "count": count}
-            for username, count in sorted(
-                by_user.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-        ]
-
-        # Most common actions
-        action_counts = {}
-        for log in logs:
-            action_counts[log.action] = action_counts.get(log.action, 0) + 1
-
-        most_common_actions = [
-            {"action": action, "count": count}
-            for action, count in sorted(
-                action_counts.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )[:10]
-        ]
+        recent_errors = self.query_logs(AuditLogFilter(
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            level=AuditLevel.ERROR,
+            limit=10
+        )) + self.query_logs(AuditLogFilter(
+            start_date=filters.start_date,
+            end_date=filters.end_date,
+            level=AuditLevel.CRITICAL,
+            limit=10
+        ))
+        recent_errors.sort(key=lambda log: log.timestamp, reverse=True)
 
         return AuditLogSummary(
-            total_logs=len(logs),
-            by_level=by_level,
-            by_category=by_category,
+            total_logs=self._query(f"SELECT COUNT(*) FROM audit_logs WHERE {' AND '.join(clauses)}", params)[0][0],
+            by_level=dict(self._counts("level", clauses, params)),
+            by_category=dict(self._counts("category", clauses, params)),
             by_user=by_user,
-            recent_errors=recent_errors,
-            most_active_users=most_active_users,
-            most_common_actions=most_common_actions
+            recent_errors=recent_errors[:10],
+            most_active_users=[
+                {"username": username, "count": count}
+                for username, count in list(by_user.items())[:10]
+            ],
+            most_common_actions=[
+                {"action": action, "count": count}
+                for action, count in self._counts("action", clauses, params, limit=10)
+            ]
         )
 
     def cleanup_old_logs(self, days_to_keep: int = 90):
@@ -242,6 +404,19 @@ class AuditLogStorage:
         """
         cutoff_date = datetime.utcnow() - timedelta(days=days_to_keep)
 
+        self.flush()
+        conn = self._get_connection()
+        try:
+            deleted = conn.execute(
+                "DELETE FROM audit_logs WHERE timestamp < ?", (_timestamp_key(cutoff_date),)
+            ).rowcount
+            conn.commit()
+        finally:
+            conn.close()
+        if deleted:
+            print(f"Deleted {deleted} old audit logs")
+
+        # Legacy daily files (already imported)
         for log_file in self.storage_dir.glob("audit_*.jsonl"):
             # Extract date from filename
             try:
@@ -297,3 +472,20 @@ class AuditLogStorage:
             return output.getvalue()
         else:
             raise ValueError(f"Unsupported export format: {format}")
+
+
+_storages: Dict[str, AuditLogStorage] = {}
+_storages_lock = threading.Lock()
+
+
+def get_audit_storage(storage_dir: str = None) -> AuditLogStorage:
+    """
+    Shared storage for an audit log directory (one write buffer per process).
+
+    The store is opened on first use, not on import.
+    """
+    key = os.path.abspath(storage_dir or default_storage_dir())
+    with _storages_lock:
+        if key not in _storages:
+            _storages[key] = AuditLogStorage(key)
+        return _storages[key]
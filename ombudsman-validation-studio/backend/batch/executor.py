@@ -15,7 +15,7 @@ import os
 from datetime import datetime
 from typing import List, Dict, Any, Callable, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Thread
+from threading import Lock, Thread
 
 from config.paths import paths
 
@@ -34,7 +34,7 @@ from .models import (
     PipelineExecutionItem,
     DataGenItem
 )
-from .job_manager import batch_job_manager
+from .job_manager import batch_job_manager, get_main_event_loop
 
 
 class BatchExecutor:
@@ -121,10 +121,11 @@ class BatchExecutor:
 
     def _execute_pipeline_batch(self, job: BatchJob):
         """Execute bulk pipeline operations"""
+        operation_func = lambda operation: self._execute_pipeline_operation(operation, job_id=job.job_id)
         if job.parallel_execution:
-            self._execute_parallel(job, self._execute_pipeline_operation)
+            self._execute_parallel(job, operation_func)
         else:
-            self._execute_sequential(job, self._execute_pipeline_operation)
+            self._execute_sequential(job, operation_func)
 
     def _execute_data_gen_batch(self, job: BatchJob):
         """Execute batch data generation"""
@@ -264,10 +265,14 @@ class BatchExecutor:
 
     # Operation executors for different types
 
-    def _execute_pipeline_operation(self, operation: BatchOperation) -> Dict[str, Any]:
-        """Execute a single pipeline operation"""
+    def _execute_pipeline_operation(self, operation: BatchOperation, job_id: Optional[str] = None) -> Dict[str, Any]:
+        """Execute a single pipeline operation
+
+        Args:
+            operation: Operation whose metadata names the pipeline_id
+            job_id: Batch job the operation belongs to (for step progress)
+        """
         # Import here to avoid circular imports
-        import requests
         import yaml
         from pathlib import Path
 
@@ -369,7 +374,7 @@ class BatchExecutor:
                 )
 
                 try:
-                    nested_result = self._execute_pipeline_operation(nested_operation)
+                    nested_result = self._execute_pipeline_operation(nested_operation, job_id=job_id)
                     results.append(nested_result)
                     print(f"[BATCH EXECUTOR] Pipeline {pipeline_filename} completed: {nested_result.get('status')}")
                 except Exception as e:
@@ -396,122 +401,101 @@ class BatchExecutor:
                 "results": results
             }
 
-        # Regular pipeline file - execute normally
-        logger.info(f"[BATCH EXECUTOR] Executing regular pipeline: {pipeline_id}.yaml")
-        logger.info(f"[BATCH EXECUTOR] Calling POST {BACKEND_URL}/pipelines/execute")
+        # Regular pipeline file - run in-process and wait for completion
+        logger.info(f"[BATCH EXECUTOR] Executing regular pipeline in-process: {pipeline_id}.yaml")
 
-        try:
-            response = requests.post(
-                f"{BACKEND_URL}/pipelines/execute",
-                json={
-                    "pipeline_yaml": pipeline_yaml,
-                    "pipeline_name": pipeline_name
-                },
-                timeout=300
-            )
-            logger.info(f"[BATCH EXECUTOR] Pipeline execute response: status={response.status_code}")
-        except Exception as req_error:
-            logger.error(f"[BATCH EXECUTOR] Failed to call pipeline execute endpoint: {req_error}")
-            raise Exception(f"Failed to call pipeline execute: {req_error}")
+        from pipelines.execute import execute_pipeline_in_process
 
-        if response.status_code != 200:
-            logger.error(f"[BATCH EXECUTOR] Pipeline execute failed: {response.text}")
-            raise Exception(f"Pipeline execution failed: {response.text}")
+        status_data = execute_pipeline_in_process(
+            parsed_yaml,
+            pipeline_name,
+            batch_id=job_id,
+            on_step_complete=self._step_progress_callback(job_id, operation.operation_id, pipeline_id),
+            loop=get_main_event_loop()
+        )
+        return self._summarize_pipeline_run(pipeline_id, status_data)
+
+    def _step_progress_callback(self, job_id: Optional[str], operation_id: str, pipeline_id: str) -> Callable:
+        """Callback streaming step completions of a pipeline run into its batch operation"""
+        lock = Lock()
+        completed = 0
+
+        def on_step_complete(step_name, step_index, step_result):
+            nonlocal completed
+            if not job_id:
+                return
+            # Parallel steps finish out of order, so count completions instead of using the index
+            with lock:
+                completed += 1
+                batch_job_manager.update_operation_progress(job_id, operation_id, {
+                    "pipeline_id": pipeline_id,
+                    "last_completed_step": step_name,
+                    "last_step_status": step_result.get("status"),
+                    "steps_completed": completed
+                })
 
-        result = response.json()
-        run_id = result.get("run_id")
-        logger.info(f"[BATCH EXECUTOR] Pipeline started with run_id: {run_id}")
+        return on_step_complete
 
-        # Poll for completion (pipeline runs async)
-        import time
-        max_wait_seconds = 300  # 5 minutes max
-        poll_interval = 2  # Check every 2 seconds
-        elapsed = 0
+    def _summarize_pipeline_run(self, pipeline_id: str, status_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the operation result from a finished pipeline_runs entry"""
+        run_id = status_data.get("run_id")
+        current_status = status_data.get("status")
+        results = status_data.get("results", [])
+        failed_steps = [r for r in results if r.get("status") == "FAIL"]
+        logger.info(f"[BATCH EXECUTOR] Pipeline {run_id} finished ({current_status}): {len(results)} steps, {len(failed_steps)} failed")
 
-        while elapsed < max_wait_seconds:
-            time.sleep(poll_interval)
-            elapsed += poll_interval
+        results_summary = {
+            "total_steps": len(results),
+            "passed": len([r for r in results if r.get("status") == "PASS"]),
+            "failed": len(failed_steps)
+        }
 
-            try:
-                status_response = requests.get(
-                    f"{BACKEND_URL}/pipelines/status/{run_id}",
-                    timeout=30
+        if current_status == "failed" or failed_steps:
+            # Collect error details
+            error_messages = []
+            if status_data.get("error"):
+                error_messages.append(f"Pipeline error: {status_data.get('error')}")
+
+            # Log each failed step with full details
+            for step in failed_steps:
+                step_name = step.get("name", "unknown")
+                step_details = step.get("details", {})
+
+                # Try multiple possible error field locations
+                step_error = (
+                    step_details.get("error") or
+                    step_details.get("message") or
+                    step.get("error") or
+                    step.get("message") or
+                    step_details.get("errors") or
+                    str(step_details) if step_details else None
                 )
-                if status_response.status_code == 200:
-                    status_data = status_response.json()
-                    current_status = status_data.get("status")
-                    logger.info(f"[BATCH EXECUTOR] Pipeline {run_id} status: {current_status} (elapsed: {elapsed}s)")
-
-                    if current_status in ["completed", "failed"]:
-                        # Check for step failures
-                        results = status_data.get("results", [])
-                        failed_steps = [r for r in results if r.get("status") == "FAIL"]
-                        logger.info(f"[BATCH EXECUTOR] Pipeline {run_id} finished: {len(results)} steps, {len(failed_steps)} failed")
-
-                        if current_status == "failed" or failed_steps:
-                            # Collect error details
-                            error_messages = []
-                            if status_data.get("error"):
-                                error_messages.append(f"Pipeline error: {status_data.get('error')}")
-
-                            # Log each failed step with full details
-                            for step in failed_steps:
-                                step_name = step.get("name", "unknown")
-                                step_details = step.get("details", {})
-
-                                # Try multiple possible error field locations
-                                step_error = (
-                                    step_details.get("error") or
-                                    step_details.get("message") or
-                                    step.get("error") or
-                                    step.get("message") or
-                                    step_details.get("errors") or
-                                    str(step_details) if step_details else None
-                                )
-
-                                logger.error(f"[BATCH EXECUTOR] FAILED STEP '{step_name}': {step_error}")
-                                logger.error(f"[BATCH EXECUTOR] FAILED STEP '{step_name}' full data: {step}")
-
-                                if step_error:
-                                    error_messages.append(f"{step_name}: {step_error}")
-
-                            error_summary = "; ".join(error_messages) if error_messages else "Pipeline execution had failures (no error details available)"
-                            logger.error(f"[BATCH EXECUTOR] Pipeline failed summary: {error_summary}")
-
-                            # Return failure result WITH run_id so reports can still be generated
-                            return {
-                                "run_id": run_id,
-                                "status": "failed",
-                                "pipeline_id": pipeline_id,
-                                "error": error_summary,
-                                "results_summary": {
-                                    "total_steps": len(results),
-                                    "passed": len([r for r in results if r.get("status") == "PASS"]),
-                                    "failed": len(failed_steps)
-                                }
-                            }
-
-                        # Success
-                        logger.info(f"[BATCH EXECUTOR] Pipeline {run_id} completed successfully")
-                        return {
-                            "run_id": run_id,
-                            "status": "completed",
-                            "pipeline_id": pipeline_id,
-                            "results_summary": {
-                                "total_steps": len(results),
-                                "passed": len([r for r in results if r.get("status") == "PASS"]),
-                                "failed": len(failed_steps)
-                            }
-                        }
-            except requests.RequestException as e:
-                logger.warning(f"[BATCH EXECUTOR] Status poll failed: {e}")
-
-        # Timeout - return pending status
+
+                logger.error(f"[BATCH EXECUTOR] FAILED STEP '{step_name}': {step_error}")
+                logger.error(f"[BATCH EXECUTOR] FAILED STEP '{step_name}' full data: {step}")
+
+                if step_error:
+                    error_messages.append(f"{step_name}: {step_error}")
+
+            error_summary = "; ".join(error_messages) if error_messages else "Pipeline execution had failures (no error details available)"
+            logger.error(f"[BATCH EXECUTOR] Pipeline failed summary: {error_summary}")
+
+            # Return failure result WITH run_id so reports can still be generated
+            return {
+                "run_id": run_id,
+                "status": "failed",
+                "pipeline_id": pipeline_id,
+                "error": error_summary,
+                "results_summary": results_summary
+            }
+
+        # Success
+        logger.info(f"[BATCH EXECUTOR] Pipeline {run_id} completed successfully")
         return {
             "run_id": run_id,
-            "status": "timeout",
+            "status": "completed",
             "pipeline_id": pipeline_id,
-            "message": f"Pipeline did not complete within {max_wait_seconds} seconds"
+            "results_summary": results_summary
         }
 
     def _execute_data_gen_operation(self, operation: BatchOperation) -> Dict[str, Any]:
@@ -643,6 +627,7 @@ class BatchExecutor:
         from pathlib import Path
         from datetime import datetime
         from collections import defaultdict
+        from execution.result_store import load_run_file, write_run_file
 
         # Collect all run IDs from completed operations
         print(f"[Batch {job.job_id}] Collecting run IDs from {len(job.operations)} operations...")
@@ -678,9 +663,8 @@ class BatchExecutor:
             result_file = results_dir / f"{run_id}.json"
             if result_file.exists():
                 try:
-                    with open(result_file) as f:
-                        result_data = json.load(f)
-                        all_results.append(result_data)
+                    result_data = load_run_file(str(result_file))
+                    all_results.append(result_data)
                 except json.JSONDecodeError as e:
                     print(f"[WARNING] Skipping malformed result file {run_id}.json: {e}")
                     print(f"[WARNING] File may be truncated or corrupted. Pipeline likely crashed during execution.")
@@ -770,8 +754,7 @@ class BatchExecutor:
 
         # Save consolidated result
         consolidated_file = results_dir / f"{consolidated_run_id}.json"
-        with open(consolidated_file, "w") as f:
-            json.dump(consolidated_result, f, indent=2)
+        write_run_file(str(consolidated_file), consolidated_result, default=str)
 
         print(f"[Batch {job.job_id}] Created consolidated result: {consolidated_run_id}")
         print(f"[Batch {job.job_id}] Merged {len(all_results)} pipelines, {len(tables_data)} tables, {total_validations} validations")
@@ -0,0 +1,136 @@
+"""
+Batch Job Journal
+
+Write-behind persistence for batch jobs:
+- Append-only <job_id>.journal with one line per operation change
+- Debounced snapshots: changes of a job within the delay coalesce into one
+  <job_id>.json rewrite
+- Compaction: every snapshot folds the journal into the job file and
+  truncates it; long journals are compacted right away
+- Replay of journal entries over the last snapshot on startup
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from threading import RLock, Timer
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds a changed job waits before its snapshot is written
+SNAPSHOT_DELAY_SECONDS = float(os.getenv("BATCH_SNAPSHOT_DELAY_SECONDS", "2.0"))
+
+# Journal entries after which a job is compacted without waiting
+COMPACT_ENTRIES = int(os.getenv("BATCH_JOURNAL_COMPACT_ENTRIES", "1000"))
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class JobJournal:
+    """
+    Operation journal and snapshot writer for the batch job directory.
+
+    Callers mutate job state and journal it while holding `lock`, so a
+    snapshot never misses an entry that its truncation removes.
+    """
+
+    def __init__(
+        self,
+        storage_dir: Path,
+        lock: Optional[RLock] = None,
+        snapshot_delay: float = SNAPSHOT_DELAY_SECONDS,
+        compact_entries: int = COMPACT_ENTRIES
+    ):
+        self.storage_dir = Path(storage_dir)
+        self.lock = lock or RLock()
+        self.snapshot_delay = snapshot_delay
+        self.compact_entries = compact_entries
+        self._dirty: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._entry_counts: Dict[str, int] = {}
+        self._timer: Optional[Timer] = None
+        self.snapshots_written = 0
+
+    def snapshot_path(self, job_id: str) -> Path:
+        return self.storage_dir / f"{job_id}.json"
+
+    def journal_path(self, job_id: str) -> Path:
+        return self.storage_dir / f"{job_id}{JOURNAL_SUFFIX}"
+
+    def append(self, job_id: str, entry: Dict[str, Any], snapshot: Callable[[], Dict[str, Any]]):
+        """
+        Journal one change of a job and schedule its snapshot.
+
+        Args:
+            job_id: Job the change belongs to
+            entry: JSON-serializable change record
+            snapshot: Returns the job's current state for the next snapshot
+        """
+        with self.lock:
+            with open(self.journal_path(job_id), "a") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+            self._entry_counts[job_id] = self._entry_counts.get(job_id, 0) + 1
+
+            if self._entry_counts[job_id] >= self.compact_entries:
+                self.write_snapshot(job_id, snapshot())
+                return
+
+            self._dirty[job_id] = snapshot
+            if self._timer is None:
+                self._timer = Timer(self.snapshot_delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def write_snapshot(self, job_id: str, data: Dict[str, Any]):
+        """Write a job's snapshot now and truncate its journal"""
+        with self.lock:
+            path = self.snapshot_path(job_id)
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, path)
+
+            journal = self.journal_path(job_id)
+            if journal.exists():
+                journal.unlink()
+            self._entry_counts.pop(job_id, None)
+            self._dirty.pop(job_id, None)
+            self.snapshots_written += 1
+
+    def flush(self):
+        """Write the snapshots of all jobs changed since their last one"""
+        with self.lock:
+            self._timer = None
+            for job_id, snapshot in list(self._dirty.items()):
+                try:
+                    self.write_snapshot(job_id, snapshot())
+                except Exception as e:
+                    # Entries stay in the journal and are replayed on restart
+                    self._dirty.pop(job_id, None)
+                    logger.warning(f"[BatchJobJournal] Snapshot of job {job_id} failed: {e}")
+
+    def replay(self, job_id: str) -> List[Dict[str, Any]]:
+        """Journal entries of a job written after its last snapshot"""
+        journal = self.journal_path(job_id)
+        if not journal.exists():
+            return []
+
+        entries = []
+        with open(journal) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn last line from a crash mid-append
+                    logger.warning(f"[BatchJobJournal] Skipping unreadable entry in {journal.name}")
+        return entries
+
+    def remove(self, job_id: str):
+        """Delete a job's snapshot and journal"""
+        with self.lock:
+            self._dirty.pop(job_id, None)
+            self._entry_counts.pop(job_id, None)
+            for path in (self.snapshot_path(job_id), self.journal_path(job_id)):
+                if path.exists():
+                    path.unlink()
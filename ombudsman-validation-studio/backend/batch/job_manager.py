@@ -6,17 +6,24 @@ Manages the lifecycle of batch jobs:
 - Job queue management
 - Job execution coordination
 - Progress tracking
+
+Operation changes are journaled (see job_journal.py) and job files are
+rewritten by debounced snapshots; progress comes from per-job counters
+updated on each transition.
 """
 
 import os
 import json
+import time
 import uuid
+import atexit
 import asyncio
 import logging
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
-from threading import Thread, Lock
+from threading import Thread, Lock, RLock, Timer
 
 from config.paths import paths
 from .models import (
@@ -27,9 +34,20 @@ from .models import (
     BatchOperationStatus,
     BatchProgress
 )
+from .job_journal import JobJournal
 
 logger = logging.getLogger(__name__)
 
+# Operation-level broadcasts of one job are debounced to one per interval
+BROADCAST_INTERVAL_SECONDS = float(os.getenv("BATCH_BROADCAST_INTERVAL_SECONDS", "0.5"))
+
+# Operation fields journaled on every change
+JOURNALED_OPERATION_FIELDS = ("status", "started_at", "completed_at", "duration_ms", "result", "error")
+
+FINISHED_OPERATION_STATUSES = (
+    BatchOperationStatus.COMPLETED, BatchOperationStatus.FAILED, BatchOperationStatus.SKIPPED
+)
+
 # Store reference to the main event loop for thread-safe WebSocket broadcasts
 _main_event_loop = None
 
@@ -41,6 +59,11 @@ def set_main_event_loop(loop):
     logger.info(f"Main event loop set for WebSocket broadcasts: {loop}")
 
 
+def get_main_event_loop():
+    """Main event loop registered at startup (None outside the server)."""
+    return _main_event_loop
+
+
 def _broadcast_job_update_sync(job: 'BatchJob'):
     """Broadcast job update via WebSocket (called from sync code, potentially from background thread)."""
     try:
@@ -95,6 +118,23 @@ def _broadcast_job_update_sync(job: 'BatchJob'):
         logger.warning(traceback.format_exc())
 
 
+class _ProgressCounters:
+    """Operation lookup and status counts of one job, kept current per transition"""
+
+    def __init__(self, job: BatchJob):
+        self.operations = {op.operation_id: op for op in job.operations}
+        self.counts = Counter(op.status for op in job.operations)
+        # Insertion-ordered set of running operation ids
+        self.running = {op.operation_id: None for op in job.operations if op.status == BatchOperationStatus.RUNNING}
+
+    def transition(self, operation_id: str, old: BatchOperationStatus, new: BatchOperationStatus):
+        self.counts[old] -= 1
+        self.counts[new] += 1
+        self.running.pop(operation_id, None)
+        if new == BatchOperationStatus.RUNNING:
+            self.running[operation_id] = None
+
+
 class BatchJobManager:
     """
     Singleton manager for batch jobs.
@@ -122,9 +162,20 @@ class BatchJobManager:
         self._job_storage_dir = paths.batch_jobs_dir
         self._job_storage_dir.mkdir(parents=True, exist_ok=True)
 
+        # Guards job mutations together with their journal entries
+        self._state_lock = RLock()
+        self._journal = JobJournal(self._job_storage_dir, lock=self._state_lock)
+        self._counters: Dict[str, _ProgressCounters] = {}
+        self._last_broadcast: Dict[str, float] = {}
+        self._broadcast_timers: Dict[str, Timer] = {}
+        self._broadcast_lock = Lock()
+
         # Load existing jobs from storage
         self._load_jobs()
 
+        # Snapshots still pending at shutdown
+        atexit.register(self._journal.flush)
+
     def _load_jobs(self):
         """Load existing jobs from storage"""
         loaded_count = 0
@@ -138,9 +189,19 @@ class BatchJobManager:
                 try:
                     with open(job_file, 'r') as f:
                         job_data = json.load(f)
-                        job = BatchJob(**job_data)
-                        self._jobs[job.job_id] = job
-                        loaded_count += 1
+
+                    # Apply operation changes journaled after the last snapshot
+                    entries = self._journal.replay(job_data.get("job_id", job_file.stem))
+                    if entries:
+                        self._apply_journal(job_data, entries)
+
+                    job = BatchJob(**job_data)
+                    self._jobs[job.job_id] = job
+                    loaded_count += 1
+
+                    if entries:
+                        self._update_progress(job)
+                        self._save_job(job)
                 except Exception as e:
                     error_count += 1
                     print(f"[BatchJobManager] Error loading job file {job_file.name}: {e}")
@@ -150,15 +211,89 @@ class BatchJobManager:
         except Exception as e:
             print(f"[BatchJobManager] Critical error scanning job directory: {e}")
 
+    @staticmethod
+    def _apply_journal(job_data: Dict[str, Any], entries: List[Dict[str, Any]]):
+        """Apply journaled operation fields to a job snapshot"""
+        operations = {op.get("operation_id"): op for op in job_data.get("operations", [])}
+        for entry in entries:
+            op = operations.get(entry.get("operation_id"))
+            if op is not None:
+                op.update(entry.get("fields", {}))
+
     def _save_job(self, job: BatchJob):
-        """Save job to storage"""
+        """Save job to storage (snapshot now, folding in its journal)"""
         try:
-            job_file = self._job_storage_dir / f"{job.job_id}.json"
-            with open(job_file, 'w') as f:
-                json.dump(job.model_dump(), f, default=str, indent=2)
+            with self._state_lock:
+                self._journal.write_snapshot(job.job_id, job.model_dump())
         except Exception as e:
             print(f"Error saving batch job {job.job_id}: {e}")
 
+    def _journal_operation(self, job: BatchJob, op: BatchOperation):
+        """Journal an operation change; the job file follows in a debounced snapshot"""
+        try:
+            self._journal.append(
+                job.job_id,
+                {
+                    "operation_id": op.operation_id,
+                    "fields": {field: getattr(op, field) for field in JOURNALED_OPERATION_FIELDS}
+                },
+                job.model_dump
+            )
+        except Exception as e:
+            print(f"Error journaling batch job {job.job_id}: {e}")
+
+    def _progress_counters(self, job: BatchJob) -> _ProgressCounters:
+        counters = self._counters.get(job.job_id)
+        if counters is None:
+            counters = self._counters[job.job_id] = _ProgressCounters(job)
+        return counters
+
+    def _broadcast_debounced(self, job: BatchJob):
+        """
+        Broadcast an operation-level update at most once per interval.
+
+        Updates inside the interval schedule one trailing broadcast of the
+        job's latest state when it ends; the last operation always goes out
+        at once.
+        """
+        finished = job.progress and (
+            job.progress.completed_operations + job.progress.failed_operations
+            + job.progress.skipped_operations >= job.progress.total_operations
+        )
+        with self._broadcast_lock:
+            wait = BROADCAST_INTERVAL_SECONDS - (time.monotonic() - self._last_broadcast.get(job.job_id, 0.0))
+            if not finished and wait > 0:
+                if job.job_id not in self._broadcast_timers:
+                    timer = Timer(wait, self._trailing_broadcast, args=(job.job_id,))
+                    timer.daemon = True
+                    self._broadcast_timers[job.job_id] = timer
+                    timer.start()
+                return
+            self._mark_broadcast(job.job_id)
+        _broadcast_job_update_sync(job)
+
+    def _mark_broadcast(self, job_id: str):
+        """Record a broadcast of the job's current state (call with _broadcast_lock held)"""
+        timer = self._broadcast_timers.pop(job_id, None)
+        if timer is not None:
+            timer.cancel()
+        self._last_broadcast[job_id] = time.monotonic()
+
+    def _trailing_broadcast(self, job_id: str):
+        """Broadcast the latest state of a job whose updates were held back"""
+        with self._broadcast_lock:
+            if self._broadcast_timers.pop(job_id, None) is None:
+                return
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            self._last_broadcast[job_id] = time.monotonic()
+        _broadcast_job_update_sync(job)
+
+    def flush(self):
+        """Write all pending job snapshots"""
+        self._journal.flush()
+
     def create_job(
         self,
         job_type: BatchJobType,
@@ -235,6 +370,9 @@ class BatchJobManager:
         """Update job state"""
         with self._lock:
             self._jobs[job.job_id] = job
+        with self._state_lock:
+            # Operations may have been changed directly; recount on next use
+            self._counters.pop(job.job_id, None)
             self._save_job(job)
 
     def update_job_status(self, job_id: str, status: BatchJobStatus, broadcast: bool = True):
@@ -263,8 +401,10 @@ class BatchJobManager:
 
             self.update_job(job)
 
-            # Broadcast update via WebSocket
+            # Broadcast update via WebSocket (supersedes any held-back update)
             if broadcast:
+                with self._broadcast_lock:
+                    self._mark_broadcast(job_id)
                 _broadcast_job_update_sync(job)
 
     def update_operation_status(
@@ -281,46 +421,69 @@ class BatchJobManager:
         if not job:
             return
 
-        # Find and update operation
-        for op in job.operations:
-            if op.operation_id == operation_id:
-                op.status = status
-
-                if status == BatchOperationStatus.RUNNING:
-                    op.started_at = datetime.utcnow()
-                elif status in [BatchOperationStatus.COMPLETED, BatchOperationStatus.FAILED, BatchOperationStatus.SKIPPED]:
-                    op.completed_at = datetime.utcnow()
-                    if op.started_at:
-                        duration = (op.completed_at - op.started_at).total_seconds() * 1000
-                        op.duration_ms = int(duration)
-
-                if result:
-                    op.result = result
-                if error:
-                    op.error = error
-
-                break
-
-        # Update progress
-        self._update_progress(job)
-        self.update_job(job)
+        with self._state_lock:
+            counters = self._progress_counters(job)
+            op = counters.operations.get(operation_id)
+            if op is None:
+                return
+
+            counters.transition(operation_id, op.status, status)
+            op.status = status
+
+            if status == BatchOperationStatus.RUNNING:
+                op.started_at = datetime.utcnow()
+            elif status in FINISHED_OPERATION_STATUSES:
+                op.completed_at = datetime.utcnow()
+                if op.started_at:
+                    duration = (op.completed_at - op.started_at).total_seconds() * 1000
+                    op.duration_ms = int(duration)
+
+            if result:
+                op.result = result
+            if error:
+                op.error = error
+
+            # Update progress
+            self._update_progress(job)
+            self._journal_operation(job, op)
 
         # Broadcast progress update via WebSocket
         if broadcast:
-            _broadcast_job_update_sync(job)
+            self._broadcast_debounced(job)
+
+    def update_operation_progress(
+        self,
+        job_id: str,
+        operation_id: str,
+        progress: Dict[str, Any],
+        broadcast: bool = True
+    ):
+        """Merge intermediate progress into a running operation's result"""
+        job = self.get_job(job_id)
+        if not job:
+            return
+
+        with self._state_lock:
+            op = self._progress_counters(job).operations.get(operation_id)
+            if op is None:
+                return
+
+            op.result = {**(op.result or {}), **progress}
+            self._journal_operation(job, op)
+
+        if broadcast:
+            self._broadcast_debounced(job)
 
     def _update_progress(self, job: BatchJob):
-        """Update job progress based on operation statuses"""
+        """Update job progress from the job's operation status counters"""
+        counters = self._progress_counters(job)
         total = len(job.operations)
-        completed = sum(1 for op in job.operations if op.status == BatchOperationStatus.COMPLETED)
-        failed = sum(1 for op in job.operations if op.status == BatchOperationStatus.FAILED)
-        skipped = sum(1 for op in job.operations if op.status == BatchOperationStatus.SKIPPED)
-
-        # Find current running operation
-        current_op = next(
-            (op.operation_id for op in job.operations if op.status == BatchOperationStatus.RUNNING),
-            None
-        )
+        completed = counters.counts[BatchOperationStatus.COMPLETED]
+        failed = counters.counts[BatchOperationStatus.FAILED]
+        skipped = counters.counts[BatchOperationStatus.SKIPPED]
+
+        # Earliest started operation still running
+        current_op = next(iter(counters.running), None)
 
         # Calculate percent complete
         finished = completed + failed + skipped
@@ -434,12 +597,14 @@ class BatchJobManager:
         # Remove from memory
         with self._lock:
             del self._jobs[job_id]
+        self._counters.pop(job_id, None)
+        with self._broadcast_lock:
+            self._mark_broadcast(job_id)
+            self._last_broadcast.pop(job_id, None)
 
-        # Remove from storage
+        # Remove snapshot and journal from storage
         try:
-            job_file = self._job_storage_dir / f"{job_id}.json"
-            if job_file.exists():
-                job_file.unlink()
+            self._journal.remove(job_id)
         except Exception as e:
             print(f"Error deleting batch job file {job_id}: {e}")
 
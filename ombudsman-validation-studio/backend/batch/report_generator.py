@@ -16,6 +16,7 @@ from collections import defaultdict
 from pathlib import Path
 
 from config.paths import paths
+from execution.result_store import load_run_file
 
 
 class ConsolidatedReportGenerator:
@@ -141,8 +142,7 @@ class ConsolidatedReportGenerator:
         for file in self.results_dir.glob("*.json"):
             if run_id in file.name:
                 try:
-                    with open(file) as f:
-                        return json.load(f)
+                    return load_run_file(str(file))
                 except Exception as e:
                     print(f"Error loading {file}: {e}")
                     return None
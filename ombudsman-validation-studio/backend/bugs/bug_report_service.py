@@ -17,6 +17,7 @@ from .models import (
     ValidationCategory, GenerateBugReportRequest
 )
 from config.paths import paths
+from execution.result_store import load_run_file
 
 
 class BugReportService:
@@ -117,8 +118,7 @@ class BugReportService:
 
         for file in self.results_dir.glob(pattern):
             try:
-                with open(file) as f:
-                    return json.load(f)
+                return load_run_file(str(file))
             except Exception as e:
                 print(f"Error loading batch result {file}: {e}")
                 continue
@@ -244,6 +244,24 @@ class PathConfig:
         self._ensure_init()
         return self._data_dir / "notification_rules.json"
 
+    @property
+    def step_timings_file(self) -> Path:
+        """Historical step durations used for parallel scheduling."""
+        self._ensure_init()
+        return self._data_dir / "step_timings.json"
+
+    @property
+    def watermarks_file(self) -> Path:
+        """Per-table watermarks and cached aggregates for incremental validation."""
+        self._ensure_init()
+        return self._data_dir / "watermarks.json"
+
+    @property
+    def metadata_cache_file(self) -> Path:
+        """Extracted table metadata with schema fingerprints."""
+        self._ensure_init()
+        return self._data_dir / "metadata_cache.db"
+
     # =========================================================================
     # Project-Specific Paths
     # =========================================================================
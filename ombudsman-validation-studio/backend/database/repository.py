@@ -2,16 +2,20 @@
 Results Repository
 
 Handles all database operations for pipeline execution results.
-Uses pyodbc for SQL Server connectivity.
+Uses pyodbc for SQL Server connectivity, with connections reused from the
+shared ConnectionPool and bulk inserts for the steps of a run.
 """
 
 import os
 import json
 import pyodbc
 import logging
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Tuple
 
+from ombudsman.core.connection_pool import pool_manager
+
 from .models import (
     Project, PipelineRun, ValidationStep, ExecutionLog, DataQualityMetrics,
     ProjectCreate, ProjectUpdate, PipelineRunCreate, PipelineRunUpdate,
@@ -22,17 +26,32 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Pool name shared by all repositories on the results database
+RESULTS_POOL_NAME = "results_db"
+
+# Columns written by bulk_insert_validation_steps, in parameter order
+BULK_STEP_COLUMNS = (
+    "run_id", "step_name", "step_order", "validator_type", "status", "completed_at",
+    "duration_milliseconds", "result_message", "difference_type", "total_rows",
+    "differing_rows_count", "affected_columns", "comparison_details", "sql_row_count",
+    "snowflake_row_count", "match_percentage", "step_config", "error_message", "error_stack_trace"
+)
+
 
 class ResultsRepository:
     """Repository for storing and retrieving pipeline execution results"""
 
-    def __init__(self, connection_string: Optional[str] = None):
+    def __init__(self, connection_string: Optional[str] = None, use_pool: bool = True,
+                 pool_size: Optional[int] = None):
         """
         Initialize repository with database connection.
 
         Args:
             connection_string: SQL Server connection string.
                              If None, builds from environment variables.
+            use_pool: Reuse connections from the shared pool instead of
+                      opening one per query
+            pool_size: Maximum pooled connections (default RESULTS_DB_POOL_SIZE or 5)
         """
         if connection_string is None:
             # Build from environment variables
@@ -52,12 +71,47 @@ class ResultsRepository:
             )
 
         self.connection_string = connection_string
+        self.use_pool = use_pool
+        self.pool_size = pool_size or int(os.getenv('RESULTS_DB_POOL_SIZE', '5'))
         logger.info("ResultsRepository initialized")
 
     def _get_connection(self) -> pyodbc.Connection:
-        """Get database connection"""
+        """Open a new database connection"""
         return pyodbc.connect(self.connection_string, timeout=10)
 
+    @contextmanager
+    def _connection(self):
+        """
+        Database connection for one unit of work (context manager).
+
+        Pooled connections are created on first use and returned to the
+        pool afterwards; uncommitted work is rolled back on errors.
+        """
+        if not self.use_pool:
+            conn = self._get_connection()
+            try:
+                yield conn
+            finally:
+                conn.close()
+            return
+
+        pool = pool_manager.get_or_create_pool(
+            name=RESULTS_POOL_NAME,
+            connection_factory=self._get_connection,
+            min_size=1,
+            max_size=self.pool_size,
+            max_age_seconds=3600,
+            health_check_interval=300,
+            connection_timeout=30
+        )
+        with pool.get_connection() as conn:
+            try:
+                yield conn
+            except Exception:
+                # Don't hand a connection with an open transaction back to the pool
+                conn.rollback()
+                raise
+
     def _execute_query(self, query: str, params: Optional[Tuple] = None) -> List[Dict[str, Any]]:
         """
         Execute SELECT query and return results as list of dicts.
@@ -69,8 +123,7 @@ class ResultsRepository:
         Returns:
             List of dictionaries with column names as keys
         """
-        conn = self._get_connection()
-        try:
+        with self._connection() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
@@ -93,8 +146,6 @@ class ResultsRepository:
 
             cursor.close()
             return results
-        finally:
-            conn.close()
 
     def _execute_non_query(self, query: str, params: Optional[Tuple] = None) -> int:
         """
@@ -107,8 +158,7 @@ class ResultsRepository:
         Returns:
             Number of affected rows
         """
-        conn = self._get_connection()
-        try:
+        with self._connection() as conn:
             cursor = conn.cursor()
             if params:
                 cursor.execute(query, params)
@@ -118,11 +168,6 @@ class ResultsRepository:
             affected_rows = cursor.rowcount
             cursor.close()
             return affected_rows
-        except Exception as e:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
 
     # ========================================================================
     # Projects
@@ -266,6 +311,14 @@ class ResultsRepository:
 
     def update_pipeline_run(self, run_id: str, update: PipelineRunUpdate) -> Optional[PipelineRun]:
         """Update pipeline run"""
+        statement = self._pipeline_run_update_statement(run_id, update)
+        if statement:
+            self._execute_non_query(*statement)
+            logger.info(f"Updated pipeline run: {run_id}")
+        return self.get_pipeline_run(run_id)
+
+    def _pipeline_run_update_statement(self, run_id: str, update: PipelineRunUpdate) -> Optional[Tuple[str, Tuple]]:
+        """UPDATE query and params for a pipeline run, or None if nothing changes"""
         updates = []
         params = []
 
@@ -298,13 +351,39 @@ class ResultsRepository:
             params.append(update.errors_count)
 
         if not updates:
-            return self.get_pipeline_run(run_id)
+            return None
 
         params.append(run_id)
         query = f"UPDATE PipelineRuns SET {', '.join(updates)} WHERE run_id = ?"
-        self._execute_non_query(query, tuple(params))
-        logger.info(f"Updated pipeline run: {run_id}")
-        return self.get_pipeline_run(run_id)
+        return query, tuple(params)
+
+    def complete_pipeline_run(
+        self,
+        run_id: str,
+        update: PipelineRunUpdate,
+        steps: List[Tuple[ValidationStepCreate, Optional[ValidationStepUpdate]]]
+    ) -> int:
+        """
+        Store a finished run and all of its steps in one transaction.
+
+        Args:
+            run_id: Pipeline run ID
+            update: Final pipeline run fields
+            steps: (step, result) pairs as for bulk_insert_validation_steps
+
+        Returns:
+            Number of steps inserted
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            statement = self._pipeline_run_update_statement(run_id, update)
+            if statement:
+                cursor.execute(*statement)
+            inserted = self._insert_validation_steps(cursor, steps)
+            conn.commit()
+            cursor.close()
+        logger.info(f"Completed pipeline run {run_id} with {inserted} steps")
+        return inserted
 
     def get_pipeline_run_history(
         self,
@@ -380,8 +459,7 @@ class ResultsRepository:
         """
         config_json = json.dumps(step.step_config) if step.step_config else None
 
-        conn = self._get_connection()
-        try:
+        with self._connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, (
                 step.run_id,
@@ -394,10 +472,75 @@ class ResultsRepository:
             step_id = cursor.fetchone()[0]
             conn.commit()
             cursor.close()
-            logger.info(f"Created validation step: {step_id} for run {step.run_id}")
-            return self.get_validation_step(step_id)
-        finally:
-            conn.close()
+        logger.info(f"Created validation step: {step_id} for run {step.run_id}")
+        return self.get_validation_step(step_id)
+
+    def bulk_insert_validation_steps(
+        self,
+        steps: List[Tuple[ValidationStepCreate, Optional[ValidationStepUpdate]]]
+    ) -> int:
+        """
+        Insert finished validation steps with their results in one round-trip.
+
+        Replaces a create_validation_step plus update_validation_step pair
+        per step. All rows are sent with fast_executemany in a single
+        transaction.
+
+        Args:
+            steps: (step, result) pairs; result fields default to NULL and
+                   status to passed when result is None
+
+        Returns:
+            Number of steps inserted
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            inserted = self._insert_validation_steps(cursor, steps)
+            conn.commit()
+            cursor.close()
+        logger.info(f"Inserted {inserted} validation steps")
+        return inserted
+
+    def _insert_validation_steps(self, cursor, steps) -> int:
+        """Send the rows of bulk_insert_validation_steps on an open cursor"""
+        if not steps:
+            return 0
+        rows = [self._validation_step_row(step, result) for step, result in steps]
+        query = f"""
+        INSERT INTO ValidationSteps ({', '.join(BULK_STEP_COLUMNS)}, started_at)
+        VALUES ({', '.join('?' for _ in BULK_STEP_COLUMNS)}, GETDATE())
+        """
+        # Binds all rows as one parameter array instead of a round-trip per row
+        cursor.fast_executemany = True
+        cursor.executemany(query, rows)
+        return len(rows)
+
+    @staticmethod
+    def _validation_step_row(step: ValidationStepCreate, result: Optional[ValidationStepUpdate]) -> Tuple:
+        """Parameter row in BULK_STEP_COLUMNS order"""
+        result = result or ValidationStepUpdate()
+        status = result.status or StepStatus.PASSED
+        return (
+            step.run_id,
+            step.step_name,
+            step.step_order,
+            step.validator_type,
+            status.value,
+            result.completed_at,
+            result.duration_milliseconds,
+            result.result_message,
+            result.difference_type,
+            result.total_rows,
+            result.differing_rows_count,
+            json.dumps(result.affected_columns) if result.affected_columns is not None else None,
+            json.dumps(result.comparison_details) if result.comparison_details is not None else None,
+            result.sql_row_count,
+            result.snowflake_row_count,
+            result.match_percentage,
+            json.dumps(step.step_config) if step.step_config else None,
+            result.error_message,
+            result.error_stack_trace
+        )
 
     def get_validation_step(self, step_id: int) -> Optional[ValidationStep]:
         """Get validation step by ID"""
@@ -0,0 +1,207 @@
+"""
+Result Store - split, compressed storage for run result payloads.
+
+Provides:
+- A compact <run_id>.json summary holding run metadata and every step
+  without its bulky detail fields
+- A <run_id>.details blob with one compressed frame per step holding those
+  fields (zstd when the zstandard package is installed, zlib otherwise)
+- Partial reads of one step's details by offset, without touching the rest
+- Transparent handling of legacy single-file JSON results, which are
+  rewritten in the split format the first time they are loaded
+
+The summary stays plain JSON, so code listing runs (run catalog, project
+cleanup) keeps reading it directly; only code that needs step details has
+to go through load_run_file / load_step_details.
+"""
+
+import json
+import logging
+import os
+import zlib
+from typing import Any, Dict, List, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+STORAGE_KEY = "_storage"
+DETAIL_REF_KEY = "_detail"
+STORAGE_FORMAT = 1
+
+# Detail fields whose JSON is larger than this move to the blob
+DETAIL_INLINE_BYTES = 2048
+
+DETAILS_SUFFIX = ".details"
+
+
+def _default_codec() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data, 6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("zstandard is required to read these results (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def details_path(path: str) -> str:
+    """Blob file belonging to a result file"""
+    return os.path.splitext(path)[0] + DETAILS_SUFFIX
+
+
+def _steps(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    steps = data.get("steps", data.get("results"))
+    return steps if isinstance(steps, list) else []
+
+
+def _bulky_keys(step: Any) -> List[str]:
+    """Detail fields of a (JSON-safe) step that belong in the blob"""
+    details = step.get("details") if isinstance(step, dict) else None
+    if not isinstance(details, dict):
+        return []
+    return [
+        key for key, value in details.items()
+        if isinstance(value, (dict, list)) and len(json.dumps(value, default=str)) > DETAIL_INLINE_BYTES
+    ]
+
+
+def _atomic_write(path: str, data: bytes):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_run_file(path: str, data: Dict[str, Any], cls=None, default=None, codec: Optional[str] = None):
+    """
+    Write a run result in the split format.
+
+    The caller's dict is not modified.
+
+    Args:
+        path: Summary file path (<run_id>.json)
+        data: Full run payload
+        cls: JSONEncoder class for values json cannot encode by default
+        default: default= function for json.dumps (alternative to cls)
+        codec: "zstd" or "zlib" (default: zstd if available)
+    """
+    codec = codec or _default_codec()
+    summary = json.loads(json.dumps(data, cls=cls, default=default))
+    summary.pop(STORAGE_KEY, None)
+
+    frames = []
+    offset = 0
+    for step in _steps(summary):
+        keys = _bulky_keys(step)
+        if not keys:
+            continue
+        bulky = {key: step["details"].pop(key) for key in keys}
+        frame = _compress(json.dumps(bulky, separators=(",", ":")).encode("utf-8"), codec)
+        step[DETAIL_REF_KEY] = {"offset": offset, "length": len(frame), "keys": sorted(bulky)}
+        frames.append(frame)
+        offset += len(frame)
+
+    blob_path = details_path(path)
+    if frames:
+        # Blob first: a summary never points at frames that are not on disk yet
+        _atomic_write(blob_path, b"".join(frames))
+        summary[STORAGE_KEY] = {
+            "format": STORAGE_FORMAT,
+            "codec": codec,
+            "details": os.path.basename(blob_path)
+        }
+    _atomic_write(path, json.dumps(summary, separators=(",", ":")).encode("utf-8"))
+    if not frames and os.path.exists(blob_path):
+        os.remove(blob_path)
+
+
+def _read_frame(blob, ref: Dict[str, Any], codec: str) -> Dict[str, Any]:
+    blob.seek(ref["offset"])
+    return json.loads(_decompress(blob.read(ref["length"]), codec))
+
+
+def _attach_details(path: str, data: Dict[str, Any], steps: List[Dict[str, Any]]):
+    storage = data[STORAGE_KEY]
+    with open(os.path.join(os.path.dirname(path), storage["details"]), "rb") as blob:
+        for step in steps:
+            ref = step.pop(DETAIL_REF_KEY, None) if isinstance(step, dict) else None
+            if ref:
+                step.setdefault("details", {}).update(_read_frame(blob, ref, storage["codec"]))
+
+
+def is_split(data: Dict[str, Any]) -> bool:
+    """True if a loaded summary still refers to a details blob"""
+    return isinstance(data, dict) and STORAGE_KEY in data
+
+
+def load_run_file(path: str, details: bool = True, convert_legacy: bool = True) -> Dict[str, Any]:
+    """
+    Load a run result, in either the split or the legacy format.
+
+    Args:
+        path: Result file path (<run_id>.json)
+        details: Re-attach the step details from the blob; with False the
+                 summary is returned as stored (steps keep their _detail refs)
+        convert_legacy: Rewrite legacy files with bulky details in the split format
+
+    Returns:
+        Run payload in the same shape it had when written
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        return data
+
+    if not is_split(data):
+        if convert_legacy and any(_bulky_keys(step) for step in _steps(data)):
+            try:
+                write_run_file(path, data, default=str)
+                logger.info(f"[RESULT_STORE] Converted {os.path.basename(path)} to split storage")
+            except Exception as e:
+                logger.warning(f"[RESULT_STORE] Could not convert {path}: {e}")
+        return data
+
+    if details:
+        _attach_details(path, data, _steps(data))
+        data.pop(STORAGE_KEY, None)
+    return data
+
+
+def load_step_details(path: str, data: Dict[str, Any], step: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Re-attach the details of one step of a summary loaded with details=False.
+
+    Only that step's frame is read from the blob.
+
+    Returns:
+        The step, with its full details
+    """
+    if is_split(data) and DETAIL_REF_KEY in step:
+        _attach_details(path, data, [step])
+    return step
+
+
+def update_step_details(path: str, step_index: int, details: Dict[str, Any]):
+    """Replace the details of one step and rewrite the run"""
+    data = load_run_file(path, convert_legacy=False)
+    _steps(data)[step_index]["details"] = details
+    write_run_file(path, data, default=str)
+
+
+def remove_run_file(path: str):
+    """Delete a result file and its details blob"""
+    for file_path in (path, details_path(path)):
+        if os.path.exists(file_path):
+            os.remove(file_path)
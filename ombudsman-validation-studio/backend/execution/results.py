@@ -5,7 +5,6 @@ import json
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 from collections import defaultdict
-from pathlib import Path
 import io
 
 # Export libraries
@@ -19,6 +18,9 @@ import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+from .run_catalog import get_run_catalog
+from .result_store import load_run_file, load_step_details, remove_run_file, update_step_details
+
 router = APIRouter()
 
 RESULTS_DIR = "results"
@@ -62,22 +64,22 @@ def cleanup_old_results():
                                 try:
                                     file_timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
                                     if file_timestamp.replace(tzinfo=None) < cutoff_date:
-                                        Path(file_path).unlink()
+                                        remove_run_file(file_path)
                                         deleted_count += 1
                                         print(f"[CLEANUP] Deleted old result file: {file} (age: {(datetime.now() - file_timestamp.replace(tzinfo=None)).days} days)")
                                 except:
                                     # If timestamp parsing fails, use file mtime
-                                    Path(file_path).unlink()
+                                    remove_run_file(file_path)
                                     deleted_count += 1
                                     print(f"[CLEANUP] Deleted old result file: {file} (based on file mtime)")
                             else:
                                 # No timestamp in file, use file mtime
-                                Path(file_path).unlink()
+                                remove_run_file(file_path)
                                 deleted_count += 1
                                 print(f"[CLEANUP] Deleted old result file: {file} (no timestamp found)")
                     except json.JSONDecodeError:
                         # If file is corrupted, delete it anyway
-                        Path(file_path).unlink()
+                        remove_run_file(file_path)
                         deleted_count += 1
                         print(f"[CLEANUP] Deleted corrupted result file: {file}")
 
@@ -91,27 +93,102 @@ def cleanup_old_results():
         print(f"[CLEANUP] Cleanup error: {e}")
 
 
+def _summarize_run(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Run catalog columns for one result payload"""
+    # History metrics read the "steps" key only, trends fall back to "results"
+    steps = data.get("steps", [])
+    trend_steps = data.get("steps", data.get("results", []))
+    return {
+        "run_id": data.get("run_id"),
+        "pipeline_name": data.get("pipeline_name"),
+        "trend_name": data.get("batch_job_name") or data.get("pipeline_name"),
+        "status": data.get("status"),
+        "started_at": data.get("started_at"),
+        "completed_at": data.get("completed_at"),
+        "trend_timestamp": data.get("started_at") or data.get("timestamp") or data.get("execution_time"),
+        "total_steps": len(steps),
+        "passed_steps": sum(1 for s in steps if s.get("status") == "success"),
+        "failed_steps": sum(1 for s in steps if s.get("status") == "failure"),
+        "total_errors": sum(s.get("error_count", 0) for s in steps),
+        "blocker_count": sum(1 for s in steps if s.get("severity") == "BLOCKER"),
+        "high_count": sum(1 for s in steps if s.get("severity") == "HIGH"),
+        "medium_count": sum(1 for s in steps if s.get("severity") == "MEDIUM"),
+        "trend_errors": sum(_count_errors_in_step(step) for step in trend_steps),
+        "trend_validations": len(trend_steps),
+    }
+
+
+def _run_catalog():
+    """Run catalog of RESULTS_DIR, synced with the files on disk"""
+    catalog = get_run_catalog(RESULTS_DIR, _summarize_run)
+    catalog.sync()
+    return catalog
+
+
+def index_run_file(path: str):
+    """Add a just-written result file to the run catalog"""
+    get_run_catalog(RESULTS_DIR, _summarize_run).index_file(path)
+
+
+def _find_result_file(run_id: str):
+    """Result file for a run_id, or None"""
+    if not os.path.exists(RESULTS_DIR):
+        return None
+    return _run_catalog().find_file(run_id)
+
+
 @router.get("")
-def fetch_results():
+def fetch_results(summary: bool = False):
     """
     Fetch all validation results from the results directory.
     Automatically cleans up results older than RETENTION_DAYS.
+
+    Args:
+        summary: Return the run catalog's summary rows instead of full payloads
     """
     # Run cleanup before fetching results
     cleanup_old_results()
 
+    if summary:
+        return {"results": _run_catalog().list_runs()}
+
     entries = []
     if os.path.exists(RESULTS_DIR):
-        for file in os.listdir(RESULTS_DIR):
-            if file.endswith(".json"):
-                try:
-                    with open(os.path.join(RESULTS_DIR, file)) as f:
-                        entries.append(json.load(f))
-                except Exception as e:
-                    print(f"Error reading {file}: {e}")
+        for run in _run_catalog().list_runs():
+            try:
+                entries.append(load_run_file(os.path.join(RESULTS_DIR, run["file_name"])))
+            except Exception as e:
+                print(f"Error reading {run['file_name']}: {e}")
     return {"results": entries}
 
 
+def _resolve_deferred_explain(result_file: str, result_data: Dict[str, Any], step_index: int,
+                              details: Dict[str, Any]) -> None:
+    """
+    Fetch explain samples that were deferred when the step ran.
+
+    The resolved payload is written back to the result file, so the samples
+    are only queried the first time a step is opened.
+    """
+    from ombudsman.validation.explain import has_deferred, resolve_explain
+
+    if not has_deferred(details.get("explain")):
+        return
+
+    with _lease_run_connections(result_data) as (sql_conn, snow_conn):
+        resolve_explain(details["explain"], sql_conn, snow_conn)
+
+    update_step_details(result_file, step_index, details)
+
+
+def _lease_run_connections(result_data: Dict[str, Any]):
+    """Connection pair for the databases a stored run validated"""
+    from ombudsman.core.connections import lease_connections
+    from pipelines.execute import resolve_connection_config
+
+    return lease_connections(resolve_connection_config(result_data.get("pipeline_def") or {}))
+
+
 @router.get("/{run_id}/step/{step_name}")
 def get_step_details(run_id: str, step_name: str):
     """
@@ -131,28 +208,24 @@ def get_step_details(run_id: str, step_name: str):
     if not os.path.exists(RESULTS_DIR):
         raise HTTPException(status_code=404, detail="Results directory not found")
 
-    result_file = None
-    for file in os.listdir(RESULTS_DIR):
-        if file.endswith(".json") and run_id in file:
-            result_file = os.path.join(RESULTS_DIR, file)
-            break
+    result_file = _find_result_file(run_id)
 
     if not result_file:
         raise HTTPException(status_code=404, detail=f"No results found for run_id: {run_id}")
 
     try:
-        with open(result_file) as f:
-            result_data = json.load(f)
+        # Only this step's details are read from the details blob
+        result_data = load_run_file(result_file, details=False)
 
         # Find the specific step (try both "steps" and "results" keys)
         steps = result_data.get("steps", result_data.get("results", []))
         target_step = None
 
-        for step in steps:
+        for step_index, step in enumerate(steps):
             # Check both "step_name" and "name" keys
             step_id = step.get("step_name", step.get("name"))
             if step_id == step_name:
-                target_step = step
+                target_step = load_step_details(result_file, result_data, step)
                 break
 
         if not target_step:
@@ -161,6 +234,12 @@ def get_step_details(run_id: str, step_name: str):
         # Extract details
         details = target_step.get("details", {})
 
+        # Samples of steps that passed are only fetched once someone asks for them
+        try:
+            _resolve_deferred_explain(result_file, result_data, step_index, details)
+        except Exception as e:
+            details.setdefault("explain_error", f"Could not fetch explain data: {str(e)}")
+
         # Build response with all available information
         response = {
             "run_id": run_id,
@@ -201,6 +280,12 @@ def get_step_details(run_id: str, step_name: str):
         if details.get("metadata"):
             response["metadata"] = details["metadata"]
 
+        # Add explain data (samples, distributions) if available
+        if details.get("explain"):
+            response["explain"] = details["explain"]
+        if details.get("explain_error"):
+            response["explain_error"] = details["explain_error"]
+
         return response
 
     except HTTPException:
@@ -231,18 +316,13 @@ def get_comparison_details(run_id: str, step_name: str):
     if not os.path.exists(RESULTS_DIR):
         return {"error": "Results directory not found"}
 
-    result_file = None
-    for file in os.listdir(RESULTS_DIR):
-        if file.endswith(".json") and run_id in file:
-            result_file = os.path.join(RESULTS_DIR, file)
-            break
+    result_file = _find_result_file(run_id)
 
     if not result_file:
         return {"error": f"No results found for run_id: {run_id}"}
 
     try:
-        with open(result_file) as f:
-            result_data = json.load(f)
+        result_data = load_run_file(result_file, details=False)
 
         # Find the specific step (try both "steps" and "results" keys)
         steps = result_data.get("steps", result_data.get("results", []))
@@ -252,7 +332,7 @@ def get_comparison_details(run_id: str, step_name: str):
             # Check both "step_name" and "name" keys
             step_id = step.get("step_name", step.get("name"))
             if step_id == step_name:
-                target_step = step
+                target_step = load_step_details(result_file, result_data, step)
                 break
 
         if not target_step:
@@ -748,13 +828,12 @@ def _load_run_data(run_id: str) -> Dict:
     if not os.path.exists(RESULTS_DIR):
         return {"error": "Results directory not found"}
 
-    for file in os.listdir(RESULTS_DIR):
-        if file.endswith(".json") and run_id in file:
-            try:
-                with open(os.path.join(RESULTS_DIR, file)) as f:
-                    return json.load(f)
-            except Exception as e:
-                return {"error": f"Failed to load run data: {str(e)}"}
+    result_file = _find_result_file(run_id)
+    if result_file:
+        try:
+            return load_run_file(result_file)
+        except Exception as e:
+            return {"error": f"Failed to load run data: {str(e)}"}
 
     return {"error": f"Run {run_id} not found"}
 
@@ -916,40 +995,22 @@ def _calculate_trend_analysis(run2_data: Dict, pipeline_name: str = None) -> Dic
         if not target_name:
             return _empty_trend_analysis()
 
-        # Load all matching runs
-        for file in sorted(os.listdir(RESULTS_DIR)):
-            if not file.endswith(".json"):
-                continue
-
-            file_path = os.path.join(RESULTS_DIR, file)
+        # Load all matching runs (by batch name or pipeline name) from the run catalog
+        for run in _run_catalog().trend_runs(target_name):
             try:
-                with open(file_path, 'r') as f:
-                    run_data = json.load(f)
-
-                # Match by batch name or pipeline name
-                run_name = run_data.get("batch_job_name") or run_data.get("pipeline_name")
-                if run_name == target_name:
-                    # Extract timestamp
-                    timestamp_str = run_data.get("started_at") or run_data.get("timestamp") or run_data.get("execution_time")
-                    if not timestamp_str:
-                        continue
-
-                    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-
-                    # Count total errors
-                    steps = run_data.get("steps", run_data.get("results", []))
-                    total_errors = sum(_count_errors_in_step(step) for step in steps)
-                    total_validations = len(steps)
-
-                    historical_runs.append({
-                        "run_id": run_data.get("run_id"),
-                        "timestamp": timestamp,
-                        "total_errors": total_errors,
-                        "total_validations": total_validations,
-                        "error_rate": (total_errors / max(total_validations, 1)) * 100
-                    })
+                timestamp = datetime.fromisoformat(run["trend_timestamp"].replace('Z', '+00:00'))
+                total_errors = run["trend_errors"]
+                total_validations = run["trend_validations"]
+
+                historical_runs.append({
+                    "run_id": run["run_id"],
+                    "timestamp": timestamp,
+                    "total_errors": total_errors,
+                    "total_validations": total_validations,
+                    "error_rate": (total_errors / max(total_validations, 1)) * 100
+                })
             except Exception as e:
-                print(f"[TREND] Error processing {file}: {e}")
+                print(f"[TREND] Error processing {run['file_name']}: {e}")
                 continue
 
         # Sort by timestamp
@@ -1642,76 +1703,37 @@ def get_historical_trends(pipeline_name: str = None, limit: int = 10):
                 "summary": {}
             }
         
-        # Collect all result files
-        result_files = []
-        for file in os.listdir(RESULTS_DIR):
-            if not file.endswith(".json"):
-                continue
-            
-            file_path = os.path.join(RESULTS_DIR, file)
-            try:
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                    
-                    # Filter by pipeline name if specified
-                    if pipeline_name and data.get('pipeline_name') != pipeline_name:
-                        continue
-                    
-                    result_files.append({
-                        "file_path": file_path,
-                        "run_id": data.get('run_id'),
-                        "pipeline_name": data.get('pipeline_name'),
-                        "started_at": data.get('started_at'),
-                        "data": data
-                    })
-            except Exception as e:
-                continue
-        
-        # Sort by timestamp (newest first)
-        result_files.sort(key=lambda x: x['started_at'] or '', reverse=True)
-        
-        # Limit number of runs
-        result_files = result_files[:limit]
-        
+        # Latest runs from the run catalog, newest first
+        catalog_runs = _run_catalog().history(pipeline_name, limit)
+
         # Reverse for chronological order (oldest to newest) for trend calculation
-        result_files.reverse()
-        
+        catalog_runs.reverse()
+
         # Extract historical data points
         historical_runs = []
-        for rf in result_files:
-            data = rf['data']
-            steps = data.get('steps', [])
-            
-            # Calculate metrics for this run
-            total_steps = len(steps)
-            passed_steps = sum(1 for s in steps if s.get('status') == 'success')
-            failed_steps = sum(1 for s in steps if s.get('status') == 'failure')
-            total_errors = sum(s.get('error_count', 0) for s in steps)
-            
-            # Count severity levels
-            blocker_count = sum(1 for s in steps if s.get('severity') == 'BLOCKER')
-            high_count = sum(1 for s in steps if s.get('severity') == 'HIGH')
-            medium_count = sum(1 for s in steps if s.get('severity') == 'MEDIUM')
-            
+        for run in catalog_runs:
+            total_steps = run["total_steps"]
+            passed_steps = run["passed_steps"]
+
             # Calculate success rate
             success_rate = (passed_steps / total_steps * 100) if total_steps > 0 else 0
-            
+
             historical_runs.append({
-                "run_id": rf['run_id'],
-                "pipeline_name": rf['pipeline_name'],
-                "timestamp": rf['started_at'],
+                "run_id": run["run_id"],
+                "pipeline_name": run["pipeline_name"],
+                "timestamp": run["started_at"],
                 "metrics": {
                     "total_steps": total_steps,
                     "passed_steps": passed_steps,
-                    "failed_steps": failed_steps,
+                    "failed_steps": run["failed_steps"],
                     "success_rate": round(success_rate, 2),
-                    "total_errors": total_errors,
-                    "blocker_issues": blocker_count,
-                    "high_severity_issues": high_count,
-                    "medium_severity_issues": medium_count
+                    "total_errors": run["total_errors"],
+                    "blocker_issues": run["blocker_count"],
+                    "high_severity_issues": run["high_count"],
+                    "medium_severity_issues": run["medium_count"]
                 }
             })
-        
+
         # Calculate trends
         trends = _calculate_trends(historical_runs)
         
@@ -1912,8 +1934,7 @@ def set_baseline(request: Dict[str, str]):
             raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
 
         # Load the result data
-        with open(result_file, 'r') as f:
-            result_data = json.load(f)
+        result_data = load_run_file(result_file)
 
         # Extract key metrics
         pipeline_name = result_data.get('pipeline_name', request.get('pipeline_name', 'unknown'))
@@ -2030,8 +2051,7 @@ def compare_to_baseline(run_id: str):
             raise HTTPException(status_code=404, detail=f"Run {run_id} not found")
 
         # Load the comparison run data
-        with open(result_file, 'r') as f:
-            result_data = json.load(f)
+        result_data = load_run_file(result_file)
 
         # Extract metrics from comparison run
         steps = result_data.get('steps', [])
@@ -2163,8 +2183,7 @@ def export_json(run_id: str):
         if not os.path.exists(result_file):
             raise HTTPException(status_code=404, detail=f"Results file not found for run_id: {run_id}")
         
-        with open(result_file, 'r') as f:
-            results = json.load(f)
+        results = load_run_file(result_file)
         
         # Create a formatted JSON export
         export_data = {
@@ -2209,8 +2228,7 @@ def export_excel(run_id: str):
         if not os.path.exists(result_file):
             raise HTTPException(status_code=404, detail=f"Results file not found for run_id: {run_id}")
         
-        with open(result_file, 'r') as f:
-            results = json.load(f)
+        results = load_run_file(result_file)
         
         # Create Excel workbook
         wb = openpyxl.Workbook()
@@ -2322,8 +2340,7 @@ def export_pdf(run_id: str):
         if not os.path.exists(result_file):
             raise HTTPException(status_code=404, detail=f"Results file not found for run_id: {run_id}")
         
-        with open(result_file, 'r') as f:
-            results = json.load(f)
+        results = load_run_file(result_file)
         
         # Create PDF buffer
         pdf_buffer = io.BytesIO()
@@ -2502,8 +2519,7 @@ def export_batch_json(batch_id: str):
         if not os.path.exists(result_file):
             raise HTTPException(status_code=404, detail=f"Batch results file not found for batch_id: {batch_id}")
 
-        with open(result_file, 'r') as f:
-            batch_results = json.load(f)
+        batch_results = load_run_file(result_file)
 
         # Create a formatted JSON export
         export_data = {
@@ -2553,8 +2569,7 @@ def export_batch_excel(batch_id: str):
         if not os.path.exists(result_file):
             raise HTTPException(status_code=404, detail=f"Batch results file not found for batch_id: {batch_id}")
 
-        with open(result_file, 'r') as f:
-            batch_results = json.load(f)
+        batch_results = load_run_file(result_file)
 
         # Create Excel workbook
         wb = openpyxl.Workbook()
@@ -2699,8 +2714,7 @@ def export_batch_pdf(batch_id: str):
         if not os.path.exists(result_file):
             raise HTTPException(status_code=404, detail=f"Batch results file not found for batch_id: {batch_id}")
 
-        with open(result_file, 'r') as f:
-            batch_results = json.load(f)
+        batch_results = load_run_file(result_file)
 
         # Create PDF buffer
         pdf_buffer = io.BytesIO()
@@ -0,0 +1,207 @@
+"""
+Run Catalog - SQLite index over the result files of pipeline runs.
+
+Provides:
+- A run_id -> result file index
+- Per-run summary columns (pipeline, status, timings, step counts, severities)
+- Incremental maintenance: only files added or changed since the last sync
+  are read, and runs are indexed as soon as they complete
+
+List, history and trend endpoints query the summary columns instead of
+parsing every result file on every request; full payloads are only loaded
+for the runs a request actually returns.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = ".run_catalog.db"
+
+# Summary columns filled from a run's payload by the summarize callable
+SUMMARY_COLUMNS = (
+    "run_id", "pipeline_name", "trend_name", "status", "started_at", "completed_at",
+    "trend_timestamp", "total_steps", "passed_steps", "failed_steps", "total_errors",
+    "blocker_count", "high_count", "medium_count", "trend_errors", "trend_validations"
+)
+
+
+class RunCatalog:
+    """SQLite catalog of the run result files in one directory"""
+
+    def __init__(self, results_dir: str, summarize: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 db_path: Optional[str] = None):
+        """
+        Args:
+            results_dir: Directory holding the <run_id>.json result files
+            summarize: Function turning a run payload into SUMMARY_COLUMNS values
+            db_path: Catalog database (default: .run_catalog.db in results_dir)
+        """
+        self.results_dir = results_dir
+        self.summarize = summarize
+        self.db_path = db_path or os.path.join(results_dir, CATALOG_FILE)
+        self._lock = threading.Lock()
+        os.makedirs(results_dir, exist_ok=True)
+        self._create_tables()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get database connection"""
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row  # Enable column access by name
+        return conn
+
+    def _create_tables(self):
+        """Create catalog table and indexes if they don't exist"""
+        columns = ",\n".join(
+            f"{col} {'INTEGER' if col.endswith(('_steps', '_errors', '_count', '_validations')) else 'TEXT'}"
+            for col in SUMMARY_COLUMNS
+        )
+        conn = self._get_connection()
+        try:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS runs (
+                    file_name TEXT PRIMARY KEY,
+                    mtime REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    error TEXT,
+                    {columns}
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_run_id ON runs(run_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_pipeline ON runs(pipeline_name, started_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_trend ON runs(trend_name)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _summary_row(self, file_name: str, stat: os.stat_result) -> Dict[str, Any]:
+        row = {"file_name": file_name, "mtime": stat.st_mtime, "size": stat.st_size, "error": None}
+        try:
+            with open(os.path.join(self.results_dir, file_name)) as f:
+                data = json.load(f)
+            summary = self.summarize(data) if isinstance(data, dict) else {}
+        except Exception as e:
+            # Unreadable files stay indexed so they are not parsed again until they change
+            row["error"] = str(e)
+            summary = {}
+        for col in SUMMARY_COLUMNS:
+            row[col] = summary.get(col)
+        if not row["run_id"]:
+            row["run_id"] = file_name[:-len(".json")]
+        return row
+
+    def _upsert(self, conn: sqlite3.Connection, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        columns = list(rows[0].keys())
+        conn.executemany(
+            f"INSERT OR REPLACE INTO runs ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+            [tuple(row[col] for col in columns) for row in rows]
+        )
+
+    def sync(self) -> int:
+        """
+        Bring the catalog up to date with the results directory.
+
+        Only files whose size or modification time changed are read.
+
+        Returns:
+            Number of files (re)indexed
+        """
+        if not os.path.exists(self.results_dir):
+            return 0
+        with self._lock:
+            files = {
+                entry.name: entry.stat()
+                for entry in os.scandir(self.results_dir)
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+            conn = self._get_connection()
+            try:
+                known = {row["file_name"]: (row["mtime"], row["size"])
+                         for row in conn.execute("SELECT file_name, mtime, size FROM runs")}
+                removed = [(name,) for name in known if name not in files]
+                if removed:
+                    conn.executemany("DELETE FROM runs WHERE file_name = ?", removed)
+                changed = [
+                    self._summary_row(name, stat) for name, stat in files.items()
+                    if known.get(name) != (stat.st_mtime, stat.st_size)
+                ]
+                self._upsert(conn, changed)
+                conn.commit()
+            finally:
+                conn.close()
+        if changed or removed:
+            logger.info(f"[RUN_CATALOG] Indexed {len(changed)} result files, dropped {len(removed)}")
+        return len(changed)
+
+    def index_file(self, path: str):
+        """Index one result file right after it was written."""
+        file_name = os.path.basename(path)
+        if os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.results_dir):
+            return
+        with self._lock:
+            row = self._summary_row(file_name, os.stat(path))
+            conn = self._get_connection()
+            try:
+                self._upsert(conn, [row])
+                conn.commit()
+            finally:
+                conn.close()
+
+    def _query(self, query: str, params=()) -> List[Dict[str, Any]]:
+        conn = self._get_connection()
+        try:
+            return [dict(row) for row in conn.execute(query, params)]
+        finally:
+            conn.close()
+
+    def find_file(self, run_id: str) -> Optional[str]:
+        """Path of a run's result file (exact run_id first, then file name containing it)."""
+        rows = self._query("SELECT file_name FROM runs WHERE run_id = ? OR file_name = ? LIMIT 1",
+                           (run_id, f"{run_id}.json"))
+        if not rows:
+            pattern = "%" + run_id.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            rows = self._query("SELECT file_name FROM runs WHERE file_name LIKE ? ESCAPE '\\' LIMIT 1", (pattern,))
+        return os.path.join(self.results_dir, rows[0]["file_name"]) if rows else None
+
+    def list_runs(self) -> List[Dict[str, Any]]:
+        """Summaries of all readable runs, newest first."""
+        return self._query("SELECT * FROM runs WHERE error IS NULL ORDER BY COALESCE(started_at, '') DESC")
+
+    def history(self, pipeline_name: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """The latest runs, optionally of one pipeline, newest first."""
+        query = "SELECT * FROM runs WHERE error IS NULL"
+        params: List[Any] = []
+        if pipeline_name:
+            query += " AND pipeline_name = ?"
+            params.append(pipeline_name)
+        query += " ORDER BY COALESCE(started_at, '') DESC LIMIT ?"
+        params.append(limit)
+        return self._query(query, tuple(params))
+
+    def trend_runs(self, trend_name: str) -> List[Dict[str, Any]]:
+        """Runs of one batch or pipeline name that carry a timestamp."""
+        return self._query(
+            "SELECT * FROM runs WHERE error IS NULL AND trend_name = ? AND trend_timestamp IS NOT NULL",
+            (trend_name,)
+        )
+
+
+_catalogs: Dict[str, RunCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_run_catalog(results_dir: str, summarize: Callable[[Dict[str, Any]], Dict[str, Any]]) -> RunCatalog:
+    """Shared catalog for a results directory."""
+    key = os.path.abspath(results_dir)
+    with _catalogs_lock:
+        if key not in _catalogs:
+            _catalogs[key] = RunCatalog(results_dir, summarize)
+        return _catalogs[key]
@@ -68,12 +68,6 @@ app.add_middleware(
 # Add audit logging middleware
 app.add_middleware(AuditMiddleware)
 
-# Log application startup
-audit_logger.log_system_event(
-    action="application_startup",
-    details={"version": "2.0.0"}
-)
-
 # Original routers
 app.include_router(metadata_router, prefix="/metadata", tags=["Metadata"])
 app.include_router(mapping_router, prefix="/mapping", tags=["Mapping"])
@@ -114,6 +108,12 @@ async def startup_event():
     loop = asyncio.get_running_loop()
     set_main_event_loop(loop)
     print(f"[STARTUP] Main event loop registered for WebSocket broadcasts")
+
+    # Log application startup (opens the audit store)
+    audit_logger.log_system_event(
+        action="application_startup",
+        details={"version": "2.0.0"}
+    )
 app.include_router(bugs_router, tags=["Bug Reports"])
 app.include_router(docs_router, prefix="/docs", tags=["Documentation"])
 app.include_router(automation_router, tags=["Automation"])
@@ -0,0 +1,276 @@
+"""
+Bulk Metadata Extraction
+
+Set-based catalog queries that read a whole schema at once:
+- SQL Server: tables, columns, primary keys and foreign keys in four
+  INFORMATION_SCHEMA queries, however many tables the schema holds
+- Snowflake: tables and columns from INFORMATION_SCHEMA plus
+  SHOW PRIMARY KEYS / SHOW IMPORTED KEYS for the schema
+
+Both functions take an open cursor and return the same per-table shape
+database_mapping has always produced ("columns", "relationships",
+"object_type"), with "nullable" and "primary_key" added. The table list
+queries also return a schema fingerprint per table (SQL Server modify_date,
+Snowflake LAST_DDL) for the metadata cache.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# INFORMATION_SCHEMA names Snowflake types differently from DESCRIBE TABLE
+SNOWFLAKE_TYPE_ALIASES = {"TEXT": "VARCHAR"}
+
+# Up to this many tables, detail queries name them in an IN list
+IN_LIST_LIMIT = 500
+
+# (table_name, table_type, fingerprint)
+TableListEntry = Tuple[str, str, Optional[str]]
+
+
+def _table_entry(object_type: str) -> Dict[str, Any]:
+    return {
+        "columns": {},
+        "relationships": {},
+        "nullable": {},
+        "primary_key": [],
+        "object_type": "VIEW" if object_type == "VIEW" else "TABLE"
+    }
+
+
+def _select_tables(table_list: Iterable[Tuple[str, str]]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+    """Empty entries for the wanted tables, and a case-insensitive name lookup"""
+    tables = {name: _table_entry(object_type) for name, object_type in table_list}
+    return tables, {name.upper(): name for name in tables}
+
+
+def _name_filter(column: str, patterns: List[str], specific_tables: Optional[List[str]],
+                 placeholder: str, upper: bool = False) -> Tuple[str, List[str]]:
+    """SQL condition restricting a catalog query to the requested tables"""
+    if specific_tables:
+        values = [t.upper() for t in specific_tables] if upper else list(specific_tables)
+        target = f"UPPER({column})" if upper else column
+        return f"{target} IN ({', '.join(placeholder for _ in values)})", values
+    if upper:
+        return " OR ".join(f"UPPER({column}) LIKE UPPER({placeholder})" for _ in patterns), list(patterns)
+    return " OR ".join(f"{column} LIKE {placeholder}" for _ in patterns), list(patterns)
+
+
+def _detail_filter(column: str, names: List[str], patterns: List[str],
+                   placeholder: str, upper: bool = False) -> Tuple[str, List[str]]:
+    """SQL condition restricting detail queries to the listed tables"""
+    if len(names) <= IN_LIST_LIMIT:
+        return _name_filter(column, patterns, names, placeholder, upper)
+    if patterns:
+        return _name_filter(column, patterns, None, placeholder, upper)
+    return "1 = 1", []
+
+
+def _match_specific(rows: List[TableListEntry], specific_tables: Optional[List[str]]) -> List[TableListEntry]:
+    """Entries under the requested names; tables not in the catalog have no fingerprint"""
+    if not specific_tables:
+        return rows
+    found = {row[0].upper(): row for row in rows}
+    return [
+        (t, found[t.upper()][1], found[t.upper()][2]) if t.upper() in found else (t, 'BASE TABLE', None)
+        for t in specific_tables
+    ]
+
+
+def sqlserver_table_list(cursor, schema: str, patterns: List[str],
+                         specific_tables: Optional[List[str]] = None) -> List[TableListEntry]:
+    """Tables and views of a SQL Server schema with their modify_date as fingerprint"""
+    name_filter, name_params = _name_filter("T.TABLE_NAME", patterns, specific_tables, "?")
+    cursor.execute(f"""
+        SELECT T.TABLE_NAME, T.TABLE_TYPE, CONVERT(VARCHAR(33), O.modify_date, 126)
+        FROM INFORMATION_SCHEMA.TABLES T
+        LEFT JOIN sys.objects O
+            ON O.object_id = OBJECT_ID(QUOTENAME(T.TABLE_SCHEMA) + '.' + QUOTENAME(T.TABLE_NAME))
+        WHERE T.TABLE_SCHEMA = ?
+        AND T.TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+        AND ({name_filter})
+        ORDER BY T.TABLE_NAME
+    """, [schema] + name_params)
+    return _match_specific([(row[0], row[1], row[2]) for row in cursor.fetchall()], specific_tables)
+
+
+def sqlserver_schema_metadata(cursor, schema: str, patterns: List[str],
+                              specific_tables: Optional[List[str]] = None,
+                              table_list: Optional[List[TableListEntry]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract tables, columns, primary and foreign keys of one SQL Server schema.
+
+    Args:
+        cursor: Open pyodbc cursor on the database
+        schema: Schema to read
+        patterns: SQL LIKE patterns for table names
+        specific_tables: Exact table names (overrides patterns)
+        table_list: Tables to extract, from sqlserver_table_list (queried if not given)
+
+    Returns:
+        table_name -> {"columns", "relationships", "nullable", "primary_key", "object_type"}
+    """
+    if table_list is None:
+        table_list = sqlserver_table_list(cursor, schema, patterns, specific_tables)
+
+    tables, lookup = _select_tables((name, object_type) for name, object_type, _ in table_list)
+    if not tables:
+        return tables
+    name_filter, name_params = _detail_filter("TABLE_NAME", list(tables), patterns, "?")
+
+    # All columns of the requested tables in one pass
+    cursor.execute(f"""
+        SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
+               NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = ? AND ({name_filter})
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """, [schema] + name_params)
+    for table_name, col_name, data_type, max_len, precision, scale, is_nullable in cursor.fetchall():
+        table = tables.get(lookup.get(table_name.upper()))
+        if table is None:
+            continue
+
+        # Format data type with size
+        if max_len:
+            data_type = f"{data_type}({max_len})"
+        elif precision and scale:
+            data_type = f"{data_type}({precision},{scale})"
+
+        table["columns"][col_name] = data_type.upper()
+        table["nullable"][col_name] = is_nullable == "YES"
+
+    # Primary keys of the whole schema
+    cursor.execute("""
+        SELECT TC.TABLE_NAME, KCU.COLUMN_NAME
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS TC
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE KCU
+            ON TC.CONSTRAINT_NAME = KCU.CONSTRAINT_NAME
+            AND TC.TABLE_SCHEMA = KCU.TABLE_SCHEMA
+        WHERE TC.TABLE_SCHEMA = ? AND TC.CONSTRAINT_TYPE = 'PRIMARY KEY'
+        ORDER BY TC.TABLE_NAME, KCU.ORDINAL_POSITION
+    """, [schema])
+    for table_name, col_name in cursor.fetchall():
+        table = tables.get(lookup.get(table_name.upper()))
+        if table is not None:
+            table["primary_key"].append(col_name)
+
+    # Foreign keys of the whole schema - only tables have them, not views
+    cursor.execute("""
+        SELECT
+            FK_TAB.TABLE_NAME as FK_Table,
+            FK_COL.COLUMN_NAME as FK_Column,
+            PK_TAB.TABLE_NAME as PK_Table,
+            PK_COL.COLUMN_NAME as PK_Column
+        FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS RC
+        JOIN INFORMATION_SCHEMA.TABLE_CONSTRAINTS FK_TAB
+            ON RC.CONSTRAINT_NAME = FK_TAB.CONSTRAINT_NAME
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE FK_COL
+            ON RC.CONSTRAINT_NAME = FK_COL.CONSTRAINT_NAME
+        JOIN INFORMATION_SCHEMA.TABLE_CONSTRAINTS PK_TAB
+            ON RC.UNIQUE_CONSTRAINT_NAME = PK_TAB.CONSTRAINT_NAME
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE PK_COL
+            ON RC.UNIQUE_CONSTRAINT_NAME = PK_COL.CONSTRAINT_NAME
+            AND FK_COL.ORDINAL_POSITION = PK_COL.ORDINAL_POSITION
+        WHERE FK_TAB.TABLE_SCHEMA = ?
+    """, [schema])
+    for fk_table, fk_col, pk_table, pk_col in cursor.fetchall():
+        table = tables.get(lookup.get(fk_table.upper()))
+        if table is not None and table["object_type"] == "TABLE":
+            table["relationships"][fk_col] = f"{pk_table}.{pk_col}"
+
+    return tables
+
+
+def _show_rows(cursor, query: str) -> List[Dict[str, Any]]:
+    """Rows of a SHOW command keyed by lower-case column name (empty if not permitted)"""
+    try:
+        cursor.execute(query)
+        names = [col[0].lower() for col in cursor.description]
+        return [dict(zip(names, row)) for row in cursor.fetchall()]
+    except Exception as e:
+        logger.warning(f"[BULK_METADATA] {query} failed: {e}")
+        return []
+
+
+def snowflake_table_list(cursor, database: str, schema: str, patterns: List[str],
+                         specific_tables: Optional[List[str]] = None) -> List[TableListEntry]:
+    """Tables and views of a Snowflake schema with their last DDL time as fingerprint"""
+    name_filter, name_params = _name_filter("TABLE_NAME", patterns, specific_tables, "%s", upper=True)
+
+    # LAST_DDL ignores DML; accounts without it fall back to LAST_ALTERED
+    for fingerprint_column in ("LAST_DDL", "LAST_ALTERED"):
+        try:
+            cursor.execute(f"""
+                SELECT TABLE_NAME, TABLE_TYPE, TO_VARCHAR({fingerprint_column})
+                FROM {database.upper()}.INFORMATION_SCHEMA.TABLES
+                WHERE UPPER(TABLE_SCHEMA) = UPPER(%s)
+                AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
+                AND ({name_filter})
+                ORDER BY TABLE_NAME
+            """, [schema] + name_params)
+            break
+        except Exception as e:
+            if fingerprint_column == "LAST_ALTERED":
+                raise
+            logger.info(f"[BULK_METADATA] {fingerprint_column} not available, using LAST_ALTERED: {e}")
+    return _match_specific([(row[0], row[1], row[2]) for row in cursor.fetchall()], specific_tables)
+
+
+def snowflake_schema_metadata(cursor, database: str, schema: str, patterns: List[str],
+                              specific_tables: Optional[List[str]] = None,
+                              table_list: Optional[List[TableListEntry]] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract tables, columns, primary and foreign keys of one Snowflake schema.
+
+    Args:
+        cursor: Open Snowflake cursor
+        database: Database holding the schema
+        schema: Schema to read
+        patterns: SQL LIKE patterns for table names (case-insensitive)
+        specific_tables: Exact table names (overrides patterns)
+        table_list: Tables to extract, from snowflake_table_list (queried if not given)
+
+    Returns:
+        table_name -> {"columns", "relationships", "nullable", "primary_key", "object_type"}
+    """
+    database = database.upper()  # Snowflake uses uppercase
+    if table_list is None:
+        table_list = snowflake_table_list(cursor, database, schema, patterns, specific_tables)
+
+    tables, lookup = _select_tables((name, object_type) for name, object_type, _ in table_list)
+    if not tables:
+        return tables
+    name_filter, name_params = _detail_filter("TABLE_NAME", list(tables), patterns, "%s", upper=True)
+
+    # Replaces one DESCRIBE TABLE per table
+    cursor.execute(f"""
+        SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE, IS_NULLABLE
+        FROM {database}.INFORMATION_SCHEMA.COLUMNS
+        WHERE UPPER(TABLE_SCHEMA) = UPPER(%s) AND ({name_filter})
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+    """, [schema] + name_params)
+    for table_name, col_name, data_type, is_nullable in cursor.fetchall():
+        table = tables.get(lookup.get(table_name.upper()))
+        if table is None:
+            continue
+        data_type = data_type.split("(")[0].upper()  # Remove size info for now
+        table["columns"][col_name] = SNOWFLAKE_TYPE_ALIASES.get(data_type, data_type)
+        table["nullable"][col_name] = is_nullable == "YES"
+
+    scope = f"{database}.{schema.upper()}"
+
+    primary_keys = _show_rows(cursor, f"SHOW PRIMARY KEYS IN SCHEMA {scope}")
+    for row in sorted(primary_keys, key=lambda r: (r.get("table_name", ""), r.get("key_sequence") or 0)):
+        table = tables.get(lookup.get(str(row.get("table_name", "")).upper()))
+        if table is not None:
+            table["primary_key"].append(row["column_name"])
+
+    # Note: Snowflake FK constraints are informational, not enforced
+    for row in _show_rows(cursor, f"SHOW IMPORTED KEYS IN SCHEMA {scope}"):
+        table = tables.get(lookup.get(str(row.get("fk_table_name", "")).upper()))
+        if table is not None and table["object_type"] == "TABLE":
+            table["relationships"][row["fk_column_name"]] = f"{row['pk_table_name']}.{row['pk_column_name']}"
+
+    return tables
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import pyodbc
 import snowflake.connector
 import os
@@ -13,9 +14,13 @@ from alerts.service import alert_service
 logger = logging.getLogger(__name__)
 
 from config.paths import paths
+from mapping.metadata_cache import SNOWFLAKE, SQLSERVER, cached_schema_metadata
 
 router = APIRouter()
 
+# Concurrent schema extractions (each SQL Server / Snowflake schema is one task)
+METADATA_EXTRACT_WORKERS = int(os.getenv("METADATA_EXTRACT_WORKERS", "8"))
+
 
 class DatabaseMappingRequest(BaseModel):
     """Request to map databases and extract metadata"""
@@ -26,6 +31,7 @@ class DatabaseMappingRequest(BaseModel):
     table_patterns: List[str] = ["dim_%", "fact_%"]  # SQL LIKE patterns
     specific_tables: Optional[List[str]] = None  # Override patterns with specific tables
     schema_mappings: Optional[Dict[str, str]] = None  # SQL schema -> Snowflake schema mappings
+    refresh_metadata: bool = False  # Ignore cached metadata and re-extract every table
 
 
 class SchemaMappingUpdate(BaseModel):
@@ -180,25 +186,18 @@ async def extract_and_map_metadata(request: DatabaseMappingRequest):
         all_snow_metadata = {}
         schema_extraction_results = []
 
-        for sql_schema, snow_schema in schema_mappings.items():
-            print(f"[DEBUG] Extracting from SQL Server schema: {sql_schema} -> Snowflake schema: {snow_schema}")
+        # All schemas of both engines are extracted concurrently
+        extracted = extract_schema_pairs(
+            sql_database=request.sql_server_database,
+            snowflake_database=request.snowflake_database,
+            schema_mappings=schema_mappings,
+            patterns=request.table_patterns,
+            specific_tables=request.specific_tables,
+            refresh=request.refresh_metadata
+        )
 
-            # Extract from SQL Server schema
-            sql_metadata = extract_sqlserver_tables(
-                database=request.sql_server_database,
-                schema=sql_schema,
-                patterns=request.table_patterns,
-                specific_tables=request.specific_tables
-            )
+        for sql_schema, snow_schema, sql_metadata, snow_metadata in extracted:
             print(f"[DEBUG] SQL Server extraction found {len(sql_metadata)} tables in {sql_schema}")
-
-            # Extract from Snowflake schema
-            snow_metadata = extract_snowflake_tables(
-                database=request.snowflake_database,
-                schema=snow_schema,
-                patterns=request.table_patterns,
-                specific_tables=request.specific_tables
-            )
             print(f"[DEBUG] Snowflake extraction found {len(snow_metadata)} tables in {snow_schema}")
 
             # Prefix table names with schema to avoid conflicts
@@ -290,7 +289,8 @@ async def extract_and_map_metadata(request: DatabaseMappingRequest):
         raise HTTPException(status_code=500, detail=f"Metadata extraction failed: {str(e)}")
 
 
-def extract_sqlserver_tables(database: str, schema: str, patterns: List[str], specific_tables: Optional[List[str]]) -> Dict:
+def extract_sqlserver_tables(database: str, schema: str, patterns: List[str], specific_tables: Optional[List[str]],
+                             refresh: bool = False) -> Dict:
     """Extract table metadata from SQL Server"""
     conn_str = os.getenv("SQLSERVER_CONN_STR", "")
 
@@ -314,89 +314,17 @@ def extract_sqlserver_tables(database: str, schema: str, patterns: List[str], sp
     conn = pyodbc.connect(conn_str)
     cursor = conn.cursor()
 
-    tables = {}
-
-    # Get tables and views based on patterns or specific list
-    if specific_tables:
-        table_list = [(t, 'TABLE') for t in specific_tables]  # Assume tables if specific list provided
-    else:
-        # Build query with LIKE patterns - include both BASE TABLE and VIEW
-        pattern_conditions = " OR ".join([f"TABLE_NAME LIKE '{p}'" for p in patterns])
-        query = f"""
-            SELECT TABLE_NAME, TABLE_TYPE
-            FROM INFORMATION_SCHEMA.TABLES
-            WHERE TABLE_SCHEMA = '{schema}'
-            AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
-            AND ({pattern_conditions})
-            ORDER BY TABLE_NAME
-        """
-        cursor.execute(query)
-        table_list = [(row[0], row[1]) for row in cursor.fetchall()]
-
-    # Get columns for each table/view
-    for table_name, table_type in table_list:
-        cursor.execute(f"""
-            SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH,
-                   NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE
-            FROM INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = '{schema}' AND TABLE_NAME = '{table_name}'
-            ORDER BY ORDINAL_POSITION
-        """)
-
-        columns = {}
-        for row in cursor.fetchall():
-            col_name = row[0]
-            data_type = row[1]
-            max_len = row[2]
-            precision = row[3]
-            scale = row[4]
-
-            # Format data type with size
-            if max_len:
-                data_type = f"{data_type}({max_len})"
-            elif precision and scale:
-                data_type = f"{data_type}({precision},{scale})"
-
-            columns[col_name] = data_type.upper()
-
-        # Get foreign keys - only for tables, not views
-        relationships = {}
-        if table_type == 'BASE TABLE':
-            cursor.execute(f"""
-                SELECT
-                    FK_COL.COLUMN_NAME as FK_Column,
-                    PK_TAB.TABLE_NAME as PK_Table,
-                    PK_COL.COLUMN_NAME as PK_Column
-                FROM INFORMATION_SCHEMA.REFERENTIAL_CONSTRAINTS RC
-                JOIN INFORMATION_SCHEMA.TABLE_CONSTRAINTS FK_TAB
-                    ON RC.CONSTRAINT_NAME = FK_TAB.CONSTRAINT_NAME
-                JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE FK_COL
-                    ON RC.CONSTRAINT_NAME = FK_COL.CONSTRAINT_NAME
-                JOIN INFORMATION_SCHEMA.TABLE_CONSTRAINTS PK_TAB
-                    ON RC.UNIQUE_CONSTRAINT_NAME = PK_TAB.CONSTRAINT_NAME
-                JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE PK_COL
-                    ON RC.UNIQUE_CONSTRAINT_NAME = PK_COL.CONSTRAINT_NAME
-                WHERE FK_TAB.TABLE_SCHEMA = '{schema}'
-                AND FK_TAB.TABLE_NAME = '{table_name}'
-            """)
-
-            for row in cursor.fetchall():
-                fk_col, pk_table, pk_col = row
-                relationships[fk_col] = f"{pk_table}.{pk_col}"
-
-        tables[table_name] = {
-            "columns": columns,
-            "relationships": relationships,
-            "object_type": "VIEW" if table_type == 'VIEW' else "TABLE"
-        }
-
-    cursor.close()
-    conn.close()
-
-    return tables
+    try:
+        # Set-based catalog queries for tables changed since the last extraction
+        return cached_schema_metadata(SQLSERVER, cursor, database, schema, patterns, specific_tables,
+                                      refresh=refresh)
+    finally:
+        cursor.close()
+        conn.close()
 
 
-def extract_snowflake_tables(database: str, schema: str, patterns: List[str], specific_tables: Optional[List[str]]) -> Dict:
+def extract_snowflake_tables(database: str, schema: str, patterns: List[str], specific_tables: Optional[List[str]],
+                             refresh: bool = False) -> Dict:
     """Extract table metadata from Snowflake"""
     try:
         from ombudsman.core.connections import get_snow_conn
@@ -428,51 +356,14 @@ def extract_snowflake_tables(database: str, schema: str, patterns: List[str], sp
         else:
             cfg["snowflake"]["password"] = password
 
-        tables = {}
-
         with get_snow_conn(cfg) as conn:
             cursor = conn.cursor()
-
-            # Get tables and views based on patterns or specific list
-            if specific_tables:
-                table_list = [(t, 'TABLE') for t in specific_tables]  # Assume tables if specific list provided
-            else:
-                # Build query with LIKE patterns (case-insensitive using UPPER) - include both BASE TABLE and VIEW
-                pattern_conditions = " OR ".join([f"UPPER(TABLE_NAME) LIKE UPPER('{p}')" for p in patterns])
-                query = f"""
-                    SELECT TABLE_NAME, TABLE_TYPE
-                    FROM {database.upper()}.INFORMATION_SCHEMA.TABLES
-                    WHERE UPPER(TABLE_SCHEMA) = UPPER('{schema}')
-                    AND TABLE_TYPE IN ('BASE TABLE', 'VIEW')
-                    AND ({pattern_conditions})
-                    ORDER BY TABLE_NAME
-                """
-                print(f"[DEBUG] Snowflake query: {query}")
-                cursor.execute(query)
-                table_list = [(row[0], row[1]) for row in cursor.fetchall()]
-                print(f"[DEBUG] Snowflake found {len(table_list)} objects in {schema}: {table_list[:5]}")
-
-            # Get columns for each table/view
-            for table_name, table_type in table_list:
-                cursor.execute(f"DESCRIBE TABLE {database.upper()}.{schema.upper()}.{table_name}")
-
-                columns = {}
-                for row in cursor.fetchall():
-                    col_name = row[0]
-                    data_type = row[1].split("(")[0].upper()  # Remove size info for now
-                    columns[col_name] = data_type
-
-                # Get foreign keys (if any) - only for tables, not views
-                # Note: Snowflake FK constraints might not be enforced
-                relationships = {}
-
-                tables[table_name] = {
-                    "columns": columns,
-                    "relationships": relationships,
-                    "object_type": "VIEW" if table_type == 'VIEW' else "TABLE"
-                }
-
-            cursor.close()
+            try:
+                # Set-based catalog queries for tables changed since the last extraction
+                tables = cached_schema_metadata(SNOWFLAKE, cursor, database, schema, patterns, specific_tables,
+                                                refresh=refresh)
+            finally:
+                cursor.close()
 
         print(f"[DEBUG] Snowflake extraction complete: {len(tables)} tables extracted from {schema}")
         return tables
@@ -484,6 +375,47 @@ def extract_snowflake_tables(database: str, schema: str, patterns: List[str], sp
         return {}
 
 
+def extract_schema_pairs(
+    sql_database: str,
+    snowflake_database: str,
+    schema_mappings: Dict[str, str],
+    patterns: List[str],
+    specific_tables: Optional[List[str]] = None,
+    refresh: bool = False
+) -> List[Tuple[str, str, Dict, Dict]]:
+    """
+    Extract every mapped schema pair, SQL Server and Snowflake side concurrently.
+
+    Each schema of each engine is one task on a thread pool
+    (METADATA_EXTRACT_WORKERS threads), with its own connection. Tables
+    whose schema fingerprint is unchanged come from the metadata cache
+    unless refresh is set.
+
+    Returns:
+        (sql_schema, snowflake_schema, sql_metadata, snowflake_metadata) per
+        mapping, in the order of schema_mappings
+    """
+    pairs = list(schema_mappings.items())
+    if not pairs:
+        return []
+
+    workers = min(METADATA_EXTRACT_WORKERS, 2 * len(pairs))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="metadata") as pool:
+        futures = [
+            (
+                sql_schema,
+                snow_schema,
+                pool.submit(extract_sqlserver_tables, sql_database, sql_schema, patterns, specific_tables, refresh),
+                pool.submit(extract_snowflake_tables, snowflake_database, snow_schema, patterns, specific_tables, refresh)
+            )
+            for sql_schema, snow_schema in pairs
+        ]
+        return [
+            (sql_schema, snow_schema, sql_future.result(), snow_future.result())
+            for sql_schema, snow_schema, sql_future, snow_future in futures
+        ]
+
+
 def create_table_mappings(sql_metadata: Dict, snow_metadata: Dict, schema_mappings: Dict[str, str] = None) -> List[TableMapping]:
     """Create mappings between SQL Server and Snowflake tables with column-level mappings using schema mappings"""
     mappings = []
@@ -0,0 +1,225 @@
+"""
+Schema Metadata Cache
+
+Keeps extracted table metadata between extractions and pipeline runs:
+- Persistent SQLite cache of per-table metadata keyed by
+  (engine, database, schema, table) with the table's schema fingerprint
+  (SQL Server modify_date, Snowflake LAST_DDL)
+- Incremental extraction: one cheap table list query per schema, and only
+  tables whose fingerprint changed are read from the catalog again
+- In-process cache of parsed YAML files (tables.yaml), re-parsed only when
+  the file changes on disk
+"""
+
+import copy
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from config.paths import paths
+from mapping.bulk_metadata import (
+    TableListEntry,
+    snowflake_schema_metadata,
+    snowflake_table_list,
+    sqlserver_schema_metadata,
+    sqlserver_table_list,
+)
+
+logger = logging.getLogger(__name__)
+
+SQLSERVER = "sqlserver"
+SNOWFLAKE = "snowflake"
+
+
+class MetadataCache:
+    """SQLite store of extracted table metadata with schema fingerprints"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._create_tables()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _create_tables(self):
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS table_metadata (
+                    engine TEXT NOT NULL,
+                    database_name TEXT NOT NULL,
+                    schema_name TEXT NOT NULL,
+                    table_name TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    metadata TEXT NOT NULL,
+                    extracted_at TEXT NOT NULL,
+                    PRIMARY KEY (engine, database_name, schema_name, table_name)
+                )
+            """)
+
+    def fingerprints(self, engine: str, database: str, schema: str) -> Dict[str, str]:
+        """table_name -> fingerprint of every cached table of a schema"""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT table_name, fingerprint FROM table_metadata "
+                "WHERE engine = ? AND database_name = ? AND schema_name = ?",
+                (engine, database.upper(), schema.upper())
+            ).fetchall()
+        return {row["table_name"]: row["fingerprint"] for row in rows}
+
+    def load(self, engine: str, database: str, schema: str, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Cached metadata of the given tables (missing ones are left out)"""
+        if not table_names:
+            return {}
+        wanted = set(table_names)
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT table_name, metadata FROM table_metadata "
+                "WHERE engine = ? AND database_name = ? AND schema_name = ?",
+                (engine, database.upper(), schema.upper())
+            ).fetchall()
+        return {
+            row["table_name"]: json.loads(row["metadata"])
+            for row in rows if row["table_name"] in wanted
+        }
+
+    def store(self, engine: str, database: str, schema: str, entries: Dict[str, Tuple[str, Dict[str, Any]]]):
+        """Save table_name -> (fingerprint, metadata) entries"""
+        if not entries:
+            return
+        now = datetime.utcnow().isoformat()
+        with self._lock, self._get_connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO table_metadata "
+                "(engine, database_name, schema_name, table_name, fingerprint, metadata, extracted_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (engine, database.upper(), schema.upper(), table_name, fingerprint, json.dumps(metadata), now)
+                    for table_name, (fingerprint, metadata) in entries.items()
+                ]
+            )
+
+
+_metadata_cache: Optional[MetadataCache] = None
+_metadata_cache_lock = threading.Lock()
+
+
+def get_metadata_cache() -> MetadataCache:
+    """Get the metadata cache singleton"""
+    global _metadata_cache
+    if _metadata_cache is None:
+        with _metadata_cache_lock:
+            if _metadata_cache is None:
+                _metadata_cache = MetadataCache(paths.metadata_cache_file)
+    return _metadata_cache
+
+
+def cached_schema_metadata(
+    engine: str,
+    cursor,
+    database: str,
+    schema: str,
+    patterns: List[str],
+    specific_tables: Optional[List[str]] = None,
+    cache: Optional[MetadataCache] = None,
+    refresh: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Extract a schema's metadata, reusing cached tables whose fingerprint is unchanged.
+
+    Args:
+        engine: SQLSERVER or SNOWFLAKE
+        cursor: Open cursor on the engine
+        database: Database holding the schema
+        schema: Schema to read
+        patterns: SQL LIKE patterns for table names
+        specific_tables: Exact table names (overrides patterns)
+        cache: Cache to use (defaults to the shared one)
+        refresh: Re-extract every table regardless of fingerprints
+
+    Returns:
+        table_name -> metadata, in table list order
+    """
+    cache = cache or get_metadata_cache()
+
+    if engine == SNOWFLAKE:
+        table_list = snowflake_table_list(cursor, database, schema, patterns, specific_tables)
+    else:
+        table_list = sqlserver_table_list(cursor, schema, patterns, specific_tables)
+
+    cached_fingerprints = {} if refresh else cache.fingerprints(engine, database, schema)
+    unchanged = [
+        name for name, _, fingerprint in table_list
+        if fingerprint is not None and cached_fingerprints.get(name) == fingerprint
+    ]
+    tables = cache.load(engine, database, schema, unchanged)
+    # Anything not served from the cache is extracted again
+    changed: List[TableListEntry] = [entry for entry in table_list if entry[0] not in tables]
+
+    if changed:
+        if engine == SNOWFLAKE:
+            extracted = snowflake_schema_metadata(cursor, database, schema, patterns, specific_tables, changed)
+        else:
+            extracted = sqlserver_schema_metadata(cursor, schema, patterns, specific_tables, changed)
+        tables.update(extracted)
+        cache.store(engine, database, schema, {
+            name: (fingerprint, extracted[name])
+            for name, _, fingerprint in changed
+            if fingerprint is not None and name in extracted
+        })
+
+    logger.info(
+        f"[METADATA_CACHE] {engine} {database}.{schema}: {len(table_list) - len(changed)} cached, "
+        f"{len(changed)} extracted"
+    )
+    return {name: tables[name] for name, _, _ in table_list if name in tables}
+
+
+_yaml_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def load_yaml_cached(path: str) -> Any:
+    """
+    Parse a YAML file once per version on disk.
+
+    The parsed document is shared between callers; copy it before mutating.
+    """
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+
+    with open(path, "r") as f:
+        data = yaml.safe_load(f)
+
+    with _yaml_cache_lock:
+        _yaml_cache[path] = (version, data)
+    return data
+
+
+def load_tables_metadata(config_dir: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Table metadata of a project's tables.yaml, SQL Server and Snowflake merged.
+
+    Returns a copy the caller may modify; empty if the file does not exist.
+    """
+    tables_file = os.path.join(config_dir, "tables.yaml")
+    if not os.path.exists(tables_file):
+        return {}
+
+    tables_yaml = load_yaml_cached(tables_file) or {}
+    merged = {**(tables_yaml.get("snow") or {}), **(tables_yaml.get("sql") or {})}
+    return copy.deepcopy(merged)
@@ -5,6 +5,7 @@ This module provides machine learning enhanced column mapping with:
 - ML-based similarity scoring using multiple algorithms
 - Pattern recognition and learning from historical mappings
 - Confidence scoring with ensemble models
+- Candidate blocking and optimal one-to-one assignment for wide tables
 - Auto-learning from user corrections
 - Support for complex transformations and business rules
 """
@@ -18,12 +19,27 @@ from typing import Dict, List, Tuple, Optional, Any
 from datetime import datetime
 from difflib import SequenceMatcher
 from collections import defaultdict, Counter
+import heapq
 import numpy as np
+from scipy.optimize import linear_sum_assignment
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from config.paths import paths
 
+# Target columns scored per source column; smaller tables are scored exhaustively
+CANDIDATES_PER_SOURCE = int(os.getenv("MAPPING_CANDIDATES_PER_SOURCE", "25"))
+
+# Minimum ensemble score for a suggestion
+MATCH_THRESHOLD = 0.5
+
+# Type keywords per category (matched as substrings of the lowercase type)
+TYPE_CATEGORIES = {
+    "numeric": ["int", "integer", "bigint", "smallint", "decimal", "numeric", "float", "double", "number"],
+    "string": ["char", "varchar", "nvarchar", "text", "string"],
+    "datetime": ["date", "time", "datetime", "timestamp"],
+}
+
 
 @dataclass
 class MappingPattern:
@@ -115,28 +131,27 @@ class IntelligentMapper:
         """
         suggestions = []
         unmatched_source = []
-        unmatched_target = list(target_columns)
+
+        source_names = [self._get_column_name(col) for col in source_columns]
+        source_types = [self._get_column_type(col) for col in source_columns]
+        target_names = [self._get_column_name(col) for col in target_columns]
+        target_types = [self._get_column_type(col) for col in target_columns]
 
         # Track algorithm performance
         algorithm_stats = defaultdict(list)
 
-        for source_col in source_columns:
-            source_name = self._get_column_name(source_col)
-            source_type = self._get_column_type(source_col)
-
-            # Find best matches using multiple algorithms
-            candidates = []
-
-            for target_col in target_columns:
-                target_name = self._get_column_name(target_col)
-                target_type = self._get_column_type(target_col)
-
-                # Calculate scores using different algorithms
+        # Score each source column against its plausible targets only
+        eligible = {}
+        pairs_scored = 0
+        candidate_lists = self._candidate_targets(source_names, source_types, target_names, target_types)
+        for i, candidates in enumerate(candidate_lists):
+            for j in candidates:
                 scores = self._calculate_all_scores(
-                    source_name, target_name,
-                    source_type, target_type,
+                    source_names[i], target_names[j],
+                    source_types[i], target_types[j],
                     context
                 )
+                pairs_scored += 1
 
                 # Track algorithm performance
                 for algo, score in scores.items():
@@ -144,51 +159,44 @@ class IntelligentMapper:
 
                 # Ensemble scoring (weighted average)
                 final_score = self._ensemble_score(scores)
+                if final_score >= MATCH_THRESHOLD:
+                    eligible[(i, j)] = (final_score, scores)
 
-                # Generate reasoning
-                reasoning = self._generate_reasoning(scores, source_name, target_name)
-
-                candidates.append({
-                    "target": target_col,
-                    "target_name": target_name,
-                    "score": final_score,
-                    "scores": scores,
-                    "reasoning": reasoning
-                })
-
-            # Sort by score
-            candidates.sort(key=lambda x: x["score"], reverse=True)
-
-            # Accept best match if above threshold
-            best = candidates[0] if candidates else None
-
-            if best and best["score"] >= 0.5:
-                # Check for learned patterns
-                pattern_match = self._find_pattern_match(source_name, best["target_name"])
-                is_learned = pattern_match is not None
-
-                # Boost confidence if learned pattern exists
-                if is_learned:
-                    best["score"] = min(1.0, best["score"] * 1.2)
-                    best["reasoning"].append(f"Matches learned pattern: {pattern_match}")
-
-                suggestion = MappingSuggestion(
-                    source_column=source_name,
-                    target_column=best["target_name"],
-                    confidence=round(best["score"] * 100, 2),
-                    reasoning=best["reasoning"],
-                    algorithms_used=list(best["scores"].keys()),
-                    pattern_match=pattern_match,
-                    is_learned=is_learned
-                )
-
-                suggestions.append(asdict(suggestion))
+        # Each target is suggested for at most one source
+        assignment = self._assign_one_to_one({pair: score for pair, (score, _) in eligible.items()})
 
-                # Remove from unmatched
-                if best["target"] in unmatched_target:
-                    unmatched_target.remove(best["target"])
-            else:
+        for i, source_name in enumerate(source_names):
+            if i not in assignment:
                 unmatched_source.append(source_name)
+                continue
+
+            target_name = target_names[assignment[i]]
+            score, scores = eligible[(i, assignment[i])]
+            reasoning = self._generate_reasoning(scores, source_name, target_name)
+
+            # Check for learned patterns
+            pattern_match = self._find_pattern_match(source_name, target_name)
+            is_learned = pattern_match is not None
+
+            # Boost confidence if learned pattern exists
+            if is_learned:
+                score = min(1.0, score * 1.2)
+                reasoning.append(f"Matches learned pattern: {pattern_match}")
+
+            suggestion = MappingSuggestion(
+                source_column=source_name,
+                target_column=target_name,
+                confidence=round(score * 100, 2),
+                reasoning=reasoning,
+                algorithms_used=list(scores.keys()),
+                pattern_match=pattern_match,
+                is_learned=is_learned
+            )
+
+            suggestions.append(asdict(suggestion))
+
+        matched_targets = set(assignment.values())
+        unmatched_target = [target_columns[j] for j in range(len(target_columns)) if j not in matched_targets]
 
         # Generate statistics
         stats = self._generate_statistics(
@@ -197,6 +205,7 @@ class IntelligentMapper:
             len(suggestions),
             algorithm_stats
         )
+        stats["candidate_pairs_scored"] = pairs_scored
 
         return {
             "suggestions": suggestions,
@@ -339,6 +348,99 @@ class IntelligentMapper:
 
     # ==================== Private Methods ====================
 
+    def _candidate_targets(
+        self,
+        source_names: List[str],
+        source_types: List[Optional[str]],
+        target_names: List[str],
+        target_types: List[Optional[str]]
+    ) -> List[List[int]]:
+        """
+        Indexes of the targets worth scoring for each source column.
+
+        Targets are found through an inverted index of name tokens, semantic
+        token groups and character trigrams, ranked by shared keys (tokens
+        count double) with a bonus for the same type category, and cut to
+        CANDIDATES_PER_SOURCE. Targets sharing no key with a source cannot
+        reach MATCH_THRESHOLD and are never scored.
+        """
+        if len(target_names) <= CANDIDATES_PER_SOURCE:
+            return [list(range(len(target_names))) for _ in source_names]
+
+        index = defaultdict(list)
+        for j, target_name in enumerate(target_names):
+            for key in self._blocking_keys(target_name):
+                index[key].append(j)
+        target_categories = [self._type_category(t) for t in target_types]
+
+        candidate_lists = []
+        for source_name, source_type in zip(source_names, source_types):
+            overlap = Counter()
+            for key in self._blocking_keys(source_name):
+                weight = 1 if key.startswith("g:") else 2
+                for j in index.get(key, ()):
+                    overlap[j] += weight
+
+            category = self._type_category(source_type)
+            if category:
+                for j in overlap:
+                    if target_categories[j] == category:
+                        overlap[j] += 1
+
+            candidate_lists.append(
+                heapq.nlargest(CANDIDATES_PER_SOURCE, overlap, key=lambda j: (overlap[j], -j))
+            )
+        return candidate_lists
+
+    def _blocking_keys(self, column_name: str) -> set:
+        """Name tokens, semantic token groups and trigrams of a column name."""
+        words = re.findall(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+', column_name)
+        tokens = {word.lower() for word in words}
+
+        keys = {f"t:{token}" for token in tokens}
+        for group, synonyms in self.semantic_tokens.items():
+            if group in tokens or tokens.intersection(synonyms):
+                keys.add(f"s:{group}")
+
+        normalized = self._normalize_name(column_name)
+        keys.update(f"g:{normalized[i:i + 3]}" for i in range(max(1, len(normalized) - 2)))
+        return keys
+
+    def _type_category(self, data_type: Optional[str]) -> Optional[str]:
+        """Coarse type bucket (numeric, string, datetime) used for blocking."""
+        if not data_type:
+            return None
+        data_type = data_type.lower().split('(')[0].strip()
+        for category, keywords in TYPE_CATEGORIES.items():
+            if any(t in data_type for t in keywords):
+                return category
+        return None
+
+    def _assign_one_to_one(self, eligible: Dict[Tuple[int, int], float]) -> Dict[int, int]:
+        """
+        Source -> target assignment maximizing the total score (Hungarian algorithm).
+
+        Args:
+            eligible: (source_index, target_index) -> score of pairs above threshold
+
+        Returns:
+            source_index -> target_index for every assigned source
+        """
+        if not eligible:
+            return {}
+
+        rows = sorted({i for i, _ in eligible})
+        cols = sorted({j for _, j in eligible})
+        row_pos = {i: r for r, i in enumerate(rows)}
+        col_pos = {j: c for c, j in enumerate(cols)}
+
+        weights = np.zeros((len(rows), len(cols)))
+        for (i, j), score in eligible.items():
+            weights[row_pos[i], col_pos[j]] = score
+
+        row_ind, col_ind = linear_sum_assignment(weights, maximize=True)
+        return {rows[r]: cols[c] for r, c in zip(row_ind, col_ind) if weights[r, c] > 0}
+
     def _calculate_all_scores(
         self,
         source_name: str,
@@ -592,9 +694,9 @@ class IntelligentMapper:
 
     def _same_category(self, type1: str, type2: str) -> bool:
         """Check if types are in same category."""
-        numeric = ["int", "integer", "bigint", "smallint", "decimal", "numeric", "float", "double", "number"]
-        string = ["char", "varchar", "nvarchar", "text", "string"]
-        datetime = ["date", "time", "datetime", "timestamp"]
+        numeric = TYPE_CATEGORIES["numeric"]
+        string = TYPE_CATEGORIES["string"]
+        datetime = TYPE_CATEGORIES["datetime"]
 
         t1_numeric = any(t in type1 for t in numeric)
         t2_numeric = any(t in type2 for t in numeric)
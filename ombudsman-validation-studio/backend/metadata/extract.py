@@ -219,6 +219,8 @@ class InferRelationshipsRequest(BaseModel):
     use_existing_mappings: bool = True  # Load from YAML files
     source_database: str = "sql"  # "sql" or "snow"
     target_database: str = "snow"  # "sql" or "snow"
+    use_data_sketches: bool = False  # Also infer from value containment (queries the source database)
+    sketch_size: int = 256  # Distinct values sketched per column
 
 
 @router.post("/infer-relationships")
@@ -294,7 +296,20 @@ def infer_relationships(request: InferRelationshipsRequest):
 
         # Create inferrer and run inference
         inferrer = RelationshipInferrer()
-        inferred = inferrer.infer_all_relationships(metadata)
+        sketches = None
+        if request.use_data_sketches:
+            use_snowflake = request.source_database == "snow"
+            conn, snow_conn_context = _open_source_connection(use_snowflake)
+            try:
+                inferrer = RelationshipInferrer(
+                    sql_conn=conn if not use_snowflake else None,
+                    snow_conn=conn if use_snowflake else None
+                )
+                sketches = inferrer.collect_sketches(metadata, use_snowflake, request.sketch_size)
+            finally:
+                _close_source_connection(conn, snow_conn_context)
+            print(f"[INFER] Sketched {len(sketches)} key columns")
+        inferred = inferrer.infer_all_relationships(metadata, sketches)
 
         # Calculate metrics
         total_relationships = len(inferred)
@@ -342,6 +357,72 @@ def infer_relationships(request: InferRelationshipsRequest):
         raise HTTPException(status_code=500, detail=f"Relationship inference failed: {str(e)}")
 
 
+def _open_source_connection(use_snowflake: bool):
+    """
+    Open a connection to SQL Server or Snowflake from environment settings.
+
+    Returns:
+        (connection, snowflake context manager or None); close with _close_source_connection
+    """
+    conn = None
+    snow_conn_context = None
+    if use_snowflake:
+        from ombudsman.core.connections import get_snow_conn
+
+        # Build config with OAuth/token/password support
+        oauth_client_id = os.getenv('SNOWFLAKE_OAUTH_CLIENT_ID', '')
+        oauth_refresh_token = os.getenv('SNOWFLAKE_OAUTH_REFRESH_TOKEN', '')
+        token = os.getenv('SNOWFLAKE_TOKEN', '')
+        password = os.getenv('SNOWFLAKE_PASSWORD', '')
+
+        cfg = {
+            "snowflake": {
+                "user": os.getenv('SNOWFLAKE_USER', ''),
+                "account": os.getenv('SNOWFLAKE_ACCOUNT', ''),
+                "warehouse": os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH'),
+                "database": os.getenv('SNOWFLAKE_DATABASE', 'SAMPLEDW'),
+                "schema": os.getenv('SNOWFLAKE_SCHEMA', 'PUBLIC'),
+                "role": os.getenv('SNOWFLAKE_ROLE', '')
+            }
+        }
+
+        # Add auth method (OAuth > token > password)
+        if oauth_client_id and oauth_refresh_token:
+            cfg["snowflake"]["oauth_client_id"] = oauth_client_id
+            cfg["snowflake"]["oauth_client_secret"] = os.getenv('SNOWFLAKE_OAUTH_CLIENT_SECRET', '')
+            cfg["snowflake"]["oauth_refresh_token"] = oauth_refresh_token
+        elif token:
+            cfg["snowflake"]["token"] = token
+        else:
+            cfg["snowflake"]["password"] = password
+
+        snow_conn_context = get_snow_conn(cfg)
+        conn = snow_conn_context.__enter__()
+    else:
+        import pyodbc
+
+        conn_str = os.getenv("SQLSERVER_CONN_STR", "")
+        if not conn_str:
+            conn_str = (
+                f"DRIVER={{ODBC Driver 18 for SQL Server}};"
+                f"SERVER={os.getenv('MSSQL_HOST', 'localhost')},{os.getenv('MSSQL_PORT', '1433')};"
+                f"DATABASE={os.getenv('MSSQL_DATABASE', 'SampleDW')};"
+                f"UID={os.getenv('MSSQL_USER', 'sa')};"
+                f"PWD={os.getenv('MSSQL_PASSWORD', '')};"
+                f"TrustServerCertificate=yes;"
+            )
+        conn = pyodbc.connect(conn_str)
+
+    return conn, snow_conn_context
+
+
+def _close_source_connection(conn, snow_conn_context):
+    if snow_conn_context:
+        snow_conn_context.__exit__(None, None, None)
+    elif conn:
+        conn.close()
+
+
 class ValidateRelationshipRequest(BaseModel):
     """Request to validate a specific relationship"""
     fact_table: str
@@ -360,55 +441,8 @@ def validate_relationship(request: ValidateRelationshipRequest):
     """
     try:
         from ombudsman.core.relationship_inferrer import RelationshipInferrer
-        import pyodbc
-
-        # Create database connection
-        conn = None
-        snow_conn_context = None
-        if request.use_snowflake:
-            from ombudsman.core.connections import get_snow_conn
-
-            # Build config with OAuth/token/password support
-            oauth_client_id = os.getenv('SNOWFLAKE_OAUTH_CLIENT_ID', '')
-            oauth_refresh_token = os.getenv('SNOWFLAKE_OAUTH_REFRESH_TOKEN', '')
-            token = os.getenv('SNOWFLAKE_TOKEN', '')
-            password = os.getenv('SNOWFLAKE_PASSWORD', '')
 
-            cfg = {
-                "snowflake": {
-                    "user": os.getenv('SNOWFLAKE_USER', ''),
-                    "account": os.getenv('SNOWFLAKE_ACCOUNT', ''),
-                    "warehouse": os.getenv('SNOWFLAKE_WAREHOUSE', 'COMPUTE_WH'),
-                    "database": os.getenv('SNOWFLAKE_DATABASE', 'SAMPLEDW'),
-                    "schema": os.getenv('SNOWFLAKE_SCHEMA', 'PUBLIC'),
-                    "role": os.getenv('SNOWFLAKE_ROLE', '')
-                }
-            }
-
-            # Add auth method (OAuth > token > password)
-            if oauth_client_id and oauth_refresh_token:
-                cfg["snowflake"]["oauth_client_id"] = oauth_client_id
-                cfg["snowflake"]["oauth_client_secret"] = os.getenv('SNOWFLAKE_OAUTH_CLIENT_SECRET', '')
-                cfg["snowflake"]["oauth_refresh_token"] = oauth_refresh_token
-            elif token:
-                cfg["snowflake"]["token"] = token
-            else:
-                cfg["snowflake"]["password"] = password
-
-            snow_conn_context = get_snow_conn(cfg)
-            conn = snow_conn_context.__enter__()
-        else:
-            conn_str = os.getenv("SQLSERVER_CONN_STR", "")
-            if not conn_str:
-                conn_str = (
-                    f"DRIVER={{ODBC Driver 18 for SQL Server}};"
-                    f"SERVER={os.getenv('MSSQL_HOST', 'localhost')},{os.getenv('MSSQL_PORT', '1433')};"
-                    f"DATABASE={os.getenv('MSSQL_DATABASE', 'SampleDW')};"
-                    f"UID={os.getenv('MSSQL_USER', 'sa')};"
-                    f"PWD={os.getenv('MSSQL_PASSWORD', '')};"
-                    f"TrustServerCertificate=yes;"
-                )
-            conn = pyodbc.connect(conn_str)
+        conn, snow_conn_context = _open_source_connection(request.use_snowflake)
 
         # Create inferrer with connection
         inferrer = RelationshipInferrer(
@@ -427,10 +461,7 @@ def validate_relationship(request: ValidateRelationshipRequest):
         )
 
         # Close connection
-        if snow_conn_context:
-            snow_conn_context.__exit__(None, None, None)
-        elif conn:
-            conn.close()
+        _close_source_connection(conn, snow_conn_context)
 
         return {
             "status": "success",
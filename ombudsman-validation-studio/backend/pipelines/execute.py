@@ -7,11 +7,12 @@ import logging
 import asyncio
 from datetime import datetime, date
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from concurrent.futures import ThreadPoolExecutor
 
 from config.paths import paths
-from pipelines.parallel_executor import ParallelStepExecutor
+from pipelines.parallel_executor import ParallelStepExecutor, StepTimingHistory
+from execution.result_store import load_run_file, remove_run_file, write_run_file
 from errors import (
     InvalidPipelineConfigError,
     PipelineNotFoundError,
@@ -53,11 +54,10 @@ def load_existing_runs():
         if filename.endswith('.json'):
             try:
                 filepath = os.path.join(RESULTS_DIR, filename)
-                with open(filepath, 'r') as f:
-                    run_data = json.load(f)
-                    run_id = run_data.get('run_id')
-                    if run_id:
-                        pipeline_runs[run_id] = run_data
+                run_data = load_run_file(filepath)
+                run_id = run_data.get('run_id')
+                if run_id:
+                    pipeline_runs[run_id] = run_data
             except Exception as e:
                 print(f"Failed to load {filename}: {e}")
 
@@ -302,24 +302,7 @@ async def execute_pipeline(
                 details={"pipeline_yaml": request.pipeline_yaml[:500]}  # First 500 chars for context
             )
 
-        # Generate run ID
-        run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-        # Initialize run status
-        pipeline_runs[run_id] = {
-            "run_id": run_id,
-            "pipeline_name": request.pipeline_name,
-            "project_id": request.project_id,
-            "batch_id": request.batch_id,
-            "status": "pending",
-            "started_at": datetime.now().isoformat(),
-            "completed_at": None,
-            "results": [],
-            "pipeline_def": pipeline_def,
-            "current_step": 0,
-            "total_steps": len(pipeline_def.get("pipeline", pipeline_def).get("steps", [])),
-            "current_step_name": None
-        }
+        run_id = create_pipeline_run(pipeline_def, request.pipeline_name, request.project_id, request.batch_id)
 
         # Execute in background using asyncio task (not BackgroundTasks which doesn't work well with async)
         asyncio.create_task(run_pipeline_async(run_id, pipeline_def, request.pipeline_name, request.project_id, request.batch_id))
@@ -345,6 +328,74 @@ async def execute_pipeline(
         )
 
 
+def create_pipeline_run(pipeline_def: dict, pipeline_name: str, project_id: Optional[str] = None,
+                        batch_id: Optional[str] = None) -> str:
+    """Register a pending run in pipeline_runs and return its run_id"""
+    # Run IDs have one-second resolution; batches can start several per second
+    run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    suffix = 1
+    while run_id in pipeline_runs:
+        suffix += 1
+        run_id = f"run_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{suffix}"
+
+    pipeline_runs[run_id] = {
+        "run_id": run_id,
+        "pipeline_name": pipeline_name,
+        "project_id": project_id,
+        "batch_id": batch_id,
+        "status": "pending",
+        "started_at": datetime.now().isoformat(),
+        "completed_at": None,
+        "results": [],
+        "pipeline_def": pipeline_def,
+        "current_step": 0,
+        "total_steps": len(pipeline_def.get("pipeline", pipeline_def).get("steps", [])),
+        "current_step_name": None
+    }
+    return run_id
+
+
+def execute_pipeline_in_process(pipeline_def: dict, pipeline_name: str, project_id: Optional[str] = None,
+                                batch_id: Optional[str] = None,
+                                on_step_complete: Optional[Callable[[str, int, dict], None]] = None,
+                                loop: Optional[asyncio.AbstractEventLoop] = None) -> dict:
+    """
+    Run a pipeline from a worker thread and block until it finishes.
+
+    Used by the batch executor instead of POSTing to /pipelines/execute and
+    polling /pipelines/status. The run is registered in pipeline_runs like
+    any other, so the status endpoint and result files behave the same.
+
+    Args:
+        pipeline_def: Parsed pipeline YAML
+        pipeline_name: Run name
+        project_id: Optional project ID
+        batch_id: Optional batch job ID
+        on_step_complete: Called with (step_name, step_index, result) as
+                          each step finishes
+        loop: Server event loop to run on (so WebSocket events reach
+              clients); a private loop is used if None or not running
+
+    Returns:
+        The final pipeline_runs entry
+    """
+    is_valid, error_msg = validate_pipeline_config(pipeline_def)
+    if not is_valid:
+        raise InvalidPipelineConfigError(message=error_msg)
+
+    run_id = create_pipeline_run(pipeline_def, pipeline_name, project_id, batch_id)
+    coro = run_pipeline_async(run_id, pipeline_def, pipeline_name, project_id, batch_id,
+                              on_step_complete=on_step_complete)
+
+    if loop is not None and loop.is_running():
+        # No timeout: completion is signalled by the future, however long the run takes
+        asyncio.run_coroutine_threadsafe(coro, loop).result()
+    else:
+        asyncio.run(coro)
+
+    return pipeline_runs[run_id]
+
+
 def run_pipeline_background(run_id: str, pipeline_def: dict, pipeline_name: str):
     """Sync wrapper to run async pipeline execution in background"""
     logger.info(f"[BACKGROUND] Starting pipeline execution wrapper for run_id: {run_id}")
@@ -362,8 +413,116 @@ def run_pipeline_background(run_id: str, pipeline_def: dict, pipeline_name: str)
         logger.error(f"[BACKGROUND] Traceback:\n{error_details}")
 
 
-async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str, project_id: Optional[str] = None, batch_id: Optional[str] = None):
-    """Execute pipeline asynchronously"""
+def _notify_step_complete(callback, step_name: str, step_index: int, result: dict):
+    """Invoke an on_step_complete callback without letting it break the run"""
+    if not callback:
+        return
+    try:
+        callback(step_name, step_index, result)
+    except Exception as e:
+        logger.warning(f"[PIPELINE] on_step_complete callback failed for '{step_name}': {e}")
+
+
+def resolve_connection_config(pipeline_def: dict) -> dict:
+    """Connection config for a pipeline
+
+    Uses connections from the pipeline definition if provided, otherwise the
+    active project, then falls back to environment variables.
+    """
+    pipeline = pipeline_def.get("pipeline", pipeline_def)
+
+    # Check if pipeline definition includes connection config
+    if "connections" in pipeline_def and "snowflake" in pipeline_def:
+        cfg = pipeline_def
+        print(f"[CONFIG] Using connections from pipeline_def root")
+    elif "connections" in pipeline and "snowflake" in pipeline:
+        cfg = pipeline
+        print(f"[CONFIG] Using connections from pipeline nested")
+    else:
+        # Check if there's an active project
+        print(f"[CONFIG] No connection config in pipeline, checking for active project")
+        try:
+            from projects.context import get_active_project
+            active_project = get_active_project()
+
+            if active_project:
+                # get_active_project returns the full metadata dict, not just project_id
+                if isinstance(active_project, dict):
+                    metadata = active_project
+                    print(f"[CONFIG] Found active project: {metadata.get('name')} (ID: {metadata.get('project_id')})")
+                else:
+                    # If it's just a string (project_id), load the metadata
+                    print(f"[CONFIG] Found active project ID: {active_project}")
+                    project_dir = paths.get_project_dir(active_project)
+                    if os.path.exists(f"{project_dir}/project.json"):
+                        with open(f"{project_dir}/project.json", "r") as f:
+                            metadata = json.load(f)
+                    else:
+                        raise Exception("Project metadata not found")
+
+                logger.info(f"[CONFIG] Using active project config - SQL DB: {metadata.get('sql_database')}, Snowflake DB: {metadata.get('snowflake_database')}")
+                logger.info(f"[CONFIG] SQL connection: host={os.getenv('MSSQL_HOST', 'NOT SET')}, port={os.getenv('MSSQL_PORT', '1433')}, user={os.getenv('MSSQL_USER', 'sa')}")
+                cfg = {
+                    "connections": {
+                        "sql": {
+                            "host": os.getenv("MSSQL_HOST", "host.docker.internal"),
+                            "port": os.getenv("MSSQL_PORT", "1433"),
+                            "user": os.getenv("MSSQL_USER", "sa"),
+                            "password": os.getenv("MSSQL_PASSWORD", ""),
+                            "database": metadata.get("sql_database", "SampleDW")
+                        }
+                    },
+                    "snowflake": {
+                        "user": os.getenv("SNOWFLAKE_USER", ""),
+                        "password": os.getenv("SNOWFLAKE_PASSWORD", ""),
+                        "account": os.getenv("SNOWFLAKE_ACCOUNT", ""),
+                        "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH"),
+                        "database": metadata.get("snowflake_database", "SAMPLEDW"),
+                        "schema": metadata.get("snowflake_schemas", ["PUBLIC"])[0] if metadata.get("snowflake_schemas") else "PUBLIC",
+                        "role": os.getenv("SNOWFLAKE_ROLE", "")
+                    }
+                }
+            else:
+                raise Exception("No active project")
+
+        except Exception as e:
+            # Fall back to environment variables
+            logger.warning(f"[CONFIG] No active project or error loading project ({e}), using environment variables")
+            logger.info(f"[CONFIG] MSSQL_HOST from env: {os.getenv('MSSQL_HOST', 'NOT SET - using host.docker.internal')}")
+            logger.info(f"[CONFIG] MSSQL_PORT from env: {os.getenv('MSSQL_PORT', '1433')}")
+            logger.info(f"[CONFIG] MSSQL_USER from env: {os.getenv('MSSQL_USER', 'sa')}")
+            logger.info(f"[CONFIG] MSSQL_DATABASE from env: {os.getenv('MSSQL_DATABASE', 'SampleDW')}")
+            logger.info(f"[CONFIG] SNOWFLAKE_DATABASE from env: {os.getenv('SNOWFLAKE_DATABASE', 'SAMPLEDW')}")
+            cfg = {
+                "connections": {
+                    "sql": {
+                        "host": os.getenv("MSSQL_HOST", "host.docker.internal"),
+                        "port": os.getenv("MSSQL_PORT", "1433"),
+                        "user": os.getenv("MSSQL_USER", "sa"),
+                        "password": os.getenv("MSSQL_PASSWORD", ""),
+                        "database": os.getenv("MSSQL_DATABASE", "SampleDW")
+                    }
+                },
+                "snowflake": {
+                    "user": os.getenv("SNOWFLAKE_USER", ""),
+                    "password": os.getenv("SNOWFLAKE_PASSWORD", ""),
+                    "account": os.getenv("SNOWFLAKE_ACCOUNT", ""),
+                    "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH"),
+                    "database": os.getenv("SNOWFLAKE_DATABASE", "SAMPLEDW"),
+                    "schema": os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC")
+                }
+            }
+
+    return cfg
+
+
+async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str, project_id: Optional[str] = None, batch_id: Optional[str] = None,
+                             on_step_complete: Optional[Callable[[str, int, dict], None]] = None):
+    """Execute pipeline asynchronously
+
+    on_step_complete, if given, is called with (step_name, step_index, result)
+    as soon as each step finishes (from a worker thread for parallel runs).
+    """
     logger.info(f"[ASYNC] Starting pipeline execution for run_id: {run_id}, project_id: {project_id}, batch_id: {batch_id}")
 
     # Import database repository
@@ -417,92 +576,14 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
         from ombudsman.pipeline.step_executor import StepExecutor
         from ombudsman.logging.json_logger import JsonLogger
         from ombudsman.core.registry import ValidationRegistry
-        from ombudsman.core.connections import get_sql_conn, get_snow_conn
+        from ombudsman.core.incremental import WatermarkStore
+        from ombudsman.core.query_cache import cache_from_config
+        from ombudsman.core.scan_fusion import plan_scan_fusion
+        from ombudsman.core.catalog import ChangeDetector
+        from ombudsman.validation.explain import without_deferred
+        from ombudsman.core.connections import get_sql_conn, get_snow_conn, lease_connections
 
-        # Build config - use pipeline_def connections if provided, otherwise check active project, then fall back to environment variables
-        pipeline = pipeline_def.get("pipeline", pipeline_def)
-
-        # Check if pipeline definition includes connection config
-        if "connections" in pipeline_def and "snowflake" in pipeline_def:
-            cfg = pipeline_def
-            print(f"[CONFIG] Using connections from pipeline_def root")
-        elif "connections" in pipeline and "snowflake" in pipeline:
-            cfg = pipeline
-            print(f"[CONFIG] Using connections from pipeline nested")
-        else:
-            # Check if there's an active project
-            print(f"[CONFIG] No connection config in pipeline, checking for active project")
-            try:
-                from projects.context import get_active_project
-                active_project = get_active_project()
-
-                if active_project:
-                    # get_active_project returns the full metadata dict, not just project_id
-                    if isinstance(active_project, dict):
-                        metadata = active_project
-                        print(f"[CONFIG] Found active project: {metadata.get('name')} (ID: {metadata.get('project_id')})")
-                    else:
-                        # If it's just a string (project_id), load the metadata
-                        print(f"[CONFIG] Found active project ID: {active_project}")
-                        project_dir = paths.get_project_dir(active_project)
-                        if os.path.exists(f"{project_dir}/project.json"):
-                            with open(f"{project_dir}/project.json", "r") as f:
-                                metadata = json.load(f)
-                        else:
-                            raise Exception("Project metadata not found")
-
-                    logger.info(f"[CONFIG] Using active project config - SQL DB: {metadata.get('sql_database')}, Snowflake DB: {metadata.get('snowflake_database')}")
-                    logger.info(f"[CONFIG] SQL connection: host={os.getenv('MSSQL_HOST', 'NOT SET')}, port={os.getenv('MSSQL_PORT', '1433')}, user={os.getenv('MSSQL_USER', 'sa')}")
-                    cfg = {
-                        "connections": {
-                            "sql": {
-                                "host": os.getenv("MSSQL_HOST", "host.docker.internal"),
-                                "port": os.getenv("MSSQL_PORT", "1433"),
-                                "user": os.getenv("MSSQL_USER", "sa"),
-                                "password": os.getenv("MSSQL_PASSWORD", ""),
-                                "database": metadata.get("sql_database", "SampleDW")
-                            }
-                        },
-                        "snowflake": {
-                            "user": os.getenv("SNOWFLAKE_USER", ""),
-                            "password": os.getenv("SNOWFLAKE_PASSWORD", ""),
-                            "account": os.getenv("SNOWFLAKE_ACCOUNT", ""),
-                            "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH"),
-                            "database": metadata.get("snowflake_database", "SAMPLEDW"),
-                            "schema": metadata.get("snowflake_schemas", ["PUBLIC"])[0] if metadata.get("snowflake_schemas") else "PUBLIC",
-                            "role": os.getenv("SNOWFLAKE_ROLE", "")
-                        }
-                    }
-                else:
-                    raise Exception("No active project")
-
-            except Exception as e:
-                # Fall back to environment variables
-                logger.warning(f"[CONFIG] No active project or error loading project ({e}), using environment variables")
-                logger.info(f"[CONFIG] MSSQL_HOST from env: {os.getenv('MSSQL_HOST', 'NOT SET - using host.docker.internal')}")
-                logger.info(f"[CONFIG] MSSQL_PORT from env: {os.getenv('MSSQL_PORT', '1433')}")
-                logger.info(f"[CONFIG] MSSQL_USER from env: {os.getenv('MSSQL_USER', 'sa')}")
-                logger.info(f"[CONFIG] MSSQL_DATABASE from env: {os.getenv('MSSQL_DATABASE', 'SampleDW')}")
-                logger.info(f"[CONFIG] SNOWFLAKE_DATABASE from env: {os.getenv('SNOWFLAKE_DATABASE', 'SAMPLEDW')}")
-                cfg = {
-                    "connections": {
-                        "sql": {
-                            "host": os.getenv("MSSQL_HOST", "host.docker.internal"),
-                            "port": os.getenv("MSSQL_PORT", "1433"),
-                            "user": os.getenv("MSSQL_USER", "sa"),
-                            "password": os.getenv("MSSQL_PASSWORD", ""),
-                            "database": os.getenv("MSSQL_DATABASE", "SampleDW")
-                        }
-                    },
-                    "snowflake": {
-                        "user": os.getenv("SNOWFLAKE_USER", ""),
-                        "password": os.getenv("SNOWFLAKE_PASSWORD", ""),
-                        "account": os.getenv("SNOWFLAKE_ACCOUNT", ""),
-                        "warehouse": os.getenv("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH"),
-                        "database": os.getenv("SNOWFLAKE_DATABASE", "SAMPLEDW"),
-                        "schema": os.getenv("SNOWFLAKE_SCHEMA", "PUBLIC")
-                    }
-                }
+        cfg = resolve_connection_config(pipeline_def)
 
         # Initialize registry
         registry = ValidationRegistry()
@@ -549,8 +630,10 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
         # Load actual datatypes from tables.yaml if metadata only has column names
         # This is needed because intelligent_suggest only provides column names, not datatypes
         try:
-            from ombudsman.core.metadata_loader import load_metadata as load_tables_yaml
-            tables_metadata = load_tables_yaml()
+            # Parsed once per tables.yaml version, not on every run
+            from mapping.metadata_cache import load_tables_metadata
+            from projects.context import get_project_config_dir
+            tables_metadata = load_tables_metadata(get_project_config_dir(project_id))
 
             # MERGE datatype information into metadata (DO NOT REPLACE)
             # This preserves foreign_keys and business_key from pipeline YAML
@@ -565,7 +648,7 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                     # Merge: start with new metadata, then overlay existing metadata (so existing wins)
                     metadata[table_name] = {**new_metadata, **existing_metadata}
         except Exception as e:
-            logger.debug(f"Could not load tables.yaml using metadata_loader: {e}")
+            logger.debug(f"Could not load tables.yaml: {e}")
 
         # Enrich metadata with numeric_columns, date_columns, and all_columns
         metadata = enrich_metadata(metadata)
@@ -634,6 +717,21 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
             except Exception as e:
                 logger.info(f"[PIPELINE] AI type checker not available: {e}, using rule-based fallback")
 
+            # Repeated reads across steps (samples, counts) are served from memory
+            query_cache = cache_from_config(cfg)
+
+            # Steps aggregating over the same table share one scan per engine
+            scan_plan = None
+            if cfg.get("scan_fusion", True):
+                scan_plan = plan_scan_fusion(steps, metadata, incremental=cfg.get("incremental", False))
+
+            watermark_store = WatermarkStore(str(paths.watermarks_file))
+
+            # Opt-in: skip steps whose table's catalog fingerprint is unchanged since they passed
+            change_detector = None
+            if cfg.get("skip_unchanged_tables", False):
+                change_detector = ChangeDetector(watermark_store, mapping, metadata)
+
             # Create executor
             executor = StepExecutor(
                 registry=registry,
@@ -641,7 +739,15 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                 snow_conn=snow_conn,
                 mapping=mapping,
                 metadata=metadata,
-                type_checker=type_checker
+                type_checker=type_checker,
+                watermark_store=watermark_store,
+                incremental=cfg.get("incremental", False),
+                lease_connections=lambda: lease_connections(cfg),
+                query_cache=query_cache,
+                scan_plan=scan_plan,
+                change_detector=change_detector,
+                # Opt-in: explain samples of passing steps are fetched only when the step is opened
+                defer_explain=pipeline.get("defer_explain", cfg.get("defer_explain", False))
             )
 
             # Create JSON logger for pipeline execution
@@ -658,10 +764,14 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                 logger.info(f"[PARALLEL] Running {len(steps)} steps with up to {max_workers} parallel workers")
 
                 # Create parallel executor
+                # Each worker leases its own connection pair from the pools
+                # (sized from max_parallel_workers) for the lifetime of a step
                 parallel_exec = ParallelStepExecutor(
                     step_executor=executor,
                     max_workers=max_workers,
-                    stop_on_error=False
+                    stop_on_error=False,
+                    lease_connections=lambda: lease_connections(cfg),
+                    timing_history=StepTimingHistory(str(paths.step_timings_file))
                 )
 
                 # Track step events for async emission
@@ -674,9 +784,10 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                     pipeline_runs[run_id]["current_step"] = step_index + 1
                     pipeline_runs[run_id]["current_step_name"] = step_name
 
-                def on_step_complete(step_name, step_index, result):
+                def on_parallel_step_complete(step_name, step_index, result):
                     result_dict = result.to_dict() if hasattr(result, 'to_dict') else result
                     step_events.append(("complete", step_name, step_index, result_dict))
+                    _notify_step_complete(on_step_complete, step_name, step_index, result_dict)
 
                 def on_step_error(step_name, step_index, error):
                     step_events.append(("error", step_name, step_index, error))
@@ -688,10 +799,11 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                     lambda: parallel_exec.execute_parallel(
                         steps,
                         on_step_start=on_step_start,
-                        on_step_complete=on_step_complete,
+                        on_step_complete=on_parallel_step_complete,
                         on_step_error=on_step_error
                     )
                 )
+                pipeline_runs[run_id]["scheduling"] = parallel_exec.schedule_report
 
                 # Emit collected events asynchronously
                 for event in step_events:
@@ -707,7 +819,7 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                             step_name=event[1],
                             step_order=event[2],
                             status=event[3].get("status", "passed"),
-                            result=event[3]
+                            result=without_deferred(event[3])
                         )
                     elif event[0] == "error":
                         await emitter.step_failed(
@@ -743,11 +855,12 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
 
                         # Emit step completed
                         result_dict = result.to_dict() if hasattr(result, 'to_dict') else result
+                        _notify_step_complete(on_step_complete, step_name, i, result_dict)
                         await emitter.step_completed(
                             step_name=step_name,
                             step_order=i,
                             status=result_dict.get("status", "passed"),
-                            result=result_dict
+                            result=without_deferred(result_dict)
                         )
 
                     except Exception as step_error:
@@ -775,6 +888,11 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
             pipeline_runs[run_id]["status"] = "completed"
             pipeline_runs[run_id]["completed_at"] = end_time.isoformat()
             pipeline_runs[run_id]["results"] = results_dict
+            if query_cache is not None:
+                pipeline_runs[run_id]["query_cache"] = query_cache.stats()
+                logger.info(f"[PIPELINE] Query cache: {pipeline_runs[run_id]['query_cache']}")
+            if scan_plan is not None:
+                pipeline_runs[run_id]["scan_fusion"] = scan_plan.report()
 
             # Emit pipeline completed event
             await emitter.pipeline_completed(
@@ -789,19 +907,8 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
             # Save to database
             if repo:
                     try:
-                        # Update pipeline run
-                        repo.update_pipeline_run(run_id, PipelineRunUpdate(
-                            status=DBPipelineStatus.COMPLETED,
-                            completed_at=end_time,
-                            duration_seconds=duration_seconds,
-                            total_steps=len(results_dict),
-                            successful_steps=successful_steps,
-                            failed_steps=failed_steps,
-                            warnings_count=warnings_count,
-                            errors_count=failed_steps
-                        ))
-
-                        # Save validation steps
+                        # Collect validation steps with their results
+                        db_steps = []
                         for i, result in enumerate(results_dict):
                             step_status = StepStatus.PASSED
                             if result.get('status') == 'failed':
@@ -809,17 +916,13 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                             elif result.get('status') == 'warning':
                                 step_status = StepStatus.WARNING
 
-                            # Create step
-                            step = repo.create_validation_step(ValidationStepCreate(
+                            db_steps.append((ValidationStepCreate(
                                 run_id=run_id,
                                 step_name=result.get('name', f'Step {i+1}'),
                                 step_order=i,
                                 validator_type=result.get('validator_type'),
                                 step_config=result.get('config')
-                            ))
-
-                            # Update with results
-                            repo.update_validation_step(step.step_id, ValidationStepUpdate(
+                            ), ValidationStepUpdate(
                                 status=step_status,
                                 completed_at=end_time,
                                 duration_milliseconds=result.get('duration_ms'),
@@ -833,7 +936,19 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                                 snowflake_row_count=result.get('snowflake_row_count'),
                                 match_percentage=result.get('match_percentage'),
                                 error_message=result.get('error')
-                            ))
+                            )))
+
+                        # Update pipeline run and insert all steps in one transaction
+                        repo.complete_pipeline_run(run_id, PipelineRunUpdate(
+                            status=DBPipelineStatus.COMPLETED,
+                            completed_at=end_time,
+                            duration_seconds=duration_seconds,
+                            total_steps=len(results_dict),
+                            successful_steps=successful_steps,
+                            failed_steps=failed_steps,
+                            warnings_count=warnings_count,
+                            errors_count=failed_steps
+                        ), db_steps)
 
                         logger.info(f"Pipeline run {run_id} saved to database successfully")
                     except Exception as e:
@@ -842,8 +957,8 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
             # Save results to file
             os.makedirs(RESULTS_DIR, exist_ok=True)
             try:
-                with open(f"{RESULTS_DIR}/{run_id}.json", "w") as f:
-                    json.dump(pipeline_runs[run_id], f, indent=2, cls=CustomJSONEncoder)
+                # Compact summary plus compressed step details (execution/result_store.py)
+                write_run_file(f"{RESULTS_DIR}/{run_id}.json", pipeline_runs[run_id], cls=CustomJSONEncoder)
                 logger.info(f"Pipeline results saved to {RESULTS_DIR}/{run_id}.json")
             except TypeError as e:
                 logger.error(f"Failed to serialize pipeline results for {run_id}: {e}")
@@ -855,6 +970,13 @@ async def run_pipeline_async(run_id: str, pipeline_def: dict, pipeline_name: str
                         "raw_data": str(pipeline_runs[run_id])
                     }, f, indent=2)
 
+            # Index the run for the results endpoints right away
+            try:
+                from execution.results import index_run_file
+                index_run_file(f"{RESULTS_DIR}/{run_id}.json")
+            except Exception as e:
+                logger.warning(f"[PIPELINE] Could not index results of {run_id}: {e}")
+
         finally:
             # Clean up connections
             if sql_conn_ctx:
@@ -926,7 +1048,9 @@ async def get_pipeline_status(
     if run_id not in pipeline_runs:
         raise PipelineNotFoundError(pipeline_id=run_id)
 
-    return pipeline_runs[run_id]
+    # Deferred explain queries are resolved by the step details endpoint, not here
+    from ombudsman.validation.explain import without_deferred
+    return without_deferred(pipeline_runs[run_id])
 
 
 @router.get("/list")
@@ -1044,9 +1168,7 @@ async def delete_pipeline_run(
         del pipeline_runs[run_id]
 
         # Delete results file
-        results_file = f"{RESULTS_DIR}/{run_id}.json"
-        if os.path.exists(results_file):
-            os.remove(results_file)
+        remove_run_file(f"{RESULTS_DIR}/{run_id}.json")
 
         return {"message": "Pipeline run deleted"}
 
@@ -20,13 +20,27 @@ steps:
     # No dependencies - runs in parallel with schema_validation
 ```
 
-Steps without dependencies run in parallel. Steps with dependencies wait
-for all their dependencies to complete before starting.
+Steps without dependencies run in parallel. Steps with dependencies are
+dispatched the moment their last dependency completes - there are no
+waves, so one slow step never holds back unrelated work.
+
+When several steps are ready and all workers are busy, the step with the
+longest expected remaining path (its own expected duration plus that of
+its slowest chain of dependents) goes first. Expected durations come from
+a StepTimingHistory of previous runs when one is given.
+
+When a `lease_connections` factory is given, every step leases its own
+SQL Server / Snowflake connection pair for its lifetime, so N workers run
+N concurrent queries per side instead of sharing one connection.
 """
 
 import asyncio
+import heapq
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import List, Dict, Any, Callable, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
@@ -34,6 +48,9 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Expected duration (seconds) for steps that have never been timed
+DEFAULT_STEP_SECONDS = 1.0
+
 
 class StepStatus(Enum):
     PENDING = "pending"
@@ -49,11 +66,129 @@ class StepNode:
     name: str
     step_config: Dict[str, Any]
     dependencies: Set[str] = field(default_factory=set)
+    dependents: Set[str] = field(default_factory=set)
     status: StepStatus = StepStatus.PENDING
     result: Any = None
     error: Optional[str] = None
     start_time: Optional[float] = None
     end_time: Optional[float] = None
+    expected_seconds: float = DEFAULT_STEP_SECONDS
+    priority: float = 0.0
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.start_time is None or self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+
+class StepTimingHistory:
+    """
+    Exponentially weighted step durations persisted across runs.
+
+    Steps are keyed by validator and table, so the same check on the same
+    table shares its history across pipelines.
+    """
+
+    def __init__(self, path: Optional[str] = None, alpha: float = 0.3):
+        """
+        Initialize timing history.
+
+        Args:
+            path: JSON file to load from / save to (in-memory only if None)
+            alpha: Weight of the newest observation
+        """
+        self.path = path
+        self.alpha = alpha
+        self._timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self._timings = {k: float(v) for k, v in json.load(f).items()}
+            except Exception as e:
+                logger.warning(f"Could not load step timings from {path}: {e}")
+
+    @staticmethod
+    def step_key(step: Dict[str, Any]) -> str:
+        validator = step.get("validator", step.get("name", ""))
+        table = (step.get("config") or {}).get("table", "")
+        return f"{validator}:{table}" if table else validator
+
+    def expected(self, step: Dict[str, Any]) -> Optional[float]:
+        """Expected duration in seconds, or None if never timed."""
+        with self._lock:
+            return self._timings.get(self.step_key(step))
+
+    def record(self, step: Dict[str, Any], seconds: float):
+        """Fold an observed duration into the history."""
+        key = self.step_key(step)
+        with self._lock:
+            previous = self._timings.get(key)
+            if previous is None:
+                self._timings[key] = seconds
+            else:
+                self._timings[key] = self.alpha * seconds + (1 - self.alpha) * previous
+
+    def save(self):
+        """Write the history to disk (atomic replace)."""
+        if not self.path:
+            return
+        with self._lock:
+            data = dict(self._timings)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save step timings to {self.path}: {e}")
+
+
+def critical_path(nodes: Dict[str, StepNode], weight: Callable[[StepNode], float]):
+    """
+    Longest weighted path through the dependency graph.
+
+    Args:
+        nodes: Dependency graph
+        weight: Duration of a node
+
+    Returns:
+        (path, length) - step names from first to last, and total weight
+    """
+    best: Dict[str, float] = {}
+    prev: Dict[str, Optional[str]] = {}
+    visiting: Set[str] = set()
+
+    def longest_to(name: str) -> float:
+        if name in best:
+            return best[name]
+        if name in visiting:
+            # Cycle - treated as a dead end, reported elsewhere
+            return 0.0
+        visiting.add(name)
+        node = nodes[name]
+        best_dep, best_len = None, 0.0
+        for dep in node.dependencies:
+            length = longest_to(dep)
+            if length > best_len or best_dep is None:
+                best_dep, best_len = dep, length
+        visiting.discard(name)
+        best[name] = best_len + weight(node)
+        prev[name] = best_dep
+        return best[name]
+
+    if not nodes:
+        return [], 0.0
+
+    end = max(nodes, key=longest_to)
+    path = []
+    current: Optional[str] = end
+    while current is not None:
+        path.append(current)
+        current = prev.get(current)
+    return list(reversed(path)), best[end]
 
 
 class ParallelStepExecutor:
@@ -68,7 +203,9 @@ class ParallelStepExecutor:
         self,
         step_executor,  # StepExecutor instance
         max_workers: int = 4,
-        stop_on_error: bool = False
+        stop_on_error: bool = False,
+        lease_connections: Optional[Callable] = None,
+        timing_history: Optional[StepTimingHistory] = None
     ):
         """
         Initialize parallel executor.
@@ -77,10 +214,18 @@ class ParallelStepExecutor:
             step_executor: The StepExecutor instance for running individual steps
             max_workers: Maximum concurrent steps (default 4)
             stop_on_error: Stop all execution if any step fails
+            lease_connections: Optional context manager factory yielding a
+                (sql_conn, snow_conn) pair per step; when omitted all steps
+                share the step executor's connections
+            timing_history: Optional StepTimingHistory used to prioritise
+                ready steps; updated with the durations of this run
         """
         self.step_executor = step_executor
         self.max_workers = max_workers
         self.stop_on_error = stop_on_error
+        self.lease_connections = lease_connections
+        self.timing_history = timing_history
+        self.schedule_report: Dict[str, Any] = {}
         self._cancelled = False
 
     def build_dependency_graph(self, steps: List[Dict]) -> Dict[str, StepNode]:
@@ -118,48 +263,59 @@ class ParallelStepExecutor:
                 logger.warning(f"Step '{name}' has unknown dependencies: {missing}")
                 node.dependencies -= missing  # Remove invalid dependencies
 
+        for name, node in nodes.items():
+            for dep in node.dependencies:
+                nodes[dep].dependents.add(name)
+
+        self._assign_priorities(nodes)
         return nodes
 
-    def get_ready_steps(self, nodes: Dict[str, StepNode]) -> List[StepNode]:
+    def _assign_priorities(self, nodes: Dict[str, StepNode]):
         """
-        Get steps that are ready to execute (all dependencies completed).
-
-        Args:
-            nodes: Dependency graph
-
-        Returns:
-            List of steps ready to run
+        Set each node's priority to its expected duration plus the longest
+        expected chain of dependents after it (upward rank).
         """
-        ready = []
-
-        for node in nodes.values():
-            if node.status != StepStatus.PENDING:
-                continue
-
-            # Check if all dependencies are completed
-            deps_met = all(
-                nodes[dep].status == StepStatus.COMPLETED
-                for dep in node.dependencies
-                if dep in nodes
-            )
-
-            # Check if any dependency failed (skip this step)
-            deps_failed = any(
-                nodes[dep].status == StepStatus.FAILED
-                for dep in node.dependencies
-                if dep in nodes
-            )
+        known = []
+        if self.timing_history:
+            for node in nodes.values():
+                expected = self.timing_history.expected(node.step_config)
+                if expected is not None:
+                    node.expected_seconds = expected
+                    known.append(expected)
+
+        # Untimed steps are assumed to take an average timed step
+        default = sum(known) / len(known) if known else DEFAULT_STEP_SECONDS
+        if self.timing_history:
+            for node in nodes.values():
+                if self.timing_history.expected(node.step_config) is None:
+                    node.expected_seconds = default
+
+        ranks: Dict[str, float] = {}
+        visiting: Set[str] = set()
+
+        def rank(name: str) -> float:
+            if name in ranks:
+                return ranks[name]
+            if name in visiting:
+                return 0.0
+            visiting.add(name)
+            node = nodes[name]
+            downstream = max((rank(d) for d in node.dependents), default=0.0)
+            visiting.discard(name)
+            ranks[name] = node.expected_seconds + downstream
+            return ranks[name]
 
-            if deps_failed:
-                node.status = StepStatus.SKIPPED
-                node.error = "Skipped due to failed dependency"
-                logger.warning(f"Skipping step '{node.name}' due to failed dependencies")
-                continue
+        for name, node in nodes.items():
+            node.priority = rank(name)
 
-            if deps_met:
-                ready.append(node)
+    def _run_step(self, step_config: Dict[str, Any]) -> Any:
+        """Run a step, on leased connections when a lease factory is set."""
+        if self.lease_connections is None:
+            return self.step_executor.run_step(step_config)
 
-        return ready
+        with self.lease_connections() as (sql_conn, snow_conn):
+            executor = self.step_executor.with_connections(sql_conn, snow_conn)
+            return executor.run_step(step_config)
 
     def execute_step(self, node: StepNode) -> StepNode:
         """
@@ -176,7 +332,7 @@ class ParallelStepExecutor:
 
         try:
             logger.info(f"[PARALLEL] Starting step: {node.name}")
-            result = self.step_executor.run_step(node.step_config)
+            result = self._run_step(node.step_config)
 
             node.status = StepStatus.COMPLETED
             node.result = result
@@ -193,6 +349,17 @@ class ParallelStepExecutor:
 
         return node
 
+    def _skip_dependents(self, nodes: Dict[str, StepNode], node: StepNode):
+        """Mark everything downstream of a failed/skipped step as skipped."""
+        for name in node.dependents:
+            dependent = nodes[name]
+            if dependent.status != StepStatus.PENDING:
+                continue
+            dependent.status = StepStatus.SKIPPED
+            dependent.error = "Skipped due to failed dependency"
+            logger.warning(f"Skipping step '{name}' due to failed dependencies")
+            self._skip_dependents(nodes, dependent)
+
     def execute_parallel(
         self,
         steps: List[Dict],
@@ -218,6 +385,7 @@ class ParallelStepExecutor:
         # Build dependency graph
         nodes = self.build_dependency_graph(steps)
         step_order = [s.get("name", f"step_{i}") for i, s in enumerate(steps)]
+        step_index = {name: i for i, name in enumerate(step_order)}
 
         logger.info(f"[PARALLEL] Executing {len(steps)} steps with max {self.max_workers} workers")
 
@@ -225,77 +393,104 @@ class ParallelStepExecutor:
         completed_count = 0
         total_steps = len(steps)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            while True:
-                # Check for cancellation
-                if self._cancelled:
-                    logger.info("[PARALLEL] Execution cancelled")
-                    break
+        # Dependencies still outstanding per step; a step becomes ready at 0
+        remaining = {name: len(node.dependencies) for name, node in nodes.items()}
 
-                # Get steps ready to run
-                ready_steps = self.get_ready_steps(nodes)
+        # Ready queue: highest priority first, original order breaks ties
+        ready: List[tuple] = []
 
-                if not ready_steps:
-                    # Check if all done or deadlocked
-                    pending = [n for n in nodes.values() if n.status == StepStatus.PENDING]
-                    if not pending:
-                        break  # All done
+        def push_ready(node: StepNode):
+            heapq.heappush(ready, (-node.priority, step_index[node.name], node.name))
 
-                    # Deadlock detection
-                    logger.error(f"[PARALLEL] Deadlock detected! Pending steps: {[n.name for n in pending]}")
-                    for node in pending:
-                        node.status = StepStatus.FAILED
-                        node.error = "Circular dependency detected"
-                    break
+        def notify(callback, *args):
+            # A failing callback must not change the outcome of the step it reports
+            if not callback:
+                return
+            try:
+                callback(*args)
+            except Exception as e:
+                logger.error(f"[PARALLEL] Callback {getattr(callback, '__name__', callback)} failed for {args[0]}: {e}")
+
+        for name, count in remaining.items():
+            if count == 0:
+                push_ready(nodes[name])
 
-                # Submit ready steps
-                futures = {}
-                for node in ready_steps:
+        run_started = time.time()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running = {}
+
+            while ready or running:
+                # Dispatch as many ready steps as there are free workers
+                while ready and len(running) < self.max_workers and not self._cancelled:
+                    _, _, name = heapq.heappop(ready)
+                    node = nodes[name]
+                    if node.status != StepStatus.PENDING:
+                        continue
                     node.status = StepStatus.RUNNING
 
                     # Call start callback
                     if on_step_start:
                         try:
-                            step_index = step_order.index(node.name)
-                            on_step_start(node.name, step_index)
-                        except:
+                            on_step_start(node.name, step_index[node.name])
+                        except Exception:
                             pass
 
-                    future = executor.submit(self.execute_step, node)
-                    futures[future] = node
-
-                # Wait for this batch to complete
-                for future in as_completed(futures):
-                    node = futures[future]
+                    running[executor.submit(self.execute_step, node)] = node
 
-                    try:
-                        result_node = future.result()
-                        completed_count += 1
-
-                        step_index = step_order.index(node.name)
+                if not running:
+                    break
 
-                        if result_node.status == StepStatus.COMPLETED:
-                            if on_step_complete:
-                                on_step_complete(node.name, step_index, result_node.result)
-                        else:
-                            if on_step_error:
-                                on_step_error(node.name, step_index, result_node.error)
+                # Wake up as soon as any step finishes
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
 
-                            if self.stop_on_error:
-                                self._cancelled = True
-                                logger.info(f"[PARALLEL] Stopping due to error in {node.name}")
+                for future in done:
+                    node = running.pop(future)
+                    index = step_index[node.name]
 
+                    try:
+                        result_node = future.result()
                     except Exception as e:
                         logger.error(f"[PARALLEL] Unexpected error executing {node.name}: {e}")
                         node.status = StepStatus.FAILED
                         node.error = str(e)
+                        self._skip_dependents(nodes, node)
+                        notify(on_step_error, node.name, index, str(e))
+                        continue
+
+                    completed_count += 1
 
-                        if on_step_error:
-                            step_index = step_order.index(node.name)
-                            on_step_error(node.name, step_index, str(e))
+                    if result_node.status == StepStatus.COMPLETED:
+                        notify(on_step_complete, node.name, index, result_node.result)
+
+                        for name in node.dependents:
+                            remaining[name] -= 1
+                            if remaining[name] == 0 and nodes[name].status == StepStatus.PENDING:
+                                push_ready(nodes[name])
+                    else:
+                        notify(on_step_error, node.name, index, result_node.error)
+
+                        self._skip_dependents(nodes, node)
+
+                        if self.stop_on_error:
+                            self._cancelled = True
+                            logger.info(f"[PARALLEL] Stopping due to error in {node.name}")
 
                 logger.debug(f"[PARALLEL] Progress: {completed_count}/{total_steps} steps completed")
 
+        if self._cancelled:
+            logger.info("[PARALLEL] Execution cancelled")
+        else:
+            # Anything still pending never became ready: its dependencies form a cycle
+            pending = [n for n in nodes.values() if n.status == StepStatus.PENDING]
+            if pending:
+                logger.error(f"[PARALLEL] Deadlock detected! Pending steps: {[n.name for n in pending]}")
+                for node in pending:
+                    node.status = StepStatus.FAILED
+                    node.error = "Circular dependency detected"
+
+        self._record_schedule(nodes, time.time() - run_started)
+
         # Collect results in original order
         results = []
         for name in step_order:
@@ -329,6 +524,33 @@ class ParallelStepExecutor:
 
         return results
 
+    def _record_schedule(self, nodes: Dict[str, StepNode], makespan: float):
+        """Update timing history and build the critical-path report."""
+        if self.timing_history:
+            for node in nodes.values():
+                if node.status == StepStatus.COMPLETED and node.duration is not None:
+                    self.timing_history.record(node.step_config, node.duration)
+            self.timing_history.save()
+
+        expected_path, expected_length = critical_path(nodes, lambda n: n.expected_seconds)
+        actual_path, actual_length = critical_path(nodes, lambda n: n.duration or 0.0)
+
+        self.schedule_report = {
+            "max_workers": self.max_workers,
+            "makespan_seconds": round(makespan, 3),
+            "critical_path": actual_path,
+            "critical_path_seconds": round(actual_length, 3),
+            "expected_critical_path": expected_path,
+            "expected_critical_path_seconds": round(expected_length, 3),
+            # 1.0 means the run finished in its critical-path time
+            "critical_path_efficiency": round(actual_length / makespan, 3) if makespan > 0 else None
+        }
+
+        logger.info(
+            f"[PARALLEL] Makespan {makespan:.2f}s, critical path {actual_length:.2f}s "
+            f"({' -> '.join(actual_path)})"
+        )
+
     def cancel(self):
         """Cancel ongoing execution."""
         self._cancelled = True
@@ -340,7 +562,9 @@ async def execute_steps_parallel_async(
     max_workers: int = 4,
     on_step_start: Optional[Callable] = None,
     on_step_complete: Optional[Callable] = None,
-    on_step_error: Optional[Callable] = None
+    on_step_error: Optional[Callable] = None,
+    lease_connections: Optional[Callable] = None,
+    timing_history: Optional[StepTimingHistory] = None
 ) -> List[Any]:
     """
     Async wrapper for parallel step execution.
@@ -349,7 +573,9 @@ async def execute_steps_parallel_async(
     """
     parallel_exec = ParallelStepExecutor(
         step_executor=step_executor,
-        max_workers=max_workers
+        max_workers=max_workers,
+        lease_connections=lease_connections,
+        timing_history=timing_history
     )
 
     # Run in thread pool
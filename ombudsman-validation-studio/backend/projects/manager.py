@@ -11,6 +11,7 @@ import shutil
 from auth.dependencies import require_user_or_admin, optional_authentication
 from auth.models import UserInDB
 from config.paths import paths
+from execution.result_store import remove_run_file
 from .automation import ProjectAutomation
 
 logger = logging.getLogger(__name__)
@@ -516,7 +517,7 @@ async def delete_project(
                     pipeline_name = result_data.get('pipeline_name', '')
 
                     if pipeline_name in pipeline_names or project_id in pipeline_name:
-                        os.remove(result_path)
+                        remove_run_file(result_path)
                         deleted_items["results"].append(result_file)
                         print(f"[PROJECT_DELETE] Deleted result: {result_file}")
 
@@ -800,8 +801,7 @@ async def setup_project(
 
         # Import database mapping functions
         from mapping.database_mapping import (
-            extract_sqlserver_tables,
-            extract_snowflake_tables,
+            extract_schema_pairs,
             create_table_mappings,
             generate_yaml_files
         )
@@ -823,25 +823,18 @@ async def setup_project(
         all_snow_metadata = {}
         schema_results = []
 
-        for sql_schema, snow_schema in schema_mappings.items():
-            print(f"[PROJECT_SETUP] Extracting {sql_schema} (SQL) -> {snow_schema} (Snowflake)")
+        # Both engines and all schemas are extracted concurrently
+        extracted = extract_schema_pairs(
+            sql_database=project_metadata.get("sql_database"),
+            snowflake_database=project_metadata.get("snowflake_database"),
+            schema_mappings=schema_mappings,
+            patterns=["%"],
+            specific_tables=None
+        )
 
-            # Extract from SQL Server
-            sql_metadata = extract_sqlserver_tables(
-                database=project_metadata.get("sql_database"),
-                schema=sql_schema,
-                patterns=["%"],
-                specific_tables=None
-            )
+        for sql_schema, snow_schema, sql_metadata, snow_metadata in extracted:
+            print(f"[PROJECT_SETUP] Extracted {sql_schema} (SQL) -> {snow_schema} (Snowflake)")
             print(f"[PROJECT_SETUP]   SQL Server: {len(sql_metadata)} tables in {sql_schema}")
-
-            # Extract from Snowflake
-            snow_metadata = extract_snowflake_tables(
-                database=project_metadata.get("snowflake_database"),
-                schema=snow_schema,
-                patterns=["%"],
-                specific_tables=None
-            )
             print(f"[PROJECT_SETUP]   Snowflake: {len(snow_metadata)} tables in {snow_schema}")
 
             # Add to combined metadata with schema prefix
@@ -12,6 +12,17 @@ backend_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_dir))
 
 
+@pytest.fixture(autouse=True, scope="session")
+def audit_storage_dir(tmp_path_factory):
+    """Audit events logged during tests go to a temporary store, not data/audit_logs."""
+    import audit.storage
+    storage_dir = str(tmp_path_factory.mktemp("audit_logs"))
+    original = audit.storage.default_storage_dir
+    audit.storage.default_storage_dir = lambda: storage_dir
+    yield storage_dir
+    audit.storage.default_storage_dir = original
+
+
 @pytest.fixture
 def client():
     """Create a test client for the FastAPI app."""
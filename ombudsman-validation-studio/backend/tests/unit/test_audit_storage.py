@@ -0,0 +1,164 @@
+"""
+Unit tests for the audit log store.
+
+Tests buffered writes, indexed filtering, cursor pagination, summaries
+and the import of legacy daily JSONL files.
+"""
+
+import pytest
+import json
+from datetime import datetime, timedelta
+
+from audit.models import AuditCategory, AuditLevel, AuditLogCreate, AuditLogFilter
+from audit.storage import AuditLogStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Storage whose background thread never flushes on its own"""
+    return AuditLogStorage(str(tmp_path), flush_rows=1000, flush_interval=3600)
+
+
+def make_log(minutes_ago=0, **fields):
+    values = {
+        "timestamp": datetime.utcnow() - timedelta(minutes=minutes_ago),
+        "category": AuditCategory.API_REQUEST,
+        "action": "GET /pipelines",
+    }
+    values.update(fields)
+    return AuditLogCreate(**values)
+
+
+@pytest.mark.unit
+class TestBufferedWrites:
+    """Test write-behind buffering."""
+
+    def test_add_log_is_buffered(self, storage):
+        """Entries are queued until a flush writes them in one batch."""
+        for i in range(5):
+            storage.add_log(make_log(i))
+
+        assert len(storage._pending) == 5
+        assert storage.flush() == 5
+        assert storage._pending == []
+
+    def test_query_sees_buffered_logs(self, storage):
+        """Queries flush first, so nothing logged is missing."""
+        stored = storage.add_log(make_log(details={"path": "/pipelines"}))
+
+        logs = storage.query_logs(AuditLogFilter())
+
+        assert [log.id for log in logs] == [stored.id]
+        assert logs[0].details == {"path": "/pipelines"}
+
+
+@pytest.mark.unit
+class TestQueries:
+    """Test filters, sorting and pagination in the database."""
+
+    def test_filters(self, storage):
+        """User, resource, level and action substring filters combine."""
+        storage.add_log(make_log(1, user_id="u1", resource_type="pipeline", resource_id="p1"))
+        storage.add_log(make_log(2, user_id="u1", action="POST /pipelines/run", level=AuditLevel.ERROR))
+        storage.add_log(make_log(3, user_id="u2", resource_type="pipeline", resource_id="p1"))
+
+        assert len(storage.query_logs(AuditLogFilter(user_id="u1"))) == 2
+        assert len(storage.query_logs(AuditLogFilter(resource_type="pipeline", resource_id="p1"))) == 2
+        assert len(storage.query_logs(AuditLogFilter(user_id="u1", action="run"))) == 1
+        assert len(storage.query_logs(AuditLogFilter(level=AuditLevel.ERROR))) == 1
+        assert storage.query_logs(AuditLogFilter(search="100%")) == []
+
+    def test_time_range(self, storage):
+        """Logs outside the day range are excluded."""
+        storage.add_log(make_log(0))
+        storage.add_log(make_log(60 * 24 * 40))
+
+        assert len(storage.query_logs(AuditLogFilter())) == 1
+        assert len(storage.query_logs(AuditLogFilter(start_date=datetime.utcnow() - timedelta(days=60)))) == 2
+
+    def test_cursor_pagination(self, storage):
+        """Cursor pages follow each other without gaps or repeats."""
+        for i in range(7):
+            storage.add_log(make_log(i))
+
+        seen = []
+        cursor = None
+        while True:
+            page = storage.query_logs(AuditLogFilter(limit=3, cursor=cursor))
+            seen.extend(page)
+            if len(page) < 3:
+                break
+            cursor = storage.cursor_for(page[-1])
+
+        assert len(seen) == 7 and len({log.id for log in seen}) == 7
+        assert [log.timestamp for log in seen] == sorted((log.timestamp for log in seen), reverse=True)
+
+    def test_cursor_only_for_timestamp_order(self, storage):
+        """Queries sorted by another field page by offset and take no cursor."""
+        assert storage.supports_cursor(AuditLogFilter())
+        assert not storage.supports_cursor(AuditLogFilter(sort_by="action"))
+
+        for i in range(4):
+            storage.add_log(make_log(i, action=f"GET /{i}"))
+        first = storage.query_logs(AuditLogFilter(limit=2, sort_by="action", sort_order="asc"))
+        cursor = storage.cursor_for(first[-1])
+        again = storage.query_logs(AuditLogFilter(limit=2, sort_by="action", sort_order="asc", cursor=cursor))
+
+        assert [log.id for log in again] == [log.id for log in first]
+
+    def test_offset_pagination(self, storage):
+        """Offset pages match the cursor order."""
+        for i in range(5):
+            storage.add_log(make_log(i))
+
+        everything = storage.query_logs(AuditLogFilter())
+        page = storage.query_logs(AuditLogFilter(limit=2, offset=2))
+
+        assert [log.id for log in page] == [log.id for log in everything[2:4]]
+
+    def test_summary(self, storage):
+        """Summary counts are aggregated in the database."""
+        storage.add_log(make_log(1, username="alice"))
+        storage.add_log(make_log(2, username="alice", level=AuditLevel.ERROR, error_message="boom"))
+        storage.add_log(make_log(3, username="bob"))
+
+        summary = storage.get_summary(AuditLogFilter())
+
+        assert summary.total_logs == 3
+        assert summary.by_level == {"info": 2, "error": 1}
+        assert summary.most_active_users[0] == {"username": "alice", "count": 2}
+        assert [log.error_message for log in summary.recent_errors] == ["boom"]
+
+
+@pytest.mark.unit
+class TestLegacyImport:
+    """Test loading the daily JSONL files of earlier versions."""
+
+    def test_jsonl_imported_once(self, tmp_path):
+        """Legacy entries are queryable and not imported twice."""
+        log = make_log().model_dump(mode="json")
+        log_file = tmp_path / f"audit_{datetime.utcnow().strftime('%Y%m%d')}.jsonl"
+        log_file.write_text(json.dumps({**log, "id": "legacy-1"}) + "\n")
+
+        AuditLogStorage(str(tmp_path), flush_interval=3600)
+        storage = AuditLogStorage(str(tmp_path), flush_interval=3600)
+
+        assert [log.id for log in storage.query_logs(AuditLogFilter())] == ["legacy-1"]
+
+
+@pytest.mark.unit
+class TestLazyStorage:
+    """Test that the store is opened on first use."""
+
+    def test_import_opens_no_store(self, tmp_path, monkeypatch):
+        """Importing the router and logger creates no database until an event is logged."""
+        import audit.storage
+        from audit.audit_logger import AuditLogger
+        import audit.router  # noqa: F401
+
+        monkeypatch.setattr(audit.storage, "default_storage_dir", lambda: str(tmp_path / "lazy"))
+        assert not (tmp_path / "lazy").exists()
+
+        AuditLogger().log_system_event(action="test_event")
+
+        assert (tmp_path / "lazy" / "audit.db").exists()
@@ -0,0 +1,93 @@
+"""
+Unit tests for in-process batch pipeline execution.
+
+Tests step progress streaming into batch operations and the summary built
+from a finished pipeline run.
+"""
+
+import pytest
+
+from batch.executor import BatchExecutor
+from batch.job_manager import batch_job_manager
+from batch.models import BatchJobType, BatchOperation, BatchOperationStatus
+
+
+@pytest.fixture
+def pipeline_job():
+    operation = BatchOperation(
+        operation_id="op_1",
+        operation_type="pipeline_execution",
+        metadata={"pipeline_id": "orders"}
+    )
+    job = batch_job_manager.create_job(
+        job_type=BatchJobType.BULK_PIPELINE_EXECUTION,
+        name="unit-test-batch",
+        operations=[operation]
+    )
+    yield job
+    batch_job_manager.delete_job(job.job_id)
+
+
+@pytest.mark.unit
+class TestOperationProgress:
+    """Test streaming step completions into a batch job."""
+
+    def test_progress_merged_into_result(self, pipeline_job):
+        """Each update is merged into the running operation's result."""
+        batch_job_manager.update_operation_progress(
+            pipeline_job.job_id, "op_1", {"steps_completed": 1}, broadcast=False
+        )
+        batch_job_manager.update_operation_progress(
+            pipeline_job.job_id, "op_1", {"steps_completed": 2, "last_completed_step": "nulls"},
+            broadcast=False
+        )
+
+        operation = batch_job_manager.get_job(pipeline_job.job_id).operations[0]
+        assert operation.result == {"steps_completed": 2, "last_completed_step": "nulls"}
+        assert operation.status == BatchOperationStatus.PENDING
+
+    def test_unknown_operation_ignored(self, pipeline_job):
+        """Progress for an unknown operation changes nothing."""
+        batch_job_manager.update_operation_progress(
+            pipeline_job.job_id, "missing", {"steps_completed": 1}, broadcast=False
+        )
+        assert batch_job_manager.get_job(pipeline_job.job_id).operations[0].result is None
+
+    def test_steps_completed_counts_out_of_order_steps(self, pipeline_job):
+        """Steps finishing out of order still count up one by one."""
+        on_step_complete = BatchExecutor()._step_progress_callback(pipeline_job.job_id, "op_1", "orders")
+        seen = []
+        for name, index in (("nulls", 2), ("counts", 0), ("dupes", 1)):
+            on_step_complete(name, index, {"status": "PASS"})
+            seen.append(batch_job_manager.get_job(pipeline_job.job_id).operations[0].result["steps_completed"])
+
+        assert seen == [1, 2, 3]
+        assert batch_job_manager.get_job(pipeline_job.job_id).operations[0].result["last_completed_step"] == "dupes"
+
+
+@pytest.mark.unit
+class TestPipelineRunSummary:
+    """Test the operation result built from a finished run."""
+
+    def test_completed_run(self):
+        """A run without failing steps is completed."""
+        summary = BatchExecutor()._summarize_pipeline_run("orders", {
+            "run_id": "run_1",
+            "status": "completed",
+            "results": [{"name": "counts", "status": "PASS"}, {"name": "nulls", "status": "PASS"}]
+        })
+
+        assert summary["status"] == "completed"
+        assert summary["results_summary"] == {"total_steps": 2, "passed": 2, "failed": 0}
+
+    def test_failed_step_reported(self):
+        """Failing steps make the operation fail with their errors."""
+        summary = BatchExecutor()._summarize_pipeline_run("orders", {
+            "run_id": "run_2",
+            "status": "completed",
+            "results": [{"name": "counts", "status": "FAIL", "details": {"error": "count mismatch"}}]
+        })
+
+        assert summary["status"] == "failed"
+        assert summary["run_id"] == "run_2"
+        assert "counts: count mismatch" in summary["error"]
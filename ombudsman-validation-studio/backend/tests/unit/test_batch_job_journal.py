@@ -0,0 +1,179 @@
+"""
+Unit tests for journaled batch job persistence.
+
+Tests that operation changes are appended to the journal instead of
+rewriting the job file, debounced snapshots and compaction, replay on
+startup, the incremental progress counters and debounced broadcasts.
+"""
+
+import pytest
+import json
+import time
+from types import SimpleNamespace
+
+from batch import job_manager as job_manager_module
+from batch.job_journal import JobJournal
+from batch.job_manager import BatchJobManager
+from batch.models import BatchJobType, BatchOperation, BatchOperationStatus
+
+
+def make_manager(storage_dir, monkeypatch):
+    """A BatchJobManager on its own directory, bypassing the singleton"""
+    monkeypatch.setattr(job_manager_module, "paths", SimpleNamespace(batch_jobs_dir=storage_dir))
+    manager = object.__new__(BatchJobManager)
+    manager._jobs = {}
+    manager._initialize()
+    manager._journal.snapshot_delay = 60
+    return manager
+
+
+def make_job(manager, count=10):
+    operations = [
+        BatchOperation(operation_id=f"op_{i}", operation_type="pipeline_execution")
+        for i in range(count)
+    ]
+    return manager.create_job(job_type=BatchJobType.BULK_PIPELINE_EXECUTION, name="journal-test",
+                              operations=operations)
+
+
+def finish_operations(manager, job, count, status=BatchOperationStatus.COMPLETED):
+    for i in range(count):
+        manager.update_operation_status(job.job_id, f"op_{i}", BatchOperationStatus.RUNNING, broadcast=False)
+        manager.update_operation_status(job.job_id, f"op_{i}", status, result={"run_id": f"run_{i}"},
+                                        broadcast=False)
+
+
+@pytest.fixture(autouse=True)
+def no_broadcast(monkeypatch):
+    monkeypatch.setattr(job_manager_module, "_broadcast_job_update_sync", lambda job: None)
+
+
+@pytest.mark.unit
+class TestJobJournal:
+    """Test journaling, snapshots and replay."""
+
+    def test_transitions_append_to_journal(self, tmp_path, monkeypatch):
+        """Operation changes are journaled; the job file is written once."""
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager)
+        finish_operations(manager, job, 5)
+
+        journal = manager._journal
+        assert journal.snapshots_written == 1
+        assert len(journal.replay(job.job_id)) == 10
+        with open(journal.snapshot_path(job.job_id)) as f:
+            assert json.load(f)["progress"]["completed_operations"] == 0
+
+    def test_flush_compacts(self, tmp_path, monkeypatch):
+        """A snapshot folds the journal into the job file."""
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager)
+        finish_operations(manager, job, 5)
+        manager.flush()
+
+        journal = manager._journal
+        assert not journal.journal_path(job.job_id).exists()
+        with open(journal.snapshot_path(job.job_id)) as f:
+            assert json.load(f)["progress"]["completed_operations"] == 5
+
+    def test_long_journal_compacted(self, tmp_path, monkeypatch):
+        """Reaching compact_entries triggers a snapshot without waiting."""
+        manager = make_manager(tmp_path, monkeypatch)
+        manager._journal.compact_entries = 4
+        job = make_job(manager)
+        finish_operations(manager, job, 3)
+
+        assert manager._journal.snapshots_written == 2
+        assert len(manager._journal.replay(job.job_id)) == 2
+
+    def test_replay_on_startup(self, tmp_path, monkeypatch):
+        """Journaled changes survive a restart before any snapshot."""
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager)
+        finish_operations(manager, job, 3)
+        finish_operations(manager, job, 1, status=BatchOperationStatus.FAILED)
+
+        restored = make_manager(tmp_path, monkeypatch).get_job(job.job_id)
+
+        assert restored.operations[2].status == BatchOperationStatus.COMPLETED
+        assert restored.operations[2].result == {"run_id": "run_2"}
+        assert restored.operations[0].status == BatchOperationStatus.FAILED
+        assert restored.progress.completed_operations == 2
+        assert restored.progress.failed_operations == 1
+
+    def test_torn_entry_skipped(self, tmp_path):
+        """An incomplete last line is ignored on replay."""
+        journal = JobJournal(tmp_path, snapshot_delay=60)
+        journal.append("job_1", {"operation_id": "op_0", "fields": {}}, dict)
+        with open(journal.journal_path("job_1"), "a") as f:
+            f.write('{"operation_id": "op_1", "fie')
+
+        assert journal.replay("job_1") == [{"operation_id": "op_0", "fields": {}}]
+
+
+@pytest.mark.unit
+class TestProgressCounters:
+    """Test incremental progress tracking."""
+
+    def test_progress_from_counters(self, tmp_path, monkeypatch):
+        """Progress reflects every transition without rescanning operations."""
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager, count=4)
+        finish_operations(manager, job, 2)
+        manager.update_operation_status(job.job_id, "op_3", BatchOperationStatus.RUNNING, broadcast=False)
+
+        progress = manager.get_job(job.job_id).progress
+        assert progress.completed_operations == 2
+        assert progress.current_operation == "op_3"
+        assert progress.percent_complete == 50.0
+
+    def test_cancel_recounts(self, tmp_path, monkeypatch):
+        """Operations changed outside the manager are recounted."""
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager, count=3)
+        finish_operations(manager, job, 1)
+        manager.cancel_job(job.job_id)
+        manager.update_operation_status(job.job_id, "op_0", BatchOperationStatus.COMPLETED, broadcast=False)
+
+        assert manager.get_job(job.job_id).progress.skipped_operations == 2
+
+
+@pytest.mark.unit
+class TestBroadcastDebounce:
+    """Test debounced operation-level broadcasts."""
+
+    def test_held_back_update_sent_after_interval(self, tmp_path, monkeypatch):
+        """An update inside the interval goes out with the latest state once it ends."""
+        sent = []
+        monkeypatch.setattr(job_manager_module, "BROADCAST_INTERVAL_SECONDS", 0.1)
+        monkeypatch.setattr(job_manager_module, "_broadcast_job_update_sync",
+                            lambda job: sent.append(job.progress.current_operation))
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager, count=3)
+        sent.clear()
+
+        manager.update_operation_status(job.job_id, "op_0", BatchOperationStatus.RUNNING)
+        manager.update_operation_status(job.job_id, "op_0", BatchOperationStatus.COMPLETED)
+        manager.update_operation_status(job.job_id, "op_1", BatchOperationStatus.RUNNING)
+        assert sent == ["op_0"]
+
+        deadline = time.monotonic() + 2
+        while len(sent) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sent == ["op_0", "op_1"]
+
+    def test_last_operation_sent_at_once(self, tmp_path, monkeypatch):
+        """Finishing the last operation broadcasts immediately and drops the trailing one."""
+        sent = []
+        monkeypatch.setattr(job_manager_module, "BROADCAST_INTERVAL_SECONDS", 60)
+        monkeypatch.setattr(job_manager_module, "_broadcast_job_update_sync",
+                            lambda job: sent.append(job.progress.completed_operations))
+        manager = make_manager(tmp_path, monkeypatch)
+        job = make_job(manager, count=1)
+        sent.clear()
+
+        manager.update_operation_status(job.job_id, "op_0", BatchOperationStatus.RUNNING)
+        manager.update_operation_status(job.job_id, "op_0", BatchOperationStatus.COMPLETED)
+
+        assert sent == [0, 1]
+        assert manager._broadcast_timers == {}
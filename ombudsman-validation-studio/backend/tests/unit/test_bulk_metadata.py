@@ -0,0 +1,140 @@
+"""
+Unit tests for set-based metadata extraction.
+
+Tests that a whole schema is read in a fixed number of catalog queries
+and that columns, nullability, primary and foreign keys land on the
+right tables.
+"""
+
+import pytest
+
+from mapping.bulk_metadata import snowflake_schema_metadata, sqlserver_schema_metadata, sqlserver_table_list
+
+
+class ScriptedCursor:
+    """Returns one scripted result set per executed query"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.queries = []
+        self.description = None
+        self._rows = []
+
+    def execute(self, query, params=None):
+        self.queries.append((" ".join(query.split()), params))
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        if isinstance(result, dict):
+            self.description = [(name,) for name in result["columns"]]
+            self._rows = result["rows"]
+        else:
+            self._rows = result
+
+    def fetchall(self):
+        return self._rows
+
+
+@pytest.mark.unit
+class TestSqlServerMetadata:
+    """Test bulk extraction from SQL Server."""
+
+    def test_whole_schema_in_four_queries(self):
+        """Tables, columns, PKs and FKs take one query each, however many tables."""
+        tables = [(f"dim_{i}", "BASE TABLE", None) for i in range(50)] + [
+            ("fact_sales", "BASE TABLE", None), ("v_sales", "VIEW", None)]
+        columns = [
+            ("fact_sales", "ID", "int", None, 10, 0, "NO"),
+            ("fact_sales", "AMOUNT", "decimal", None, 18, 2, "YES"),
+            ("fact_sales", "CUSTOMER_ID", "int", None, 10, 0, "YES"),
+            ("v_sales", "NAME", "varchar", 50, None, None, "YES"),
+            ("other_table", "X", "int", None, 10, 0, "NO"),
+        ]
+        pks = [("fact_sales", "ID")]
+        fks = [("fact_sales", "CUSTOMER_ID", "dim_0", "ID"), ("other_table", "X", "dim_1", "ID")]
+        cursor = ScriptedCursor([tables, columns, pks, fks])
+
+        metadata = sqlserver_schema_metadata(cursor, "dbo", ["dim_%", "fact_%", "v_%"])
+
+        assert len(cursor.queries) == 4
+        assert len(metadata) == 52 and "other_table" not in metadata
+        fact = metadata["fact_sales"]
+        assert fact["columns"] == {"ID": "INT", "AMOUNT": "DECIMAL(18,2)", "CUSTOMER_ID": "INT"}
+        assert fact["nullable"] == {"ID": False, "AMOUNT": True, "CUSTOMER_ID": True}
+        assert fact["primary_key"] == ["ID"]
+        assert fact["relationships"] == {"CUSTOMER_ID": "dim_0.ID"}
+        assert metadata["v_sales"]["object_type"] == "VIEW"
+        assert metadata["v_sales"]["columns"] == {"NAME": "VARCHAR(50)"}
+
+    def test_patterns_are_parameters(self):
+        """Schema and LIKE patterns are bound, not pasted into the SQL."""
+        cursor = ScriptedCursor([[]])
+        sqlserver_schema_metadata(cursor, "sales", ["dim_%"])
+
+        query, params = cursor.queries[0]
+        assert "dim_%" not in query
+        assert params == ["sales", "dim_%"]
+
+    def test_specific_tables(self):
+        """Specific tables are bound by name and match case-insensitively."""
+        cursor = ScriptedCursor([
+            [("DIM_CUSTOMER", "BASE TABLE", "2026-01-05T10:00:00")],
+            [("DIM_CUSTOMER", "ID", "int", None, 10, 0, "NO")], [], []
+        ])
+
+        metadata = sqlserver_schema_metadata(cursor, "dbo", [], specific_tables=["dim_customer"])
+
+        assert len(cursor.queries) == 4
+        assert cursor.queries[0][1] == ["dbo", "dim_customer"]
+        assert cursor.queries[1][1] == ["dbo", "dim_customer"]
+        assert metadata["dim_customer"]["columns"] == {"ID": "INT"}
+
+    def test_table_list_fingerprints(self):
+        """Requested tables missing from the catalog have no fingerprint."""
+        cursor = ScriptedCursor([[("DIM_CUSTOMER", "BASE TABLE", "2026-01-05T10:00:00")]])
+
+        table_list = sqlserver_table_list(cursor, "dbo", [], specific_tables=["dim_customer", "dim_gone"])
+
+        assert table_list == [("dim_customer", "BASE TABLE", "2026-01-05T10:00:00"),
+                              ("dim_gone", "BASE TABLE", None)]
+
+
+@pytest.mark.unit
+class TestSnowflakeMetadata:
+    """Test bulk extraction from Snowflake."""
+
+    def test_whole_schema_without_describe(self):
+        """Columns come from INFORMATION_SCHEMA, keys from SHOW commands."""
+        tables = [("DIM_CUSTOMER", "BASE TABLE", None), ("FACT_SALES", "BASE TABLE", None)]
+        columns = [
+            ("DIM_CUSTOMER", "ID", "NUMBER", "NO"),
+            ("DIM_CUSTOMER", "NAME", "TEXT", "YES"),
+            ("FACT_SALES", "CUSTOMER_ID", "NUMBER", "YES"),
+        ]
+        pks = {"columns": ["created_on", "table_name", "column_name", "key_sequence"],
+               "rows": [(None, "DIM_CUSTOMER", "ID", 1)]}
+        fks = {"columns": ["pk_table_name", "pk_column_name", "fk_table_name", "fk_column_name"],
+               "rows": [("DIM_CUSTOMER", "ID", "FACT_SALES", "CUSTOMER_ID")]}
+        cursor = ScriptedCursor([tables, columns, pks, fks])
+
+        metadata = snowflake_schema_metadata(cursor, "sampledw", "public", ["%"])
+
+        assert not any(q.startswith("DESCRIBE") for q, _ in cursor.queries)
+        assert cursor.queries[2][0] == "SHOW PRIMARY KEYS IN SCHEMA SAMPLEDW.PUBLIC"
+        assert metadata["DIM_CUSTOMER"]["columns"] == {"ID": "NUMBER", "NAME": "VARCHAR"}
+        assert metadata["DIM_CUSTOMER"]["primary_key"] == ["ID"]
+        assert metadata["FACT_SALES"]["relationships"] == {"CUSTOMER_ID": "DIM_CUSTOMER.ID"}
+
+    def test_show_keys_not_permitted(self):
+        """Missing privileges on SHOW commands leave keys empty."""
+        cursor = ScriptedCursor([
+            [("DIM_CUSTOMER", "BASE TABLE", None)],
+            [("DIM_CUSTOMER", "ID", "NUMBER", "NO")],
+            RuntimeError("Insufficient privileges"),
+            RuntimeError("Insufficient privileges"),
+        ])
+
+        metadata = snowflake_schema_metadata(cursor, "SAMPLEDW", "PUBLIC", ["%"])
+
+        assert metadata["DIM_CUSTOMER"]["columns"] == {"ID": "NUMBER"}
+        assert metadata["DIM_CUSTOMER"]["primary_key"] == []
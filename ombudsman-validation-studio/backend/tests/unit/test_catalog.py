@@ -0,0 +1,164 @@
+"""
+Unit tests for catalog-based record counts and change detection.
+
+Tests when catalog counts replace COUNT(*), the fallback to exact counts,
+and skipping steps whose tables are unchanged since they last passed.
+"""
+
+import pytest
+import sys
+import os
+from datetime import datetime
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.catalog import CatalogStats, ChangeDetector, catalog_fallback_reason
+from ombudsman.core.incremental import WatermarkStore
+from ombudsman.pipeline.step_executor import StepExecutor
+from ombudsman.validation.dq.validate_record_counts import validate_record_counts
+
+
+class CatalogConnection:
+    """Answers catalog queries from fixed stats and COUNT(*) from a row count"""
+
+    def __init__(self, catalog_count, exact_count, age_seconds=3600, modified=datetime(2024, 1, 1)):
+        self.catalog = (catalog_count, modified, age_seconds)
+        self.exact_count = exact_count
+        self.queries = []
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        if "dm_db_partition_stats" in query or "INFORMATION_SCHEMA.TABLES" in query:
+            return [self.catalog]
+        return [(self.exact_count,)]
+
+    def fetch_one(self, query):
+        return self.fetch_many(query)[0][0]
+
+    def fetch_dicts(self, query):
+        return []
+
+    def count_queries(self):
+        return [q for q in self.queries if q.startswith("SELECT COUNT(*)")]
+
+
+class StubRegistry:
+    def __init__(self, funcs):
+        self.registry = {name: {"func": func} for name, func in funcs.items()}
+
+    def get(self, name):
+        return self.registry.get(name)
+
+
+MAPPING = {"orders": {"sql": "dbo.orders", "snow": "DW.ORDERS"}}
+
+
+@pytest.mark.unit
+class TestCatalogFallback:
+    """Test when catalog counts can be trusted."""
+
+    def test_settled_matching_counts_trusted(self):
+        """Equal counts on tables idle past the settle window need no COUNT(*)."""
+        stats = CatalogStats(100, datetime(2024, 1, 1), 3600)
+        assert catalog_fallback_reason(stats, stats, settle_seconds=300) is None
+
+    def test_fallback_reasons(self):
+        """Missing stats, differing counts and recent writes need exact counts."""
+        settled = CatalogStats(100, datetime(2024, 1, 1), 3600)
+        assert "unavailable" in catalog_fallback_reason(settled, None)
+        assert "differ" in catalog_fallback_reason(settled, CatalogStats(99, datetime(2024, 1, 1), 3600))
+        assert "Snowflake" in catalog_fallback_reason(settled, CatalogStats(100, datetime(2024, 1, 1), 10))
+
+
+@pytest.mark.unit
+class TestCatalogRecordCounts:
+    """Test validate_record_counts in catalog mode."""
+
+    def test_catalog_counts_skip_scan(self):
+        """Matching settled catalog counts pass without COUNT(*) on either side."""
+        sql, snow = CatalogConnection(500, 500), CatalogConnection(500, 500)
+        result = validate_record_counts(sql, snow, "orders", MAPPING, count_mode="catalog")
+
+        assert result["status"] == "PASS"
+        assert result["count_source"] == "catalog"
+        assert sql.count_queries() == [] and snow.count_queries() == []
+
+    def test_disagreeing_catalog_falls_back(self):
+        """Differing catalog counts are confirmed with exact counts."""
+        sql, snow = CatalogConnection(500, 500), CatalogConnection(498, 500)
+        result = validate_record_counts(sql, snow, "orders", MAPPING, count_mode="catalog")
+
+        assert result["status"] == "PASS"
+        assert result["count_source"] == "exact"
+        assert result["catalog"]["fallback_reason"] == "catalog row counts differ"
+        assert len(sql.count_queries()) == 1
+
+    def test_exact_mode_unchanged(self):
+        """The default mode never reads the catalog."""
+        sql = CatalogConnection(500, 500)
+        result = validate_record_counts(sql, CatalogConnection(500, 500), "orders", MAPPING)
+
+        assert "count_source" not in result
+        assert sql.queries[0].startswith("SELECT COUNT(*)")
+
+
+@pytest.mark.unit
+class TestChangeDetection:
+    """Test skipping steps on unchanged tables."""
+
+    def run_twice(self, second_sql, step=None, second_metadata=None):
+        calls = []
+
+        def validator(sql_conn, snow_conn, table, **kwargs):
+            calls.append(table)
+            return {"status": "PASS"}
+
+        store = WatermarkStore()
+        step = step or {"name": "validate_record_counts", "config": {"table": "orders"}}
+        registry = StubRegistry({step["name"]: validator})
+        metadata = {"orders": {"columns": {"id": "INT"}}}
+        for sql, meta in ((CatalogConnection(500, 500), metadata), (second_sql, second_metadata or metadata)):
+            executor = StepExecutor(registry, sql, CatalogConnection(500, 500), MAPPING, meta,
+                                    change_detector=ChangeDetector(store, MAPPING, meta))
+            result = executor.run_step(step)
+        return calls, result
+
+    def test_unchanged_table_skipped(self):
+        """A passing step is skipped next run when the fingerprints match."""
+        calls, result = self.run_twice(CatalogConnection(500, 500))
+
+        assert calls == ["orders"]
+        assert result.status == "SKIPPED"
+        assert result.details["table"] == "orders"
+
+    def test_changed_table_revalidated(self):
+        """A new row count or modification time runs the step again."""
+        calls, result = self.run_twice(CatalogConnection(501, 501, modified=datetime(2024, 2, 1)))
+
+        assert calls == ["orders", "orders"]
+        assert result.status == "PASS"
+
+    def test_metadata_change_revalidated(self):
+        """A changed table definition runs the step again although the data is the same."""
+        calls, result = self.run_twice(CatalogConnection(500, 500),
+                                       second_metadata={"orders": {"columns": {"id": "BIGINT"}}})
+
+        assert calls == ["orders", "orders"]
+        assert result.status == "PASS"
+
+    def test_unmapped_referenced_table_not_skipped(self):
+        """A step also reading a table without a fingerprint always runs."""
+        step = {"name": "validate_foreign_keys",
+                "config": {"table": "orders", "fk_column": "customer_id",
+                           "ref_table": "customers", "ref_column": "id"}}
+        calls, result = self.run_twice(CatalogConnection(500, 500), step=step)
+
+        assert calls == ["orders", "orders"]
+        assert result.status == "PASS"
+
+    def test_referenced_tables(self):
+        """Every table option of a step is fingerprinted."""
+        config = {"table": "orders", "ref_table": "customers", "fk_column": "customer_id"}
+        assert ChangeDetector.referenced_tables(config) == ["customers", "orders"]
+        assert ChangeDetector.referenced_tables({"tables": [{"sql": "a"}]}) == []
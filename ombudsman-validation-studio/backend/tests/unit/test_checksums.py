@@ -0,0 +1,129 @@
+"""
+Unit tests for portable cross-engine checksums.
+
+Tests type-aware canonicalization SQL and the fingerprint validator.
+"""
+
+import pytest
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.validation.hashing import (
+    parse_type,
+    type_category,
+    canonical_expression,
+    hash_slice_expression,
+    table_fingerprint,
+    NULL_MARKER,
+)
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE
+from ombudsman.validation.validate_checksums import validate_checksums
+
+
+class FingerprintConnection:
+    """Returns a fixed fingerprint row and per-column sums"""
+
+    def __init__(self, table_row, column_row=None):
+        self.table_row = table_row
+        self.column_row = column_row
+        self.queries = []
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        if query.startswith("SELECT COUNT(*)"):
+            return [self.table_row]
+        return [self.column_row]
+
+
+MAPPING = {"orders": {"sql": "dbo.orders", "snow": "SALES.ORDERS"}}
+METADATA = {"orders": {"columns": {"ID": "INT", "AMOUNT": "DECIMAL(18,2)", "CREATED": "DATETIME2"}}}
+
+
+@pytest.mark.unit
+class TestTypeCategories:
+    """Test type parsing and categorization."""
+
+    def test_parse_type(self):
+        """Precision and scale are split off the type name."""
+        assert parse_type("DECIMAL(18, 2)") == ("decimal", "18", 2)
+        assert parse_type("NVARCHAR(MAX)") == ("nvarchar", "max", None)
+        assert parse_type(None) == (None, None, None)
+
+    @pytest.mark.parametrize("data_type,category", [
+        ("INT", "integer"),
+        ("NUMBER(38,0)", "decimal"),
+        ("FLOAT", "float"),
+        ("BIT", "boolean"),
+        ("BOOLEAN", "boolean"),
+        ("DATETIME2(7)", "timestamp"),
+        ("TIMESTAMP_TZ", "timestamp_tz"),
+        ("VARCHAR(50)", "string"),
+        ("VARBINARY(MAX)", "binary"),
+        ("GEOGRAPHY", "text"),
+    ])
+    def test_categories(self, data_type, category):
+        """SQL Server and Snowflake spellings map to shared categories."""
+        assert type_category(data_type) == category
+
+
+@pytest.mark.unit
+class TestCanonicalExpressions:
+    """Test generated canonicalization SQL."""
+
+    def test_decimal_scale_from_type(self):
+        """Decimals are cast to the scale declared in the type."""
+        assert "DECIMAL(38, 2)" in canonical_expression("AMOUNT", SQLSERVER, "DECIMAL(18,2)")
+        assert "NUMBER(38, 2)" in canonical_expression("AMOUNT", SNOWFLAKE, "DECIMAL(18,2)")
+
+    def test_timestamp_truncated_to_precision(self):
+        """Both engines keep the same number of characters."""
+        sql = canonical_expression("CREATED", SQLSERVER, "DATETIME2", timestamp_precision=3)
+        snow = canonical_expression("CREATED", SNOWFLAKE, "DATETIME2", timestamp_precision=3)
+        assert sql.endswith(", 23), '#NULL#')")
+        assert snow.endswith(", 23), '#NULL#')")
+
+    def test_null_marker_and_trim(self):
+        """NULLs become the marker and strings are right-trimmed."""
+        expr = canonical_expression("NAME", SNOWFLAKE, "VARCHAR")
+        assert expr == f"COALESCE(RTRIM(CAST(NAME AS VARCHAR)), '{NULL_MARKER}')"
+
+    def test_sqlserver_hashes_utf8(self):
+        """SQL Server converts to UTF-8 before hashing."""
+        assert "_UTF8 AS VARCHAR(MAX)" in hash_slice_expression("s", SQLSERVER)
+
+
+@pytest.mark.unit
+class TestChecksumValidator:
+    """Test the fingerprint validator."""
+
+    def test_fingerprint_single_scan(self):
+        """A table fingerprint is one aggregate query."""
+        conn = FingerprintConnection((3, 10, 20, 30, 40))
+        fp = table_fingerprint(conn, SNOWFLAKE, "SALES.ORDERS", ["ID"])
+
+        assert fp["fingerprint"] == "3:a-14-1e-28"
+        assert len(conn.queries) == 1
+
+    def test_matching_tables_pass(self):
+        """Equal fingerprints pass without column drill-down."""
+        sql = FingerprintConnection((5, 1, 2, 3, 4))
+        snow = FingerprintConnection((5, 1, 2, 3, 4))
+
+        result = validate_checksums(sql, snow, "orders", MAPPING, METADATA)
+
+        assert result["status"] == "PASS"
+        assert len(sql.queries) == len(snow.queries) == 1
+
+    def test_mismatch_reports_columns(self):
+        """A mismatch is narrowed down to the differing columns."""
+        sql = FingerprintConnection((5, 1, 2, 3, 4), (1, 1, 2, 2, 3, 3))
+        snow = FingerprintConnection((5, 1, 2, 3, 9), (1, 1, 2, 7, 3, 3))
+
+        result = validate_checksums(sql, snow, "orders", MAPPING, METADATA)
+
+        assert result["status"] == "FAIL"
+        assert [i["column"] for i in result["issues"]] == ["AMOUNT"]
+        assert result["issues"][0]["canonical_type"] == "decimal"
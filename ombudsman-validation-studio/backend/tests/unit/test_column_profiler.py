@@ -0,0 +1,125 @@
+"""
+Unit tests for single-pass column profiling.
+
+Tests build_profile_queries, profile_table and validate_nulls on top of it.
+"""
+
+import pytest
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE
+from ombudsman.validation.column_profiler import build_profile_queries, profile_table
+from ombudsman.validation.dq.validate_nulls import validate_nulls
+
+
+class FakeConnection:
+    """Answers profile queries with fixed values and records every query"""
+
+    def __init__(self, null_counts, row_count=100):
+        self.null_counts = null_counts
+        self.row_count = row_count
+        self.queries = []
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        return [tuple([self.row_count] + list(self.null_counts))]
+
+    def fetch_dicts(self, query):
+        self.queries.append(query)
+        return [{"id": 1}]
+
+
+@pytest.mark.unit
+class TestBuildProfileQueries:
+    """Test profile query generation."""
+
+    def test_single_query_for_all_columns(self):
+        """All columns are profiled in one SELECT."""
+        queries = build_profile_queries(SQLSERVER, "[dbo].[t]", ["a", "b", "c"])
+
+        assert len(queries) == 1
+        query, slots = queries[0]
+        assert query.startswith("SELECT COUNT(*) AS p0")
+        assert "SUM(CASE WHEN [a] IS NULL THEN 1 ELSE 0 END) AS p1" in query
+        assert slots == [(None, "row_count"), ("a", "null_count"), ("b", "null_count"), ("c", "null_count")]
+
+    def test_snowflake_dialect(self):
+        """Snowflake columns are unquoted and use STDDEV."""
+        query, _ = build_profile_queries(SNOWFLAKE, "DB.S.T", ["x"], aggregates=("stddev",))[0]
+        assert "STDDEV(x)" in query
+
+    def test_wide_tables_are_chunked(self):
+        """Select lists are split at max_expressions."""
+        cols = [f"c{i}" for i in range(10)]
+        queries = build_profile_queries(SQLSERVER, "[dbo].[t]", cols, max_expressions=4)
+
+        assert len(queries) == 3
+        assert sum(len(slots) for _, slots in queries) == 11
+
+    def test_where_clause(self):
+        """Optional predicate is appended."""
+        query, _ = build_profile_queries(SQLSERVER, "[dbo].[t]", ["a"], where="[id] > 5")[0]
+        assert query.endswith("FROM [dbo].[t] WHERE [id] > 5")
+
+    def test_unknown_aggregate(self):
+        """Unknown aggregates are rejected."""
+        with pytest.raises(ValueError):
+            build_profile_queries(SQLSERVER, "[dbo].[t]", ["a"], aggregates=("median",))
+
+
+@pytest.mark.unit
+class TestProfileTable:
+    """Test profile execution and result mapping."""
+
+    def test_profile_values(self):
+        """Values are mapped back to their columns."""
+        conn = FakeConnection([0, 7])
+        profile = profile_table(conn, SQLSERVER, "[dbo].[t]", ["a", "b"])
+
+        assert profile["row_count"] == 100
+        assert profile["columns"]["a"]["null_count"] == 0
+        assert profile["columns"]["b"]["null_count"] == 7
+        assert len(conn.queries) == 1
+
+
+@pytest.mark.unit
+class TestValidateNulls:
+    """Test validate_nulls round-trips."""
+
+    def test_one_scan_per_side_and_lazy_samples(self):
+        """Samples are only fetched for mismatching columns."""
+        cols = [f"c{i}" for i in range(120)]
+        sql_conn = FakeConnection([0] * 120)
+        snow_conn = FakeConnection([0] * 119 + [3])
+
+        result = validate_nulls(
+            sql_conn, snow_conn, "t",
+            {"t": {"sql": "dbo.t", "snow": "S.T"}},
+            {"t": {"columns": cols}}
+        )
+
+        assert result["status"] == "FAIL"
+        assert [i["column"] for i in result["issues"]] == ["c119"]
+        # 1 profile scan + 2 sample queries for the single mismatching column
+        assert len(sql_conn.queries) == 3
+        assert len(snow_conn.queries) == 3
+        assert "sql_null_samples" in result["explain"]["c119"]
+        assert "sql_null_samples" not in result["explain"]["c0"]
+
+    def test_pass(self):
+        """Matching counts pass without sample queries."""
+        sql_conn = FakeConnection([1, 2])
+        snow_conn = FakeConnection([1, 2])
+
+        result = validate_nulls(
+            sql_conn, snow_conn, "t",
+            {"t": {"sql": "dbo.t", "snow": "S.T"}},
+            {"t": {"columns": {"a": "INT", "b": "INT"}}}
+        )
+
+        assert result["status"] == "PASS"
+        assert len(sql_conn.queries) == 1
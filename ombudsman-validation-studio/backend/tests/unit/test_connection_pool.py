@@ -314,6 +314,32 @@ class TestConnectionPool:
         # Cleanup
         pool.close_all()
 
+    def test_ensure_capacity(self):
+        """Test growing a pool beyond its original max_size."""
+        pool = ConnectionPool(
+            name="test_pool",
+            connection_factory=lambda: MockConnection(),
+            min_size=1,
+            max_size=2,
+            connection_timeout=1
+        )
+
+        connections = [pool._get() for _ in range(2)]
+        pool.ensure_capacity(4)
+        connections += [pool._get() for _ in range(2)]
+
+        assert pool.get_stats()["active_connections"] == 4
+
+        # Never shrinks
+        pool.ensure_capacity(3)
+        assert pool.max_size == 4
+
+        # Cleanup
+        for conn in connections:
+            pool._put(conn)
+        assert pool.get_stats()["pool_size"] == 4
+        pool.close_all()
+
     def test_close_all(self):
         """Test closing all connections in pool."""
         pool = ConnectionPool(
@@ -381,6 +407,19 @@ class TestConnectionPoolManager:
         # Cleanup
         manager.close_all_pools()
 
+    def test_get_or_create_pool_grows_existing(self):
+        """Test that asking for a larger max_size grows an existing pool."""
+        manager = ConnectionPoolManager()
+
+        pool = manager.get_or_create_pool("grow_pool", lambda: MockConnection(), min_size=1, max_size=5)
+        same = manager.get_or_create_pool("grow_pool", lambda: MockConnection(), min_size=1, max_size=9)
+
+        assert same is pool
+        assert pool.max_size == 9
+
+        # Cleanup
+        manager.close_all_pools()
+
     def test_get_pool(self):
         """Test getting existing pool."""
         manager = ConnectionPoolManager()
@@ -0,0 +1,126 @@
+"""
+Unit tests for concurrent dual-engine query dispatch.
+
+Tests that both sides run at the same time, that errors from either side
+propagate, and that a shared connection is used sequentially.
+"""
+
+import pytest
+import sys
+import os
+import threading
+import time
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.dispatch import dispatch_pair, run_pair
+from ombudsman.validation.dq.validate_outliers import validate_outliers
+from ombudsman.validation.dq.validate_record_counts import validate_record_counts
+
+
+class SlowConnection:
+    """Answers every query with a fixed value after a delay"""
+
+    def __init__(self, value, delay=0.0):
+        self.value = value
+        self.delay = delay
+        self.threads = []
+
+    def fetch_one(self, query):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return self.value
+
+    def fetch_dicts(self, query):
+        return [{"query": query}]
+
+
+class MomentsConnection(SlowConnection):
+    """Answers moment queries with fixed statistics and outlier counts with 0"""
+
+    def fetch_many(self, query):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [(100, 5.0, 1.0, 0.0, 10.0)]
+
+
+MAPPING = {"orders": {"sql": "dbo.orders", "snow": "DW.ORDERS"}}
+
+
+@pytest.mark.unit
+class TestDispatchPair:
+    """Test running both engines together."""
+
+    def test_sides_overlap(self):
+        """Wall time is close to the slower side, not the sum."""
+        sql, snow = SlowConnection(1, delay=0.3), SlowConnection(2, delay=0.3)
+
+        start = time.time()
+        result = run_pair(sql, snow, "SELECT 1", "SELECT 2")
+        elapsed = time.time() - start
+
+        assert result == (1, 2)
+        assert elapsed < 0.5
+
+    def test_snowflake_error_raised(self):
+        """A failure on the Snowflake side is re-raised after both finish."""
+        finished = []
+
+        def snow_call():
+            raise RuntimeError("warehouse suspended")
+
+        with pytest.raises(RuntimeError, match="warehouse suspended"):
+            dispatch_pair(lambda: finished.append("sql"), snow_call)
+        assert finished == ["sql"]
+
+    def test_sql_error_waits_for_snowflake(self):
+        """A SQL Server failure still lets the Snowflake query complete."""
+        finished = []
+
+        def sql_call():
+            raise RuntimeError("login failed")
+
+        def snow_call():
+            time.sleep(0.1)
+            finished.append("snow")
+
+        with pytest.raises(RuntimeError, match="login failed"):
+            dispatch_pair(sql_call, snow_call)
+        assert finished == ["snow"]
+
+    def test_shared_connection_sequential(self):
+        """One connection object for both sides is never used concurrently."""
+        conn = SlowConnection(5)
+        assert run_pair(conn, conn, "SELECT 1", "SELECT 2") == (5, 5)
+        assert conn.threads == [threading.current_thread().name] * 2
+
+
+@pytest.mark.unit
+class TestValidatorDispatch:
+    """Test built-in validators querying both engines at once."""
+
+    def test_record_counts_overlap(self):
+        """Counts on both engines are fetched concurrently."""
+        sql, snow = SlowConnection(10, delay=0.3), SlowConnection(10, delay=0.3)
+
+        start = time.time()
+        result = validate_record_counts(sql, snow, "orders", MAPPING, {})
+        elapsed = time.time() - start
+
+        assert result["status"] == "PASS"
+        assert elapsed < 0.5
+        assert snow.threads == ["snow-dispatch"]
+
+    def test_outlier_stats_overlap(self):
+        """Moments and outlier counts of both engines are computed concurrently."""
+        sql, snow = MomentsConnection(0, delay=0.2), MomentsConnection(0, delay=0.2)
+
+        start = time.time()
+        result = validate_outliers(sql, snow, "orders", MAPPING, {"orders": {"numeric_columns": ["amount"]}})
+        elapsed = time.time() - start
+
+        assert result["status"] == "PASS"
+        assert elapsed < 0.6
+        assert set(snow.threads) == {"snow-dispatch"}
+        assert set(sql.threads) == {threading.current_thread().name}
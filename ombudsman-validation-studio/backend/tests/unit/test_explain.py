@@ -0,0 +1,207 @@
+"""
+Unit tests for deferred explain data.
+
+Tests recording explain queries instead of running them, resolving them
+later into the same payload, the step executor fetching them only for
+steps that do not pass, and the step details endpoint resolving them on
+first access.
+"""
+
+import pytest
+import sys
+import os
+from contextlib import contextmanager
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.validation.explain import (
+    DEFERRED_KEY, explain_pair, has_deferred, resolve_explain, without_deferred
+)
+from ombudsman.validation.dq.validate_record_counts import validate_record_counts
+from ombudsman.pipeline.step_executor import StepExecutor
+from execution import results
+from execution.result_store import load_run_file, write_run_file
+
+
+class SampleConnection:
+    """Returns a fixed row count and sample rows, recording every query"""
+
+    def __init__(self, count, rows=None, fail_samples=False):
+        self.count = count
+        self.rows = rows if rows is not None else [{"ID": i} for i in range(30)]
+        self.fail_samples = fail_samples
+        self.queries = []
+
+    def fetch_one(self, query):
+        self.queries.append(query)
+        return self.count
+
+    def fetch_many(self, query):
+        return [(self.fetch_one(query),)]
+
+    def fetch_dicts(self, query):
+        self.queries.append(query)
+        if self.fail_samples:
+            raise RuntimeError("Connection reset")
+        return list(self.rows)
+
+    def sample_queries(self):
+        return [q for q in self.queries if "20" in q]
+
+
+class StubRegistry:
+    def __init__(self, funcs):
+        self.registry = {name: {"func": func} for name, func in funcs.items()}
+
+    def get(self, name):
+        return self.registry.get(name)
+
+
+MAPPING = {"orders": {"sql": "dbo.orders", "snow": "DW.ORDERS"}}
+
+
+@pytest.mark.unit
+class TestExplainPair:
+    """Test deferring and resolving explain queries."""
+
+    def test_deferred_resolves_like_eager(self):
+        """A resolved deferred payload equals the eagerly collected one."""
+        eager, deferred = {}, {}
+        conns = (SampleConnection(0), SampleConnection(0))
+
+        explain_pair(eager, "sql_samples", "snow_samples", *conns, "SELECT TOP 20 *", "SELECT * LIMIT 20")
+        explain_pair(deferred, "sql_samples", "snow_samples", *conns, "SELECT TOP 20 *", "SELECT * LIMIT 20",
+                     defer=True)
+
+        assert "sql_samples" not in deferred and has_deferred({"col": deferred})
+        assert resolve_explain({"col": deferred}, *conns) == 1
+        assert deferred == eager
+        assert len(eager["sql_samples"]) == 20
+
+    def test_mapped_columns(self):
+        """map_columns turns bucket rows into a {bucket: count} dict."""
+        rows = [{"bucket": 1, "count": 5}, {"bucket": 2, "count": 7}]
+        node = {}
+        explain_pair(node, "sql_dist", "snow_dist", SampleConnection(0, rows), SampleConnection(0, rows),
+                     "q1", "q2", map_columns=("bucket", "count"))
+
+        assert node["sql_dist"] == {1: 5, 2: 7}
+
+    def test_failed_query_sets_error(self):
+        """A failing deferred query leaves an error on its node."""
+        node = {}
+        explain_pair(node, "sql_samples", "snow_samples", None, None, "q1", "q2", defer=True)
+        resolve_explain(node, SampleConnection(0, fail_samples=True), SampleConnection(0))
+
+        assert DEFERRED_KEY not in node
+        assert "Connection reset" in node["error"]
+
+    def test_failed_distribution_empty_in_both_modes(self):
+        """With empty_on_error a failing query gives empty rows, deferred or not."""
+        failing = SampleConnection(0, fail_samples=True)
+        eager, deferred = {}, {}
+        for node, defer in ((eager, False), (deferred, True)):
+            explain_pair(node, "sql_distribution", "snow_distribution", failing, failing, "q1", "q2",
+                         defer=defer, map_columns=("bucket", "count"), empty_on_error=True)
+        resolve_explain(deferred, failing, failing)
+
+        assert eager == deferred == {"sql_distribution": {}, "snow_distribution": {}}
+
+    def test_without_deferred(self):
+        """Served payloads drop the recorded query specs."""
+        node = {}
+        explain_pair(node, "sql_samples", "snow_samples", None, None, "q1", "q2", defer=True)
+
+        assert without_deferred({"results": [{"explain": {"col": node}}]}) == {"results": [{"explain": {"col": {}}}]}
+        assert has_deferred(node)
+
+
+@pytest.mark.unit
+class TestDeferredValidators:
+    """Test validators and the step executor with deferred explain data."""
+
+    def test_validator_skips_sample_queries(self):
+        """A deferring validator runs no sample queries of its own."""
+        sql, snow = SampleConnection(10), SampleConnection(10)
+        result = validate_record_counts(sql, snow, "orders", MAPPING, defer_explain=True)
+
+        assert result["status"] == "PASS"
+        assert sql.sample_queries() == [] and snow.sample_queries() == []
+        assert has_deferred(result["explain"])
+
+    def run_step(self, sql_count, snow_count):
+        sql, snow = SampleConnection(sql_count), SampleConnection(snow_count)
+        registry = StubRegistry({"validate_record_counts": validate_record_counts})
+        executor = StepExecutor(registry, sql, snow, MAPPING, {}, defer_explain=True)
+        return executor.run_step({"name": "validate_record_counts", "config": {"table": "orders"}})
+
+    def test_passing_step_keeps_queries(self):
+        """Passing steps keep their explain queries for later."""
+        result = self.run_step(10, 10)
+
+        assert result.status == "PASS"
+        assert has_deferred(result.details["explain"])
+
+    def test_failing_step_fetches_samples(self):
+        """Failing steps have their samples fetched before the result is stored."""
+        result = self.run_step(10, 9)
+
+        assert result.status == "FAIL"
+        assert not has_deferred(result.details["explain"])
+        assert len(result.details["explain"]["snow_samples"]) == 20
+
+
+def write_deferred_run(tmp_path):
+    explain = {}
+    explain_pair(explain, "sql_samples", "snow_samples", None, None,
+                 "SELECT TOP 20 *", "SELECT * LIMIT 20", defer=True)
+    write_run_file(str(tmp_path / "run_1.json"), {
+        "run_id": "run_1",
+        "pipeline_def": {},
+        "steps": [{"name": "validate_record_counts", "status": "PASS", "details": {"explain": explain}}]
+    })
+    return str(tmp_path / "run_1.json")
+
+
+@pytest.mark.unit
+class TestStepDetailsExplain:
+    """Test resolving deferred explain data when a stored step is opened."""
+
+    def test_resolved_explain_written_back(self, tmp_path, monkeypatch):
+        """Samples are fetched once and stored in the result file."""
+        path = write_deferred_run(tmp_path)
+        leased = []
+
+        @contextmanager
+        def lease(result_data):
+            leased.append(result_data["run_id"])
+            yield SampleConnection(0), SampleConnection(0)
+
+        monkeypatch.setattr(results, "_lease_run_connections", lease)
+        data = load_run_file(path, details=False)
+        details = load_run_file(path)["steps"][0]["details"]
+
+        results._resolve_deferred_explain(path, data, 0, details)
+        results._resolve_deferred_explain(path, data, 0, details)
+
+        stored = load_run_file(path)["steps"][0]["details"]["explain"]
+        assert leased == ["run_1"]
+        assert not has_deferred(stored)
+        assert len(stored["sql_samples"]) == 20
+
+    def test_failed_resolution_reports_explain_error(self, tmp_path, monkeypatch):
+        """A step whose samples cannot be fetched is still served, with explain_error."""
+        path = write_deferred_run(tmp_path)
+
+        def lease(result_data):
+            raise RuntimeError("Snowflake unreachable")
+
+        monkeypatch.setattr(results, "_lease_run_connections", lease)
+        monkeypatch.setattr(results, "_find_result_file", lambda run_id: path)
+
+        response = results.get_step_details("run_1", "validate_record_counts")
+
+        assert response["status"] == "PASS"
+        assert "Snowflake unreachable" in response["explain_error"]
+        assert has_deferred(load_run_file(path)["steps"][0]["details"]["explain"])
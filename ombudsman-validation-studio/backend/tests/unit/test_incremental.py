@@ -0,0 +1,167 @@
+"""
+Unit tests for incremental validation with watermarks.
+
+Tests watermark predicates, aggregate merging, the watermark store and
+incremental record count / metric sum validation.
+"""
+
+import pytest
+import re
+import sys
+import os
+from datetime import date, datetime
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.incremental import (
+    WatermarkStore,
+    IncrementalRun,
+    watermark_predicate,
+    merge_aggregates,
+    encode_watermark,
+    decode_watermark,
+)
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE
+from ombudsman.validation.dq.validate_record_counts import validate_record_counts
+from ombudsman.validation.metrics.validate_metric_sums import validate_metric_sums
+
+
+class WatermarkedConnection:
+    """Rows of (load_id, amount) answering MAX/COUNT/SUM with an optional window"""
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.queries = []
+
+    def _window(self, query):
+        low = re.search(r"> (\d+)", query)
+        high = re.search(r"<= (\d+)", query)
+        return [
+            r for r in self.rows
+            if (not low or r[0] > int(low.group(1))) and (not high or r[0] <= int(high.group(1)))
+        ]
+
+    def fetch_one(self, query):
+        self.queries.append(query)
+        if query.startswith("SELECT MAX("):
+            return max((r[0] for r in self.rows), default=None)
+        rows = self._window(query)
+        if query.startswith("SELECT COUNT(*)"):
+            return len(rows)
+        return sum(r[1] for r in rows)
+
+    def fetch_dicts(self, query):
+        return []
+
+
+MAPPING = {"orders": {"sql": "dbo.orders", "snow": "SALES.ORDERS"}}
+METADATA = {"orders": {"columns": ["LOAD_ID", "AMOUNT"], "watermark_column": "LOAD_ID"}}
+
+
+@pytest.mark.unit
+class TestWatermarkHelpers:
+    """Test predicates, encoding and merging."""
+
+    def test_predicate_bounds(self):
+        """Windows are (low, high] and quoted per dialect."""
+        assert watermark_predicate("LOAD_ID", SQLSERVER, 5, 9) == "[LOAD_ID] > 5 AND [LOAD_ID] <= 9"
+        assert watermark_predicate("LOAD_ID", SNOWFLAKE, None, 9) == "LOAD_ID <= 9"
+        assert watermark_predicate("LOAD_ID", SNOWFLAKE) is None
+
+    def test_timestamp_literals_are_cast(self):
+        """Timestamps are cast explicitly on both engines."""
+        ts = datetime(2024, 1, 2, 3, 4, 5, 123456)
+        assert "AS DATETIME2(7)" in watermark_predicate("UPDATED", SQLSERVER, ts)
+        assert "AS TIMESTAMP_NTZ(9)" in watermark_predicate("UPDATED", SNOWFLAKE, ts)
+
+    def test_encoding_round_trip(self):
+        """Watermarks survive JSON encoding with their type."""
+        for value in (42, date(2024, 5, 1), datetime(2024, 5, 1, 12, 30), "A-17"):
+            assert decode_watermark(encode_watermark(value)) == value
+
+    def test_merge_aggregates(self):
+        """Nested numeric aggregates are added key by key."""
+        merged = merge_aggregates({"sql": {"a": 1, "b": 2}}, {"sql": {"a": 10, "c": 5}})
+        assert merged == {"sql": {"a": 11, "b": 2, "c": 5}}
+
+    def test_store_persists(self, tmp_path):
+        """Entries are saved on put and reloaded by a new store."""
+        path = str(tmp_path / "watermarks.json")
+        WatermarkStore(path).put("k", {"watermark": encode_watermark(3)})
+        assert WatermarkStore(path).get("k") == {"watermark": {"type": "int", "value": "3"}}
+
+    def test_scope_change_forces_full_run(self):
+        """Cached totals for another column set are not reused."""
+        store = WatermarkStore()
+        store.put("k", {"watermark_column": "LOAD_ID", "watermark": encode_watermark(3),
+                        "scope": {"columns": ["A"]}, "aggregates": {}})
+
+        assert IncrementalRun(store, "k", "LOAD_ID", scope={"columns": ["A"]}).mode == "incremental"
+        assert IncrementalRun(store, "k", "LOAD_ID", scope={"columns": ["B"]}).mode == "full"
+
+
+@pytest.mark.unit
+class TestIncrementalValidators:
+    """Test validators running over the delta only."""
+
+    def test_record_counts_scan_only_delta(self):
+        """The second run counts new rows and adds the cached totals."""
+        store = WatermarkStore()
+        sql = WatermarkedConnection([(i, 1) for i in range(1, 101)])
+        snow = WatermarkedConnection([(i, 1) for i in range(1, 101)])
+
+        first = validate_record_counts(sql, snow, "orders", MAPPING, METADATA, store, incremental=True)
+        assert first["incremental"]["mode"] == "full"
+        assert first["sql_count"] == 100
+
+        sql.rows += [(101, 1), (102, 1)]
+        snow.rows += [(101, 1), (102, 1)]
+        second = validate_record_counts(sql, snow, "orders", MAPPING, METADATA, store, incremental=True)
+
+        assert second["status"] == "PASS"
+        assert second["incremental"]["mode"] == "incremental"
+        assert second["incremental"]["sql_delta"] == 2
+        assert second["sql_count"] == second["snow_count"] == 102
+        assert "[LOAD_ID] > 100 AND [LOAD_ID] <= 102" in sql.queries[-1]
+
+    def test_failed_window_is_revalidated(self):
+        """The watermark does not advance past a mismatching window."""
+        store = WatermarkStore()
+        sql = WatermarkedConnection([(1, 1), (2, 1)])
+        snow = WatermarkedConnection([(1, 1)])
+
+        failed = validate_record_counts(sql, snow, "orders", MAPPING, METADATA, store, incremental=True)
+        assert failed["status"] == "FAIL"
+
+        snow.rows.append((2, 1))
+        retried = validate_record_counts(sql, snow, "orders", MAPPING, METADATA, store, incremental=True)
+        assert retried["status"] == "PASS"
+        assert retried["incremental"]["mode"] == "full"
+
+    def test_not_incremental_without_flag(self):
+        """Without incremental=True the whole table is counted."""
+        sql = WatermarkedConnection([(1, 1)])
+        snow = WatermarkedConnection([(1, 1)])
+
+        result = validate_record_counts(sql, snow, "orders", MAPPING, METADATA, WatermarkStore())
+
+        assert "incremental" not in result
+        assert sql.queries[0] == "SELECT COUNT(*) FROM [dbo].[orders]"
+
+    def test_metric_sums_merge_cached_sums(self):
+        """Metric sums add the delta to the cached per-column sums."""
+        store = WatermarkStore()
+        sql = WatermarkedConnection([(1, 10), (2, 20)])
+        snow = WatermarkedConnection([(1, 10), (2, 20)])
+        validate_metric_sums(sql, snow, "orders", ["AMOUNT"], MAPPING, metadata=METADATA,
+                             watermark_store=store, incremental=True)
+
+        sql.rows.append((3, 5))
+        snow.rows.append((3, 7))
+        result = validate_metric_sums(sql, snow, "orders", ["AMOUNT"], MAPPING, metadata=METADATA,
+                                      watermark_store=store, incremental=True)
+
+        assert result["status"] == "FAIL"
+        assert result["issues"][0]["sql_sum"] == 35
+        assert result["issues"][0]["snow_sum"] == 37
@@ -241,6 +241,55 @@ class TestMappingSuggestions:
         assert any("exact" in r.lower() for r in reasoning)
 
 
+@pytest.mark.unit
+class TestCandidateBlocking:
+    """Test candidate pruning and one-to-one assignment"""
+
+    def test_wide_tables_scored_against_candidates(self):
+        """Test that wide tables score only the top candidates per source"""
+        import tempfile
+        from mapping.ml_mapper import CANDIDATES_PER_SOURCE
+        fresh_mapper = IntelligentMapper(storage_dir=tempfile.mkdtemp())
+
+        words = ["customer", "product", "order", "region", "store", "supplier", "invoice", "payment"]
+        suffixes = ["id", "name", "code", "date", "amount", "status", "type", "key", "flag", "note"]
+        names = [f"{w}_{s}_{n}" for w in words for s in suffixes for n in range(2)]
+        source = [{"name": name, "data_type": "varchar"} for name in names]
+        target = [{"name": name.upper(), "data_type": "varchar"} for name in reversed(names)]
+
+        result = fresh_mapper.suggest_mappings(source, target)
+
+        assert result["statistics"]["candidate_pairs_scored"] <= len(source) * CANDIDATES_PER_SOURCE
+        assert len(result["suggestions"]) == len(source)
+        assert all(s["target_column"] == s["source_column"].upper() for s in result["suggestions"])
+
+    def test_blocking_keys_split_uppercase_names(self, mapper):
+        """Test that uppercase and camelCase names give the same tokens"""
+        upper = {k for k in mapper._blocking_keys("CUSTOMER_ID") if k.startswith("t:")}
+        camel = {k for k in mapper._blocking_keys("CustomerId") if k.startswith("t:")}
+
+        assert upper == camel == {"t:customer", "t:id"}
+        assert "s:customer" in mapper._blocking_keys("client_key")
+
+    def test_optimal_assignment(self, mapper):
+        """Test that assignment maximizes the total score instead of first-come matching"""
+        eligible = {(0, 0): 0.9, (0, 1): 0.8, (1, 0): 0.85}
+
+        assert mapper._assign_one_to_one(eligible) == {0: 1, 1: 0}
+
+    def test_target_suggested_once(self):
+        """Test that two sources never get the same target"""
+        import tempfile
+        fresh_mapper = IntelligentMapper(storage_dir=tempfile.mkdtemp())
+        source = [{"name": "customer_id"}, {"name": "cust_id"}]
+        target = [{"name": "CUSTOMER_ID"}]
+
+        result = fresh_mapper.suggest_mappings(source, target)
+
+        assert [s["source_column"] for s in result["suggestions"]] == ["customer_id"]
+        assert result["unmatched_source"] == ["cust_id"]
+
+
 @pytest.mark.unit
 class TestLearning:
     """Test learning from mappings and corrections"""
@@ -0,0 +1,169 @@
+"""
+Unit tests for key sketches and data-driven relationship inference.
+
+Tests containment estimates from bottom-k sketches, the hash value index,
+parsing of the server-side sketch queries, and relationships found from
+values where names do not match.
+"""
+
+import pytest
+import sys
+import os
+import hashlib
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.key_sketches import KeySketch, SketchIndex, collect_table_sketches, containment
+from ombudsman.core.relationship_inferrer import RelationshipInferrer
+from ombudsman.validation.sql_utils import SQLSERVER
+
+
+def value_hash(value):
+    """32-bit slice of the MD5 of a value's text, like the server-side hash"""
+    return int.from_bytes(hashlib.md5(str(value).encode()).digest()[:4], "big")
+
+
+def make_sketch(table, column, values, sketch_size=256, rows=None):
+    distinct = sorted({value_hash(v) for v in values})
+    return KeySketch(table=table, column=column, hashes=distinct[:sketch_size],
+                     distinct_count=len(distinct), non_null_count=rows if rows is not None else len(values))
+
+
+def make_metadata(*tables):
+    return {t: {"columns": {}, "schema": "dbo", "table": t} for t in tables}
+
+
+class SketchCursor:
+    """Answers the count query and the sketch query with canned rows"""
+
+    def __init__(self, counts, sketch_rows):
+        self.counts = counts
+        self.sketch_rows = sketch_rows
+        self.queries = []
+
+    def execute(self, query):
+        self.queries.append(query)
+
+    def fetchone(self):
+        return self.counts
+
+    def fetchall(self):
+        return self.sketch_rows
+
+
+@pytest.mark.unit
+class TestContainment:
+    """Test containment estimates from sketches"""
+
+    def test_complete_sketches_exact(self):
+        """Test that small columns give exact containment"""
+        pk = make_sketch("dim_region", "region_no", range(10))
+        fk = make_sketch("fact_sales", "area", [1, 2, 3, 42], rows=500)
+
+        share, sampled = containment(fk, pk)
+
+        assert sampled == 4
+        assert share == 0.75
+
+    def test_large_columns_sampled(self):
+        """Test that containment of large columns is estimated from the sketch sample"""
+        pk = make_sketch("dim_customer", "customer_no", range(20000))
+        fk = make_sketch("fact_sales", "cust_ref", range(0, 20000, 3), rows=50000)
+        unrelated = make_sketch("fact_sales", "order_no", range(50000, 60000))
+
+        share, sampled = containment(fk, pk)
+
+        assert sampled >= 8
+        assert share == 1.0
+        assert containment(unrelated, pk)[0] == 0.0
+
+    def test_index_candidates(self):
+        """Test that the index returns only unique columns sharing sketched values"""
+        pk = make_sketch("dim_customer", "customer_no", range(1000))
+        other = make_sketch("dim_product", "product_no", range(5000, 6000))
+        duplicated = make_sketch("fact_sales", "cust_ref", range(500), rows=3000)
+        index = SketchIndex([pk, other, duplicated])
+
+        assert index.candidates(make_sketch("fact_sales", "x", range(100, 400))) == [pk]
+
+
+@pytest.mark.unit
+class TestSketchCollection:
+    """Test the server-side sketch queries"""
+
+    def test_collect_table_sketches(self):
+        """Test that only key-like columns are sketched and rows are parsed per column"""
+        columns = {"customer_id": "INT", "amount": "DECIMAL(18,2)", "code": "VARCHAR(10)", "sold_at": "DATETIME"}
+        cursor = SketchCursor(counts=(100, 90), sketch_rows=[(0, 7, 3), (0, 3, 3), (0, 5, 3), (1, 9, 1)])
+
+        sketches = collect_table_sketches(cursor, "fact_sales", "[dbo].[fact_sales]", columns, SQLSERVER, 16)
+
+        assert cursor.queries[0] == "SELECT COUNT([customer_id]), COUNT([code]) FROM [dbo].[fact_sales]"
+        assert "rn <= 16" in cursor.queries[1]
+        assert [s.column for s in sketches] == ["customer_id", "code"]
+        assert sketches[0].hashes == [3, 5, 7] and sketches[0].complete
+        assert sketches[1].non_null_count == 90 and not sketches[1].is_unique
+
+
+@pytest.mark.unit
+class TestValueInference:
+    """Test relationships inferred from value containment"""
+
+    def test_relationship_missed_by_names(self):
+        """Test that a contained column is linked even when its name does not match"""
+        sketches = {
+            ("dim_client", "client_no"): make_sketch("dim_client", "client_no", range(1000)),
+            ("fact_sales", "buyer"): make_sketch("fact_sales", "buyer", range(0, 1000, 2), rows=8000),
+            ("fact_sales", "status"): make_sketch("fact_sales", "status", range(1, 6), rows=8000),
+        }
+        inferrer = RelationshipInferrer()
+
+        inferred = inferrer.infer_all_relationships(make_metadata("dim_client", "fact_sales"), sketches)
+
+        assert [(r["fk_column"], r["dim_table"], r["dim_column"]) for r in inferred] == [
+            ("buyer", "dim_client", "client_no")
+        ]
+        assert inferred[0]["method"] == "value_containment"
+        assert inferred[0]["containment"] == 1.0
+
+    def test_small_subset_of_large_dimension(self):
+        """Test that an FK using few of a large dimension's keys is linked without a name match"""
+        sketches = {
+            ("dim_account", "acct_no"): make_sketch("dim_account", "acct_no", range(20000)),
+            ("fact_sales", "payer"): make_sketch("fact_sales", "payer", range(0, 20000, 20), rows=9000),
+        }
+
+        inferred = RelationshipInferrer().infer_from_sketches(make_metadata("dim_account", "fact_sales"), sketches)
+
+        assert [(r["fk_column"], r["dim_column"]) for r in inferred] == [("payer", "acct_no")]
+        assert inferred[0]["confidence"] == "high"
+
+    def test_tightest_referenced_column_kept(self):
+        """Test that of two identity columns containing the FK, the smaller one is chosen"""
+        sketches = {
+            ("dim_store", "store_no"): make_sketch("dim_store", "store_no", range(1000)),
+            ("dim_item", "item_no"): make_sketch("dim_item", "item_no", range(50000)),
+            ("fact_sales", "outlet"): make_sketch("fact_sales", "outlet", range(0, 1000, 5), rows=4000),
+        }
+
+        inferred = RelationshipInferrer().infer_from_sketches(
+            make_metadata("dim_store", "dim_item", "fact_sales"), sketches)
+
+        # store_no is unique and covers too little of item_no to extend it
+        assert [(r["fk_column"], r["dim_table"]) for r in inferred] == [("outlet", "dim_store")]
+
+    def test_agreeing_methods_merged(self):
+        """Test that name and value evidence for the same FK give one relationship"""
+        inferrer = RelationshipInferrer()
+        by_name = [{"fact_table": "fact_sales", "fk_column": "customer_id", "dim_table": "dim_customer",
+                    "dim_column": "customer_id", "confidence": "medium", "confidence_score": 0.8,
+                    "method": "name_pattern"}]
+        by_value = [{**by_name[0], "confidence": "high", "confidence_score": 0.9,
+                     "method": "value_containment", "containment": 1.0}]
+
+        merged = inferrer._merge_relationships(by_name, by_value)
+
+        assert len(merged) == 1
+        assert merged[0]["method"] == "name_pattern+value_containment"
+        assert merged[0]["confidence"] == "high"
@@ -0,0 +1,116 @@
+"""
+Unit tests for the schema metadata cache.
+
+Tests that tables with an unchanged schema fingerprint are served from
+the cache, that changed tables are re-extracted, and that tables.yaml
+is parsed once per version on disk.
+"""
+
+import os
+import pytest
+
+from mapping.metadata_cache import (
+    SQLSERVER,
+    MetadataCache,
+    cached_schema_metadata,
+    load_tables_metadata,
+    load_yaml_cached,
+)
+
+
+class ScriptedCursor:
+    """Returns one scripted row list per executed query"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+        self._rows = self.results.pop(0)
+
+    def fetchall(self):
+        return self._rows
+
+
+def table_list(customer_version="v1"):
+    return [("dim_customer", "BASE TABLE", customer_version), ("dim_product", "BASE TABLE", "v1")]
+
+
+def detail_results(*tables):
+    columns = [(table, "ID", "int", None, 10, 0, "NO") for table in tables]
+    return [columns, [(table, "ID") for table in tables], []]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return MetadataCache(tmp_path / "metadata_cache.db")
+
+
+@pytest.mark.unit
+class TestCachedSchemaMetadata:
+    """Test fingerprint-based incremental extraction."""
+
+    def test_unchanged_tables_not_extracted(self, cache):
+        """A second extraction of an unchanged schema runs only the table list query."""
+        first = ScriptedCursor([table_list()] + detail_results("dim_customer", "dim_product"))
+        cached_schema_metadata(SQLSERVER, first, "SampleDW", "dbo", ["dim_%"], cache=cache)
+
+        second = ScriptedCursor([table_list()])
+        metadata = cached_schema_metadata(SQLSERVER, second, "SampleDW", "dbo", ["dim_%"], cache=cache)
+
+        assert len(second.queries) == 1
+        assert list(metadata) == ["dim_customer", "dim_product"]
+        assert metadata["dim_customer"]["primary_key"] == ["ID"]
+
+    def test_changed_table_extracted(self, cache):
+        """Only the table whose fingerprint moved is read from the catalog."""
+        first = ScriptedCursor([table_list()] + detail_results("dim_customer", "dim_product"))
+        cached_schema_metadata(SQLSERVER, first, "SampleDW", "dbo", ["dim_%"], cache=cache)
+
+        second = ScriptedCursor([table_list("v2")] + [
+            [("dim_customer", "ID", "bigint", None, 19, 0, "NO")], [("dim_customer", "ID")], []
+        ])
+        metadata = cached_schema_metadata(SQLSERVER, second, "SampleDW", "dbo", ["dim_%"], cache=cache)
+
+        assert second.queries[1][1] == ["dbo", "dim_customer"]
+        assert metadata["dim_customer"]["columns"] == {"ID": "BIGINT"}
+        assert metadata["dim_product"]["columns"] == {"ID": "INT"}
+        assert cache.fingerprints(SQLSERVER, "SampleDW", "dbo")["dim_customer"] == "v2"
+
+    def test_refresh_and_missing_fingerprint(self, cache):
+        """refresh re-extracts everything; tables without a fingerprint are never cached."""
+        first = ScriptedCursor([table_list(None)] + detail_results("dim_customer", "dim_product"))
+        cached_schema_metadata(SQLSERVER, first, "SampleDW", "dbo", ["dim_%"], cache=cache)
+        assert set(cache.fingerprints(SQLSERVER, "SampleDW", "dbo")) == {"dim_product"}
+
+        second = ScriptedCursor([table_list()] + detail_results("dim_customer", "dim_product"))
+        cached_schema_metadata(SQLSERVER, second, "SampleDW", "dbo", ["dim_%"], cache=cache, refresh=True)
+
+        assert len(second.queries) == 4
+
+
+@pytest.mark.unit
+class TestTablesYamlCache:
+    """Test the in-process tables.yaml cache."""
+
+    def test_parsed_once_per_version(self, tmp_path):
+        """Unchanged files are not parsed again; edits are picked up."""
+        tables_file = tmp_path / "tables.yaml"
+        tables_file.write_text("sql:\n  dim_customer:\n    columns: {ID: INT}\n")
+
+        assert load_yaml_cached(str(tables_file)) is load_yaml_cached(str(tables_file))
+
+        tables_file.write_text("sql:\n  dim_customer:\n    columns: {ID: BIGINT}\n")
+        os.utime(tables_file, ns=(0, os.stat(tables_file).st_mtime_ns + 1))
+
+        assert load_tables_metadata(str(tmp_path))["dim_customer"]["columns"] == {"ID": "BIGINT"}
+
+    def test_returns_copy(self, tmp_path):
+        """Callers can modify the metadata without touching the cached document."""
+        (tmp_path / "tables.yaml").write_text("snow:\n  DIM_CUSTOMER:\n    columns: {ID: NUMBER}\n")
+
+        load_tables_metadata(str(tmp_path))["DIM_CUSTOMER"]["columns"]["X"] = "VARCHAR"
+
+        assert load_tables_metadata(str(tmp_path))["DIM_CUSTOMER"]["columns"] == {"ID": "NUMBER"}
+        assert load_tables_metadata(str(tmp_path / "missing")) == {}
@@ -0,0 +1,192 @@
+"""
+Unit tests for parallel step execution.
+
+Tests dependency ordering, event-driven scheduling, priorities and
+per-step connection leasing.
+"""
+
+import pytest
+import threading
+import time
+from contextlib import contextmanager
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from pipelines.parallel_executor import ParallelStepExecutor, StepTimingHistory
+
+
+class RecordingExecutor:
+    """Minimal StepExecutor stand-in that records the connections it ran on"""
+
+    def __init__(self, sql_conn="shared_sql", snow_conn="shared_snow", delay=0.0):
+        self.sql_conn = sql_conn
+        self.snow_conn = snow_conn
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def with_connections(self, sql_conn, snow_conn):
+        executor = RecordingExecutor(sql_conn, snow_conn, self.delay)
+        executor.calls = self.calls
+        executor._lock = self._lock
+        return executor
+
+    def run_step(self, step):
+        config = step.get("config", {})
+        if config.get("fail"):
+            raise RuntimeError("step failed")
+        time.sleep(config.get("delay", self.delay))
+        with self._lock:
+            self.calls.append((step["name"], self.sql_conn, self.snow_conn))
+        return {"name": step["name"], "status": "PASS"}
+
+
+class CountingLeases:
+    """Lease factory that hands out unique connection pairs"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.issued = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def __call__(self):
+        with self._lock:
+            self.issued += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            n = self.issued
+        try:
+            yield f"sql_{n}", f"snow_{n}"
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+@pytest.mark.unit
+class TestConnectionLeasing:
+    """Test per-step connection leasing."""
+
+    def test_shared_connections_without_leasing(self):
+        """Without a lease factory all steps share the executor's connections."""
+        executor = RecordingExecutor()
+        ParallelStepExecutor(executor, max_workers=2).execute_parallel(
+            [{"name": "a"}, {"name": "b"}]
+        )
+
+        assert {(c[1], c[2]) for c in executor.calls} == {("shared_sql", "shared_snow")}
+
+    def test_each_step_leases_its_own_connections(self):
+        """Concurrent steps run on distinct leased connections."""
+        executor = RecordingExecutor(delay=0.05)
+        leases = CountingLeases()
+
+        results = ParallelStepExecutor(
+            executor, max_workers=4, lease_connections=leases
+        ).execute_parallel([{"name": f"s{i}"} for i in range(4)])
+
+        assert [r["name"] for r in results] == ["s0", "s1", "s2", "s3"]
+        assert len({c[1] for c in executor.calls}) == 4
+        assert leases.peak == 4
+        assert leases.active == 0
+
+    def test_dependencies_still_respected(self):
+        """Dependent steps start after their dependencies when leasing."""
+        executor = RecordingExecutor()
+        ParallelStepExecutor(
+            executor, max_workers=4, lease_connections=CountingLeases()
+        ).execute_parallel([
+            {"name": "child", "depends_on": "parent"},
+            {"name": "parent"},
+        ])
+
+        assert [c[0] for c in executor.calls] == ["parent", "child"]
+
+
+@pytest.mark.unit
+class TestEventDrivenScheduling:
+    """Test dispatch-on-completion scheduling."""
+
+    def test_slow_step_does_not_block_unrelated_chain(self):
+        """A dependent of a fast step starts before a slow sibling finishes."""
+        executor = RecordingExecutor()
+        ParallelStepExecutor(executor, max_workers=3).execute_parallel([
+            {"name": "slow", "config": {"delay": 0.3}},
+            {"name": "fast", "config": {"delay": 0.01}},
+            {"name": "after_fast", "depends_on": "fast", "config": {"delay": 0.01}},
+        ])
+
+        order = [c[0] for c in executor.calls]
+        assert order.index("after_fast") < order.index("slow")
+
+    def test_longest_expected_step_goes_first(self):
+        """With one worker, historically slow steps are dispatched first."""
+        history = StepTimingHistory()
+        history.record({"validator": "quick"}, 1.0)
+        history.record({"validator": "heavy"}, 50.0)
+
+        started = []
+        ParallelStepExecutor(RecordingExecutor(), max_workers=1, timing_history=history).execute_parallel(
+            [{"name": "a", "validator": "quick"}, {"name": "b", "validator": "heavy"}],
+            on_step_start=lambda name, index: started.append(name)
+        )
+
+        assert started == ["b", "a"]
+
+    def test_critical_path_report(self):
+        """The longest chain is reported as the critical path."""
+        parallel = ParallelStepExecutor(RecordingExecutor(), max_workers=4)
+        parallel.execute_parallel([
+            {"name": "a", "config": {"delay": 0.05}},
+            {"name": "b", "depends_on": "a", "config": {"delay": 0.05}},
+            {"name": "c", "config": {"delay": 0.01}},
+        ])
+
+        report = parallel.schedule_report
+        assert report["critical_path"] == ["a", "b"]
+        assert report["critical_path_seconds"] <= report["makespan_seconds"]
+
+    def test_failure_skips_all_downstream_steps(self):
+        """Steps downstream of a failure are skipped, not reported as cycles."""
+        results = ParallelStepExecutor(RecordingExecutor(), max_workers=2).execute_parallel([
+            {"name": "a", "config": {"fail": True}},
+            {"name": "b", "depends_on": "a"},
+            {"name": "c", "depends_on": "b"},
+        ])
+
+        assert [r.status for r in results] == ["ERROR", "SKIPPED", "SKIPPED"]
+
+    def test_failing_callback_keeps_step_completed(self):
+        """A raising on_step_complete does not fail the step or skip its dependents."""
+        def on_step_complete(name, index, result):
+            raise RuntimeError("websocket closed")
+
+        executor = RecordingExecutor()
+        ParallelStepExecutor(executor, max_workers=2).execute_parallel([
+            {"name": "a"},
+            {"name": "b", "depends_on": "a"},
+        ], on_step_complete=on_step_complete)
+
+        assert [c[0] for c in executor.calls] == ["a", "b"]
+
+
+@pytest.mark.unit
+class TestStepTimingHistory:
+    """Test persisted step timings."""
+
+    def test_ewma_and_persistence(self, tmp_path):
+        """Durations are smoothed and survive a reload."""
+        path = str(tmp_path / "timings.json")
+        step = {"validator": "validate_record_counts", "config": {"table": "dim_customer"}}
+
+        history = StepTimingHistory(path, alpha=0.5)
+        history.record(step, 10.0)
+        history.record(step, 20.0)
+        history.save()
+
+        assert StepTimingHistory(path).expected(step) == pytest.approx(15.0)
+        assert StepTimingHistory(path).expected({"validator": "validate_record_counts"}) is None
@@ -0,0 +1,175 @@
+"""
+Unit tests for range-partitioned scans.
+
+Tests range splitting, partition predicates, concurrent execution with
+per-partition retry and partitioned metric sums.
+"""
+
+import pytest
+import re
+import sys
+import os
+import threading
+from contextlib import contextmanager
+from datetime import date
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.partitioning import (
+    Partition,
+    PartitionError,
+    TablePartitioner,
+    plan_partitions,
+    split_range,
+    sum_rows_by_key,
+    ALL_ROWS,
+)
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE
+from ombudsman.validation.metrics.validate_metric_sums import validate_metric_sums
+
+
+class RangeConnection:
+    """Rows of (id, amount) answering MIN/MAX and SUM with range predicates"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def fetch_many(self, query):
+        with self.lock:
+            self.queries.append(query)
+        if "MIN(" in query:
+            ids = [r[0] for r in self.rows]
+            return [(min(ids), max(ids))]
+        low = re.search(r">= (\d+)", query)
+        high = re.search(r"< (\d+)", query)
+        rows = [
+            r for r in self.rows
+            if (not low or r[0] >= int(low.group(1))) and (not high or r[0] < int(high.group(1)))
+        ]
+        return [(sum(r[1] for r in rows) if rows else None,)]
+
+
+MAPPING = {"sales": {"sql": "dbo.sales", "snow": "DW.SALES"}}
+
+
+@pytest.mark.unit
+class TestPartitionPlanning:
+    """Test range splitting and predicates."""
+
+    def test_split_integers(self):
+        """Integer ranges are split into equal widths."""
+        assert split_range(1, 100, 4) == [26, 51, 76]
+
+    def test_split_dates(self):
+        """Date ranges are split by days."""
+        assert split_range(date(2024, 1, 1), date(2024, 1, 9), 2) == [date(2024, 1, 5)]
+
+    def test_unsplittable_types(self):
+        """Strings and single values give no boundaries."""
+        assert split_range("a", "z", 4) == []
+        assert split_range(5, 5, 4) == []
+
+    def test_predicates_cover_all_rows(self):
+        """Edge partitions are open-ended and the first takes NULLs."""
+        first = Partition(0, "ID", None, 10)
+        middle = Partition(1, "ID", 10, 20)
+        last = Partition(2, "ID", 20, None)
+
+        assert first.predicate(SQLSERVER) == "([ID] < 10 OR [ID] IS NULL)"
+        assert middle.predicate(SNOWFLAKE) == "ID >= 10 AND ID < 20"
+        assert last.predicate(SNOWFLAKE) == "ID >= 20"
+        assert Partition(0, None, None, None).predicate(SQLSERVER) == ALL_ROWS
+
+    def test_plan_from_min_max_probe(self):
+        """Partitions come from one MIN/MAX query on SQL Server."""
+        conn = RangeConnection([(i, 1) for i in range(1, 101)])
+        planned = plan_partitions(conn, "[dbo].[sales]", "ID", partitions=4)
+
+        assert len(planned) == 4
+        assert planned[0].low is None and planned[-1].high is None
+        assert len(conn.queries) == 1
+
+    def test_sum_rows_by_key(self):
+        """Partial rows are added per group key, ignoring NULL sums."""
+        rows = [("2024-01", 5, None), ("2024-02", 1, 1), ("2024-01", 2, 3)]
+        assert sorted(sum_rows_by_key(rows, 1)) == [("2024-01", 7, 3), ("2024-02", 1, 1)]
+        assert sum_rows_by_key([(1,), (None,), (4,)], 0) == [(5,)]
+
+
+@pytest.mark.unit
+class TestTablePartitioner:
+    """Test concurrent partition execution."""
+
+    def test_leases_connections_per_partition(self):
+        """Each partition runs on its own leased pair."""
+        leased = []
+
+        @contextmanager
+        def lease():
+            pair = (object(), object())
+            leased.append(pair)
+            yield pair
+
+        partitions = [Partition(i, "ID", i, i + 1) for i in range(6)]
+        partitioner = TablePartitioner(None, None, partitions, lease, max_workers=3)
+        seen = partitioner.map(lambda p, sql, snow: (p.index, sql))
+
+        assert [index for index, _ in seen] == list(range(6))
+        assert len(leased) == 6
+
+    def test_failed_partition_retried_alone(self):
+        """Only the failing partition is run again."""
+        calls = []
+
+        def task(partition, sql, snow):
+            calls.append(partition.index)
+            if partition.index == 1 and calls.count(1) == 1:
+                raise RuntimeError("connection reset")
+            return partition.index
+
+        partitions = [Partition(i, "ID", i, i + 1) for i in range(3)]
+        partitioner = TablePartitioner(None, None, partitions)
+
+        assert partitioner.map(task) == [0, 1, 2]
+        assert sorted(calls) == [0, 1, 1, 2]
+        assert partitioner.stats["retried"] == [1]
+
+    def test_exhausted_retries_raise(self):
+        """A partition failing every attempt raises PartitionError."""
+        def task(partition, sql, snow):
+            raise RuntimeError("timeout")
+
+        partitioner = TablePartitioner(None, None, [Partition(0, "ID", None, 5)], retries=1)
+        with pytest.raises(PartitionError):
+            partitioner.map(task)
+
+
+@pytest.mark.unit
+class TestPartitionedMetricSums:
+    """Test metric sums merged across partitions."""
+
+    def test_partitioned_sums_match_full_scan(self):
+        """Partial sums add up to the table total."""
+        rows = [(i, i * 2) for i in range(1, 1001)]
+        sql, snow = RangeConnection(rows), RangeConnection(list(rows))
+
+        result = validate_metric_sums(sql, snow, "sales", ["AMOUNT"], MAPPING,
+                                      partition_column="ID", partitions=4)
+
+        assert result["status"] == "PASS"
+        assert result["partitioning"]["partitions"] == 4
+        assert len(snow.queries) == 4
+
+    def test_partitioned_sums_detect_difference(self):
+        """A difference inside one range shows in the merged total."""
+        rows = [(i, 1) for i in range(1, 101)]
+        changed = [(i, 5 if i == 60 else 1) for i in range(1, 101)]
+
+        result = validate_metric_sums(RangeConnection(rows), RangeConnection(changed), "sales",
+                                      ["AMOUNT"], MAPPING, partition_column="ID", partitions=4)
+
+        assert result["status"] == "FAIL"
+        assert result["issues"][0]["difference"] == 4
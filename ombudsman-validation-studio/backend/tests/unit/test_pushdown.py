@@ -0,0 +1,202 @@
+"""
+Unit tests for server-side aggregate pushdown helpers.
+
+Tests binned KS, histogram quantiles and the sampling fallback.
+"""
+
+import pytest
+import numpy as np
+from scipy.stats import ks_2samp
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.validation.pushdown import (
+    binned_ks_2samp,
+    histogram_edges,
+    histogram_quantiles,
+    fetch_histogram,
+    fetch_sample,
+)
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE
+from ombudsman.validation.dq.validate_outliers import validate_outliers
+from ombudsman.validation.dq.validate_distribution import validate_distribution
+
+
+class SampleOnlyConnection:
+    """Fails aggregate queries so validators have to fall back to sampling"""
+
+    def __init__(self, values):
+        self.values = values
+        self.queries = []
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        if "NEWID()" in query or "SAMPLE (" in query:
+            return [(v,) for v in self.values]
+        raise RuntimeError("aggregate pushdown not supported")
+
+    def fetch_one(self, query):
+        raise RuntimeError("aggregate pushdown not supported")
+
+    def fetch_dicts(self, query):
+        return []
+
+
+class PushdownConnection(SampleOnlyConnection):
+    """Answers aggregate queries as well as samples"""
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        if "NEWID()" in query or "SAMPLE (" in query:
+            return [(v,) for v in self.values]
+        return [(len(self.values), 10.0, 0.0, 10.0, 10.0)]
+
+    def fetch_one(self, query):
+        self.queries.append(query)
+        return 0
+
+
+class ValuesConnection(SampleOnlyConnection):
+    """Returns every value for unsampled column reads"""
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        if "COUNT(" not in query:
+            return [(v,) for v in self.values]
+        raise RuntimeError("aggregate pushdown not supported")
+
+
+@pytest.mark.unit
+class TestBinnedKS:
+    """Test KS on binned counts."""
+
+    def test_identical_histograms(self):
+        """Identical counts give D=0 and p=1."""
+        counts = np.array([5, 10, 5])
+        d, p = binned_ks_2samp(counts, counts)
+        assert d == 0.0
+        assert p == pytest.approx(1.0)
+
+    def test_close_to_exact_statistic(self):
+        """Binned statistic is close to (and never above) the exact one."""
+        rng = np.random.default_rng(42)
+        a = rng.normal(0, 1, 5000)
+        b = rng.normal(0.3, 1, 5000)
+
+        edges = histogram_edges(min(a.min(), b.min()), max(a.max(), b.max()), 200)
+        ca, _ = np.histogram(a, edges)
+        cb, _ = np.histogram(b, edges)
+
+        d, p = binned_ks_2samp(ca, cb)
+        exact = ks_2samp(a, b)
+
+        assert d <= exact.statistic + 1e-9
+        assert d == pytest.approx(exact.statistic, abs=0.02)
+        assert p < 0.05
+
+    def test_empty_side(self):
+        """An empty side is treated as no evidence of drift."""
+        assert binned_ks_2samp(np.array([0, 0]), np.array([1, 2])) == (0.0, 1.0)
+
+
+@pytest.mark.unit
+class TestHistogram:
+    """Test histogram helpers."""
+
+    def test_quantiles_from_histogram(self):
+        """Median of a uniform histogram sits in the middle."""
+        edges = np.linspace(0, 10, 11)
+        q = histogram_quantiles(np.ones(10), edges)
+        assert q[0.5] == pytest.approx(5.0)
+
+    def test_fetch_histogram_clamps_buckets(self):
+        """Out-of-range bucket ids are clamped into the edge bins."""
+        class Conn:
+            def fetch_many(self, query):
+                self.query = query
+                return [(-1, 2), (0, 3), (4, 5)]
+
+        conn = Conn()
+        counts = fetch_histogram(conn, SQLSERVER, "[dbo].[t]", "amount", np.linspace(0, 4, 5))
+
+        assert counts.tolist() == [5, 0, 0, 5]
+        assert "GROUP BY bucket" in conn.query
+
+
+@pytest.mark.unit
+class TestOutlierFallback:
+    """Test client-side sampling fallback."""
+
+    def test_falls_back_to_sample(self):
+        """Pushdown failure uses the sampled values."""
+        values = [10.0] * 50 + [1000.0]
+        result = validate_outliers(
+            SampleOnlyConnection(values), SampleOnlyConnection(values), "t",
+            {"t": {"sql": "dbo.t", "snow": "S.T"}},
+            {"t": {"numeric_columns": ["amount"]}}
+        )
+
+        assert result["details"][0]["method"] == "sample"
+        assert result["details"][0]["sql_server_outlier_count"] == 1
+
+    def test_one_failing_side_samples_both(self):
+        """Both engines fall back together, so counts stay comparable."""
+        values = [10.0] * 50 + [1000.0]
+        sql = PushdownConnection(values)
+        result = validate_outliers(
+            sql, SampleOnlyConnection(values), "t",
+            {"t": {"sql": "dbo.t", "snow": "S.T"}},
+            {"t": {"numeric_columns": ["amount"]}}
+        )
+
+        assert result["details"][0]["method"] == "sample"
+        assert any("NEWID()" in q for q in sql.queries)
+        assert result["details"][0]["sql_server_outlier_count"] == result["details"][0]["snowflake_outlier_count"]
+
+    def test_snowflake_sample_filters_first(self):
+        """Snowflake samples the non-null rows, not the table before filtering."""
+        conn = SampleOnlyConnection([1.0, 2.0])
+        fetch_sample(conn, SNOWFLAKE, "DB.S.T", "amount", 100)
+
+        query = conn.queries[0]
+        assert query.index("IS NOT NULL") < query.index("SAMPLE (100 ROWS)")
+        assert query.endswith("SAMPLE (100 ROWS)")
+
+    def test_no_fallback_raises(self):
+        """fallback='none' surfaces the pushdown error."""
+        with pytest.raises(RuntimeError):
+            validate_outliers(
+                SampleOnlyConnection([1.0]), SampleOnlyConnection([1.0]), "t",
+                {"t": {"sql": "dbo.t", "snow": "S.T"}},
+                {"t": {"numeric_columns": ["amount"]}},
+                fallback="none"
+            )
+
+
+@pytest.mark.unit
+class TestDistributionQuartiles:
+    """Test quartiles in the distribution explain payload."""
+
+    def test_sampled_quartiles_marked_approximate(self):
+        """Fallback modes still report quartiles, flagged by how they were computed."""
+        values = [float(v) for v in range(1, 101)]
+        for fallback, conn_class, approximate in (
+            ("sample", SampleOnlyConnection, True),
+            ("client", ValuesConnection, False),
+        ):
+            result = validate_distribution(
+                conn_class(values), conn_class(values), "t",
+                {"t": {"sql": "dbo.t", "snow": "S.T"}},
+                {"t": {"numeric_columns": ["amount"]}},
+                fallback=fallback
+            )
+
+            explain = result["explain"]["amount"]
+            assert explain["sql_quartiles"]["q2"] == pytest.approx(50.5)
+            assert explain["sql_quartiles"]["approximate"] is approximate
+            assert explain["snow_quartiles"]["approximate"] is approximate
+            assert "PERCENTILE_CONT(0.50)" in explain["queries"]["sql_quartiles"]
+            assert "PERCENTILE_CONT(0.50)" in explain["queries"]["snow_quartiles"]
@@ -0,0 +1,146 @@
+"""
+Unit tests for the run-scoped query cache.
+
+Tests SQL normalization, which statements are cached, LRU eviction and
+sharing of cached results between steps through StepExecutor.
+"""
+
+import pytest
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.query_cache import QueryCache, cache_from_config, is_cacheable, normalize_sql
+from ombudsman.pipeline.step_executor import StepExecutor
+
+
+class CountingConnection:
+    """Records every statement that reaches the engine"""
+
+    def __init__(self):
+        self.queries = []
+
+    def fetch_one(self, query):
+        self.queries.append(query)
+        return 42
+
+    def fetch_dicts(self, query):
+        self.queries.append(query)
+        return [{"ID": 1}]
+
+    def execute(self, query):
+        self.queries.append(query)
+
+
+class StubRegistry:
+    def __init__(self, funcs):
+        self.registry = {name: {"func": func} for name, func in funcs.items()}
+
+    def get(self, name):
+        return self.registry.get(name)
+
+
+@pytest.mark.unit
+class TestNormalization:
+    """Test cache keys and cacheable statements."""
+
+    def test_whitespace_collapsed_outside_literals(self):
+        """Layout differences map to one key; literal contents do not."""
+        assert normalize_sql("SELECT  *\n  FROM t ;") == "SELECT * FROM t"
+        assert normalize_sql("SELECT 'a  b' FROM t") == "SELECT 'a  b' FROM t"
+
+    def test_only_deterministic_reads_cached(self):
+        """Writes and volatile functions bypass the cache."""
+        assert is_cacheable("SELECT COUNT(*) FROM t")
+        assert is_cacheable("WITH x AS (SELECT 1) SELECT * FROM x")
+        assert not is_cacheable("DELETE FROM t")
+        assert not is_cacheable("SELECT TOP 10 * FROM t ORDER BY NEWID()")
+
+
+@pytest.mark.unit
+class TestQueryCache:
+    """Test cached reads through a wrapped connection."""
+
+    def test_repeated_query_served_from_memory(self):
+        """The second identical read does not reach the engine."""
+        cache = QueryCache()
+        raw = CountingConnection()
+        conn = cache.wrap(raw, "sqlserver")
+
+        assert conn.fetch_one("SELECT COUNT(*) FROM t") == 42
+        assert conn.fetch_one("SELECT COUNT(*)\n FROM t") == 42
+
+        assert len(raw.queries) == 1
+        assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    def test_identity_separates_engines(self):
+        """The same text on the two engines is cached separately."""
+        cache = QueryCache()
+        sql, snow = CountingConnection(), CountingConnection()
+        cache.wrap(sql, "sqlserver").fetch_one("SELECT COUNT(*) FROM t")
+        cache.wrap(snow, "snowflake").fetch_one("SELECT COUNT(*) FROM t")
+
+        assert len(sql.queries) == 1 and len(snow.queries) == 1
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = QueryCache(max_entries=2)
+        raw = CountingConnection()
+        conn = cache.wrap(raw, "sqlserver")
+
+        conn.fetch_one("SELECT 1")
+        conn.fetch_one("SELECT 2")
+        conn.fetch_one("SELECT 1")
+        conn.fetch_one("SELECT 3")
+        conn.fetch_one("SELECT 1")
+        conn.fetch_one("SELECT 2")
+
+        assert raw.queries == ["SELECT 1", "SELECT 2", "SELECT 3", "SELECT 2"]
+        assert cache.stats()["evictions"] == 2
+
+    def test_cached_rows_are_copies(self):
+        """Changing a returned row does not change the cached result."""
+        conn = QueryCache().wrap(CountingConnection(), "sqlserver")
+        conn.fetch_dicts("SELECT TOP 20 * FROM t")[0]["ID"] = 99
+
+        assert conn.fetch_dicts("SELECT TOP 20 * FROM t") == [{"ID": 1}]
+
+    def test_write_clears_cache(self):
+        """A statement executed through the wrapper invalidates cached reads."""
+        raw = CountingConnection()
+        conn = QueryCache().wrap(raw, "sqlserver")
+        conn.fetch_one("SELECT COUNT(*) FROM t")
+        conn.execute("DELETE FROM t")
+        conn.fetch_one("SELECT COUNT(*) FROM t")
+
+        assert len(raw.queries) == 3
+
+    def test_disabled_by_config(self):
+        """query_cache: false turns the cache off."""
+        assert cache_from_config({"query_cache": False}) is None
+        assert cache_from_config({"query_cache": {"max_entries": 5}}).max_entries == 5
+        assert cache_from_config({}) is not None
+
+
+@pytest.mark.unit
+class TestStepExecutorCache:
+    """Test cache sharing between steps of a run."""
+
+    def test_steps_share_results(self):
+        """Two steps issuing the same count query hit the engine once."""
+        def count_rows(sql_conn, snow_conn):
+            sql_conn.fetch_one("SELECT COUNT(*) FROM t")
+            snow_conn.fetch_one("SELECT COUNT(*) FROM t")
+            return {"status": "PASS"}
+
+        sql, snow = CountingConnection(), CountingConnection()
+        cache = QueryCache()
+        executor = StepExecutor(StubRegistry({"counts": count_rows}), sql, snow, {}, {}, query_cache=cache)
+
+        executor.run_step({"name": "counts"})
+        executor.with_connections(sql, snow).run_step({"name": "counts"})
+
+        assert len(sql.queries) == 1 and len(snow.queries) == 1
+        assert cache.stats()["hits"] == 2
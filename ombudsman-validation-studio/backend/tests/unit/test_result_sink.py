@@ -0,0 +1,140 @@
+"""
+Unit tests for the buffered result sink.
+
+Tests bulk flushing every N rows and at run end, the bounded retry queue,
+and PipelineRunner writing its results through the sink.
+"""
+
+import pytest
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.result_sink import BufferedResultSink
+from ombudsman.core.validation_writer import ValidationWriter
+from ombudsman.core.result import ValidationResult
+
+
+class BulkConnection:
+    """Records executemany batches; fails while fail_writes is set"""
+
+    def __init__(self, fail_writes=False):
+        self.fail_writes = fail_writes
+        self.batches = []
+        self.executed = []
+        self.commits = 0
+        self.database = "DW"
+        self.schema = "PUBLIC"
+
+    def cursor(self):
+        return self
+
+    def execute(self, sql, params=None):
+        self.executed.append(sql)
+
+    def executemany(self, sql, rows):
+        if self.fail_writes:
+            raise RuntimeError("Warehouse suspended")
+        self.batches.append(list(rows))
+
+    def commit(self):
+        self.commits += 1
+
+    def close(self):
+        pass
+
+
+@pytest.mark.unit
+class TestBufferedResultSink:
+    """Test buffering, flushing and retrying result rows."""
+
+    def test_flushes_every_n_rows(self):
+        """Rows are written in batches of flush_rows, the rest on close."""
+        conn = BulkConnection()
+        sink = BufferedResultSink(conn, "INSERT", flush_rows=2, background=False)
+        for i in range(5):
+            sink.add((i,))
+        stats = sink.close()
+
+        assert [len(b) for b in conn.batches] == [2, 2, 1]
+        assert stats["written"] == 5 and stats["pending"] == 0
+
+    def test_background_flush(self):
+        """Threshold flushes on a helper thread still write every row once."""
+        conn = BulkConnection()
+        sink = BufferedResultSink(conn, "INSERT", flush_rows=10)
+        for i in range(95):
+            sink.add((i,))
+        sink.close()
+
+        assert sorted(r[0] for b in conn.batches for r in b) == list(range(95))
+
+    def test_failed_flush_retried(self):
+        """Rows of a failed flush are written by the next one."""
+        conn = BulkConnection(fail_writes=True)
+        sink = BufferedResultSink(conn, "INSERT", flush_rows=0)
+        sink.add((1,))
+
+        assert sink.flush() is False
+        conn.fail_writes = False
+        sink.add((2,))
+
+        assert sink.flush() is True
+        assert conn.batches == [[(1,), (2,)]]
+
+    def test_retry_queue_bounded(self):
+        """Beyond max_pending_rows the oldest rows are dropped."""
+        conn = BulkConnection(fail_writes=True)
+        sink = BufferedResultSink(conn, "INSERT", flush_rows=0, max_pending_rows=3)
+        for i in range(5):
+            sink.add((i,))
+        stats = sink.close()
+
+        assert stats["pending"] == 3 and stats["dropped"] == 2
+        assert "Warehouse suspended" in stats["last_error"]
+
+
+@pytest.mark.unit
+class TestResultWriters:
+    """Test the result writers using the sink."""
+
+    def test_validation_writer_single_batch(self):
+        """All validation results go out in one executemany."""
+        conn = BulkConnection()
+        writer = ValidationWriter(conn)
+        for i in range(3):
+            writer.add_result(f"check_{i}", "dq", "PASS", "NONE", {})
+        writer.write_to_snowflake()
+
+        assert len(conn.batches) == 1 and len(conn.batches[0]) == 3
+
+    def test_validation_writer_raises_on_failed_write(self):
+        """Results the sink could not write still fail the call."""
+        writer = ValidationWriter(BulkConnection(fail_writes=True))
+        writer.add_result("check", "dq", "FAIL", "HIGH", {})
+
+        with pytest.raises(RuntimeError, match="Warehouse suspended"):
+            writer.write_to_snowflake()
+
+    def test_pipeline_runner_bulk_insert(self):
+        """PipelineRunner writes its step results in one insert at run end."""
+        pytest.importorskip("pyodbc")
+        from ombudsman.pipeline.pipeline_runner import PipelineRunner
+
+        class Executor:
+            snow_conn = BulkConnection()
+
+            def run_step(self, step):
+                return ValidationResult(step["name"], "PASS")
+
+        class Logger:
+            def log(self, entry):
+                pass
+
+        executor = Executor()
+        PipelineRunner(executor, Logger()).run([{"name": f"step_{i}"} for i in range(4)], "nightly")
+
+        assert len(executor.snow_conn.batches) == 1
+        assert [row[1] for row in executor.snow_conn.batches[0]] == ["step_0", "step_1", "step_2", "step_3"]
@@ -0,0 +1,113 @@
+"""
+Unit tests for the split result storage format.
+
+Tests round-tripping run payloads, partial reads of one step's details,
+and conversion of legacy single-file results.
+"""
+
+import pytest
+import json
+import os
+
+from execution import result_store
+from execution.result_store import (
+    DETAIL_REF_KEY, details_path, is_split, load_run_file, load_step_details,
+    remove_run_file, update_step_details, write_run_file
+)
+
+
+def make_run(step_count=3, sample_rows=200):
+    return {
+        "run_id": "run_1",
+        "pipeline_name": "nightly",
+        "steps": [
+            {
+                "name": f"step_{i}",
+                "status": "failure",
+                "details": {
+                    "table": "orders",
+                    "missing_in_snow": [{"ID": n, "NAME": f"customer {n}"} for n in range(sample_rows)],
+                    "explain": {"sql_query": "SELECT 1", "rows": [{"ID": n} for n in range(sample_rows)]}
+                }
+            }
+            for i in range(step_count)
+        ]
+    }
+
+
+@pytest.mark.unit
+class TestResultStore:
+    """Test writing and reading split result files."""
+
+    def test_round_trip(self, tmp_path):
+        """A written run loads back unchanged."""
+        path = str(tmp_path / "run_1.json")
+        run = make_run()
+        write_run_file(path, run)
+
+        assert load_run_file(path) == run
+        assert os.path.exists(details_path(path))
+
+    def test_summary_is_compact(self, tmp_path):
+        """Bulky detail fields move to the blob; small ones stay inline."""
+        path = str(tmp_path / "run_1.json")
+        run = make_run()
+        write_run_file(path, run)
+
+        with open(path) as f:
+            summary = json.load(f)
+        step = summary["steps"][0]
+        assert step["details"] == {"table": "orders"}
+        assert step[DETAIL_REF_KEY]["keys"] == ["explain", "missing_in_snow"]
+        assert os.path.getsize(path) + os.path.getsize(details_path(path)) < len(json.dumps(run, indent=2))
+
+    def test_partial_read_one_step(self, tmp_path):
+        """Only the requested step gets its details back."""
+        path = str(tmp_path / "run_1.json")
+        run = make_run()
+        write_run_file(path, run)
+
+        summary = load_run_file(path, details=False)
+        step = load_step_details(path, summary, summary["steps"][1])
+
+        assert step == run["steps"][1]
+        assert DETAIL_REF_KEY in summary["steps"][0]
+
+    def test_legacy_file_converted(self, tmp_path):
+        """Legacy JSON results load as before and are rewritten split."""
+        path = str(tmp_path / "run_1.json")
+        run = make_run()
+        with open(path, "w") as f:
+            json.dump(run, f, indent=2)
+
+        assert load_run_file(path) == run
+        assert is_split(load_run_file(path, details=False))
+        assert load_run_file(path) == run
+
+    def test_small_run_has_no_blob(self, tmp_path):
+        """Runs without bulky details stay a single plain JSON file."""
+        path = str(tmp_path / "run_1.json")
+        write_run_file(path, make_run(sample_rows=2))
+
+        assert not os.path.exists(details_path(path))
+        assert not is_split(load_run_file(path, details=False))
+
+    def test_zlib_codec(self, tmp_path, monkeypatch):
+        """Without zstandard the blob is written with zlib."""
+        monkeypatch.setattr(result_store, "zstandard", None)
+        path = str(tmp_path / "run_1.json")
+        run = make_run()
+        write_run_file(path, run)
+
+        assert load_run_file(path, details=False)["_storage"]["codec"] == "zlib"
+        assert load_run_file(path) == run
+
+    def test_update_and_remove(self, tmp_path):
+        """Updated step details are stored and removal deletes both files."""
+        path = str(tmp_path / "run_1.json")
+        write_run_file(path, make_run())
+        update_step_details(path, 0, {"table": "customers"})
+
+        assert load_run_file(path)["steps"][0]["details"] == {"table": "customers"}
+        remove_run_file(path)
+        assert not os.path.exists(path) and not os.path.exists(details_path(path))
@@ -0,0 +1,118 @@
+"""
+Unit tests for ResultsRepository connection reuse and bulk step inserts.
+
+Tests that queries share pooled connections and that a finished run and
+all of its steps are stored in a single transaction.
+"""
+
+import pytest
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+pytest.importorskip("pyodbc")
+
+from database.repository import ResultsRepository, BULK_STEP_COLUMNS, RESULTS_POOL_NAME
+from database.models import (
+    LogLevel, PipelineRunUpdate, PipelineStatus, StepStatus, ValidationStepCreate, ValidationStepUpdate
+)
+from ombudsman.core.connection_pool import pool_manager
+
+
+class RecordingConnection:
+    """Records statements, executemany batches and commits"""
+
+    def __init__(self):
+        self.statements = []
+        self.batches = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+        self.description = None
+        self.rowcount = 1
+        self.fast_executemany = False
+
+    def cursor(self):
+        return self
+
+    def execute(self, query, params=None):
+        self.statements.append((query, params))
+
+    def executemany(self, query, rows):
+        self.batches.append((query, list(rows), self.fast_executemany))
+
+    def fetchall(self):
+        return []
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def repository():
+    """Repository whose connections are RecordingConnections"""
+    opened = []
+
+    class Repository(ResultsRepository):
+        def _get_connection(self):
+            conn = RecordingConnection()
+            opened.append(conn)
+            return conn
+
+    pool_manager.close_all_pools()
+    repo = Repository(connection_string="DSN=test", pool_size=2)
+    yield repo, opened
+    pool_manager.close_all_pools()
+
+
+def make_steps(count):
+    return [
+        (ValidationStepCreate(run_id="run_1", step_name=f"step_{i}", step_order=i, step_config={"table": "orders"}),
+         ValidationStepUpdate(status=StepStatus.FAILED, affected_columns=["ID"]))
+        for i in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestResultsRepository:
+    """Test pooled connections and bulk inserts."""
+
+    def test_queries_reuse_pooled_connection(self, repository):
+        """Consecutive queries run on one pooled connection."""
+        repo, opened = repository
+        for _ in range(5):
+            repo.add_execution_log("run_1", LogLevel.INFO, "step done")
+
+        assert len(opened) == 1
+        assert len(opened[0].statements) == 5
+        assert pool_manager.get_pool(RESULTS_POOL_NAME) is not None
+
+    def test_bulk_insert_one_batch(self, repository):
+        """All steps go out as one fast_executemany batch."""
+        repo, opened = repository
+        assert repo.bulk_insert_validation_steps(make_steps(500)) == 500
+
+        query, rows, fast = opened[0].batches[0]
+        assert len(opened[0].batches) == 1 and fast
+        assert len(rows) == 500 and len(rows[0]) == len(BULK_STEP_COLUMNS)
+        assert rows[0][BULK_STEP_COLUMNS.index("status")] == "failed"
+        assert rows[0][BULK_STEP_COLUMNS.index("affected_columns")] == '["ID"]'
+
+    def test_complete_run_single_transaction(self, repository):
+        """The run update and its steps commit together."""
+        repo, opened = repository
+        repo.complete_pipeline_run("run_1", PipelineRunUpdate(status=PipelineStatus.COMPLETED, total_steps=3),
+                                   make_steps(3))
+
+        conn = opened[0]
+        assert conn.statements[0][0].startswith("UPDATE PipelineRuns")
+        assert len(conn.batches[0][1]) == 3
+        assert conn.commits == 1
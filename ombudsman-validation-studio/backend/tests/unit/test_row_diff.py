@@ -0,0 +1,136 @@
+"""
+Unit tests for the hash-bucketed row diff.
+
+Tests bucket refinement and missing/extra/changed detection against
+in-memory tables that mimic the server-side hashing.
+"""
+
+import pytest
+import hashlib
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.validation.hashing import hash_slice_expression, row_string_expression
+from ombudsman.validation.row_diff import HashedTable, diff_tables
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE
+
+
+def _slice(text, index):
+    return int(hashlib.md5(text.encode("utf-8")).hexdigest()[index * 8:index * 8 + 8], 16)
+
+
+class MemoryTable(HashedTable):
+    """HashedTable over {key: row_values} computed in Python instead of SQL"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.rows_returned = 0
+
+    def _hashed(self):
+        for key, values in self.rows.items():
+            row_string = "|".join([str(key)] + [str(v) for v in values])
+            yield _slice(str(key), 0), str(key), _slice(row_string, 0), _slice(row_string, 1)
+
+    @staticmethod
+    def _in(kh, buckets):
+        return any(kh % b.modulus == b.id for b in buckets)
+
+    def bucket_digests(self, modulus, within=None):
+        self.queries.append(("digest", modulus))
+        digests = {}
+        for kh, _, h0, h1 in self._hashed():
+            if within and not self._in(kh, within):
+                continue
+            count, s0, s1 = digests.get(kh % modulus, (0, 0, 0))
+            digests[kh % modulus] = (count + 1, s0 + h0, s1 + h1)
+        return digests
+
+    def bucket_rows(self, buckets):
+        if not buckets:
+            return {}
+        self.queries.append(("rows", len(buckets)))
+        rows = {}
+        for kh, key, h0, h1 in self._hashed():
+            if self._in(kh, buckets):
+                rows.setdefault(key, []).append((h0, h1))
+                self.rows_returned += 1
+        return rows
+
+
+@pytest.mark.unit
+class TestHashExpressions:
+    """Test generated hashing SQL."""
+
+    def test_sqlserver_slice(self):
+        """SQL Server reads 4 digest bytes (of the UTF-8 string) as BIGINT."""
+        expr = hash_slice_expression("s", SQLSERVER, 1)
+        assert expr.startswith("CAST(SUBSTRING(HASHBYTES('MD5', CAST((s) COLLATE ")
+        assert expr.endswith("AS VARCHAR(MAX))), 5, 4) AS BIGINT)")
+
+    def test_snowflake_slice(self):
+        """Snowflake reads the same bytes from the hex digest."""
+        expr = hash_slice_expression("s", SNOWFLAKE, 1)
+        assert expr == "TO_NUMBER(SUBSTR(MD5(s), 9, 8), 'XXXXXXXX')"
+
+    def test_row_string_quotes_columns(self):
+        """Columns are escaped per dialect and joined with a separator."""
+        assert "[order id]" in row_string_expression(["order id", "amount"], SQLSERVER)
+        assert row_string_expression(["id", "amount"], SNOWFLAKE).startswith("CONCAT_WS('|'")
+
+
+@pytest.mark.unit
+class TestDiffTables:
+    """Test bucket comparison and refinement."""
+
+    def test_identical_tables_fetch_no_rows(self):
+        """Matching tables are settled from digests alone."""
+        rows = {i: (i * 10, f"name{i}") for i in range(1000)}
+        source, target = MemoryTable(dict(rows)), MemoryTable(dict(rows))
+
+        diff = diff_tables(source, target, buckets=16)
+
+        assert diff["missing"] == diff["extra"] == diff["changed"] == []
+        assert source.rows_returned == target.rows_returned == 0
+        assert diff["source_rows"] == 1000
+
+    def test_reports_missing_extra_and_changed(self):
+        """Each kind of difference is classified by key."""
+        rows = {i: (i * 10,) for i in range(500)}
+        changed = dict(rows)
+        del changed[3]
+        changed[7] = (-1,)
+        changed[9999] = (1,)
+
+        diff = diff_tables(MemoryTable(rows), MemoryTable(changed), buckets=8)
+
+        assert diff["missing"] == ["3"]
+        assert diff["extra"] == ["9999"]
+        assert diff["changed"] == ["7"]
+
+    def test_refinement_limits_rows_fetched(self):
+        """Large mismatched buckets are split before rows are fetched."""
+        rows = {i: (i,) for i in range(20000)}
+        changed = dict(rows)
+        changed[42] = (-42,)
+
+        source, target = MemoryTable(rows), MemoryTable(changed)
+        diff = diff_tables(source, target, buckets=4, split_factor=8, max_rows_per_bucket=200)
+
+        assert diff["changed"] == ["42"]
+        assert diff["stats"]["levels"] > 1
+        assert source.rows_returned <= 200
+
+    def test_depth_limit_still_finds_differences(self):
+        """Hitting max_depth falls back to fetching the large buckets."""
+        rows = {i: (i,) for i in range(2000)}
+        changed = dict(rows)
+        changed[5] = (0,)
+
+        diff = diff_tables(MemoryTable(rows), MemoryTable(changed), buckets=2, max_rows_per_bucket=10, max_depth=0)
+
+        assert diff["changed"] == ["5"]
+        assert diff["stats"]["levels"] == 1
@@ -0,0 +1,97 @@
+"""
+Unit tests for the run catalog.
+
+Tests incremental indexing of result files, run_id lookups, and the
+results endpoints answering from catalog summaries.
+"""
+
+import pytest
+import json
+import os
+
+from execution.run_catalog import RunCatalog
+from execution import results
+
+
+def write_run(directory, run_id, pipeline="nightly", started_at="2024-01-01T00:00:00", steps=None):
+    path = os.path.join(directory, f"{run_id}.json")
+    with open(path, "w") as f:
+        json.dump({"run_id": run_id, "pipeline_name": pipeline, "started_at": started_at,
+                   "steps": steps or []}, f)
+    return path
+
+
+class CountingSummarizer:
+    """Summarizes payloads while counting how many were read"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, data):
+        self.calls += 1
+        return results._summarize_run(data)
+
+
+@pytest.mark.unit
+class TestRunCatalog:
+    """Test catalog maintenance and lookups."""
+
+    def test_sync_reads_only_changed_files(self, tmp_path):
+        """A second sync skips unchanged files and drops deleted ones."""
+        summarize = CountingSummarizer()
+        write_run(tmp_path, "run_1")
+        write_run(tmp_path, "run_2")
+        catalog = RunCatalog(str(tmp_path), summarize)
+
+        assert catalog.sync() == 2
+        os.remove(tmp_path / "run_1.json")
+        write_run(tmp_path, "run_3")
+
+        assert catalog.sync() == 1
+        assert summarize.calls == 3
+        assert sorted(r["run_id"] for r in catalog.list_runs()) == ["run_2", "run_3"]
+
+    def test_find_file(self, tmp_path):
+        """Runs are found by exact run_id, then by file name."""
+        catalog = RunCatalog(str(tmp_path), results._summarize_run)
+        write_run(tmp_path, "run_20240101_000000")
+        catalog.sync()
+
+        assert catalog.find_file("run_20240101_000000").endswith("run_20240101_000000.json")
+        assert catalog.find_file("20240101") is not None
+        assert catalog.find_file("run_missing") is None
+
+    def test_unreadable_file_not_listed(self, tmp_path):
+        """Corrupt files are indexed with an error and left out of queries."""
+        (tmp_path / "broken.json").write_text("{not json")
+        catalog = RunCatalog(str(tmp_path), results._summarize_run)
+        catalog.sync()
+
+        assert catalog.list_runs() == []
+
+
+@pytest.mark.unit
+class TestResultsEndpoints:
+    """Test results endpoints backed by the catalog."""
+
+    def test_history_from_summaries(self, tmp_path, monkeypatch):
+        """History metrics come from the summary columns, newest runs only."""
+        monkeypatch.setattr(results, "RESULTS_DIR", str(tmp_path))
+        steps = [{"status": "success"}, {"status": "failure", "error_count": 4, "severity": "HIGH"}]
+        for day in range(1, 5):
+            write_run(tmp_path, f"run_{day}", started_at=f"2024-01-0{day}T00:00:00", steps=steps)
+        write_run(tmp_path, "other", pipeline="weekly")
+
+        history = results.get_historical_trends(pipeline_name="nightly", limit=3)
+
+        assert [r["run_id"] for r in history["runs"]] == ["run_2", "run_3", "run_4"]
+        assert history["runs"][0]["metrics"]["total_errors"] == 4
+        assert history["runs"][0]["metrics"]["high_severity_issues"] == 1
+
+    def test_load_run_data(self, tmp_path, monkeypatch):
+        """Single runs load through the run_id index."""
+        monkeypatch.setattr(results, "RESULTS_DIR", str(tmp_path))
+        write_run(tmp_path, "run_7")
+
+        assert results._load_run_data("run_7")["run_id"] == "run_7"
+        assert "error" in results._load_run_data("run_8")
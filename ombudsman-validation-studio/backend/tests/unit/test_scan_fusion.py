@@ -0,0 +1,145 @@
+"""
+Unit tests for pipeline-level scan fusion.
+
+Tests grouping of steps by table, one fused scan shared by several
+validators, and fallback to per-step queries.
+"""
+
+import pytest
+import re
+import sys
+import os
+import statistics
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.scan_fusion import plan_scan_fusion
+from ombudsman.validation.column_profiler import build_profile_queries
+from ombudsman.validation.sql_utils import SQLSERVER
+from ombudsman.validation.dq.validate_record_counts import validate_record_counts
+from ombudsman.validation.dq.validate_nulls import validate_nulls
+from ombudsman.validation.metrics.validate_metric_sums import validate_metric_sums
+
+
+class ProfileConnection:
+    """Evaluates single-pass aggregate SELECTs over in-memory rows"""
+
+    AGGREGATE = re.compile(r"(SUM\(CASE WHEN \[?(\w+)\]? IS NULL|COUNT\(\*\)|(SUM|AVG|MIN|MAX|STDEV|STDDEV|COUNT)\(\[?(\w+)\]?\))")
+
+    def __init__(self, rows, fail=False):
+        self.rows = rows
+        self.fail = fail
+        self.queries = []
+
+    def _evaluate(self, match):
+        if match.group(2):
+            return sum(1 for r in self.rows if r[match.group(2)] is None)
+        if match.group(1) == "COUNT(*)":
+            return len(self.rows)
+        func, col = match.group(3), match.group(4)
+        values = [r[col] for r in self.rows if r[col] is not None]
+        if func == "COUNT":
+            return len(values)
+        if not values:
+            return None
+        return {"SUM": sum, "AVG": statistics.mean, "MIN": min, "MAX": max,
+                "STDEV": statistics.stdev, "STDDEV": statistics.stdev}[func](values)
+
+    def fetch_many(self, query):
+        self.queries.append(query)
+        if self.fail and "AS p0" in query:
+            raise RuntimeError("Arithmetic overflow")
+        select_list = query[len("SELECT "):query.index(" FROM ")]
+        return [tuple(self._evaluate(m) for m in self.AGGREGATE.finditer(select_list))]
+
+    def fetch_one(self, query):
+        return self.fetch_many(query)[0][0]
+
+    def fetch_dicts(self, query):
+        self.queries.append(query)
+        return []
+
+
+ROWS = [{"ID": i, "AMOUNT": i * 10, "NOTE": None if i % 3 else "x"} for i in range(1, 7)]
+MAPPING = {"orders": {"sql": "dbo.orders", "snow": "DW.ORDERS"}}
+METADATA = {"orders": {"columns": {"ID": "INT", "AMOUNT": "INT", "NOTE": "VARCHAR"}}}
+STEPS = [
+    {"name": "counts", "validator": "validate_record_counts", "config": {"table": "orders"}},
+    {"name": "nulls", "validator": "validate_nulls", "config": {"table": "orders"}},
+    {"name": "sums", "validator": "validate_metric_sums", "config": {"table": "orders", "metric_cols": ["AMOUNT"]}},
+]
+
+
+@pytest.mark.unit
+class TestScanPlanning:
+    """Test grouping of steps into fused scans."""
+
+    def test_steps_grouped_by_table(self):
+        """Fusable steps on one table share a plan with merged aggregates."""
+        plan = plan_scan_fusion(STEPS, METADATA)
+        scan = plan.scans["orders"]
+
+        assert scan.steps == ["counts", "nulls", "sums"]
+        assert scan.columns["AMOUNT"] == {"null_count", "sum"}
+        assert scan.columns["NOTE"] == {"null_count"}
+
+    def test_unfusable_steps_left_out(self):
+        """Incremental and grouped steps, and single-step tables, are not planned."""
+        steps = [
+            {"name": "counts", "validator": "validate_record_counts", "config": {"table": "orders", "incremental": True}},
+            {"name": "daily", "validator": "validate_metric_sums",
+             "config": {"table": "orders", "metric_cols": ["AMOUNT"], "date_col": "ID"}},
+            {"name": "nulls", "validator": "validate_nulls", "config": {"table": "orders"}},
+        ]
+        assert plan_scan_fusion(steps, METADATA) is None
+
+    def test_per_column_aggregates(self):
+        """A fused query only applies each aggregate to the columns that need it."""
+        queries = build_profile_queries(SQLSERVER, "[dbo].[orders]", ["AMOUNT", "NOTE"],
+                                        {"AMOUNT": ["sum"], "NOTE": ["null_count"]})
+        assert queries[0][0] == (
+            "SELECT COUNT(*) AS p0, SUM([AMOUNT]) AS p1, "
+            "SUM(CASE WHEN [NOTE] IS NULL THEN 1 ELSE 0 END) AS p2 FROM [dbo].[orders]"
+        )
+
+
+@pytest.mark.unit
+class TestFusedValidators:
+    """Test validators reading from a shared fused scan."""
+
+    def test_one_scan_serves_all_steps(self):
+        """Counts, nulls and sums come from a single aggregate query per engine."""
+        sql, snow = ProfileConnection(ROWS), ProfileConnection(ROWS)
+        plan = plan_scan_fusion(STEPS, METADATA)
+
+        counts = validate_record_counts(sql, snow, "orders", MAPPING, METADATA, scan_plan=plan)
+        nulls = validate_nulls(sql, snow, "orders", MAPPING, METADATA, scan_plan=plan)
+        sums = validate_metric_sums(sql, snow, "orders", ["AMOUNT"], MAPPING, scan_plan=plan)
+
+        assert counts["status"] == nulls["status"] == sums["status"] == "PASS"
+        assert counts["sql_count"] == 6
+        assert [q for q in sql.queries if "SUM(" in q or "COUNT(" in q] == [sql.queries[0]]
+        assert plan.report()["scans_saved"] == 4
+
+    def test_fused_values_detect_differences(self):
+        """A difference in the fused scan still fails the affected step."""
+        changed = [dict(r, NOTE=None) for r in ROWS]
+        plan = plan_scan_fusion(STEPS, METADATA)
+
+        nulls = validate_nulls(ProfileConnection(ROWS), ProfileConnection(changed), "orders",
+                               MAPPING, METADATA, scan_plan=plan)
+
+        assert nulls["status"] == "FAIL"
+        assert nulls["issues"][0]["column"] == "NOTE"
+
+    def test_failed_fused_scan_falls_back(self):
+        """Steps run their own queries when the fused scan fails."""
+        sql = ProfileConnection(ROWS, fail=True)
+        plan = plan_scan_fusion(STEPS, METADATA)
+
+        counts = validate_record_counts(sql, ProfileConnection(ROWS), "orders", MAPPING, METADATA, scan_plan=plan)
+
+        assert counts["sql_count"] == 6
+        assert "fused_scan" not in counts
+        assert "error" in plan.report()["tables"]["orders"]
@@ -0,0 +1,96 @@
+"""
+Unit tests for chunked cursor streaming.
+
+Tests batch sizing, NumPy column output and Decimal detection.
+"""
+
+import pytest
+import numpy as np
+from decimal import Decimal
+import sys
+import os
+
+# Add ombudsman_core to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../../../../ombudsman_core/src")))
+
+from ombudsman.core.streaming import (
+    iter_cursor_batches,
+    decimal_columns,
+    convert_decimal_rows,
+)
+
+
+class FakeCursor:
+    """DB-API cursor over an in-memory result set"""
+
+    def __init__(self, description, rows):
+        self.description = description
+        self.rows = list(rows)
+        self.fetch_sizes = []
+
+    def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self.rows = self.rows[:size], self.rows[size:]
+        return batch
+
+
+def _cursor(rows):
+    description = [("ID", int, None, None, None, None, True), ("AMOUNT", Decimal, None, None, 18, 2, True)]
+    return FakeCursor(description, rows)
+
+
+@pytest.mark.unit
+class TestIterCursorBatches:
+    """Test chunked iteration."""
+
+    def test_batches_are_bounded(self):
+        """No batch is larger than batch_size."""
+        cursor = _cursor([(i, Decimal("1.50")) for i in range(25)])
+        batches = list(iter_cursor_batches(cursor, batch_size=10, output="rows"))
+
+        assert [len(b) for b in batches] == [10, 10, 5]
+        assert set(cursor.fetch_sizes) == {10}
+
+    def test_numpy_columns(self):
+        """Integer columns become int64, decimals float64 with NaN for NULL."""
+        cursor = _cursor([(1, Decimal("1.50")), (2, None)])
+        batch = next(iter_cursor_batches(cursor, output="numpy"))
+
+        assert set(batch) == {"id", "amount"}
+        assert batch["id"].dtype == np.int64
+        assert batch["amount"].dtype == np.float64
+        assert batch["amount"][0] == 1.5
+        assert np.isnan(batch["amount"][1])
+
+    def test_unknown_format(self):
+        """Unknown output formats are rejected."""
+        with pytest.raises(ValueError):
+            list(iter_cursor_batches(_cursor([]), output="pandas"))
+
+    def test_arrow_output(self):
+        """Arrow output yields record batches when pyarrow is installed."""
+        pytest.importorskip("pyarrow")
+        cursor = _cursor([(i, Decimal("2.00")) for i in range(5)])
+        batches = list(iter_cursor_batches(cursor, batch_size=2, output="arrow"))
+
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+        assert batches[0].schema.names == ["id", "amount"]
+
+
+@pytest.mark.unit
+class TestDecimalColumns:
+    """Test Decimal detection from cursor.description."""
+
+    def test_pyodbc_description(self):
+        """pyodbc type codes are Python types."""
+        assert decimal_columns(_cursor([]).description) == {1}
+
+    def test_snowflake_description(self):
+        """Snowflake FIXED columns with a scale are Decimal."""
+        description = [("ID", 0, None, None, 38, 0, True), ("AMOUNT", 0, None, None, 18, 2, True), ("NAME", 2, None, None, None, None, True)]
+        assert decimal_columns(description) == {1}
+
+    def test_convert_only_flagged_columns(self):
+        """Only flagged columns are converted to float."""
+        rows = convert_decimal_rows([(Decimal("1"), Decimal("2.5"))], {1})
+        assert rows == [(Decimal("1"), 2.5)]
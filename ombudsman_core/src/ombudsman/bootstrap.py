@@ -31,6 +31,8 @@ def register_validators(registry):
     from .validation.dq.validate_outliers import validate_outliers
     from .validation.dq.validate_record_counts import validate_record_counts
     from .validation.dq.validate_regex_patterns import validate_regex_patterns
+    from .validation.dq.validate_row_diff import validate_row_diff
+    from .validation.validate_checksums import validate_checksums
 
     registry.register("validate_nulls", validate_nulls, "dq")
     registry.register("validate_uniqueness", validate_uniqueness, "dq")
@@ -40,6 +42,8 @@ def register_validators(registry):
     registry.register("validate_outliers", validate_outliers, "dq")
     registry.register("validate_record_counts", validate_record_counts, "dq")
     registry.register("validate_regex_patterns", validate_regex_patterns, "dq")
+    registry.register("validate_row_diff", validate_row_diff, "dq")
+    registry.register("validate_checksums", validate_checksums, "dq")
 
     # ---- Referential Integrity (Batch 5) ----
     from .validation.ri.validate_foreign_keys import validate_foreign_keys
@@ -0,0 +1,230 @@
+"""
+Row counts and change times from engine catalogs.
+
+Provides:
+- Catalog row counts and last-modified times without scanning the table
+  (sys.dm_db_partition_stats / sys.objects on SQL Server,
+  INFORMATION_SCHEMA.TABLES on Snowflake)
+- A check whether catalog counts can stand in for COUNT(*)
+- Table fingerprints that let unchanged tables skip validation entirely
+
+Catalog counts are maintained by the engines themselves and can lag behind
+in-flight loads, so they are only trusted when both sides agree and neither
+table was modified within a settle window. Anything else falls back to an
+exact COUNT(*).
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from collections import namedtuple
+from typing import Any, Dict, List, Optional
+
+from ..validation.sql_utils import (
+    SQLSERVER,
+    SNOWFLAKE,
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+)
+from ..validation.hashing import sql_string_literal
+from .dispatch import dispatch_pair
+
+logger = logging.getLogger(__name__)
+
+# Tables modified more recently than this may still be loading
+DEFAULT_SETTLE_SECONDS = 300
+
+
+class CatalogStats(namedtuple("CatalogStats", ["row_count", "last_modified", "age_seconds"])):
+    """Catalog row count, last modification time and seconds since it."""
+
+    def fingerprint(self) -> Dict[str, Any]:
+        return {
+            "row_count": self.row_count,
+            "last_modified": str(self.last_modified) if self.last_modified is not None else None
+        }
+
+
+def _sqlserver_stats_query(table: str) -> str:
+    obj = f"OBJECT_ID({sql_string_literal(table, SQLSERVER)})"
+    # Usage stats reset on restart, so sys.objects.modify_date (DDL) is the floor
+    last_modified = f"""(
+            SELECT MAX(t.modified) FROM (
+                SELECT MAX(last_user_update) AS modified FROM sys.dm_db_index_usage_stats
+                WHERE database_id = DB_ID() AND object_id = {obj}
+                UNION ALL
+                SELECT modify_date FROM sys.objects WHERE object_id = {obj}
+            ) t
+        )"""
+    return f"""
+        SELECT
+            (SELECT SUM(row_count) FROM sys.dm_db_partition_stats
+             WHERE object_id = {obj} AND index_id IN (0, 1)) AS row_count,
+            {last_modified} AS last_modified,
+            DATEDIFF(SECOND, {last_modified}, GETDATE()) AS age_seconds
+    """
+
+
+def _snowflake_name_part(part: str) -> str:
+    part = part.strip()
+    if part.startswith('"') and part.endswith('"'):
+        return part[1:-1]
+    # Unquoted identifiers are stored upper-case
+    return part.upper()
+
+
+def _snowflake_stats_query(table: str) -> str:
+    database, schema, name = table.split(".")
+    return f"""
+        SELECT ROW_COUNT, LAST_ALTERED, DATEDIFF('second', LAST_ALTERED, CURRENT_TIMESTAMP())
+        FROM {database}.INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_SCHEMA = {sql_string_literal(_snowflake_name_part(schema))}
+          AND TABLE_NAME = {sql_string_literal(_snowflake_name_part(name))}
+    """
+
+
+def read_catalog_stats(conn, dialect: str, table: str) -> Optional[CatalogStats]:
+    """
+    Catalog statistics for one table.
+
+    Args:
+        conn: Connection for the engine
+        dialect: SQLSERVER or SNOWFLAKE
+        table: Escaped table name ([schema].[table] or DATABASE.SCHEMA.TABLE)
+
+    Returns:
+        CatalogStats, or None if the catalog cannot be read (missing
+        permissions such as VIEW DATABASE STATE, unknown table)
+    """
+    try:
+        query = _sqlserver_stats_query(table) if dialect == SQLSERVER else _snowflake_stats_query(table)
+        rows = conn.fetch_many(query)
+    except Exception as e:
+        logger.warning(f"[catalog] Could not read catalog stats for {table}: {e}")
+        return None
+    if not rows or rows[0][0] is None:
+        return None
+    row_count, last_modified, age_seconds = rows[0]
+    return CatalogStats(int(row_count), last_modified, int(age_seconds) if age_seconds is not None else None)
+
+
+def read_catalog_pair(sql_conn, snow_conn, sql_table: str, snow_table: str):
+    """(sql_stats, snow_stats) read from both catalogs at once."""
+    return dispatch_pair(
+        lambda: read_catalog_stats(sql_conn, SQLSERVER, sql_table),
+        lambda: read_catalog_stats(snow_conn, SNOWFLAKE, snow_table),
+        concurrent=sql_conn is not snow_conn
+    )
+
+
+def catalog_fallback_reason(sql_stats: Optional[CatalogStats], snow_stats: Optional[CatalogStats],
+                            settle_seconds: int = DEFAULT_SETTLE_SECONDS) -> Optional[str]:
+    """
+    Why catalog counts cannot replace exact counts, or None if they can.
+    """
+    if sql_stats is None or snow_stats is None:
+        return "catalog statistics unavailable"
+    if sql_stats.row_count != snow_stats.row_count:
+        return "catalog row counts differ"
+    for side, stats in (("SQL Server", sql_stats), ("Snowflake", snow_stats)):
+        if stats.age_seconds is None:
+            return f"{side} last modification time unknown"
+        if stats.age_seconds < settle_seconds:
+            return f"{side} table modified {stats.age_seconds}s ago"
+    return None
+
+
+class ChangeDetector:
+    """
+    Skips steps whose tables have not changed since the step last passed.
+
+    A table's fingerprint is its catalog row count and last-modified time on
+    both engines, read once per run. After a step passes, the fingerprints of
+    every table it references are stored under a key covering the step's
+    config and those tables' mapping and metadata; the next run skips the
+    step while all fingerprints are still the same.
+    """
+
+    def __init__(self, store, mapping: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            store: WatermarkStore holding the fingerprints
+            mapping: Table mapping ({table: {"sql": ..., "snow": ...}})
+            metadata: Table metadata; a change to a table's entry revalidates its steps
+        """
+        self.store = store
+        self.mapping = mapping
+        self.metadata = metadata or {}
+        self._fingerprints: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def referenced_tables(config: Optional[Dict[str, Any]]) -> List[str]:
+        """
+        Every table a step config names ('table', 'ref_table', 'tables', ...).
+
+        Options ending in '_table' or '_tables' count as table references, so
+        a step reading a table that is not mapped is never skipped. Returns an
+        empty list, which disables skipping, if a reference is not a table name.
+        """
+        tables = []
+        for key, value in (config or {}).items():
+            if not (key in ("table", "tables") or key.endswith("_table") or key.endswith("_tables")):
+                continue
+            for table in (value if isinstance(value, (list, tuple)) else [value]):
+                if not isinstance(table, str) or not table:
+                    return []
+                if table not in tables:
+                    tables.append(table)
+        return sorted(tables)
+
+    def step_key(self, step_name: str, tables: List[str], config: Optional[Dict[str, Any]] = None) -> str:
+        # Steps running one validator with different options, or on tables whose
+        # mapping or metadata changed, are tracked apart
+        definition = {
+            "config": config or {},
+            "mapping": {t: (self.mapping or {}).get(t) for t in tables},
+            "metadata": {t: self.metadata.get(t) for t in tables}
+        }
+        digest = hashlib.sha1(json.dumps(definition, sort_keys=True, default=str).encode()).hexdigest()[:12]
+        return f"catalog:{step_name}:{','.join(tables)}:{digest}"
+
+    def fingerprint(self, table: str, sql_conn, snow_conn) -> Optional[Dict[str, Any]]:
+        """Current fingerprint of a mapped table (None if unavailable)."""
+        with self._lock:
+            if table in self._fingerprints:
+                return self._fingerprints[table]
+        fingerprint = None
+        if table in (self.mapping or {}):
+            sql_stats, snow_stats = read_catalog_pair(
+                sql_conn, snow_conn,
+                escape_sql_server_identifier(self.mapping[table]["sql"]),
+                escape_snowflake_identifier(self.mapping[table]["snow"])
+            )
+            if sql_stats is not None and snow_stats is not None:
+                fingerprint = {"sql": sql_stats.fingerprint(), "snow": snow_stats.fingerprint()}
+        with self._lock:
+            # Keep the first reading so every step of the run compares against the same one
+            return self._fingerprints.setdefault(table, fingerprint)
+
+    def unchanged(self, key: str, tables: List[str], sql_conn, snow_conn) -> Optional[Dict[str, Any]]:
+        """
+        The stored entry if no table is changed since the step last passed.
+
+        Also takes the tables' fingerprints for this run, so call it before
+        the step runs.
+        """
+        current = {table: self.fingerprint(table, sql_conn, snow_conn) for table in tables}
+        entry = self.store.get(key)
+        if not tables or not entry or None in current.values() or current != entry.get("fingerprint"):
+            return None
+        return entry
+
+    def record_pass(self, key: str, tables: List[str], passed_at: str):
+        """Remember the fingerprints taken before the passing step ran."""
+        with self._lock:
+            fingerprints = {table: self._fingerprints.get(table) for table in tables}
+        if not tables or None in fingerprints.values():
+            return
+        self.store.put(key, {"fingerprint": fingerprints, "passed_at": passed_at})
@@ -385,6 +385,24 @@ class ConnectionPool:
                     )
                     break
 
+    def ensure_capacity(self, max_size: int):
+        """
+        Grow the pool so it can hand out at least max_size connections.
+
+        Pools are never shrunk here; idle connections above the old size are
+        simply created on demand.
+
+        Args:
+            max_size: Required maximum number of connections
+        """
+        with self._lock:
+            if max_size <= self.max_size:
+                return
+            logger.info(f"Growing connection pool '{self.name}': max {self.max_size} -> {max_size}")
+            self.max_size = max_size
+            with self._pool.mutex:
+                self._pool.maxsize = max_size
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get pool statistics.
@@ -465,7 +483,13 @@ class ConnectionPoolManager:
                         connection_factory,
                         **pool_kwargs
                     )
-        return self._pools[name]
+                    return self._pools[name]
+
+        # Existing pool: grow it if the caller needs more connections
+        pool = self._pools[name]
+        if "max_size" in pool_kwargs:
+            pool.ensure_capacity(pool_kwargs["max_size"])
+        return pool
 
     def get_pool(self, name: str) -> Optional[ConnectionPool]:
         """
@@ -6,6 +6,7 @@ Provides:
 - Retry logic
 - Health checks
 - Consistent interface via ConnectionWrapper
+- Streaming (chunked) result fetching
 '''
 
 # src/ombudsman/core/connections.py
@@ -18,12 +19,13 @@ import time
 import logging
 import requests
 import base64
-from decimal import Decimal
 from typing import Optional, Dict, Any
 from contextlib import contextmanager
 
 # Import connection pool manager
 from .connection_pool import pool_manager
+from .streaming import iter_cursor_batches, decimal_columns, convert_decimal_rows, DEFAULT_BATCH_SIZE
+from .partitioning import DEFAULT_PARTITION_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -57,18 +59,35 @@ class ConnectionWrapper:
         cursor.execute(query)
         # Lowercase column names for consistent access across databases
         columns = [column[0].lower() for column in cursor.description]
-        results = []
-        for row in cursor.fetchall():
-            # Convert Decimal values to float for JSON serialization
-            converted_row = []
-            for value in row:
-                if isinstance(value, Decimal):
-                    converted_row.append(float(value))
-                else:
-                    converted_row.append(value)
-            results.append(dict(zip(columns, converted_row)))
+        # Convert Decimal values to float for JSON serialization, only
+        # checking the columns the driver reports as decimal
+        rows = convert_decimal_rows(cursor.fetchall(), decimal_columns(cursor.description))
         cursor.close()
-        return results
+        return [dict(zip(columns, row)) for row in rows]
+
+    def iter_batches(self, query, batch_size=DEFAULT_BATCH_SIZE, output="numpy"):
+        """
+        Execute query and stream results in bounded-memory chunks.
+
+        Args:
+            query: SQL query
+            batch_size: Rows per batch
+            output: "numpy" ({column: ndarray}), "arrow" (pyarrow.RecordBatch)
+                    or "rows" (list of tuples)
+
+        Yields:
+            One batch of at most batch_size rows per iteration
+
+        Example:
+            for batch in conn.iter_batches("SELECT amount FROM fact_sales"):
+                total += batch["amount"].sum()
+        """
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute(query)
+            yield from iter_cursor_batches(cursor, batch_size, output)
+        finally:
+            cursor.close()
 
     def cursor(self):
         """Get raw cursor for direct access"""
@@ -93,6 +112,31 @@ class ConnectionWrapper:
         return getattr(self._conn, 'schema', None)
 
 
+# Default pool capacity per database
+DEFAULT_POOL_MAX_SIZE = 10
+
+
+def _pool_max_size(cfg) -> int:
+    """
+    Pool capacity needed for a config.
+
+    Every parallel worker leases its own connection per side, the
+    pipeline runner holds one more for the duration of the run, and a
+    partitioned scan leases up to partition_workers on top.
+    """
+    workers = (cfg or {}).get("max_parallel_workers", 4)
+    partition_workers = (cfg or {}).get("partition_workers", DEFAULT_PARTITION_WORKERS)
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        workers = 4
+    try:
+        partition_workers = int(partition_workers)
+    except (TypeError, ValueError):
+        partition_workers = DEFAULT_PARTITION_WORKERS
+    return max(DEFAULT_POOL_MAX_SIZE, workers + 1 + partition_workers)
+
+
 def _create_sql_connection(cfg):
     """
     Create a raw SQL Server connection (used by connection pool).
@@ -148,7 +192,7 @@ def get_sql_conn(cfg, use_pool=True):
             name="sqlserver",
             connection_factory=lambda: _create_sql_connection(cfg),
             min_size=2,
-            max_size=10,
+            max_size=_pool_max_size(cfg),
             max_age_seconds=3600,
             health_check_interval=300,
             connection_timeout=30
@@ -388,7 +432,7 @@ def get_snow_conn(cfg=None, use_pool=True, retries=3, retry_delay=2):
             name="snowflake",
             connection_factory=lambda: _create_snowflake_connection(cfg, retries, retry_delay),
             min_size=2,
-            max_size=10,
+            max_size=_pool_max_size(cfg),
             max_age_seconds=3600,
             health_check_interval=300,
             connection_timeout=30
@@ -406,6 +450,28 @@ def get_snow_conn(cfg=None, use_pool=True, retries=3, retry_delay=2):
             raw_conn.close()
 
 
+@contextmanager
+def lease_connections(cfg):
+    """
+    Lease one SQL Server and one Snowflake connection from the pools.
+
+    Used by parallel step execution so every worker queries on its own
+    connections instead of sharing (and serializing on) a single pair.
+
+    Args:
+        cfg: Configuration dictionary
+
+    Yields:
+        (sql_conn, snow_conn) tuple of ConnectionWrapper
+
+    Example:
+        with lease_connections(cfg) as (sql_conn, snow_conn):
+            executor.with_connections(sql_conn, snow_conn).run_step(step)
+    """
+    with get_sql_conn(cfg) as sql_conn, get_snow_conn(cfg) as snow_conn:
+        yield sql_conn, snow_conn
+
+
 def test_snowflake_connection(cfg=None):
     """
     Test Snowflake connection and return status information.
@@ -0,0 +1,76 @@
+"""
+Concurrent dual-engine query dispatch.
+
+Validators compare the same query on SQL Server and Snowflake. Running the
+two sides one after the other makes a step take the sum of both engines'
+latencies; dispatching them together makes it take the slower of the two.
+
+The SQL Server side runs on the calling thread and the Snowflake side on a
+short-lived helper thread, each on its own connection. A fresh thread per
+call (rather than a shared pool) means nested use from partition or step
+worker threads can never deadlock waiting for pool slots.
+"""
+
+import threading
+from typing import Any, Callable, Tuple
+
+
+def dispatch_pair(sql_call: Callable[[], Any], snow_call: Callable[[], Any],
+                  concurrent: bool = True) -> Tuple[Any, Any]:
+    """
+    Run two callables concurrently and return both results.
+
+    Both sides always finish before this returns. If either raises, the
+    exception is re-raised (the SQL Server one if both fail).
+
+    Args:
+        sql_call: Work for the SQL Server side
+        snow_call: Work for the Snowflake side
+        concurrent: Set False when both sides share one connection
+
+    Returns:
+        (sql_result, snow_result)
+    """
+    if not concurrent:
+        return sql_call(), snow_call()
+
+    snow_outcome = {}
+
+    def run_snow():
+        try:
+            snow_outcome["result"] = snow_call()
+        except BaseException as e:
+            snow_outcome["error"] = e
+
+    helper = threading.Thread(target=run_snow, name="snow-dispatch", daemon=True)
+    helper.start()
+    try:
+        sql_result = sql_call()
+    finally:
+        helper.join()
+
+    if "error" in snow_outcome:
+        raise snow_outcome["error"]
+    return sql_result, snow_outcome["result"]
+
+
+def run_pair(sql_conn, snow_conn, sql_query: str, snow_query: str, method: str = "fetch_one") -> Tuple[Any, Any]:
+    """
+    Run a query on each engine at the same time.
+
+    Args:
+        sql_conn: SQL Server connection
+        snow_conn: Snowflake connection
+        sql_query: Query for SQL Server
+        snow_query: Query for Snowflake
+        method: Connection method to call (fetch_one, fetch_many, fetch_dicts)
+
+    Returns:
+        (sql_result, snow_result)
+    """
+    # One connection cannot run two statements at once
+    return dispatch_pair(
+        lambda: getattr(sql_conn, method)(sql_query),
+        lambda: getattr(snow_conn, method)(snow_query),
+        concurrent=sql_conn is not snow_conn
+    )
@@ -0,0 +1,286 @@
+"""
+Incremental validation with per-table watermarks.
+
+Provides:
+- A JSON-backed store of watermarks and cached aggregates per validator/table
+- Watermark predicates rendered for SQL Server and Snowflake
+- Additive merging of delta aggregates into the previous run's totals
+
+A run validates only rows whose watermark column (load date, modified
+timestamp, surrogate key) lies in (previous watermark, current max], where
+the current max is read from SQL Server when the run starts. Additive
+aggregates (counts, null counts, sums) for that window are added to the
+cached totals of earlier runs.
+
+The watermark only advances when the merged totals pass, so a window that
+did not match (e.g. Snowflake had not finished loading) is validated again
+on the next run. Rows with a NULL watermark and changes to rows below the
+watermark are not seen; use full_refresh to rebuild the totals.
+"""
+
+import copy
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+from ..validation.sql_utils import SQLSERVER, escape_column_identifier
+from ..validation.hashing import sql_string_literal
+
+logger = logging.getLogger(__name__)
+
+
+def encode_watermark(value: Any) -> Optional[Dict[str, str]]:
+    """JSON-safe representation of a watermark value."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return {"type": "datetime", "value": value.isoformat()}
+    if isinstance(value, date):
+        return {"type": "date", "value": value.isoformat()}
+    if isinstance(value, bool):
+        return {"type": "int", "value": str(int(value))}
+    if isinstance(value, int):
+        return {"type": "int", "value": str(value)}
+    if isinstance(value, Decimal):
+        return {"type": "decimal", "value": str(value)}
+    if isinstance(value, float):
+        return {"type": "float", "value": repr(value)}
+    return {"type": "str", "value": str(value)}
+
+
+def decode_watermark(data: Optional[Dict[str, str]]) -> Any:
+    """Inverse of encode_watermark."""
+    if not data:
+        return None
+    kind, value = data.get("type"), data.get("value")
+    if kind == "datetime":
+        return datetime.fromisoformat(value)
+    if kind == "date":
+        return date.fromisoformat(value)
+    if kind == "int":
+        return int(value)
+    if kind == "decimal":
+        return Decimal(value)
+    if kind == "float":
+        return float(value)
+    return value
+
+
+def watermark_literal(value: Any, dialect: str) -> str:
+    """
+    Render a watermark value as a SQL literal.
+
+    Timestamps are cast explicitly so that fractional seconds beyond what
+    DATETIME accepts do not fail the implicit conversion on SQL Server.
+    """
+    if isinstance(value, datetime):
+        text = sql_string_literal(value.isoformat(sep=" "))
+        if value.tzinfo is not None:
+            target = "DATETIMEOFFSET(7)" if dialect == SQLSERVER else "TIMESTAMP_TZ(9)"
+        else:
+            target = "DATETIME2(7)" if dialect == SQLSERVER else "TIMESTAMP_NTZ(9)"
+        return f"CAST({text} AS {target})"
+    if isinstance(value, date):
+        return f"CAST({sql_string_literal(value.isoformat())} AS DATE)"
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, (int, Decimal, float)):
+        return str(value)
+    return sql_string_literal(value, dialect)
+
+
+def watermark_predicate(column: str, dialect: str, low: Any = None, high: Any = None) -> Optional[str]:
+    """
+    Predicate selecting low < column <= high (either bound optional).
+
+    Returns:
+        SQL predicate without the WHERE keyword, or None if unbounded
+    """
+    ref = escape_column_identifier(column, dialect)
+    clauses = []
+    if low is not None:
+        clauses.append(f"{ref} > {watermark_literal(low, dialect)}")
+    if high is not None:
+        clauses.append(f"{ref} <= {watermark_literal(high, dialect)}")
+    return " AND ".join(clauses) if clauses else None
+
+
+def merge_aggregates(previous: Any, delta: Any) -> Any:
+    """
+    Add delta aggregates to previous totals.
+
+    Both arguments are numbers or (nested) dicts of numbers; keys missing
+    on one side are taken from the other.
+    """
+    if isinstance(previous, dict) or isinstance(delta, dict):
+        previous = previous or {}
+        delta = delta or {}
+        return {
+            key: merge_aggregates(previous.get(key), delta.get(key))
+            for key in list(previous) + [k for k in delta if k not in previous]
+        }
+    if previous is None:
+        return delta
+    if delta is None:
+        return previous
+    return previous + delta
+
+
+class WatermarkStore:
+    """
+    Watermarks and cached aggregates keyed by validator and table.
+
+    Entries are written to disk as soon as they change, so a crash between
+    steps never loses the watermark of a step that already completed.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize watermark store.
+
+        Args:
+            path: JSON file to load from / save to (in-memory only if None)
+        """
+        self.path = path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+        if path and os.path.exists(path):
+            try:
+                with open(path, "r") as f:
+                    self._entries = json.load(f)
+            except Exception as e:
+                logger.warning(f"Could not load watermarks from {path}: {e}")
+
+    @staticmethod
+    def step_key(validator: str, table: str) -> str:
+        return f"{validator}:{table}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            return copy.deepcopy(entry) if entry is not None else None
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = copy.deepcopy(entry)
+            self._save_locked()
+
+    def clear(self, key: Optional[str] = None):
+        """Forget one entry (or all), forcing a full scan next time."""
+        with self._lock:
+            if key is None:
+                self._entries = {}
+            else:
+                self._entries.pop(key, None)
+            self._save_locked()
+
+    def _save_locked(self):
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self._entries, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not save watermarks to {self.path}: {e}")
+
+
+class IncrementalRun:
+    """One validator run over the delta since the stored watermark."""
+
+    def __init__(self, store: WatermarkStore, key: str, watermark_column: str,
+                 scope: Any = None, full_refresh: bool = False):
+        """
+        Args:
+            store: WatermarkStore holding previous runs
+            key: Entry key (see WatermarkStore.step_key)
+            watermark_column: Monotonic column bounding each run
+            scope: JSON-serializable description of what the aggregates
+                   cover (e.g. the column list); a change forces a full scan
+            full_refresh: Ignore the stored entry and rebuild the totals
+        """
+        self.store = store
+        self.key = key
+        self.column = watermark_column
+        self.scope = scope
+        self.high = None
+
+        previous = None if full_refresh else store.get(key)
+        if previous and (previous.get("watermark_column") != watermark_column
+                         or previous.get("scope") != scope):
+            previous = None
+        self.previous = previous
+        self.low = decode_watermark(previous.get("watermark")) if previous else None
+
+    @property
+    def mode(self) -> str:
+        return "incremental" if self.previous else "full"
+
+    @property
+    def previous_aggregates(self) -> Dict[str, Any]:
+        return self.previous.get("aggregates", {}) if self.previous else {}
+
+    def start(self, sql_conn, sql_table: str) -> "IncrementalRun":
+        """Fix the upper bound of this run at the current SQL Server maximum."""
+        ref = escape_column_identifier(self.column, SQLSERVER)
+        self.high = sql_conn.fetch_one(f"SELECT MAX({ref}) FROM {sql_table}")
+        if self.high is None:
+            # Table is empty (or all watermarks NULL): nothing to carry forward
+            self.previous = None
+            self.low = None
+        return self
+
+    def where(self, dialect: str) -> Optional[str]:
+        """Predicate for this run's window, or one matching no rows if the table is empty."""
+        if self.high is None:
+            return "1 = 0"
+        return watermark_predicate(self.column, dialect, self.low, self.high)
+
+    def merge(self, delta: Dict[str, Any]) -> Dict[str, Any]:
+        """Totals over all validated windows including this one."""
+        return merge_aggregates(self.previous_aggregates, delta)
+
+    def commit(self, totals: Dict[str, Any]):
+        """Advance the watermark and cache the totals (call only when they pass)."""
+        if self.high is None:
+            return
+        self.store.put(self.key, {
+            "watermark_column": self.column,
+            "watermark": encode_watermark(self.high),
+            "scope": self.scope,
+            "aggregates": totals,
+            "updated_at": datetime.now().isoformat()
+        })
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "watermark_column": self.column,
+            "from_exclusive": str(self.low) if self.low is not None else None,
+            "to_inclusive": str(self.high) if self.high is not None else None
+        }
+
+
+def incremental_run(store: Optional[WatermarkStore], validator: str, table: str,
+                    metadata: Optional[Dict[str, Any]] = None, enabled: bool = False,
+                    watermark_column: Optional[str] = None, scope: Any = None,
+                    full_refresh: bool = False) -> Optional[IncrementalRun]:
+    """
+    IncrementalRun for a validator step, or None to validate the whole table.
+
+    The watermark column comes from the step config, else from
+    metadata[table]["watermark_column"].
+    """
+    if not enabled or store is None:
+        return None
+    column = watermark_column or ((metadata or {}).get(table) or {}).get("watermark_column")
+    if not column:
+        logger.info(f"[incremental] No watermark column for '{table}', validating full table")
+        return None
+    return IncrementalRun(store, WatermarkStore.step_key(validator, table), column, scope, full_refresh)
@@ -0,0 +1,187 @@
+"""
+Key sketches for data-driven relationship inference.
+
+Provides:
+- Bottom-k sketches of each key-like column's distinct values, computed
+  server-side in two queries per table
+- Containment estimates between a candidate FK column and a unique column
+- An index over sketch hash values that yields candidate column pairs
+  without comparing every column with every other
+
+Values are hashed with the canonical MD5 slices of validation.hashing, so a
+value hashes the same on SQL Server and Snowflake. A sketch keeps the
+sketch_size smallest distinct hashes of a column. Every hash of a unique
+column below its largest kept hash is in its sketch, so an FK column's
+sketched hashes in that range are a uniform sample of its values whose
+membership can be checked exactly. That sample gives the containment
+estimate.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from ..validation.hashing import canonical_expression, hash_slice_expression, parse_type, type_category
+from ..validation.sql_utils import escape_column_identifier
+
+DEFAULT_SKETCH_SIZE = 256
+
+# Hashes are 32-bit unsigned MD5 slices
+HASH_SPACE = 2 ** 32
+
+# Distinct/non-null ratio from which a column counts as unique (allows hash collisions)
+UNIQUE_RATIO = 0.99
+
+# Canonicalization categories of columns that can hold keys
+KEY_CATEGORIES = {"integer", "string", "guid"}
+
+
+@dataclass
+class KeySketch:
+    """Bottom-k sketch of one column's distinct values"""
+    table: str
+    column: str
+    hashes: List[int]  # Smallest distinct hashes, ascending
+    distinct_count: int
+    non_null_count: int
+
+    @property
+    def complete(self) -> bool:
+        """Whether the sketch holds every distinct value"""
+        return len(self.hashes) >= self.distinct_count
+
+    @property
+    def threshold(self) -> int:
+        """Every distinct hash up to this value is in the sketch"""
+        if self.complete:
+            return HASH_SPACE
+        return self.hashes[-1]
+
+    @property
+    def is_unique(self) -> bool:
+        return self.non_null_count > 0 and self.distinct_count >= self.non_null_count * UNIQUE_RATIO
+
+
+def is_key_type(data_type: str) -> bool:
+    """Whether a column of this type can be an FK or PK worth sketching"""
+    category = type_category(data_type)
+    if category == "decimal":
+        # Snowflake integers are NUMBER / NUMBER(38,0)
+        return (parse_type(data_type)[2] or 0) == 0
+    return category in KEY_CATEGORIES
+
+
+def build_sketch_queries(table: str, columns: Dict[str, str], dialect: str,
+                         sketch_size: int = DEFAULT_SKETCH_SIZE) -> Tuple[str, str]:
+    """
+    Queries returning non-null counts and bottom-k sketches of a table's columns.
+
+    Args:
+        table: Escaped table reference
+        columns: {column: data_type} to sketch, in order
+        dialect: SQLSERVER or SNOWFLAKE
+        sketch_size: Hashes kept per column
+
+    Returns:
+        (count query -> one row of COUNT(column) per column,
+         sketch query -> rows of (column index, hash, distinct count))
+    """
+    refs = [escape_column_identifier(col, dialect) for col in columns]
+    count_query = f"SELECT {', '.join(f'COUNT({ref})' for ref in refs)} FROM {table}"
+
+    distinct_hashes = "\nUNION ALL\n".join(
+        f"SELECT DISTINCT {i} AS c, "
+        f"{hash_slice_expression(canonical_expression(col, dialect, data_type), dialect)} AS h "
+        f"FROM {table} WHERE {ref} IS NOT NULL"
+        for i, ((col, data_type), ref) in enumerate(zip(columns.items(), refs))
+    )
+    sketch_query = f"""
+        SELECT c, h, n FROM (
+            SELECT c, h,
+                   ROW_NUMBER() OVER (PARTITION BY c ORDER BY h) AS rn,
+                   COUNT(*) OVER (PARTITION BY c) AS n
+            FROM ({distinct_hashes}) d
+        ) s
+        WHERE rn <= {int(sketch_size)}
+    """
+    return count_query, sketch_query
+
+
+def collect_table_sketches(cursor, table_key: str, table: str, columns: Dict[str, str], dialect: str,
+                           sketch_size: int = DEFAULT_SKETCH_SIZE) -> List[KeySketch]:
+    """
+    Sketch the key-like columns of one table.
+
+    Args:
+        cursor: Open DB-API cursor
+        table_key: Name of the table in the inference metadata
+        table: Escaped table reference
+        columns: {column: data_type} of the table (non-key types are skipped)
+        dialect: SQLSERVER or SNOWFLAKE
+        sketch_size: Hashes kept per column
+
+    Returns:
+        One KeySketch per key-like column
+    """
+    key_columns = {col: data_type for col, data_type in columns.items() if is_key_type(data_type)}
+    if not key_columns:
+        return []
+
+    count_query, sketch_query = build_sketch_queries(table, key_columns, dialect, sketch_size)
+    cursor.execute(count_query)
+    non_null_counts = [int(v or 0) for v in cursor.fetchone()]
+
+    cursor.execute(sketch_query)
+    hashes = defaultdict(list)
+    distinct_counts = {}
+    for index, hash_value, distinct_count in cursor.fetchall():
+        hashes[int(index)].append(int(hash_value))
+        distinct_counts[int(index)] = int(distinct_count)
+
+    return [
+        KeySketch(
+            table=table_key,
+            column=col,
+            hashes=sorted(hashes[i]),
+            distinct_count=distinct_counts.get(i, 0),
+            non_null_count=non_null_counts[i]
+        )
+        for i, col in enumerate(key_columns)
+    ]
+
+
+def containment(fk: KeySketch, pk: KeySketch) -> Tuple[float, int]:
+    """
+    Estimated fraction of fk's distinct values that occur in pk.
+
+    Returns:
+        (containment, number of sampled fk values it rests on)
+    """
+    limit = pk.threshold
+    sample = [h for h in fk.hashes if h <= limit]
+    if not sample:
+        return 0.0, 0
+    pk_hashes = set(pk.hashes)
+    return sum(1 for h in sample if h in pk_hashes) / len(sample), len(sample)
+
+
+class SketchIndex:
+    """Inverted index from sketch hash values to the unique columns holding them"""
+
+    def __init__(self, sketches: Iterable[KeySketch]):
+        self.sketches: List[KeySketch] = []
+        self._postings: Dict[int, List[int]] = defaultdict(list)
+        for sketch in sketches:
+            if not sketch.is_unique or sketch.distinct_count < 2:
+                continue
+            position = len(self.sketches)
+            self.sketches.append(sketch)
+            for h in sketch.hashes:
+                self._postings[h].append(position)
+
+    def candidates(self, fk: KeySketch) -> List[KeySketch]:
+        """Unique columns sharing at least one sketched value with fk"""
+        positions = set()
+        for h in fk.hashes:
+            positions.update(self._postings.get(h, ()))
+        return [self.sketches[p] for p in sorted(positions)]
@@ -0,0 +1,268 @@
+"""
+Range-partitioned scans for large-table validators.
+
+Provides:
+- Range partitions over a numeric or date column from a MIN/MAX probe
+- Concurrent per-partition queries on leased connection pairs
+- Per-partition retry, so one failed range is re-run alone
+- Merging of partial GROUP BY sums
+
+Partitions are computed once from SQL Server and applied identically to
+both engines. The first and last partitions are open-ended and the first
+also takes NULLs, so every row lands in exactly one partition on either
+side even if the Snowflake copy holds values outside the probed range.
+Columns that cannot be split linearly (strings, booleans) fall back to a
+single partition.
+"""
+
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..validation.sql_utils import SQLSERVER, SNOWFLAKE, escape_column_identifier
+from .dispatch import run_pair
+from .incremental import watermark_literal
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITIONS = 8
+DEFAULT_PARTITION_WORKERS = 4
+DEFAULT_PARTITION_RETRIES = 1
+
+ALL_ROWS = "1 = 1"
+
+
+class Partition(namedtuple("Partition", ["index", "column", "low", "high"])):
+    """Rows with low <= column < high; a missing bound is open-ended."""
+
+    def predicate(self, dialect: str) -> str:
+        if self.column is None:
+            return ALL_ROWS
+        ref = escape_column_identifier(self.column, dialect)
+        clauses = []
+        if self.low is not None:
+            clauses.append(f"{ref} >= {watermark_literal(self.low, dialect)}")
+        if self.high is not None:
+            clauses.append(f"{ref} < {watermark_literal(self.high, dialect)}")
+        if not clauses:
+            return ALL_ROWS
+        predicate = " AND ".join(clauses)
+        if self.low is None:
+            # NULLs sort nowhere, so the first partition owns them
+            predicate = f"({predicate} OR {ref} IS NULL)"
+        return predicate
+
+
+class PartitionError(Exception):
+    """A partition still failed after its retries."""
+
+    def __init__(self, partition: Partition, error: Exception):
+        self.partition = partition
+        self.error = error
+        super().__init__(
+            f"Partition {partition.index} ({partition.low} .. {partition.high}) "
+            f"of column '{partition.column}' failed: {error}"
+        )
+
+
+def where_clause(*predicates: Optional[str]) -> str:
+    """WHERE clause (with leading space) ANDing the predicates; empty and ALL_ROWS ones are skipped."""
+    clauses = [p for p in predicates if p and p != ALL_ROWS]
+    return f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+
+def split_range(low: Any, high: Any, partitions: int) -> List[Any]:
+    """
+    Interior boundaries splitting [low, high] into equal-width ranges.
+
+    Returns:
+        Sorted, de-duplicated boundaries (empty if the type cannot be split)
+    """
+    if low is None or high is None or partitions <= 1 or low >= high:
+        return []
+    if isinstance(low, bool) or isinstance(high, bool):
+        return []
+
+    if isinstance(low, datetime) and isinstance(high, datetime):
+        span = high - low
+        bounds = [low + span * i / partitions for i in range(1, partitions)]
+    elif isinstance(low, date) and isinstance(high, date) and not isinstance(low, datetime):
+        days = (high - low).days
+        bounds = [low + timedelta(days=days * i // partitions) for i in range(1, partitions)]
+    elif isinstance(low, int) and isinstance(high, int):
+        span = high - low + 1
+        bounds = [low + span * i // partitions for i in range(1, partitions)]
+    elif isinstance(low, (int, float, Decimal)) and isinstance(high, (int, float, Decimal)):
+        if isinstance(low, Decimal) or isinstance(high, Decimal):
+            low, high = Decimal(low), Decimal(high)
+        bounds = [low + (high - low) * i / partitions for i in range(1, partitions)]
+    else:
+        return []
+
+    return sorted({b for b in bounds if low < b <= high})
+
+
+def plan_partitions(conn, table: str, column: Optional[str], partitions: int = DEFAULT_PARTITIONS,
+                    where: Optional[str] = None) -> List[Partition]:
+    """
+    Split a SQL Server table into ranges of column using a MIN/MAX probe.
+
+    Args:
+        conn: SQL Server connection
+        table: Escaped table name
+        column: Partition column (None for a single partition)
+        partitions: Target number of partitions
+        where: Optional base predicate the probe is restricted to
+    """
+    if not column or partitions <= 1:
+        return [Partition(0, None, None, None)]
+
+    ref = escape_column_identifier(column, SQLSERVER)
+    row = conn.fetch_many(f"SELECT MIN({ref}), MAX({ref}) FROM {table}{where_clause(where)}")[0]
+    bounds = split_range(row[0], row[1], partitions)
+    if not bounds:
+        return [Partition(0, None, None, None)]
+
+    edges = [None] + bounds + [None]
+    return [Partition(i, column, edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+
+def sum_rows_by_key(rows: List[Tuple], key_width: int) -> List[Tuple]:
+    """
+    Merge partial aggregate rows from several partitions.
+
+    Rows with equal leading key_width values are combined by adding the
+    remaining values (None counts as nothing). Use key_width=0 for
+    ungrouped SUM/COUNT rows.
+    """
+    merged: Dict[Tuple, List[Any]] = {}
+    for row in rows:
+        key = tuple(row[:key_width])
+        values = list(row[key_width:])
+        if key not in merged:
+            merged[key] = values
+            continue
+        current = merged[key]
+        for i, value in enumerate(values):
+            if value is None:
+                continue
+            current[i] = value if current[i] is None else current[i] + value
+    return [key + tuple(values) for key, values in merged.items()]
+
+
+class TablePartitioner:
+    """
+    Runs a per-partition task over both engines concurrently.
+
+    Each worker leases its own (sql_conn, snow_conn) pair. Without a lease
+    callable, or when the pools have no spare connection, partitions run
+    one at a time on the step's own connections.
+    """
+
+    def __init__(self, sql_conn, snow_conn, partitions: List[Partition],
+                 lease_connections: Optional[Callable] = None,
+                 max_workers: int = DEFAULT_PARTITION_WORKERS,
+                 retries: int = DEFAULT_PARTITION_RETRIES):
+        """
+        Args:
+            sql_conn: The step's SQL Server connection
+            snow_conn: The step's Snowflake connection
+            partitions: Ranges from plan_partitions
+            lease_connections: Callable returning a context manager that
+                               yields a (sql_conn, snow_conn) pair
+            max_workers: Maximum partitions in flight
+            retries: Extra attempts for a failed partition
+        """
+        self.sql_conn = sql_conn
+        self.snow_conn = snow_conn
+        self.partitions = partitions
+        self.lease_connections = lease_connections
+        self.max_workers = max(1, max_workers) if lease_connections else 1
+        self.retries = retries
+        self._own_lock = threading.Lock()
+        self.stats: Dict[str, Any] = {
+            "column": partitions[0].column if partitions else None,
+            "partitions": len(partitions),
+            "workers": min(self.max_workers, len(partitions)),
+            "retried": [],
+            "seconds": {}
+        }
+
+    def _attempt(self, task: Callable, partition: Partition):
+        with ExitStack() as stack:
+            conns = None
+            if self.lease_connections:
+                try:
+                    conns = stack.enter_context(self.lease_connections())
+                except Exception as e:
+                    logger.warning(f"[partitioning] Could not lease connections, using step connections: {e}")
+            if conns is None:
+                stack.enter_context(self._own_lock)
+                conns = (self.sql_conn, self.snow_conn)
+            return task(partition, conns[0], conns[1])
+
+    def _run(self, task: Callable, partition: Partition):
+        start = time.time()
+        for attempt in range(self.retries + 1):
+            try:
+                result = self._attempt(task, partition)
+                self.stats["seconds"][partition.index] = round(time.time() - start, 3)
+                return result
+            except Exception as e:
+                if attempt >= self.retries:
+                    raise PartitionError(partition, e) from e
+                logger.warning(f"[partitioning] Retrying partition {partition.index} after error: {e}")
+                self.stats["retried"].append(partition.index)
+
+    def map(self, task: Callable) -> List[Any]:
+        """
+        Run task(partition, sql_conn, snow_conn) for every partition.
+
+        Returns:
+            Task results in partition order
+        """
+        if len(self.partitions) == 1 or self.max_workers == 1:
+            return [self._run(task, p) for p in self.partitions]
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.partitions))) as pool:
+            futures = [pool.submit(self._run, task, p) for p in self.partitions]
+            return [f.result() for f in futures]
+
+    def fetch_many(self, sql_query: Callable[[str], str],
+                   snow_query: Callable[[str], str]) -> Tuple[List[Tuple], List[Tuple]]:
+        """
+        Run a query per partition on both engines.
+
+        Args:
+            sql_query: Builds the SQL Server query from a partition predicate
+            snow_query: Builds the Snowflake query from a partition predicate
+
+        Returns:
+            (sql_rows, snow_rows) concatenated across partitions
+        """
+        def task(partition, sql_conn, snow_conn):
+            return run_pair(sql_conn, snow_conn, sql_query(partition.predicate(SQLSERVER)),
+                            snow_query(partition.predicate(SNOWFLAKE)), method="fetch_many")
+
+        sql_rows, snow_rows = [], []
+        for sql_part, snow_part in self.map(task):
+            sql_rows.extend(sql_part)
+            snow_rows.extend(snow_part)
+        return sql_rows, snow_rows
+
+
+def partitioner_for(sql_conn, snow_conn, sql_table: str, column: Optional[str],
+                    partitions: int = DEFAULT_PARTITIONS, lease_connections: Optional[Callable] = None,
+                    max_workers: int = DEFAULT_PARTITION_WORKERS,
+                    retries: int = DEFAULT_PARTITION_RETRIES,
+                    where: Optional[str] = None) -> TablePartitioner:
+    """Plan partitions of sql_table by column and wrap them in a TablePartitioner."""
+    planned = plan_partitions(sql_conn, sql_table, column, partitions, where)
+    if len(planned) > 1:
+        logger.info(f"[partitioning] {sql_table} split into {len(planned)} ranges of {column}")
+    return TablePartitioner(sql_conn, snow_conn, planned, lease_connections, max_workers, retries)
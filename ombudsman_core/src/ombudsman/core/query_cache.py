@@ -0,0 +1,193 @@
+"""
+Run-scoped query result cache.
+
+Provides:
+- A size-bounded LRU of query results keyed by engine and normalized SQL
+- A connection wrapper that answers repeated reads from the cache
+- Hit/miss/eviction counters for the pipeline run report
+
+Several validators in one pipeline run issue identical statements (row
+samples, COUNT(*) probes, profile scans). A QueryCache lives for one run and
+is shared by every step, so the second and later executions of a statement
+are served from memory.
+
+Entries are keyed by a connection identity rather than the connection
+object: every pooled connection leased during a run points at the same
+configured database, so a result fetched on one is valid on the others.
+Only read statements are cached, statements calling non-deterministic
+functions are always sent to the engine, and any write through a wrapped
+connection clears the cache.
+"""
+
+import copy
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_RESULT_ROWS = 10000
+
+CACHED_METHODS = ("fetch_one", "fetch_many", "fetch_dicts")
+
+_READ_STATEMENT = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_VOLATILE = re.compile(
+    r"\b(NEWID|RAND|RANDOM|UUID_STRING|GETDATE|SYSDATETIME|CURRENT_TIMESTAMP|SYSDATE|TABLESAMPLE|SAMPLE)\b",
+    re.IGNORECASE
+)
+
+
+def normalize_sql(query: str) -> str:
+    """
+    Collapse whitespace outside string literals and drop a trailing semicolon.
+
+    Two statements differing only in layout normalize to the same text;
+    literal contents are left untouched.
+    """
+    parts = query.split("'")
+    for i in range(0, len(parts), 2):
+        parts[i] = re.sub(r"\s+", " ", parts[i])
+    return "'".join(parts).strip().rstrip(";").strip()
+
+
+def is_cacheable(query: str) -> bool:
+    """True for read statements whose result cannot change within a run."""
+    return bool(_READ_STATEMENT.match(query)) and not _VOLATILE.search(query)
+
+
+class QueryCache:
+    """Thread-safe LRU of query results shared by all steps of a run."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_result_rows: int = DEFAULT_MAX_RESULT_ROWS):
+        """
+        Args:
+            max_entries: Results kept before the least recently used is evicted
+            max_result_rows: Larger results are returned but not stored
+        """
+        self.max_entries = max_entries
+        self.max_result_rows = max_result_rows
+        self._entries: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+        self.oversized = 0
+
+    def get(self, key: Tuple[str, str, str]) -> Tuple[bool, Any]:
+        """Return (found, result), marking the entry as recently used."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(self._entries[key])
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Tuple[str, str, str], result: Any):
+        if isinstance(result, list) and len(result) > self.max_result_rows:
+            with self._lock:
+                self.oversized += 1
+            return
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def skip(self):
+        """Count a statement that bypassed the cache."""
+        with self._lock:
+            self.uncacheable += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+                "oversized": self.oversized
+            }
+
+    def wrap(self, conn, identity: str):
+        """Wrap a connection so its reads go through this cache."""
+        if conn is None or isinstance(conn, CachingConnection):
+            return conn
+        return CachingConnection(conn, self, identity)
+
+
+class CachingConnection:
+    """
+    Connection proxy answering repeated reads from a QueryCache.
+
+    fetch_one/fetch_many/fetch_dicts are cached; every other attribute is
+    passed through to the wrapped connection.
+    """
+
+    def __init__(self, conn, cache: QueryCache, identity: str):
+        self._conn = conn
+        self._cache = cache
+        self._identity = identity
+
+    def _fetch(self, method: str, query: str):
+        if not is_cacheable(query):
+            self._cache.skip()
+            return getattr(self._conn, method)(query)
+        key = (self._identity, method, normalize_sql(query))
+        found, result = self._cache.get(key)
+        if found:
+            return result
+        result = getattr(self._conn, method)(query)
+        self._cache.put(key, result)
+        return result
+
+    def fetch_one(self, query):
+        return self._fetch("fetch_one", query)
+
+    def fetch_many(self, query):
+        return self._fetch("fetch_many", query)
+
+    def fetch_dicts(self, query):
+        return self._fetch("fetch_dicts", query)
+
+    def execute(self, query):
+        # A write may change anything already cached
+        self._cache.clear()
+        return self._conn.execute(query)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def cache_from_config(cfg: Optional[Dict[str, Any]]) -> Optional[QueryCache]:
+    """
+    Build a run's QueryCache from the pipeline's 'query_cache' option.
+
+    The option may be true/false or a dict with max_entries and
+    max_result_rows. Caching is on by default.
+    """
+    option = (cfg or {}).get("query_cache", True)
+    if option is False:
+        return None
+    if isinstance(option, dict):
+        if option.get("enabled", True) is False:
+            return None
+        return QueryCache(
+            max_entries=option.get("max_entries", DEFAULT_MAX_ENTRIES),
+            max_result_rows=option.get("max_result_rows", DEFAULT_MAX_RESULT_ROWS)
+        )
+    return QueryCache()
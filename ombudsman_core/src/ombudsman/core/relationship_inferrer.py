@@ -5,13 +5,33 @@ Predicts foreign key relationships when database constraints are not enforced.
 Uses heuristics including:
 - Column name pattern matching
 - Fact/Dimension table detection
+- Value containment between columns, from server-side key sketches
 - Optional data sampling validation
 """
 
 from typing import Dict, List, Tuple, Optional
+import logging
 import re
 from difflib import SequenceMatcher
 
+from .key_sketches import DEFAULT_SKETCH_SIZE, KeySketch, SketchIndex, collect_table_sketches, containment
+from ..validation.sql_utils import SQLSERVER, SNOWFLAKE, escape_snowflake_identifier, escape_sql_server_identifier
+
+logger = logging.getLogger(__name__)
+
+# Minimum estimated share of FK values found in the referenced column
+MIN_CONTAINMENT = 0.9
+
+# Minimum sampled FK values behind a containment estimate (unless both sketches are complete)
+MIN_CONTAINMENT_SAMPLE = 8
+
+# Minimum distinct FK values; small code and flag columns fit inside any identity column
+MIN_FK_DISTINCT = 20
+
+# Minimum share of the referenced column's values a unique FK column must hold;
+# one surrogate key range falls inside any longer one
+MIN_UNIQUE_COVERAGE = 0.5
+
 
 class RelationshipInferrer:
     """
@@ -53,10 +73,15 @@ class RelationshipInferrer:
             r'^d_',
         ]
 
-    def infer_all_relationships(self, metadata: Dict) -> List[Dict]:
+    def infer_all_relationships(self, metadata: Dict,
+                                sketches: Optional[Dict[Tuple[str, str], KeySketch]] = None) -> List[Dict]:
         """
         Infer all relationships from metadata.
 
+        With sketches (see collect_sketches), relationships found from value
+        containment are merged in; where both methods find a relationship for
+        the same FK column, the higher-confidence one is kept.
+
         Args:
             metadata: Dictionary with structure:
                 {
@@ -68,6 +93,7 @@ class RelationshipInferrer:
                     },
                     ...
                 }
+            sketches: Optional key sketches per (table, column)
 
         Returns:
             List of inferred relationships:
@@ -117,8 +143,139 @@ class RelationshipInferrer:
                         "method": method
                     })
 
+        if sketches:
+            inferred = self._merge_relationships(inferred, self.infer_from_sketches(metadata, sketches))
+
         return inferred
 
+    def collect_sketches(self, metadata: Dict, use_snowflake: bool = False,
+                         sketch_size: int = DEFAULT_SKETCH_SIZE) -> Dict[Tuple[str, str], KeySketch]:
+        """
+        Compute key sketches of every key-like column, two queries per table.
+
+        Args:
+            metadata: Table metadata as for infer_all_relationships
+            use_snowflake: Use Snowflake connection instead of SQL Server
+            sketch_size: Distinct hashes kept per column
+
+        Returns:
+            (table, column) -> KeySketch; tables that fail are skipped
+        """
+        conn = self.snow_conn if use_snowflake else self.sql_conn
+        if not conn:
+            raise ValueError("No database connection available for key sketches")
+
+        dialect = SNOWFLAKE if use_snowflake else SQLSERVER
+        escape = escape_snowflake_identifier if use_snowflake else escape_sql_server_identifier
+        sketches = {}
+
+        cursor = conn.cursor()
+        try:
+            for table_key, table_meta in metadata.items():
+                name = table_meta.get("table", table_key)
+                qualified = f"{table_meta['schema']}.{name}" if table_meta.get("schema") else name
+                try:
+                    for sketch in collect_table_sketches(cursor, table_key, escape(qualified),
+                                                         table_meta.get("columns", {}), dialect, sketch_size):
+                        sketches[(table_key, sketch.column)] = sketch
+                except Exception as e:
+                    logger.warning(f"Key sketches of {table_key} failed: {e}")
+        finally:
+            cursor.close()
+
+        return sketches
+
+    def infer_from_sketches(self, metadata: Dict, sketches: Dict[Tuple[str, str], KeySketch],
+                            min_containment: float = MIN_CONTAINMENT) -> List[Dict]:
+        """
+        Infer relationships from value containment, independent of names.
+
+        Every sketched column with at least MIN_FK_DISTINCT distinct values
+        is an FK candidate; unique columns of other tables that contain its
+        values are scored. Containment alone qualifies a relationship, so the
+        column name does not matter; unique FK columns must cover
+        MIN_UNIQUE_COVERAGE of the referenced column. Name similarity only
+        raises the confidence, and among equally scored referenced columns
+        the tightest fit (fewest values) is kept.
+
+        Containment is estimated from the FK hashes below the referenced
+        sketch's threshold, roughly sketch_size * fk_distinct / pk_distinct
+        of them, and needs MIN_CONTAINMENT_SAMPLE of those unless both
+        sketches are complete. An FK using only a small part of a large
+        dimension therefore leaves too few sampled values and may be missed.
+
+        Returns:
+            Relationships in the infer_all_relationships format, with
+            method "value_containment" and the estimated containment
+        """
+        index = SketchIndex(sketches.values())
+        inferred = []
+
+        for fk in sketches.values():
+            if fk.distinct_count < MIN_FK_DISTINCT:
+                continue
+
+            best = None
+            for pk in index.candidates(fk):
+                if pk.table == fk.table:
+                    continue
+                # Columns holding the same set are not told apart by containment, and a
+                # unique column is only a one-to-one extension of a column it mostly covers
+                coverage = min(1.0, fk.distinct_count / pk.distinct_count)
+                if fk.is_unique and (fk.distinct_count >= pk.distinct_count or coverage < MIN_UNIQUE_COVERAGE):
+                    continue
+
+                share, sampled = containment(fk, pk)
+                if share < min_containment:
+                    continue
+                if sampled < MIN_CONTAINMENT_SAMPLE and not (fk.complete and pk.complete):
+                    continue
+
+                pk_name = metadata.get(pk.table, {}).get("table", pk.table)
+                name_similarity = max(self._name_similarity(fk.column, pk.column),
+                                      self._name_similarity(fk.column, pk_name))
+                confidence = share * 0.85 + name_similarity * 0.15
+
+                if best is None or (confidence, coverage) > (best[0], best[1]):
+                    best = (confidence, coverage, pk, share)
+
+            if best:
+                confidence, _, pk, share = best
+                inferred.append({
+                    "fact_table": fk.table,
+                    "fk_column": fk.column,
+                    "dim_table": pk.table,
+                    "dim_column": pk.column,
+                    "confidence": self._classify_confidence(confidence),
+                    "confidence_score": confidence,
+                    "method": "value_containment",
+                    "containment": round(share, 3)
+                })
+
+        return inferred
+
+    def _merge_relationships(self, by_name: List[Dict], by_value: List[Dict]) -> List[Dict]:
+        """Name-based and containment-based relationships, one per FK column."""
+        merged = {(rel["fact_table"], rel["fk_column"]): rel for rel in by_name}
+
+        for rel in by_value:
+            key = (rel["fact_table"], rel["fk_column"])
+            existing = merged.get(key)
+            if existing is None:
+                merged[key] = rel
+            elif (existing["dim_table"], existing["dim_column"]) == (rel["dim_table"], rel["dim_column"]):
+                # Both methods agree
+                score = max(existing["confidence_score"], rel["confidence_score"])
+                merged[key] = {**existing,
+                               "confidence": self._classify_confidence(score),
+                               "confidence_score": score,
+                               "method": f"{existing['method']}+value_containment",
+                               "containment": rel["containment"]}
+            elif rel["confidence_score"] > existing["confidence_score"]:
+                merged[key] = rel
+
+        return list(merged.values())
+
     def _classify_facts(self, metadata: Dict) -> List[str]:
         """Identify fact tables based on naming patterns and column analysis."""
         facts = []
@@ -0,0 +1,164 @@
+"""
+Buffered bulk writes of validation results.
+
+Provides:
+- A result sink that buffers result rows in memory and inserts them with
+  one multi-row executemany per flush
+- Flushes every N rows (on a background thread) and at the end of a run
+- A bounded retry queue for rows whose flush failed
+
+Writing one INSERT and commit per step costs a Snowflake round-trip and a
+micro-partition write for every result. The sink batches them instead, and
+a failed flush never raises into the pipeline: its rows are kept (up to
+max_pending_rows, oldest dropped first) and retried with the next flush.
+"""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Dict, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Rows buffered before a background flush starts
+DEFAULT_FLUSH_ROWS = 500
+
+# Rows kept for retry after failed flushes; older rows are dropped beyond this
+DEFAULT_MAX_PENDING_ROWS = 10000
+
+
+class BufferedResultSink:
+    """
+    Buffers rows for one INSERT statement and writes them in bulk.
+
+    Example:
+        sink = BufferedResultSink(snow_conn, "INSERT INTO T (A, B) VALUES (%s, %s)")
+        sink.add(("a", 1))
+        sink.close()
+    """
+
+    def __init__(self, conn, insert_sql: str, flush_rows: int = DEFAULT_FLUSH_ROWS,
+                 max_pending_rows: int = DEFAULT_MAX_PENDING_ROWS, background: bool = True):
+        """
+        Args:
+            conn: Connection with cursor() and commit(), or an object with executemany()
+            insert_sql: Parameterized INSERT taking one row per execution
+            flush_rows: Buffered rows that trigger a flush (0 to only flush explicitly)
+            max_pending_rows: Upper bound on buffered plus retried rows
+            background: Run threshold flushes on a helper thread instead of the caller's
+        """
+        self.conn = conn
+        self.insert_sql = insert_sql
+        self.flush_rows = flush_rows
+        self.background = background
+        self._rows = deque(maxlen=max_pending_rows)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._flusher: Optional[threading.Thread] = None
+        self.written = 0
+        self.flushes = 0
+        self.failures = 0
+        self.dropped = 0
+        self.last_error: Optional[str] = None
+
+    def add(self, row: Sequence[Any]):
+        """Buffer one row, flushing once flush_rows are waiting."""
+        with self._lock:
+            if len(self._rows) == self._rows.maxlen:
+                self.dropped += 1
+            self._rows.append(tuple(row))
+            due = self.flush_rows and len(self._rows) >= self.flush_rows
+            if not due or (self._flusher is not None and self._flusher.is_alive()):
+                return
+            if self.background:
+                self._flusher = threading.Thread(target=self._flush_buffered, name="result-sink", daemon=True)
+                self._flusher.start()
+                return
+        self._flush_buffered()
+
+    def _executemany(self, rows):
+        if hasattr(self.conn, "executemany"):
+            self.conn.executemany(self.insert_sql, rows)
+        else:
+            cursor = self.conn.cursor()
+            try:
+                cursor.executemany(self.insert_sql, rows)
+            finally:
+                cursor.close()
+        if hasattr(self.conn, "commit"):
+            self.conn.commit()
+
+    def _flush_buffered(self) -> bool:
+        # One writer at a time; rows added meanwhile wait for the next flush
+        with self._write_lock:
+            with self._lock:
+                rows = list(self._rows)
+                self._rows.clear()
+            if not rows:
+                return True
+            try:
+                self._executemany(rows)
+            except Exception as e:
+                with self._lock:
+                    # Failed rows go back in front of newer ones, within the bound
+                    room = self._rows.maxlen - len(self._rows)
+                    kept = rows[-room:] if room > 0 else []
+                    self.dropped += len(rows) - len(kept)
+                    self._rows.extendleft(reversed(kept))
+                    self.failures += 1
+                    self.last_error = str(e)
+                logger.warning(f"[result_sink] Flush of {len(rows)} rows failed, will retry: {e}")
+                return False
+            with self._lock:
+                self.written += len(rows)
+                self.flushes += 1
+            return True
+
+    def flush(self) -> bool:
+        """Write all buffered rows now. Returns False if the write failed."""
+        flusher = self._flusher
+        if flusher is not None:
+            flusher.join()
+        return self._flush_buffered()
+
+    def close(self) -> Dict[str, Any]:
+        """Flush remaining rows and return the sink's stats."""
+        self.flush()
+        if self._rows:
+            logger.warning(f"[result_sink] {len(self._rows)} result rows could not be written: {self.last_error}")
+        return self.stats()
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._rows)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = {
+                "written": self.written,
+                "pending": len(self._rows),
+                "flushes": self.flushes,
+                "failures": self.failures,
+                "dropped": self.dropped,
+            }
+        if self.last_error:
+            stats["last_error"] = self.last_error
+        return stats
+
+
+def sink_from_config(conn, insert_sql: str, cfg: Optional[Dict[str, Any]] = None) -> BufferedResultSink:
+    """
+    Build a sink from the 'result_sink' config option.
+
+    The option is a dict with flush_rows, max_pending_rows and background.
+    """
+    options = (cfg or {}).get("result_sink") or {}
+    if not isinstance(options, dict):
+        options = {}
+    return BufferedResultSink(
+        conn,
+        insert_sql,
+        flush_rows=options.get("flush_rows", DEFAULT_FLUSH_ROWS),
+        max_pending_rows=options.get("max_pending_rows", DEFAULT_MAX_PENDING_ROWS),
+        background=options.get("background", True)
+    )
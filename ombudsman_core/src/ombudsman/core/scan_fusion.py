@@ -0,0 +1,208 @@
+"""
+Pipeline-level scan fusion.
+
+Provides:
+- A planner that groups a pipeline's aggregate steps by table
+- One fused profile scan per table and engine, shared by those steps
+- A per-table report of how many scans were saved
+
+Generated pipelines often run record counts, null checks, statistics and
+metric sums against the same table, each with its own full scan on both
+engines. Before the steps run, plan_scan_fusion collects the aggregates
+those steps need per table (see FUSABLE_STEPS). The first step to reach a
+planned table runs a single column_profiler scan per side for all of them;
+later steps read their values from it and build their results as before.
+
+Steps that run incrementally or with filters, grouping or partitions keep
+their own queries. If a fused scan fails the steps fall back to their own
+queries too, so fusion never turns one bad column into many failed steps.
+"""
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..validation.column_profiler import profile_table
+from ..validation.sql_utils import SQLSERVER, SNOWFLAKE
+from .dispatch import dispatch_pair
+
+logger = logging.getLogger(__name__)
+
+ROW_COUNT = "row_count"
+
+# Tables need at least this many fusable steps to be worth a fused scan
+DEFAULT_MIN_STEPS = 2
+
+
+def _metadata_columns(table_metadata: Dict[str, Any]) -> List[str]:
+    columns = table_metadata.get("columns", [])
+    return list(columns.keys()) if isinstance(columns, dict) else list(columns)
+
+
+def _record_count_needs(cfg, table_metadata):
+    return {ROW_COUNT: set()}
+
+
+def _null_needs(cfg, table_metadata):
+    return {col: {"null_count"} for col in _metadata_columns(table_metadata)}
+
+
+def _statistics_needs(cfg, table_metadata):
+    return {col: {"avg", "stddev", "min", "max"} for col in table_metadata.get("numeric_columns", [])}
+
+
+def _metric_sum_needs(cfg, table_metadata):
+    if cfg.get("date_col") or cfg.get("partition_column") or table_metadata.get("partition_column"):
+        return None
+    return {col: {"sum"} for col in cfg.get("metric_cols", [])}
+
+
+def _metric_average_needs(cfg, table_metadata):
+    if cfg.get("date_col"):
+        return None
+    return {col: {"avg"} for col in cfg.get("metric_cols", [])}
+
+
+# validator name -> needs(step config, table metadata) giving {column: {aggregate}},
+# with ROW_COUNT as the column for COUNT(*); None when the step cannot be fused
+FUSABLE_STEPS: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], Optional[Dict[str, Set[str]]]]] = {
+    "validate_record_counts": _record_count_needs,
+    "validate_nulls": _null_needs,
+    "validate_statistics": _statistics_needs,
+    "validate_metric_sums": _metric_sum_needs,
+    "validate_metric_averages": _metric_average_needs,
+}
+
+# Validators that read their own incremental option
+INCREMENTAL_STEPS = {"validate_record_counts", "validate_nulls", "validate_metric_sums"}
+
+
+class TableScan:
+    """The aggregates planned for one table and, once run, their values."""
+
+    def __init__(self, table: str):
+        self.table = table
+        self.columns: Dict[str, Set[str]] = {}
+        self.steps: List[str] = []
+        self.lock = threading.Lock()
+        self.profiles: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None
+        self.error: Optional[str] = None
+        self.reads = 0
+
+    def add(self, step_name: str, needs: Dict[str, Set[str]]):
+        self.steps.append(step_name)
+        for col, aggregates in needs.items():
+            if col == ROW_COUNT:
+                continue
+            self.columns.setdefault(col, set()).update(aggregates)
+
+    def covers(self, columns: Iterable[str], aggregates: Iterable[str]) -> bool:
+        aggregates = set(aggregates)
+        return all(aggregates <= self.columns.get(col, set()) for col in columns)
+
+    def aggregates(self) -> List[str]:
+        return sorted(set().union(*self.columns.values())) if self.columns else []
+
+
+class ScanPlan:
+    """Fused scans for the tables of one pipeline run."""
+
+    def __init__(self, scans: Dict[str, TableScan]):
+        self.scans = scans
+
+    def profiles(self, table: str, sql_conn, snow_conn, sql_table: str, snow_table: str,
+                 columns: Iterable[str] = (), aggregates: Iterable[str] = ()) -> Optional[Tuple[Dict, Dict]]:
+        """
+        The fused (sql_profile, snow_profile) for a table, scanning it on first use.
+
+        Args:
+            table: Table key as used in the pipeline
+            sql_conn: SQL Server connection of the calling step
+            snow_conn: Snowflake connection of the calling step
+            sql_table: Escaped SQL Server table name
+            snow_table: Escaped Snowflake table name
+            columns: Columns the caller needs
+            aggregates: Aggregate names (column_profiler.AGGREGATES) the caller needs
+
+        Returns:
+            Profiles in column_profiler.profile_table form, or None if the
+            table was not planned, does not cover the request, or the fused
+            scan failed; the caller then runs its own queries.
+        """
+        scan = self.scans.get(table)
+        if scan is None or not scan.covers(columns, aggregates):
+            return None
+
+        with scan.lock:
+            if scan.profiles is None and scan.error is None:
+                columns_planned = sorted(scan.columns)
+                # Each column only gets the aggregates some step asked for
+                aggregates_planned = {col: sorted(aggs) for col, aggs in scan.columns.items()}
+                try:
+                    scan.profiles = dispatch_pair(
+                        lambda: profile_table(sql_conn, SQLSERVER, sql_table, columns_planned, aggregates_planned),
+                        lambda: profile_table(snow_conn, SNOWFLAKE, snow_table, columns_planned, aggregates_planned),
+                        concurrent=sql_conn is not snow_conn
+                    )
+                    logger.info(f"[scan_fusion] {table}: one scan per engine for {len(scan.steps)} steps")
+                except Exception as e:
+                    scan.error = str(e)
+                    logger.warning(f"[scan_fusion] Fused scan of {table} failed, steps will scan on their own: {e}")
+            if scan.profiles is None:
+                return None
+            scan.reads += 1
+            return scan.profiles
+
+    def report(self) -> Dict[str, Any]:
+        """Per-table steps fused, scans run and scans saved."""
+        tables = {}
+        for table, scan in self.scans.items():
+            tables[table] = {
+                "steps": scan.steps,
+                "columns": len(scan.columns),
+                "aggregates": scan.aggregates(),
+                "fused_reads": scan.reads,
+                "scans_saved": max(scan.reads - 1, 0) * 2
+            }
+            if scan.error:
+                tables[table]["error"] = scan.error
+        return {"tables": tables, "scans_saved": sum(t["scans_saved"] for t in tables.values())}
+
+
+def plan_scan_fusion(steps: List[Dict[str, Any]], metadata: Dict[str, Any], incremental: bool = False,
+                     min_steps: int = DEFAULT_MIN_STEPS) -> Optional[ScanPlan]:
+    """
+    Group the fusable steps of a pipeline by table.
+
+    Args:
+        steps: Pipeline steps ({"name", "validator", "config"})
+        metadata: Table metadata used by the validators
+        incremental: Pipeline-wide default for the incremental option
+        min_steps: Fusable steps a table needs before it gets a fused scan
+
+    Returns:
+        ScanPlan, or None if no table has enough fusable steps
+    """
+    scans: Dict[str, TableScan] = {}
+    for step in steps:
+        if step.get("enabled", True) is False:
+            continue
+        validator = step.get("validator", step.get("name"))
+        needs_for = FUSABLE_STEPS.get(validator)
+        cfg = step.get("config") or {}
+        table = cfg.get("table")
+        if not needs_for or not table or table not in (metadata or {}):
+            continue
+        if validator in INCREMENTAL_STEPS and cfg.get("incremental", incremental):
+            continue
+        needs = needs_for(cfg, metadata[table] or {})
+        if not needs:
+            continue
+        scans.setdefault(table, TableScan(table)).add(step.get("name", validator), needs)
+
+    scans = {table: scan for table, scan in scans.items() if len(scan.steps) >= min_steps}
+    if not scans:
+        return None
+    for table, scan in scans.items():
+        logger.info(f"[scan_fusion] {table}: fusing {len(scan.steps)} steps over {len(scan.columns)} columns")
+    return ScanPlan(scans)
@@ -0,0 +1,173 @@
+"""
+Chunked result streaming for DB-API cursors.
+
+Provides:
+- Bounded-memory iteration over large result sets via fetchmany
+- Columnar NumPy output (one array per column)
+- Arrow record batch output (Snowflake's fetch_arrow_batches when available)
+- Cheap Decimal detection from cursor.description for dict rows
+"""
+
+import itertools
+import logging
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 10000
+
+OUTPUT_FORMATS = ("numpy", "arrow", "rows")
+
+# Snowflake cursor.description type code for NUMBER/DECIMAL columns
+_SNOWFLAKE_FIXED = 0
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        return pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for output='arrow' (pip install pyarrow)")
+
+
+def decimal_columns(description) -> Optional[Set[int]]:
+    """
+    Work out which result columns can hold Decimal values.
+
+    pyodbc reports the Python type of each column, Snowflake reports a type
+    code plus scale. Returns None when the driver gives no usable hint, in
+    which case every value has to be checked.
+
+    Args:
+        description: cursor.description
+
+    Returns:
+        Set of column indexes, or None if unknown
+    """
+    indexes = set()
+    for i, col in enumerate(description):
+        type_code = col[1]
+        if isinstance(type_code, type):
+            # pyodbc: type_code is the Python type returned for the column
+            if issubclass(type_code, Decimal):
+                indexes.add(i)
+        elif isinstance(type_code, int):
+            # Snowflake: NUMBER with a scale comes back as Decimal
+            scale = col[5] if len(col) > 5 else None
+            if type_code == _SNOWFLAKE_FIXED and (scale is None or scale > 0):
+                indexes.add(i)
+        else:
+            return None
+    return indexes
+
+
+def convert_decimal_rows(rows, decimal_indexes: Optional[Set[int]]) -> List[tuple]:
+    """
+    Convert Decimal values to float for JSON serialization.
+
+    Only the columns in decimal_indexes are touched; None means check all.
+    """
+    if decimal_indexes is not None and not decimal_indexes:
+        return [tuple(row) for row in rows]
+
+    converted = []
+    for row in rows:
+        values = list(row)
+        indexes = decimal_indexes if decimal_indexes is not None else range(len(values))
+        for i in indexes:
+            if isinstance(values[i], Decimal):
+                values[i] = float(values[i])
+        converted.append(tuple(values))
+    return converted
+
+
+def _column_array(values: tuple) -> np.ndarray:
+    """Build the tightest NumPy array for one column of a batch."""
+    non_null = [v for v in values if v is not None]
+
+    if non_null and all(isinstance(v, (int, float, Decimal)) and not isinstance(v, bool) for v in non_null):
+        if len(non_null) == len(values) and all(isinstance(v, int) for v in non_null):
+            return np.array(values, dtype=np.int64)
+        return np.array([np.nan if v is None else float(v) for v in values], dtype=np.float64)
+
+    if non_null and all(isinstance(v, bool) for v in non_null) and len(non_null) == len(values):
+        return np.array(values, dtype=bool)
+
+    return np.array(values, dtype=object)
+
+
+def rows_to_columns(rows: List[tuple], columns: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Transpose a batch of rows into one NumPy array per column.
+
+    Integer columns without NULLs become int64, other numeric columns
+    float64 (NULL -> NaN), everything else an object array.
+    """
+    if not rows:
+        return {name: np.array([], dtype=object) for name in columns}
+    return {name: _column_array(values) for name, values in zip(columns, zip(*rows))}
+
+
+def _iter_arrow_batches(cursor, columns: List[str], batch_size: int):
+    """Yield pyarrow.RecordBatch objects, natively when the driver supports it."""
+    if hasattr(cursor, "fetch_arrow_batches"):
+        try:
+            tables = iter(cursor.fetch_arrow_batches())
+            first = next(tables)
+        except StopIteration:
+            return
+        except Exception as e:
+            # Result not in Arrow format (e.g. a non-SELECT) - fall back to rows
+            logger.debug(f"fetch_arrow_batches unavailable, falling back to fetchmany: {e}")
+        else:
+            for table in itertools.chain([first], tables):
+                for batch in table.to_batches(max_chunksize=batch_size):
+                    yield batch
+            return
+
+    pa = _require_pyarrow()
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        arrays = rows_to_columns(rows, columns)
+        yield pa.RecordBatch.from_pydict({
+            name: (arr.tolist() if arr.dtype == object else arr) for name, arr in arrays.items()
+        })
+
+
+def iter_cursor_batches(cursor, batch_size: int = DEFAULT_BATCH_SIZE, output: str = "numpy") -> Iterator[Any]:
+    """
+    Stream an executed cursor's result set in chunks.
+
+    Args:
+        cursor: Cursor on which a query has already been executed
+        batch_size: Rows per batch
+        output: "numpy" -> {column: np.ndarray}
+                "arrow" -> pyarrow.RecordBatch
+                "rows"  -> list of tuples
+
+    Yields:
+        One batch per iteration, never more than batch_size rows
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output}', expected one of {OUTPUT_FORMATS}")
+
+    # Lowercase column names for consistent access across databases
+    columns = [col[0].lower() for col in cursor.description]
+
+    if output == "arrow":
+        yield from _iter_arrow_batches(cursor, columns, batch_size)
+        return
+
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        if output == "rows":
+            yield [tuple(row) for row in rows]
+        else:
+            yield rows_to_columns(rows, columns)
@@ -3,6 +3,8 @@ import uuid
 import datetime
 import os
 
+from .result_sink import BufferedResultSink
+
 class ValidationWriter:
     def __init__(self, snow_conn):
         self.snow = snow_conn
@@ -51,12 +53,24 @@ class ValidationWriter:
             VALUES (%s, %s, %s, %s, %s, %s)
         """
 
+        # One multi-row insert for all results instead of one round-trip each
+        sink = BufferedResultSink(self.snow, insert_detail, flush_rows=0,
+                                  max_pending_rows=max(total, 1), background=False)
         for r in self.results:
-            self.snow.execute(insert_detail, (
+            sink.add((
                 self.run_id,
                 r["name"],
                 r["category"],
                 r["status"],
                 r["severity"],
                 json.dumps(r["details"])
-            ))
\ No newline at end of file
+            ))
+        stats = sink.close()
+
+        # The sink keeps failed rows instead of raising; a lost result still fails the write
+        lost = stats["pending"] + stats["dropped"]
+        if lost:
+            raise RuntimeError(
+                f"{lost} of {total} validation results were not written: {stats.get('last_error')}"
+            )
+        return stats
\ No newline at end of file
@@ -11,6 +11,7 @@ Executes an entire ordered validation suite.
 '''
 
 from ombudsman.core.connections import get_snow_conn
+from ombudsman.core.result_sink import sink_from_config
 from datetime import datetime
 import json  
 
@@ -19,7 +20,9 @@ class PipelineRunner:
     def __init__(self, executor, logger, cfg=None):
         self.executor = executor
         self.logger = logger
+        self.cfg = cfg or {}
         self.tables_initialized = False
+        self.result_sink = None  # Buffers result rows for bulk inserts
 
         # Use the Snowflake connection from the executor (already initialized)
         if hasattr(executor, 'snow_conn') and executor.snow_conn:
@@ -29,21 +32,21 @@ class PipelineRunner:
             self.snow_conn = None
             self.cursor = None
 
+    def _results_table(self):
+        """Fully qualified OMBUDSMAN_RESULTS name, to avoid database context issues"""
+        database = self.snow_conn.database
+        schema = self.snow_conn.schema
+        if database and schema:
+            return f"{database}.{schema}.OMBUDSMAN_RESULTS"
+        return "OMBUDSMAN_RESULTS"
+
     def _ensure_tables_exist(self):
         """Create OMBUDSMAN_RESULTS table if it doesn't exist"""
         if self.tables_initialized or not self.cursor:
             return
 
         try:
-            # Get database and schema from connection
-            database = self.snow_conn.database
-            schema = self.snow_conn.schema
-
-            # Use fully qualified table name to avoid database context issues
-            if database and schema:
-                table_name = f"{database}.{schema}.OMBUDSMAN_RESULTS"
-            else:
-                table_name = "OMBUDSMAN_RESULTS"
+            table_name = self._results_table()
 
             # Create table if it doesn't exist
             self.cursor.execute(f"""
@@ -65,19 +68,20 @@ class PipelineRunner:
             # Mark as initialized to avoid repeated attempts
             self.tables_initialized = True
 
+        try:
+            table_name = self._results_table()
+            self.result_sink = sink_from_config(self.snow_conn, f"""
+                INSERT INTO {table_name} (PIPELINE_NAME, STEP_NAME, STATUS, MESSAGE)
+                VALUES (%s, %s, %s, %s)
+            """, self.cfg)
+        except Exception as e:
+            print(f"Note: Snowflake logging disabled: {e}")
+
     def _write_result_to_snowflake(self, pipeline_name, result):
-        if not self.cursor or not self.tables_initialized:
+        if not self.result_sink:
             return  # Skip if no Snowflake connection configured or table creation failed
 
         try:
-            # Get fully qualified table name
-            database = self.snow_conn.database
-            schema = self.snow_conn.schema
-            if database and schema:
-                table_name = f"{database}.{schema}.OMBUDSMAN_RESULTS"
-            else:
-                table_name = "OMBUDSMAN_RESULTS"
-
             # Convert details to JSON string for MESSAGE column
             message = json.dumps({
                 "severity": result.severity,
@@ -85,16 +89,13 @@ class PipelineRunner:
                 "timestamp": result.timestamp
             })
 
-            self.cursor.execute(f"""
-                INSERT INTO {table_name} (PIPELINE_NAME, STEP_NAME, STATUS, MESSAGE)
-                VALUES (%s, %s, %s, %s)
-            """, (
+            # Buffered and written in bulk every N results and at the end of the run
+            self.result_sink.add((
                 pipeline_name,
                 result.name,  # Fixed: was result.step, now result.name
                 result.status,
                 message  # Fixed: was result.message, now JSON string with details
             ))
-            self.snow_conn.commit()
         except Exception as e:
             # Silently skip Snowflake logging if it fails
             # Results are still returned to the API
@@ -106,15 +107,21 @@ class PipelineRunner:
         # Ensure Snowflake tables exist once at the start
         self._ensure_tables_exist()
 
-        for step in pipeline_def:
-            # run the validation step
-            res = self.executor.run_step(step)
-            results.append(res)
-
-            # normal logging
-            self.logger.log(res.to_dict())
-
-            # write into Snowflake database
-            self._write_result_to_snowflake(pipeline_name, res)
+        try:
+            for step in pipeline_def:
+                # run the validation step
+                res = self.executor.run_step(step)
+                results.append(res)
+
+                # normal logging
+                self.logger.log(res.to_dict())
+
+                # write into Snowflake database
+                self._write_result_to_snowflake(pipeline_name, res)
+        finally:
+            if self.result_sink:
+                stats = self.result_sink.close()
+                if stats["pending"]:
+                    print(f"Note: Snowflake logging skipped for {stats['pending']} results: {stats.get('last_error')}")
 
         return results
\ No newline at end of file
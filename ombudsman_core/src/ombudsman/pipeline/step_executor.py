@@ -4,16 +4,45 @@ Runs a single validator with injected dependencies.
 
 '''
 
+import copy
+from datetime import datetime
+
 from ..core.result import ValidationResult
+from ..validation.explain import has_deferred, resolve_explain
 
 class StepExecutor:
-    def __init__(self, registry, sql_conn, snow_conn, mapping, metadata, type_checker=None):
+    def __init__(self, registry, sql_conn, snow_conn, mapping, metadata, type_checker=None,
+                 watermark_store=None, incremental=False, lease_connections=None, query_cache=None,
+                 scan_plan=None, change_detector=None, defer_explain=False):
         self.registry = registry
         self.sql_conn = sql_conn
         self.snow_conn = snow_conn
         self.mapping = mapping
         self.metadata = metadata
         self.type_checker = type_checker  # Optional AI type checker
+        self.watermark_store = watermark_store  # Optional WatermarkStore for incremental runs
+        self.incremental = incremental  # Pipeline-wide default for the 'incremental' step option
+        self.lease_connections = lease_connections  # Optional extra connection pairs for partitioned scans
+        self.query_cache = query_cache  # Optional run-scoped QueryCache shared by all steps
+        self.scan_plan = scan_plan  # Optional ScanPlan of fused per-table aggregate scans
+        self.change_detector = change_detector  # Optional ChangeDetector skipping unchanged tables
+        self.defer_explain = defer_explain  # Fetch explain samples only for steps that do not pass
+
+    def with_connections(self, sql_conn, snow_conn):
+        """Return a copy of this executor that runs steps on other connections"""
+        executor = copy.copy(self)
+        executor.sql_conn = sql_conn
+        executor.snow_conn = snow_conn
+        return executor
+
+    def _step_connections(self):
+        """The step's connections, read through the run's query cache if there is one"""
+        if self.query_cache is None:
+            return self.sql_conn, self.snow_conn
+        sql_conn = self.query_cache.wrap(self.sql_conn, "sqlserver")
+        if self.snow_conn is self.sql_conn:
+            return sql_conn, sql_conn
+        return sql_conn, self.query_cache.wrap(self.snow_conn, "snowflake")
 
     def run_step(self, step):
         name = step["name"]
@@ -39,6 +68,27 @@ class StepExecutor:
 
         print(f"[DEBUG StepExecutor] Found validator '{name}' in registry")
 
+        # Skip steps whose tables are unchanged since they last passed
+        tables = self.change_detector.referenced_tables(cfg) if self.change_detector is not None else []
+        check_changes = bool(tables) and step.get("skip_unchanged", True)
+        if check_changes:
+            change_key = self.change_detector.step_key(name, tables, cfg)
+            unchanged = self.change_detector.unchanged(change_key, tables, self.sql_conn, self.snow_conn)
+            if unchanged:
+                print(f"[INFO StepExecutor] Skipping '{name}': tables {tables} unchanged since {unchanged.get('passed_at')}")
+                return ValidationResult(
+                    name,
+                    status="SKIPPED",
+                    severity="NONE",
+                    details={
+                        "reason": "Tables unchanged since the last passing run",
+                        "table": cfg.get("table"),
+                        "tables": tables,
+                        "last_passed_at": unchanged.get("passed_at"),
+                        "fingerprint": unchanged.get("fingerprint")
+                    }
+                )
+
         func = entry["func"]
 
         try:
@@ -52,18 +102,29 @@ class StepExecutor:
             call_kwargs = {}
 
             # Add injected dependencies if validator accepts them
+            sql_conn, snow_conn = self._step_connections()
             if 'sql_conn' in params:
-                call_kwargs['sql_conn'] = self.sql_conn
+                call_kwargs['sql_conn'] = sql_conn
             if 'snow_conn' in params:
-                call_kwargs['snow_conn'] = self.snow_conn
+                call_kwargs['snow_conn'] = snow_conn
             if 'conn' in params:  # Some validators use 'conn' instead
-                call_kwargs['conn'] = self.sql_conn
+                call_kwargs['conn'] = sql_conn
             if 'mapping' in params:
                 call_kwargs['mapping'] = self.mapping
             if 'metadata' in params:
                 call_kwargs['metadata'] = self.metadata
             if 'type_checker' in params and self.type_checker:
                 call_kwargs['type_checker'] = self.type_checker
+            if 'watermark_store' in params and self.watermark_store is not None:
+                call_kwargs['watermark_store'] = self.watermark_store
+            if 'lease_connections' in params and self.lease_connections is not None:
+                call_kwargs['lease_connections'] = self.lease_connections
+            if 'scan_plan' in params and self.scan_plan is not None:
+                call_kwargs['scan_plan'] = self.scan_plan
+            if 'incremental' in params and self.incremental:
+                call_kwargs['incremental'] = True
+            if 'defer_explain' in params and self.defer_explain:
+                call_kwargs['defer_explain'] = True
 
             # Add config parameters (these override injected ones if same key)
             for key, value in cfg.items():
@@ -97,6 +158,16 @@ class StepExecutor:
                     details={"error": "Validator result missing required 'status' field", "result": result}
                 )
 
+            if check_changes and result.get("status") == "PASS":
+                self.change_detector.record_pass(change_key, tables, datetime.now().isoformat())
+
+            # Passing steps keep their explain queries for on-demand fetching
+            if result.get("status") != "PASS" and has_deferred(result.get("explain")):
+                try:
+                    resolve_explain(result["explain"], sql_conn, snow_conn)
+                except Exception as e:
+                    print(f"[WARN StepExecutor] Could not fetch explain data for '{name}': {e}")
+
             # Return properly formatted ValidationResult
             return ValidationResult(
                 name=name,
@@ -0,0 +1,154 @@
+# src/ombudsman/validation/column_profiler.py
+'''
+Single-pass column profiling.
+
+Computes per-column aggregates (null counts, min/max, sums, ...) for many
+columns of a table in one scan per side, instead of one query per column.
+'''
+
+from decimal import Decimal
+
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE, escape_column_identifier
+
+# Aggregate templates per dialect. {col} is the escaped column reference.
+AGGREGATES = {
+    "null_count": {
+        SQLSERVER: "SUM(CASE WHEN {col} IS NULL THEN 1 ELSE 0 END)",
+        SNOWFLAKE: "SUM(CASE WHEN {col} IS NULL THEN 1 ELSE 0 END)",
+    },
+    "non_null_count": {
+        SQLSERVER: "COUNT({col})",
+        SNOWFLAKE: "COUNT({col})",
+    },
+    "distinct_count": {
+        SQLSERVER: "COUNT(DISTINCT {col})",
+        SNOWFLAKE: "COUNT(DISTINCT {col})",
+    },
+    "min": {
+        SQLSERVER: "MIN({col})",
+        SNOWFLAKE: "MIN({col})",
+    },
+    "max": {
+        SQLSERVER: "MAX({col})",
+        SNOWFLAKE: "MAX({col})",
+    },
+    "sum": {
+        SQLSERVER: "SUM({col})",
+        SNOWFLAKE: "SUM({col})",
+    },
+    "avg": {
+        SQLSERVER: "AVG({col})",
+        SNOWFLAKE: "AVG({col})",
+    },
+    "stddev": {
+        SQLSERVER: "STDEV({col})",
+        SNOWFLAKE: "STDDEV({col})",
+    },
+}
+
+# Aggregates whose result is always an integer count
+COUNT_AGGREGATES = {"null_count", "non_null_count", "distinct_count"}
+
+# SQL Server allows 4096 expressions per SELECT; stay well below it
+DEFAULT_MAX_EXPRESSIONS = 1000
+
+
+def build_profile_queries(dialect, table, columns, aggregates=("null_count",),
+                          where=None, max_expressions=DEFAULT_MAX_EXPRESSIONS):
+    """
+    Build the SELECT statements that profile `columns` of `table`.
+
+    The first query also carries COUNT(*) as the table row count. Wide
+    tables are split into several queries of at most `max_expressions`
+    select-list items each.
+
+    Args:
+        dialect: SQLSERVER or SNOWFLAKE
+        table: Already escaped table reference
+        columns: Column names to profile
+        aggregates: Aggregate names from AGGREGATES, or a dict mapping
+                    each column to its own aggregate names
+        where: Optional predicate (without the WHERE keyword)
+        max_expressions: Maximum select-list items per query
+
+    Returns:
+        List of (query, slots) tuples, where slots lists the
+        (column, aggregate) pair for each select-list position. The row
+        count slot is (None, "row_count").
+    """
+    per_column = aggregates if isinstance(aggregates, dict) else {col: aggregates for col in columns}
+    unknown = sorted({a for aggs in per_column.values() for a in aggs if a not in AGGREGATES})
+    if unknown:
+        raise ValueError(f"Unknown aggregates: {unknown}")
+
+    slots = [(None, "row_count")]
+    for col in columns:
+        for agg in per_column.get(col, ()):
+            slots.append((col, agg))
+
+    where_clause = f" WHERE {where}" if where else ""
+    queries = []
+    for start in range(0, len(slots), max_expressions):
+        chunk = slots[start:start + max_expressions]
+        exprs = []
+        for i, (col, agg) in enumerate(chunk):
+            if agg == "row_count":
+                expr = "COUNT(*)"
+            else:
+                expr = AGGREGATES[agg][dialect].format(col=escape_column_identifier(col, dialect))
+            exprs.append(f"{expr} AS p{i}")
+        queries.append((f"SELECT {', '.join(exprs)} FROM {table}{where_clause}", chunk))
+
+    return queries
+
+
+def _normalize(agg, value):
+    if value is None:
+        return 0 if agg in COUNT_AGGREGATES or agg == "row_count" else None
+    if agg in COUNT_AGGREGATES or agg == "row_count":
+        return int(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def profile_table(conn, dialect, table, columns, aggregates=("null_count",),
+                  where=None, max_expressions=DEFAULT_MAX_EXPRESSIONS):
+    """
+    Profile all requested columns of one table in a single scan.
+
+    Args:
+        conn: ConnectionWrapper for the side being profiled
+        dialect: SQLSERVER or SNOWFLAKE
+        table: Already escaped table reference
+        columns: Column names to profile
+        aggregates: Aggregate names from AGGREGATES, or a dict mapping
+                    each column to its own aggregate names
+        where: Optional predicate (without the WHERE keyword)
+        max_expressions: Maximum select-list items per query
+
+    Returns:
+        {
+            "row_count": int,
+            "columns": {col: {aggregate: value, ...}, ...},
+            "queries": [str, ...]
+        }
+    """
+    profile = {
+        "row_count": None,
+        "columns": {col: {} for col in columns},
+        "queries": []
+    }
+
+    for query, slots in build_profile_queries(dialect, table, columns, aggregates, where, max_expressions):
+        row = conn.fetch_many(query)
+        values = row[0] if row else [None] * len(slots)
+        profile["queries"].append(query)
+
+        for (col, agg), value in zip(slots, values):
+            if agg == "row_count":
+                profile["row_count"] = _normalize(agg, value)
+            else:
+                profile["columns"][col][agg] = _normalize(agg, value)
+
+    return profile
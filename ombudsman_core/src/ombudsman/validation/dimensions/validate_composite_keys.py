@@ -1,5 +1,6 @@
 # src/ombudsman/validation/dimensions/validate_composite_keys.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 def validate_composite_keys(sql_conn, snow_conn, dim, mapping, metadata):
     sql_table = escape_sql_server_identifier(mapping[dim]["sql"])
@@ -10,8 +11,12 @@ def validate_composite_keys(sql_conn, snow_conn, dim, mapping, metadata):
     sql_key_expr = ", ".join([f"[{k}]" for k in keys])
     snow_key_expr = ", ".join(keys)
 
-    sql_rows = sql_conn.fetch_many(f"SELECT {sql_key_expr} FROM {sql_table}")
-    snow_rows = snow_conn.fetch_many(f"SELECT {snow_key_expr} FROM {snow_table}")
+    sql_rows, snow_rows = run_pair(
+        sql_conn, snow_conn,
+        f"SELECT {sql_key_expr} FROM {sql_table}",
+        f"SELECT {snow_key_expr} FROM {snow_table}",
+        method="fetch_many"
+    )
 
     sql_set = set(sql_rows)
     snow_set = set(snow_rows)
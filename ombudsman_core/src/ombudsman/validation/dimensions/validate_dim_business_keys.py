@@ -1,5 +1,6 @@
 # src/ombudsman/validation/dimensions/validate_dim_business_keys.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 def validate_dim_business_keys(sql_conn, snow_conn, dim, mapping, metadata):
     sql_table = escape_sql_server_identifier(mapping[dim]["sql"])
@@ -9,8 +10,9 @@ def validate_dim_business_keys(sql_conn, snow_conn, dim, mapping, metadata):
     sql_q = f"SELECT {bk} FROM {sql_table}"
     snow_q = f"SELECT {bk} FROM {snow_table}"
 
-    sql_keys = {r[0] for r in sql_conn.fetch_many(sql_q)}
-    snow_keys = {r[0] for r in snow_conn.fetch_many(snow_q)}
+    sql_rows, snow_rows = run_pair(sql_conn, snow_conn, sql_q, snow_q, method="fetch_many")
+    sql_keys = {r[0] for r in sql_rows}
+    snow_keys = {r[0] for r in snow_rows}
 
     missing_in_sql = list(snow_keys - sql_keys)
     missing_in_snow = list(sql_keys - snow_keys)
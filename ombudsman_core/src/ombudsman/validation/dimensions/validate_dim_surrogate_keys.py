@@ -1,5 +1,6 @@
 # src/ombudsman/validation/dimensions/validate_dim_surrogate_keys.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 def validate_dim_surrogate_keys(sql_conn, snow_conn, dim, mapping, metadata):
     sql_table = escape_sql_server_identifier(mapping[dim]["sql"])
@@ -11,8 +12,9 @@ def validate_dim_surrogate_keys(sql_conn, snow_conn, dim, mapping, metadata):
     sql_q = f"SELECT {bk}, {sk} FROM {sql_table}"
     snow_q = f"SELECT {bk}, {sk} FROM {snow_table}"
 
-    sql_map = {bk: sk for bk, sk in sql_conn.fetch_many(sql_q)}
-    snow_map = {bk: sk for bk, sk in snow_conn.fetch_many(snow_q)}
+    sql_rows, snow_rows = run_pair(sql_conn, snow_conn, sql_q, snow_q, method="fetch_many")
+    sql_map = {bk: sk for bk, sk in sql_rows}
+    snow_map = {bk: sk for bk, sk in snow_rows}
 
     key_mismatches = []
 
@@ -1,7 +1,16 @@
 # src/ombudsman/validation/dimensions/validate_scd1.py
-from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier, SQLSERVER, SNOWFLAKE
+from ombudsman.core.partitioning import (
+    partitioner_for,
+    where_clause,
+    DEFAULT_PARTITIONS,
+    DEFAULT_PARTITION_WORKERS,
+)
+from ombudsman.core.dispatch import run_pair
 
-def validate_scd1(sql_conn, snow_conn, dim, mapping, metadata):
+def validate_scd1(sql_conn, snow_conn, dim, mapping, metadata, partition_column=None,
+                  partitions=DEFAULT_PARTITIONS, partition_workers=DEFAULT_PARTITION_WORKERS,
+                  lease_connections=None):
     sql_table = escape_sql_server_identifier(mapping[dim]["sql"])
     snow_table = escape_snowflake_identifier(mapping[dim]["snow"])
 
@@ -11,23 +20,45 @@ def validate_scd1(sql_conn, snow_conn, dim, mapping, metadata):
     sql_col_list = ", ".join([f"[{bk}]"] + [f"[{a}]" for a in attrs])
     snow_col_list = ", ".join([bk] + attrs)
 
-    sql_rows = {r[0]: r[1:] for r in sql_conn.fetch_many(f"SELECT {sql_col_list} FROM {sql_table}")}
-    snow_rows = {r[0]: r[1:] for r in snow_conn.fetch_many(f"SELECT {snow_col_list} FROM {snow_table}")}
+    # Splitting on a numeric/date column compares one range at a time, so
+    # neither side is held in memory whole. The column must not change for a
+    # given key (use the business key) or a row could land in different
+    # ranges on the two sides.
+    partition_column = partition_column or metadata[dim].get("partition_column")
+    partitioner = partitioner_for(sql_conn, snow_conn, sql_table, partition_column, partitions,
+                                  lease_connections, partition_workers)
 
-    diffs = []
+    def compare_partition(partition, sql_part_conn, snow_part_conn):
+        sql_where = where_clause(partition.predicate(SQLSERVER))
+        snow_where = where_clause(partition.predicate(SNOWFLAKE))
+        sql_fetched, snow_fetched = run_pair(sql_part_conn, snow_part_conn,
+                                             f"SELECT {sql_col_list} FROM {sql_table}{sql_where}",
+                                             f"SELECT {snow_col_list} FROM {snow_table}{snow_where}",
+                                             method="fetch_many")
+        sql_rows = {r[0]: r[1:] for r in sql_fetched}
+        snow_rows = {r[0]: r[1:] for r in snow_fetched}
+
+        partition_diffs = []
+        for k in sql_rows:
+            if k in snow_rows and sql_rows[k] != snow_rows[k]:
+                partition_diffs.append({
+                    "business_key": k,
+                    "sql_values": sql_rows[k],
+                    "snow_values": snow_rows[k]
+                })
+        return partition_diffs
 
-    for k in sql_rows:
-        if k in snow_rows and sql_rows[k] != snow_rows[k]:
-            diffs.append({
-                "business_key": k,
-                "sql_values": sql_rows[k],
-                "snow_values": snow_rows[k]
-            })
+    diffs = []
+    for partition_diffs in partitioner.map(compare_partition):
+        diffs.extend(partition_diffs)
 
     status = "FAIL" if diffs else "PASS"
 
-    return {
+    result = {
         "status": status,
         "severity": "MEDIUM" if status == "FAIL" else "NONE",
         "differences": diffs
-    }
\ No newline at end of file
+    }
+    if len(partitioner.partitions) > 1:
+        result["partitioning"] = partitioner.stats
+    return result
@@ -1,5 +1,6 @@
 # src/ombudsman/validation/dimensions/validate_scd2.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 def validate_scd2(sql_conn, snow_conn, dim, mapping, metadata):
     sql_table = escape_sql_server_identifier(mapping[dim]["sql"])
@@ -9,15 +10,13 @@ def validate_scd2(sql_conn, snow_conn, dim, mapping, metadata):
     eff = metadata[dim]["effective_date"]
     end = metadata[dim]["end_date"]
 
-    sql_rows = sql_conn.fetch_dicts(f"""
+    sql_rows, snow_rows = run_pair(sql_conn, snow_conn, f"""
         SELECT {bk}, {eff}, {end}
         FROM {sql_table}
-    """)
-
-    snow_rows = snow_conn.fetch_dicts(f"""
+    """, f"""
         SELECT {bk}, {eff}, {end}
         FROM {snow_table}
-    """)
+    """, method="fetch_dicts")
 
     mismatches = []
     overlap_issues = []
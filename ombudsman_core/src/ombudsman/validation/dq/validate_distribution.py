@@ -3,14 +3,139 @@
 Kolmogorov–Smirnov or Chi‑Square test)
 Detects distribution drift between SQL Server and Snowflake for numeric columns.
 
+Modes:
+- pushdown (default): both sides return a histogram over common bin edges and
+  the KS test runs on the binned CDFs
+- client: every value is fetched and compared with scipy's ks_2samp
+
+If pushdown fails, `fallback` decides what happens: "sample" runs ks_2samp on
+random samples, "client" fetches all values, "none" re-raises.
+
+The explain quartiles are exact only in client mode; pushdown interpolates
+them from the histogram and sample mode takes them from the samples, so they
+are marked approximate. The exact PERCENTILE_CONT queries are listed with
+the explain queries.
 '''
 
 
-import numpy as np
 from scipy.stats import ks_2samp
-from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.validation.pushdown import (
+    fetch_moments,
+    fetch_histogram,
+    histogram_edges,
+    histogram_quantiles,
+    value_quantiles,
+    binned_ks_2samp,
+    fetch_sample,
+    fetch_values,
+    DEFAULT_BINS,
+    DEFAULT_SAMPLE_SIZE,
+)
+from ombudsman.core.dispatch import dispatch_pair
+from ombudsman.validation.explain import explain_pair
+
+
+def _pushdown_ks(sql_conn, snow_conn, sql_table, snow_table, col, bins):
+    """KS test on server-side histograms. Returns None if a side has no values."""
+    concurrent = sql_conn is not snow_conn
+    sql_moments, snow_moments = dispatch_pair(
+        lambda: fetch_moments(sql_conn, SQLSERVER, sql_table, col),
+        lambda: fetch_moments(snow_conn, SNOWFLAKE, snow_table, col),
+        concurrent
+    )
+
+    if sql_moments["count"] == 0 or snow_moments["count"] == 0:
+        return None
+
+    edges = histogram_edges(
+        min(sql_moments["min"], snow_moments["min"]),
+        max(sql_moments["max"], snow_moments["max"]),
+        bins
+    )
+    sql_counts, snow_counts = dispatch_pair(
+        lambda: fetch_histogram(sql_conn, SQLSERVER, sql_table, col, edges),
+        lambda: fetch_histogram(snow_conn, SNOWFLAKE, snow_table, col, edges),
+        concurrent
+    )
+
+    ks_stat, p_value = binned_ks_2samp(sql_counts, snow_counts)
+    return {
+        "ks_stat": ks_stat,
+        "p_value": p_value,
+        "method": "pushdown",
+        "histogram": {
+            "edges": [round(float(e), 6) for e in edges],
+            "sql_counts": sql_counts.tolist(),
+            "snow_counts": snow_counts.tolist()
+        },
+        "sql_quartiles": histogram_quantiles(sql_counts, edges),
+        "snow_quartiles": histogram_quantiles(snow_counts, edges)
+    }
+
+
+def _client_ks(sql_vals, snow_vals, method):
+    """KS test on values held in memory. Returns None if a side has no values."""
+    if len(sql_vals) == 0 or len(snow_vals) == 0:
+        return None
+    ks_stat, p_value = ks_2samp(sql_vals, snow_vals)
+    return {
+        "ks_stat": float(ks_stat),
+        "p_value": float(p_value),
+        "method": method,
+        "sql_quartiles": value_quantiles(sql_vals),
+        "snow_quartiles": value_quantiles(snow_vals)
+    }
+
 
-def validate_distribution(sql_conn, snow_conn, table, mapping, metadata):
+def _column_ks(sql_conn, snow_conn, sql_table, snow_table, col, mode, fallback, sample_size, bins):
+    if mode != "client":
+        try:
+            return _pushdown_ks(sql_conn, snow_conn, sql_table, snow_table, col, bins)
+        except Exception as e:
+            print(f"[validate_distribution] Pushdown failed for {col}: {e}")
+            if fallback == "sample":
+                return _client_ks(
+                    fetch_sample(sql_conn, SQLSERVER, sql_table, col, sample_size),
+                    fetch_sample(snow_conn, SNOWFLAKE, snow_table, col, sample_size),
+                    "sample"
+                )
+            if fallback != "client":
+                raise
+
+    return _client_ks(
+        fetch_values(sql_conn, SQLSERVER, sql_table, col),
+        fetch_values(snow_conn, SNOWFLAKE, snow_table, col),
+        "client"
+    )
+
+
+def _quartile_dict(quantiles, approximate):
+    return {
+        "q1": quantiles.get(0.25),
+        "q2": quantiles.get(0.5),
+        "q3": quantiles.get(0.75),
+        "approximate": approximate
+    } if quantiles else {}
+
+
+def _quartile_query(table, col_ref):
+    return (
+        f"SELECT PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {col_ref}) as q1, "
+        f"PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {col_ref}) as q2, "
+        f"PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {col_ref}) as q3 "
+        f"FROM {table} WHERE {col_ref} IS NOT NULL"
+    )
+
+
+def validate_distribution(sql_conn, snow_conn, table, mapping, metadata, mode="pushdown",
+                          fallback="sample", sample_size=DEFAULT_SAMPLE_SIZE, bins=DEFAULT_BINS,
+                          defer_explain=False):
     numerics = metadata[table].get("numeric_columns", [])
     if not numerics:
         return {"status": "SKIPPED"}
@@ -20,30 +145,26 @@ def validate_distribution(sql_conn, snow_conn, table, mapping, metadata):
 
     issues = []
     results = []
+    ks_details = {}
 
     for col in numerics:
-        sql_vals = [r[0] for r in sql_conn.fetch_many(f"SELECT [{col}] FROM {sql_table}")]
-        snow_vals = [r[0] for r in snow_conn.fetch_many(f"SELECT {col} FROM {snow_table}")]
-
-        sql_vals = np.array([v for v in sql_vals if v is not None])
-        snow_vals = np.array([v for v in snow_vals if v is not None])
-
-        if len(sql_vals) == 0 or len(snow_vals) == 0:
+        ks = _column_ks(sql_conn, snow_conn, sql_table, snow_table, col, mode, fallback, sample_size, bins)
+        if ks is None:
             continue
 
-        ks_stat, p_value = ks_2samp(sql_vals, snow_vals)
-
-        distribution_match = bool(p_value > 0.05)
+        distribution_match = bool(ks["p_value"] > 0.05)
 
         result = {
             "column": col,
-            "ks_statistic": round(float(ks_stat), 2),
-            "p_value": round(float(p_value), 4),
+            "ks_statistic": round(float(ks["ks_stat"]), 2),
+            "p_value": round(float(ks["p_value"]), 4),
             "distribution_match": distribution_match,
+            "method": ks["method"],
             "interpretation": "Distributions are similar" if distribution_match else "Distributions differ significantly"
         }
 
         results.append(result)
+        ks_details[col] = ks
 
         if not distribution_match:
             issues.append(result)
@@ -54,65 +175,41 @@ def validate_distribution(sql_conn, snow_conn, table, mapping, metadata):
     explain_data = {}
     for result in results:
         col = result["column"]
+        ks = ks_details[col]
+
+        if result["distribution_match"]:
+            interpretation = f"Distribution test passed for column '{col}': KS statistic={result['ks_statistic']}, p-value={result['p_value']} (threshold=0.05). Distributions are similar."
+        else:
+            interpretation = f"Distribution test failed for column '{col}': KS statistic={result['ks_statistic']}, p-value={result['p_value']} (threshold=0.05). This indicates the two distributions differ significantly."
+
+        explain_data[col] = {
+            "column": col,
+            "ks_statistic": result["ks_statistic"],
+            "p_value": result["p_value"],
+            "interpretation": interpretation,
+            "queries": {
+                "sql_samples": f"SELECT TOP 20 * FROM {sql_table} ORDER BY [{col}]",
+                "snow_samples": f"SELECT * FROM {snow_table} ORDER BY {col} LIMIT 20",
+                "sql_quartiles": _quartile_query(sql_table, f"[{col}]"),
+                "snow_quartiles": _quartile_query(snow_table, col)
+            }
+        }
+
+        # Quartiles come from the histogram or the fetched values, no extra scan needed
+        approximate = ks["method"] != "client"
+        explain_data[col]["sql_quartiles"] = _quartile_dict(ks["sql_quartiles"], approximate)
+        explain_data[col]["snow_quartiles"] = _quartile_dict(ks["snow_quartiles"], approximate)
+        if ks["method"] == "pushdown":
+            explain_data[col]["histogram"] = ks["histogram"]
+
         try:
             # Get sample data for comparison
-            sql_samples = sql_conn.fetch_dicts(f"SELECT TOP 20 * FROM {sql_table} ORDER BY [{col}]")
-            snow_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} ORDER BY {col} LIMIT 20")
-
-            # Get value distribution buckets (quartiles)
-            sql_quartiles = sql_conn.fetch_dicts(f"""
-                SELECT
-                    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY [{col}]) as q1,
-                    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY [{col}]) as q2,
-                    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY [{col}]) as q3
-                FROM {sql_table}
-                WHERE [{col}] IS NOT NULL
-            """)
-
-            snow_quartiles = snow_conn.fetch_dicts(f"""
-                SELECT
-                    PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {col}) as q1,
-                    PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {col}) as q2,
-                    PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {col}) as q3
-                FROM {snow_table}
-                WHERE {col} IS NOT NULL
-            """)
-
-            if result["distribution_match"]:
-                interpretation = f"Distribution test passed for column '{col}': KS statistic={result['ks_statistic']}, p-value={result['p_value']} (threshold=0.05). Distributions are similar."
-            else:
-                interpretation = f"Distribution test failed for column '{col}': KS statistic={result['ks_statistic']}, p-value={result['p_value']} (threshold=0.05). This indicates the two distributions differ significantly."
-
-            explain_data[col] = {
-                "column": col,
-                "ks_statistic": result["ks_statistic"],
-                "p_value": result["p_value"],
-                "sql_samples": sql_samples[:20],
-                "snow_samples": snow_samples[:20],
-                "sql_quartiles": sql_quartiles[0] if sql_quartiles else {},
-                "snow_quartiles": snow_quartiles[0] if snow_quartiles else {},
-                "interpretation": interpretation,
-                "queries": {
-                    "sql_samples": f"SELECT TOP 20 * FROM {sql_table} ORDER BY [{col}]",
-                    "snow_samples": f"SELECT * FROM {snow_table} ORDER BY {col} LIMIT 20",
-                    "sql_quartiles": f"SELECT PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY [{col}]) as q1, PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY [{col}]) as q2, PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY [{col}]) as q3 FROM {sql_table} WHERE [{col}] IS NOT NULL",
-                    "snow_quartiles": f"SELECT PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY {col}) as q1, PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY {col}) as q2, PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY {col}) as q3 FROM {snow_table} WHERE {col} IS NOT NULL"
-                }
-            }
+            explain_pair(explain_data[col], "sql_samples", "snow_samples", sql_conn, snow_conn,
+                         f"SELECT TOP 20 * FROM {sql_table} ORDER BY [{col}]",
+                         f"SELECT * FROM {snow_table} ORDER BY {col} LIMIT 20",
+                         defer=defer_explain)
         except Exception as e:
-            # If explain fails, at least provide basic info
-            if result["distribution_match"]:
-                interpretation = f"Distribution test passed for column '{col}': KS statistic={result['ks_statistic']}, p-value={result['p_value']} (threshold=0.05). Distributions are similar."
-            else:
-                interpretation = f"Distribution test failed for column '{col}': KS statistic={result['ks_statistic']}, p-value={result['p_value']} (threshold=0.05). This indicates the two distributions differ significantly."
-
-            explain_data[col] = {
-                "column": col,
-                "ks_statistic": result["ks_statistic"],
-                "p_value": result["p_value"],
-                "interpretation": interpretation,
-                "error": f"Could not fetch detailed samples: {str(e)}"
-            }
+            explain_data[col]["error"] = f"Could not fetch detailed samples: {str(e)}"
 
     return {
         "status": status,
@@ -120,4 +217,4 @@ def validate_distribution(sql_conn, snow_conn, table, mapping, metadata):
         "issues": issues,
         "results": results,
         "explain": explain_data  # Always include explain data
-    }
\ No newline at end of file
+    }
@@ -1,7 +1,9 @@
 # src/ombudsman/validation/dq/validate_domain_values.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
+from ombudsman.validation.explain import explain_pair
 
-def validate_domain_values(sql_conn, snow_conn, table, mapping, metadata):
+def validate_domain_values(sql_conn, snow_conn, table, mapping, metadata, defer_explain=False):
     domains = metadata[table].get("domain_values", {})
     if not domains:
         return {"status": "SKIPPED"}
@@ -27,8 +29,9 @@ def validate_domain_values(sql_conn, snow_conn, table, mapping, metadata):
             WHERE {col} NOT IN ({allowed_str})
         """
 
-        sql_bad = [v[0] for v in sql_conn.fetch_many(sql_q)]
-        snow_bad = [v[0] for v in snow_conn.fetch_many(snow_q)]
+        sql_rows, snow_rows = run_pair(sql_conn, snow_conn, sql_q, snow_q, method="fetch_many")
+        sql_bad = [v[0] for v in sql_rows]
+        snow_bad = [v[0] for v in snow_rows]
 
         has_violations = sql_bad or snow_bad
 
@@ -71,10 +74,6 @@ def validate_domain_values(sql_conn, snow_conn, table, mapping, metadata):
                     f"SELECT {col}, COUNT(*) as count FROM {snow_table} WHERE {col} NOT IN ({allowed_str}) GROUP BY {col} ORDER BY COUNT(*) DESC"
                 )
 
-            # Get all value distributions for context
-            sql_all_values = sql_conn.fetch_dicts(f"SELECT [{col}], COUNT(*) as count FROM {sql_table} GROUP BY [{col}] ORDER BY COUNT(*) DESC")
-            snow_all_values = snow_conn.fetch_dicts(f"SELECT {col}, COUNT(*) as count FROM {snow_table} GROUP BY {col} ORDER BY COUNT(*) DESC")
-
             if has_violations:
                 interpretation = f"Column '{col}' has {len(sql_bad)} invalid values in SQL Server and {len(snow_bad)} in Snowflake. Allowed values: {', '.join([str(v) for v in allowed])}"
             else:
@@ -88,8 +87,6 @@ def validate_domain_values(sql_conn, snow_conn, table, mapping, metadata):
                 "snow_invalid_samples": snow_invalid_samples[:20],
                 "sql_value_counts": sql_value_counts,
                 "snow_value_counts": snow_value_counts,
-                "sql_all_values": sql_all_values[:20],
-                "snow_all_values": snow_all_values[:20],
                 "interpretation": interpretation,
                 "queries": {
                     "sql_invalid_values": f"SELECT DISTINCT [{col}] FROM {sql_table} WHERE [{col}] NOT IN ({allowed_str})",
@@ -100,6 +97,12 @@ def validate_domain_values(sql_conn, snow_conn, table, mapping, metadata):
                     "snow_all_values": f"SELECT {col}, COUNT(*) as count FROM {snow_table} GROUP BY {col} ORDER BY COUNT(*) DESC"
                 }
             }
+
+            # Get all value distributions for context
+            explain_pair(explain_data[col], "sql_all_values", "snow_all_values", sql_conn, snow_conn,
+                         explain_data[col]["queries"]["sql_all_values"],
+                         explain_data[col]["queries"]["snow_all_values"],
+                         defer=defer_explain)
         except Exception as e:
             # If explain fails, provide basic info
             if has_violations:
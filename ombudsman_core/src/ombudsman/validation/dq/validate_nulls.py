@@ -1,19 +1,23 @@
 # src/ombudsman/validation/dq/validate_nulls.py
-from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
-
-def validate_nulls(sql_conn, snow_conn, table, mapping, metadata):
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.validation.column_profiler import profile_table
+from ombudsman.core.incremental import incremental_run
+from ombudsman.core.dispatch import dispatch_pair, run_pair
+
+
+def validate_nulls(sql_conn, snow_conn, table, mapping, metadata, watermark_store=None,
+                   incremental=False, watermark_column=None, full_refresh=False, scan_plan=None):
     sql_table = escape_sql_server_identifier(mapping[table]["sql"])
     snow_table = escape_snowflake_identifier(mapping[table]["snow"])
 
     # Extract column names from metadata
     table_metadata = metadata[table]
 
-    # DEBUG: Print metadata structure
-    print(f"[validate_nulls] table={table}")
-    print(f"[validate_nulls] table_metadata keys: {list(table_metadata.keys()) if isinstance(table_metadata, dict) else 'NOT A DICT'}")
-    print(f"[validate_nulls] columns type: {type(table_metadata.get('columns'))}")
-    print(f"[validate_nulls] columns value: {table_metadata.get('columns')}")
-
     if isinstance(table_metadata.get("columns"), dict):
         # New structure: columns is a dict {col_name: type}
         cols = list(table_metadata["columns"].keys())
@@ -21,26 +25,55 @@ def validate_nulls(sql_conn, snow_conn, table, mapping, metadata):
         # Old structure: columns is a list
         cols = table_metadata.get("columns", [])
 
-    print(f"[validate_nulls] Extracted {len(cols)} columns: {cols}")
+    print(f"[validate_nulls] table={table}, profiling {len(cols)} columns")
+
+    run = incremental_run(watermark_store, "validate_nulls", table, metadata, incremental,
+                          watermark_column, scope={"columns": cols}, full_refresh=full_refresh)
+    sql_where = snow_where = None
+    if run:
+        run.start(sql_conn, sql_table)
+        sql_where, snow_where = run.where(SQLSERVER), run.where(SNOWFLAKE)
+
+    # One scan per side for all columns, shared with other steps when fused
+    fused = None
+    if scan_plan and not run:
+        fused = scan_plan.profiles(table, sql_conn, snow_conn, sql_table, snow_table, cols, ("null_count",))
+    if fused:
+        sql_profile, snow_profile = fused
+    else:
+        sql_profile, snow_profile = dispatch_pair(
+            lambda: profile_table(sql_conn, SQLSERVER, sql_table, cols, aggregates=("null_count",), where=sql_where),
+            lambda: profile_table(snow_conn, SNOWFLAKE, snow_table, cols, aggregates=("null_count",), where=snow_where),
+            concurrent=sql_conn is not snow_conn
+        )
+
+    null_counts = {
+        "sql": {col: sql_profile["columns"][col]["null_count"] for col in cols},
+        "snow": {col: snow_profile["columns"][col]["null_count"] for col in cols}
+    }
+    if run:
+        totals = run.merge(null_counts)
+        print(f"[validate_nulls] {run.mode} run, merging delta into cached null counts")
+        if totals["sql"] == totals["snow"]:
+            run.commit(totals)
+        null_counts = totals
 
     results = []
     issues = []
     explain_data = {}
 
     for col in cols:
-        sql_q = f"SELECT COUNT(*) FROM {sql_table} WHERE [{col}] IS NULL"
-        snow_q = f"SELECT COUNT(*) FROM {snow_table} WHERE {col} IS NULL"
-
-        sql_nulls = sql_conn.fetch_one(sql_q)
-        snow_nulls = snow_conn.fetch_one(snow_q)
+        sql_nulls = null_counts["sql"][col]
+        snow_nulls = null_counts["snow"][col]
 
         match = sql_nulls == snow_nulls
+        difference = abs(sql_nulls - snow_nulls)
 
         results.append({
             "column": col,
             "sql_nulls": sql_nulls,
             "snow_nulls": snow_nulls,
-            "difference": abs(sql_nulls - snow_nulls) if sql_nulls and snow_nulls else 0,
+            "difference": difference,
             "match": match,
             "severity": "HIGH" if not match else "NONE"
         })
@@ -50,56 +83,68 @@ def validate_nulls(sql_conn, snow_conn, table, mapping, metadata):
                 "column": col,
                 "sql_nulls": sql_nulls,
                 "snow_nulls": snow_nulls,
-                "difference": abs(sql_nulls - snow_nulls)
+                "difference": difference
             })
 
-        # ALWAYS collect explain data - show sample NULL rows regardless of pass/fail
-        try:
-            sql_null_samples = sql_conn.fetch_dicts(f"SELECT TOP 20 * FROM {sql_table} WHERE [{col}] IS NULL")
-            snow_null_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} WHERE {col} IS NULL LIMIT 20")
+        if match:
+            interpretation = f"Column '{col}' NULL counts match: {sql_nulls} NULLs in both SQL Server and Snowflake"
+        else:
+            interpretation = f"Column '{col}' has {sql_nulls} NULLs in SQL Server vs {snow_nulls} NULLs in Snowflake (difference: {difference})"
+
+        explain_data[col] = {
+            "sql_null_count": sql_nulls,
+            "snow_null_count": snow_nulls,
+            "interpretation": interpretation,
+            "queries": {
+                "sql_null_count": f"SELECT COUNT(*) FROM {sql_table} WHERE [{col}] IS NULL",
+                "snow_null_count": f"SELECT COUNT(*) FROM {snow_table} WHERE {col} IS NULL",
+                "sql_null_samples": f"SELECT TOP 20 * FROM {sql_table} WHERE [{col}] IS NULL",
+                "snow_null_samples": f"SELECT * FROM {snow_table} WHERE {col} IS NULL LIMIT 20"
+            }
+        }
 
-            # Also get sample non-NULL rows for context
-            sql_non_null_samples = sql_conn.fetch_dicts(f"SELECT TOP 10 * FROM {sql_table} WHERE [{col}] IS NOT NULL")
-            snow_non_null_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} WHERE {col} IS NOT NULL LIMIT 10")
+        # Sample rows are only worth the round-trips for mismatching columns
+        if match:
+            continue
 
-            if match:
-                interpretation = f"Column '{col}' NULL counts match: {sql_nulls} NULLs in both SQL Server and Snowflake"
-            else:
-                interpretation = f"Column '{col}' has {sql_nulls} NULLs in SQL Server vs {snow_nulls} NULLs in Snowflake (difference: {abs(sql_nulls - snow_nulls)})"
+        try:
+            sql_null_samples, snow_null_samples = run_pair(
+                sql_conn, snow_conn,
+                f"SELECT TOP 20 * FROM {sql_table} WHERE [{col}] IS NULL",
+                f"SELECT * FROM {snow_table} WHERE {col} IS NULL LIMIT 20",
+                method="fetch_dicts"
+            )
 
-            explain_data[col] = {
-                "sql_null_count": sql_nulls,
-                "snow_null_count": snow_nulls,
+            # Also get sample non-NULL rows for context
+            sql_non_null_samples, snow_non_null_samples = run_pair(
+                sql_conn, snow_conn,
+                f"SELECT TOP 10 * FROM {sql_table} WHERE [{col}] IS NOT NULL",
+                f"SELECT * FROM {snow_table} WHERE {col} IS NOT NULL LIMIT 10",
+                method="fetch_dicts"
+            )
+
+            explain_data[col].update({
                 "sql_null_samples": sql_null_samples[:20],
                 "snow_null_samples": snow_null_samples[:20],
                 "sql_non_null_samples": sql_non_null_samples[:10],
                 "snow_non_null_samples": snow_non_null_samples[:10],
-                "interpretation": interpretation,
-                "queries": {
-                    "sql_null_count": f"SELECT COUNT(*) FROM {sql_table} WHERE [{col}] IS NULL",
-                    "snow_null_count": f"SELECT COUNT(*) FROM {snow_table} WHERE {col} IS NULL",
-                    "sql_null_samples": f"SELECT TOP 20 * FROM {sql_table} WHERE [{col}] IS NULL",
-                    "snow_null_samples": f"SELECT * FROM {snow_table} WHERE {col} IS NULL LIMIT 20"
-                }
-            }
+            })
         except Exception as e:
-            # If explain fails, provide basic info
-            if match:
-                interpretation = f"Column '{col}' NULL counts match: {sql_nulls} NULLs in both SQL Server and Snowflake"
-            else:
-                interpretation = f"Column '{col}' has {sql_nulls} NULLs in SQL Server vs {snow_nulls} NULLs in Snowflake (difference: {abs(sql_nulls - snow_nulls)})"
-
-            explain_data[col] = {
-                "sql_null_count": sql_nulls,
-                "snow_null_count": snow_nulls,
-                "interpretation": interpretation,
-                "error": f"Could not fetch sample data: {str(e)}"
-            }
+            explain_data[col]["error"] = f"Could not fetch sample data: {str(e)}"
 
-    return {
+    result = {
         "status": "FAIL" if any(not r["match"] for r in results) else "PASS",
         "severity": "HIGH" if issues else "NONE",
         "results": results,
         "issues": issues,
-        "explain": explain_data  # Always include explain data
-    }
\ No newline at end of file
+        "explain": explain_data,
+        "profile_queries": {
+            "sql": sql_profile["queries"],
+            "snow": snow_profile["queries"]
+        }
+    }
+    if run:
+        result["incremental"] = run.describe()
+    if fused:
+        result["fused_scan"] = True
+    return result
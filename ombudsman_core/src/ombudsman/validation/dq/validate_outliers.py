@@ -2,12 +2,112 @@
 '''
 (Z-score or IQR)
 Detects outliers in numeric columns between SQL Server and Snowflake.
+
+Modes:
+- pushdown (default): mean/stddev and outlier counts are computed server-side
+- client: every value is fetched and analysed with NumPy (original behaviour)
+
+If pushdown fails on either engine, `fallback` decides what happens for both
+engines together: "sample" analyses a random sample client-side, "client"
+fetches all values, "none" re-raises.
 '''
 
 import numpy as np
-from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
-
-def validate_outliers(sql_conn, snow_conn, table, mapping, metadata):
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.validation.pushdown import (
+    fetch_moments,
+    count_outliers,
+    outlier_predicate,
+    fetch_sample,
+    fetch_values,
+    DEFAULT_SAMPLE_SIZE,
+)
+from ombudsman.core.dispatch import dispatch_pair
+
+
+def _array_stats(vals, z_threshold):
+    """Outlier statistics computed client-side from an array of values."""
+    if len(vals) < 3:
+        return None
+    mean = float(vals.mean())
+    std = float(vals.std())
+    if std == 0:
+        outliers = []
+    else:
+        outliers = vals[np.abs((vals - mean) / std) > z_threshold].tolist()
+    return {
+        "count": len(vals),
+        "mean": mean,
+        "std": std,
+        "outlier_count": len(outliers),
+        "outliers": outliers[:10]
+    }
+
+
+def _pushdown_stats(conn, dialect, table, col, z_threshold):
+    """Outlier statistics computed server-side."""
+    moments = fetch_moments(conn, dialect, table, col)
+    if moments["count"] < 3:
+        return None
+    outliers = count_outliers(conn, dialect, table, col, moments["mean"], moments["std"], z_threshold)
+    return {
+        "count": moments["count"],
+        "mean": moments["mean"],
+        "std": moments["std"] or 0.0,
+        "outlier_count": outliers["count"],
+        "outliers": outliers["values"]
+    }
+
+
+def _pair_stats(sql_conn, snow_conn, sql_table, snow_table, col, mode, fallback, sample_size, z_threshold):
+    """
+    Returns (sql_stats, snow_stats, method), computed the same way on both sides.
+
+    If pushdown fails on either side, both sides fall back together, so a
+    full-table outlier count is never compared with a sample count.
+    """
+    def pair(stats):
+        return dispatch_pair(
+            lambda: stats(sql_conn, SQLSERVER, sql_table),
+            lambda: stats(snow_conn, SNOWFLAKE, snow_table),
+            concurrent=sql_conn is not snow_conn
+        )
+
+    def client_stats(conn, dialect, table):
+        return _array_stats(fetch_values(conn, dialect, table, col), z_threshold)
+
+    def sample_stats(conn, dialect, table):
+        return _array_stats(fetch_sample(conn, dialect, table, col, sample_size), z_threshold)
+
+    if mode == "client":
+        return (*pair(client_stats), "client")
+
+    try:
+        return (*pair(lambda conn, dialect, table: _pushdown_stats(conn, dialect, table, col, z_threshold)),
+                "pushdown")
+    except Exception as e:
+        print(f"[validate_outliers] Pushdown failed for {col}: {e}")
+        if fallback == "sample":
+            return (*pair(sample_stats), "sample")
+        if fallback == "client":
+            return (*pair(client_stats), "client")
+        raise
+
+
+def _format_outliers(values, total):
+    text = ", ".join([str(round(float(x), 2)) for x in values[:10]])
+    if total > 10:
+        text += f" ... and {total - 10} more"
+    return text
+
+
+def validate_outliers(sql_conn, snow_conn, table, mapping, metadata, mode="pushdown",
+                      fallback="sample", sample_size=DEFAULT_SAMPLE_SIZE, z_threshold=3):
     numerics = metadata[table].get("numeric_columns", [])
     if not numerics:
         return {"status": "SKIPPED"}
@@ -20,85 +120,66 @@ def validate_outliers(sql_conn, snow_conn, table, mapping, metadata):
     explain_data = {}  # ALWAYS generate explain data
 
     for col in numerics:
-        sql_vals = np.array([r[0] for r in sql_conn.fetch_many(f"SELECT [{col}] FROM {sql_table}") if r[0] is not None])
-        snow_vals = np.array([r[0] for r in snow_conn.fetch_many(f"SELECT {col} FROM {snow_table}") if r[0] is not None])
+        sql_stats, snow_stats, method = _pair_stats(sql_conn, snow_conn, sql_table, snow_table, col,
+                                                    mode, fallback, sample_size, z_threshold)
 
-        if len(sql_vals) < 3 or len(snow_vals) < 3:
+        if sql_stats is None or snow_stats is None:
             continue
 
-        sql_z = np.abs((sql_vals - sql_vals.mean()) / sql_vals.std())
-        snow_z = np.abs((snow_vals - snow_vals.mean()) / snow_vals.std())
-
-        sql_out = sql_vals[sql_z > 3].tolist()
-        snow_out = snow_vals[snow_z > 3].tolist()
+        sql_count = sql_stats["outlier_count"]
+        snow_count = snow_stats["outlier_count"]
 
         result = {
             "column": col,
-            "sql_server_outlier_count": len(sql_out),
-            "snowflake_outlier_count": len(snow_out),
-            "total_outliers": len(sql_out) + len(snow_out),
-            "sql_server_outliers": ", ".join([str(round(float(x), 2)) for x in sql_out[:10]]) + (f" ... and {len(sql_out)-10} more" if len(sql_out) > 10 else ""),
-            "snowflake_outliers": ", ".join([str(round(float(x), 2)) for x in snow_out[:10]]) + (f" ... and {len(snow_out)-10} more" if len(snow_out) > 10 else ""),
+            "sql_server_outlier_count": sql_count,
+            "snowflake_outlier_count": snow_count,
+            "total_outliers": sql_count + snow_count,
+            "sql_server_outliers": _format_outliers(sql_stats["outliers"], sql_count),
+            "snowflake_outliers": _format_outliers(snow_stats["outliers"], snow_count),
+            "method": method,
         }
 
         details.append(result)
 
-        if sql_out or snow_out:
+        if sql_count or snow_count:
             issues.append(result)
 
-        # ALWAYS collect explain data - show statistics regardless of pass/fail
-        try:
-            sql_outlier_rows = []
-            snow_outlier_rows = []
-
-            # Get full rows for outliers (limit to first 10)
-            if sql_out:
-                outlier_values = ", ".join([str(round(float(x), 2)) for x in sql_out[:10]])
-                sql_outlier_rows = sql_conn.fetch_dicts(
-                    f"SELECT TOP 10 * FROM {sql_table} WHERE [{col}] IN ({outlier_values})"
-                )
-
-            if snow_out:
-                outlier_values = ", ".join([str(round(float(x), 2)) for x in snow_out[:10]])
-                snow_outlier_rows = snow_conn.fetch_dicts(
-                    f"SELECT * FROM {snow_table} WHERE {col} IN ({outlier_values}) LIMIT 10"
-                )
-
-            if sql_out or snow_out:
-                interpretation = f"Found {len(sql_out)} outliers in SQL Server and {len(snow_out)} in Snowflake. Outliers are values more than 3 standard deviations from the mean. SQL: mean={round(float(sql_vals.mean()), 2)}, std={round(float(sql_vals.std()), 2)}. Snow: mean={round(float(snow_vals.mean()), 2)}, std={round(float(snow_vals.std()), 2)}"
-            else:
-                interpretation = f"No outliers found in either database. SQL: mean={round(float(sql_vals.mean()), 2)}, std={round(float(sql_vals.std()), 2)}. Snow: mean={round(float(snow_vals.mean()), 2)}, std={round(float(snow_vals.std()), 2)}"
-
-            explain_data[col] = {
-                "column": col,
-                "sql_mean": round(float(sql_vals.mean()), 2),
-                "sql_std": round(float(sql_vals.std()), 2),
-                "snow_mean": round(float(snow_vals.mean()), 2),
-                "snow_std": round(float(snow_vals.std()), 2),
-                "sql_outlier_count": len(sql_out),
-                "snow_outlier_count": len(snow_out),
-                "sql_outlier_rows": sql_outlier_rows,
-                "snow_outlier_rows": snow_outlier_rows,
-                "interpretation": interpretation,
-                "queries": {
-                    "sql_outliers": f"SELECT * FROM {sql_table} WHERE ABS([{col}] - (SELECT AVG([{col}]) FROM {sql_table})) / (SELECT STDEV([{col}]) FROM {sql_table}) > 3",
-                    "snow_outliers": f"SELECT * FROM {snow_table} WHERE ABS({col} - (SELECT AVG({col}) FROM {snow_table})) / (SELECT STDDEV({col}) FROM {snow_table}) > 3"
-                }
-            }
-        except:
-            # Fallback if queries fail
-            if sql_out or snow_out:
-                interpretation = f"Found {len(sql_out)} outliers in SQL Server and {len(snow_out)} in Snowflake"
-            else:
-                interpretation = f"No outliers found in either database"
-
-            explain_data[col] = {
-                "column": col,
-                "sql_outlier_count": len(sql_out),
-                "snow_outlier_count": len(snow_out),
-                "interpretation": interpretation,
-                "error": "Could not fetch detailed outlier rows"
+        sql_mean, sql_std = round(sql_stats["mean"], 2), round(sql_stats["std"], 2)
+        snow_mean, snow_std = round(snow_stats["mean"], 2), round(snow_stats["std"], 2)
+
+        if sql_count or snow_count:
+            interpretation = f"Found {sql_count} outliers in SQL Server and {snow_count} in Snowflake. Outliers are values more than {z_threshold} standard deviations from the mean. SQL: mean={sql_mean}, std={sql_std}. Snow: mean={snow_mean}, std={snow_std}"
+        else:
+            interpretation = f"No outliers found in either database. SQL: mean={sql_mean}, std={sql_std}. Snow: mean={snow_mean}, std={snow_std}"
+
+        sql_predicate = outlier_predicate(col, SQLSERVER, sql_stats["mean"], sql_stats["std"] or 0, z_threshold)
+        snow_predicate = outlier_predicate(col, SNOWFLAKE, snow_stats["mean"], snow_stats["std"] or 0, z_threshold)
+
+        explain_data[col] = {
+            "column": col,
+            "sql_mean": sql_mean,
+            "sql_std": sql_std,
+            "snow_mean": snow_mean,
+            "snow_std": snow_std,
+            "sql_outlier_count": sql_count,
+            "snow_outlier_count": snow_count,
+            "interpretation": interpretation,
+            "queries": {
+                "sql_outliers": f"SELECT * FROM {sql_table} WHERE {sql_predicate}",
+                "snow_outliers": f"SELECT * FROM {snow_table} WHERE {snow_predicate}"
             }
+        }
+
+        # Get full rows for outliers (limit to first 10)
+        try:
+            explain_data[col]["sql_outlier_rows"] = sql_conn.fetch_dicts(
+                f"SELECT TOP 10 * FROM {sql_table} WHERE {sql_predicate}"
+            ) if sql_count else []
+            explain_data[col]["snow_outlier_rows"] = snow_conn.fetch_dicts(
+                f"SELECT * FROM {snow_table} WHERE {snow_predicate} LIMIT 10"
+            ) if snow_count else []
+        except Exception:
+            explain_data[col]["error"] = "Could not fetch detailed outlier rows"
 
     status = "FAIL" if issues else "PASS"
 
@@ -108,4 +189,4 @@ def validate_outliers(sql_conn, snow_conn, table, mapping, metadata):
         "issues": issues,
         "details": details,
         "explain": explain_data  # Always include explain data
-    }
\ No newline at end of file
+    }
@@ -1,12 +1,68 @@
 # src/ombudsman/validation/dq/validate_record_counts.py
-from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.core.incremental import incremental_run
+from ombudsman.core.dispatch import run_pair
+from ombudsman.validation.explain import explain_pair
+from ombudsman.core.catalog import read_catalog_pair, catalog_fallback_reason, DEFAULT_SETTLE_SECONDS
 
-def validate_record_counts(sql_conn, snow_conn, table, mapping, metadata=None):
+
+def validate_record_counts(sql_conn, snow_conn, table, mapping, metadata=None, watermark_store=None,
+                           incremental=False, watermark_column=None, full_refresh=False, scan_plan=None,
+                           count_mode="exact", catalog_settle_seconds=DEFAULT_SETTLE_SECONDS,
+                           defer_explain=False):
     sql_table = escape_sql_server_identifier(mapping[table]["sql"])
     snow_table = escape_snowflake_identifier(mapping[table]["snow"])
 
-    sql_cnt = sql_conn.fetch_one(f"SELECT COUNT(*) FROM {sql_table}")
-    snow_cnt = snow_conn.fetch_one(f"SELECT COUNT(*) FROM {snow_table}")
+    run = incremental_run(watermark_store, "validate_record_counts", table, metadata,
+                          incremental, watermark_column, full_refresh=full_refresh)
+
+    if run:
+        run.start(sql_conn, sql_table)
+        sql_count_query = f"SELECT COUNT(*) FROM {sql_table} WHERE {run.where(SQLSERVER)}"
+        snow_count_query = f"SELECT COUNT(*) FROM {snow_table} WHERE {run.where(SNOWFLAKE)}"
+    else:
+        sql_count_query = f"SELECT COUNT(*) FROM {sql_table}"
+        snow_count_query = f"SELECT COUNT(*) FROM {snow_table}"
+
+    # count_mode="catalog" reads counts from the engine catalogs and only
+    # counts rows when they disagree or the tables changed very recently
+    sql_cnt = snow_cnt = None
+    catalog_info = None
+    if count_mode == "catalog" and not run:
+        sql_stats, snow_stats = read_catalog_pair(sql_conn, snow_conn, sql_table, snow_table)
+        fallback = catalog_fallback_reason(sql_stats, snow_stats, catalog_settle_seconds)
+        catalog_info = {
+            "sql": sql_stats.fingerprint() if sql_stats else None,
+            "snow": snow_stats.fingerprint() if snow_stats else None
+        }
+        if fallback is None:
+            sql_cnt = snow_cnt = sql_stats.row_count
+        else:
+            catalog_info["fallback_reason"] = fallback
+            print(f"[validate_record_counts] table={table}, exact count needed: {fallback}")
+
+    fused = None
+    if sql_cnt is None:
+        # The row count comes with any fused scan of this table (see core/scan_fusion.py)
+        fused = scan_plan.profiles(table, sql_conn, snow_conn, sql_table, snow_table) if scan_plan and not run else None
+        if fused:
+            sql_cnt, snow_cnt = fused[0]["row_count"], fused[1]["row_count"]
+        else:
+            sql_cnt, snow_cnt = run_pair(sql_conn, snow_conn, sql_count_query, snow_count_query)
+
+    incremental_info = None
+    if run:
+        incremental_info = {**run.describe(), "sql_delta": sql_cnt, "snow_delta": snow_cnt}
+        totals = run.merge({"sql_count": sql_cnt, "snow_count": snow_cnt})
+        sql_cnt, snow_cnt = totals["sql_count"], totals["snow_count"]
+        print(f"[validate_record_counts] table={table}, {run.mode} run, delta sql={incremental_info['sql_delta']} snow={incremental_info['snow_delta']}")
+        if sql_cnt == snow_cnt:
+            run.commit(totals)
 
     status = "FAIL" if sql_cnt != snow_cnt else "PASS"
 
@@ -16,17 +72,24 @@ def validate_record_counts(sql_conn, snow_conn, table, mapping, metadata=None):
         "sql_count": sql_cnt,
         "snow_count": snow_cnt
     }
+    if incremental_info:
+        result["incremental"] = incremental_info
+    if fused:
+        result["fused_scan"] = True
+    if catalog_info:
+        result["count_source"] = "exact" if "fallback_reason" in catalog_info else "catalog"
+        result["catalog"] = catalog_info
 
     # ALWAYS add explain data - show sample rows regardless of pass/fail
     explain_data = {}
 
     # Get sample rows from both databases (top 20 rows)
     try:
-        sql_samples = sql_conn.fetch_dicts(f"SELECT TOP 20 * FROM {sql_table}")
-        snow_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} LIMIT 20")
+        explain_pair(explain_data, "sql_samples", "snow_samples", sql_conn, snow_conn,
+                     f"SELECT TOP 20 * FROM {sql_table}",
+                     f"SELECT * FROM {snow_table} LIMIT 20",
+                     defer=defer_explain)
 
-        explain_data["sql_samples"] = sql_samples[:20]
-        explain_data["snow_samples"] = snow_samples[:20]
         explain_data["sql_count"] = sql_cnt
         explain_data["snow_count"] = snow_cnt
         explain_data["difference"] = abs(sql_cnt - snow_cnt)
@@ -39,8 +102,8 @@ def validate_record_counts(sql_conn, snow_conn, table, mapping, metadata=None):
             explain_data["interpretation"] = f"Snowflake has {abs(sql_cnt - snow_cnt)} more rows than SQL Server (SQL: {sql_cnt}, Snow: {snow_cnt})"
 
         explain_data["queries"] = {
-            "sql_count": f"SELECT COUNT(*) FROM {sql_table}",
-            "snow_count": f"SELECT COUNT(*) FROM {snow_table}",
+            "sql_count": sql_count_query,
+            "snow_count": snow_count_query,
             "sql_samples": f"SELECT TOP 20 * FROM {sql_table}",
             "snow_samples": f"SELECT * FROM {snow_table} LIMIT 20"
         }
@@ -10,6 +10,7 @@ ID format
 
 '''
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 
 def validate_regex_patterns(sql_conn, snow_conn, table, mapping, metadata):
@@ -35,8 +36,9 @@ def validate_regex_patterns(sql_conn, snow_conn, table, mapping, metadata):
             WHERE {col} NOT REGEXP '{regex}'
         """
 
-        sql_bad = [v[0] for v in sql_conn.fetch_many(sql_q)]
-        snow_bad = [v[0] for v in snow_conn.fetch_many(snow_q)]
+        sql_rows, snow_rows = run_pair(sql_conn, snow_conn, sql_q, snow_q, method="fetch_many")
+        sql_bad = [v[0] for v in sql_rows]
+        snow_bad = [v[0] for v in snow_rows]
 
         if sql_bad or snow_bad:
             violations.append({
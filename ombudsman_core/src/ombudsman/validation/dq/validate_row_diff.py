@@ -0,0 +1,155 @@
+# src/ombudsman/validation/dq/validate_row_diff.py
+'''
+Row-level diff between SQL Server and Snowflake using hash buckets.
+
+Reports rows missing in Snowflake, extra rows in Snowflake and rows whose
+values changed, without pulling either table to the client. See
+ombudsman.validation.row_diff for how buckets are compared and refined.
+
+Keys come from `key_columns` in the step config, else the table's
+unique_keys / business_key metadata. Without a key every column is treated
+as the key, so value changes show up as missing/extra rows. Rows are still
+compared as multisets, though: a row present on both sides a different
+number of times (duplicates) is reported as "changed".
+'''
+
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.validation.hashing import (
+    DEFAULT_DECIMAL_SCALE,
+    DEFAULT_FLOAT_SCALE,
+    DEFAULT_TIMESTAMP_PRECISION,
+)
+from ombudsman.validation.row_diff import (
+    HashedTable,
+    diff_tables,
+    DEFAULT_BUCKETS,
+    DEFAULT_SPLIT_FACTOR,
+    DEFAULT_MAX_ROWS_PER_BUCKET,
+    DEFAULT_MAX_DEPTH,
+)
+
+
+def _table_columns(table_metadata):
+    columns = table_metadata.get("columns", [])
+    if isinstance(columns, dict):
+        return list(columns.keys())
+    return list(columns) or list(table_metadata.get("all_columns", []))
+
+
+def _column_types(table_metadata):
+    columns = table_metadata.get("columns")
+    return dict(columns) if isinstance(columns, dict) else {}
+
+
+def _table_keys(table_metadata):
+    if table_metadata.get("unique_keys"):
+        return list(table_metadata["unique_keys"])
+    if table_metadata.get("business_key"):
+        bk = table_metadata["business_key"]
+        return [bk] if isinstance(bk, str) else list(bk)
+    return []
+
+
+def validate_row_diff(sql_conn, snow_conn, table, mapping, metadata, key_columns=None,
+                      compare_columns=None, buckets=DEFAULT_BUCKETS, split_factor=DEFAULT_SPLIT_FACTOR,
+                      max_rows_per_bucket=DEFAULT_MAX_ROWS_PER_BUCKET, max_depth=DEFAULT_MAX_DEPTH,
+                      max_samples=20, decimal_scale=DEFAULT_DECIMAL_SCALE, float_scale=DEFAULT_FLOAT_SCALE,
+                      timestamp_precision=DEFAULT_TIMESTAMP_PRECISION, trim_strings=True):
+    table_metadata = metadata.get(table, {})
+
+    if isinstance(key_columns, str):
+        key_columns = [key_columns]
+    keys = list(key_columns or _table_keys(table_metadata))
+    columns = list(compare_columns or _table_columns(table_metadata))
+
+    if not columns and not keys:
+        return {"status": "SKIPPED", "reason": f"No columns known for table '{table}'"}
+
+    if not keys:
+        keys = columns
+    # Key columns are always part of the row hash
+    columns = keys + [c for c in columns if c not in keys]
+
+    sql_table = escape_sql_server_identifier(mapping[table]["sql"])
+    snow_table = escape_snowflake_identifier(mapping[table]["snow"])
+
+    # Values are canonicalized by type so both engines hash the same text
+    types = _column_types(table_metadata)
+    options = {
+        "decimal_scale": decimal_scale,
+        "float_scale": float_scale,
+        "timestamp_precision": timestamp_precision,
+        "trim_strings": trim_strings
+    }
+
+    sql_side = HashedTable(sql_conn, SQLSERVER, sql_table, keys, columns, types, **options)
+    snow_side = HashedTable(snow_conn, SNOWFLAKE, snow_table, keys, columns, types, **options)
+
+    print(f"[validate_row_diff] table={table}, keys={keys}, {len(columns)} columns, {buckets} buckets")
+
+    diff = diff_tables(
+        sql_side, snow_side,
+        buckets=buckets,
+        split_factor=split_factor,
+        max_rows_per_bucket=max_rows_per_bucket,
+        max_depth=max_depth
+    )
+
+    missing, extra, changed = diff["missing"], diff["extra"], diff["changed"]
+    sql_rows, snow_rows = diff["source_rows"], diff["target_rows"]
+
+    different = len(missing) + len(extra) + len(changed)
+    status = "FAIL" if different else "PASS"
+    matching = max(sql_rows - len(missing) - len(changed), 0)
+    match_percentage = round(matching / sql_rows * 100, 2) if sql_rows else (100.0 if not snow_rows else 0.0)
+
+    if status == "PASS":
+        interpretation = f"All {sql_rows} rows match between SQL Server and Snowflake (compared on key: {', '.join(keys)})"
+    else:
+        interpretation = (
+            f"{len(missing)} rows missing in Snowflake, {len(extra)} extra rows in Snowflake and "
+            f"{len(changed)} changed rows (key: {', '.join(keys)}). "
+            f"Only {diff['stats']['mismatched_buckets']} mismatching buckets were fetched."
+        )
+
+    explain_data = {
+        "key_columns": keys,
+        "compared_columns": columns,
+        "interpretation": interpretation,
+        "scan": diff["stats"],
+        "queries": {
+            "sql": sql_side.queries,
+            "snow": snow_side.queries
+        }
+    }
+
+    # Full rows for a few differing keys
+    try:
+        explain_data["sql_missing_rows"] = sql_side.rows_for_keys(missing, max_samples)
+        explain_data["snow_extra_rows"] = snow_side.rows_for_keys(extra, max_samples)
+        explain_data["sql_changed_rows"] = sql_side.rows_for_keys(changed, max_samples)
+        explain_data["snow_changed_rows"] = snow_side.rows_for_keys(changed, max_samples)
+    except Exception as e:
+        explain_data["error"] = f"Could not fetch detailed rows: {str(e)}"
+
+    return {
+        "status": status,
+        "severity": "HIGH" if status == "FAIL" else "NONE",
+        "sql_row_count": sql_rows,
+        "snowflake_row_count": snow_rows,
+        "match_percentage": match_percentage,
+        "missing_in_snowflake": len(missing),
+        "extra_in_snowflake": len(extra),
+        "changed_rows": len(changed),
+        "issues": {
+            "missing_in_snowflake": missing[:max_samples],
+            "extra_in_snowflake": extra[:max_samples],
+            "changed": changed[:max_samples]
+        },
+        "explain": explain_data
+    }
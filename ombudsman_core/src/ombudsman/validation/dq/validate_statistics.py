@@ -6,8 +6,13 @@
 
 from ...core.utils import within_tolerance
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
+from ombudsman.validation.explain import explain_pair
 
-def validate_statistics(sql_conn, snow_conn, table, mapping, metadata):
+# Result statistic -> column_profiler aggregate, for fused scans
+FUSED_STATISTICS = {"avg_val": "avg", "std_val": "stddev", "min_val": "min", "max_val": "max"}
+
+def validate_statistics(sql_conn, snow_conn, table, mapping, metadata, scan_plan=None, defer_explain=False):
     numerics = metadata[table].get("numeric_columns", [])
     if not numerics:
         return {"status": "SKIPPED"}
@@ -19,24 +24,35 @@ def validate_statistics(sql_conn, snow_conn, table, mapping, metadata):
     details = []
     explain_data = {}  # ALWAYS generate explain data
 
-    for col in numerics:
-        sql_stats = sql_conn.fetch_dicts(f"""
-            SELECT
-                AVG({col}) AS avg_val,
-                STDEV({col}) AS std_val,
-                MIN({col}) AS min_val,
-                MAX({col}) AS max_val
-            FROM {sql_table}
-        """)[0]
+    # All columns' statistics from one fused scan when the pipeline planned one
+    fused = None
+    if scan_plan:
+        fused = scan_plan.profiles(table, sql_conn, snow_conn, sql_table, snow_table,
+                                   numerics, FUSED_STATISTICS.values())
 
-        snow_stats = snow_conn.fetch_dicts(f"""
-            SELECT
-                AVG({col}) AS avg_val,
-                STDDEV({col}) AS std_val,
-                MIN({col}) AS min_val,
-                MAX({col}) AS max_val
-            FROM {snow_table}
-        """)[0]
+    for col in numerics:
+        if fused:
+            sql_stats, snow_stats = (
+                {stat: profile["columns"][col][agg] for stat, agg in FUSED_STATISTICS.items()}
+                for profile in fused
+            )
+        else:
+            sql_stats, snow_stats = run_pair(sql_conn, snow_conn, f"""
+                SELECT
+                    AVG({col}) AS avg_val,
+                    STDEV({col}) AS std_val,
+                    MIN({col}) AS min_val,
+                    MAX({col}) AS max_val
+                FROM {sql_table}
+            """, f"""
+                SELECT
+                    AVG({col}) AS avg_val,
+                    STDDEV({col}) AS std_val,
+                    MIN({col}) AS min_val,
+                    MAX({col}) AS max_val
+                FROM {snow_table}
+            """, method="fetch_dicts")
+            sql_stats, snow_stats = sql_stats[0], snow_stats[0]
 
         col_issues = []
 
@@ -83,12 +99,7 @@ def validate_statistics(sql_conn, snow_conn, table, mapping, metadata):
         if col_issues:
             issues.extend(col_issues)
 
-        # ALWAYS collect explain data - for all columns regardless of pass/fail
-        # Get sample rows showing actual values (use database-specific syntax)
-        sql_samples = sql_conn.fetch_dicts(f"SELECT TOP 20 * FROM {sql_table} ORDER BY {col}")
-        snow_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} ORDER BY {col} LIMIT 20")
-
-        # Get value distribution (create buckets) - use database-specific syntax
+        # Value distribution (create buckets) - use database-specific syntax
         sql_dist_query = f"""
             SELECT
                 CASE
@@ -119,23 +130,12 @@ def validate_statistics(sql_conn, snow_conn, table, mapping, metadata):
             GROUP BY bucket
         """
 
-        try:
-            sql_dist = sql_conn.fetch_dicts(sql_dist_query)
-            snow_dist = snow_conn.fetch_dicts(snow_dist_query)
-        except:
-            sql_dist = []
-            snow_dist = []
-
         if col_issues:
             interpretation = f"Statistics mismatch for column '{col}': {len(col_issues)} metric(s) differ between SQL Server and Snowflake"
         else:
             interpretation = f"Statistics match for column '{col}': all metrics are consistent between SQL Server and Snowflake"
 
         explain_data[col] = {
-            "sql_samples": sql_samples[:20],
-            "snow_samples": snow_samples[:20],
-            "sql_distribution": {row['bucket']: row['count'] for row in sql_dist},
-            "snow_distribution": {row['bucket']: row['count'] for row in snow_dist},
             "interpretation": interpretation,
             "queries": {
                 "sql_statistics": f"SELECT AVG({col}), STDEV({col}), MIN({col}), MAX({col}) FROM {sql_table}",
@@ -147,12 +147,25 @@ def validate_statistics(sql_conn, snow_conn, table, mapping, metadata):
             }
         }
 
+        # Sample rows showing actual values, and the value distribution;
+        # with defer_explain they are fetched only if the step fails or is opened
+        explain_pair(explain_data[col], "sql_samples", "snow_samples", sql_conn, snow_conn,
+                     f"SELECT TOP 20 * FROM {sql_table} ORDER BY {col}",
+                     f"SELECT * FROM {snow_table} ORDER BY {col} LIMIT 20",
+                     defer=defer_explain)
+        explain_pair(explain_data[col], "sql_distribution", "snow_distribution", sql_conn, snow_conn,
+                     sql_dist_query, snow_dist_query, defer=defer_explain, map_columns=("bucket", "count"),
+                     empty_on_error=True)
+
     status = "FAIL" if issues else "PASS"
 
-    return {
+    result = {
         "status": status,
         "severity": "HIGH" if status == "FAIL" else "NONE",
         "issues": issues,
         "details": details,
         "explain": explain_data  # Always include explain data
-    }
\ No newline at end of file
+    }
+    if fused:
+        result["fused_scan"] = True
+    return result
\ No newline at end of file
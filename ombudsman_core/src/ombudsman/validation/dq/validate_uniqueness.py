@@ -1,7 +1,9 @@
 # src/ombudsman/validation/dq/validate_uniqueness.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import dispatch_pair, run_pair
+from ombudsman.validation.explain import explain_pair
 
-def validate_uniqueness(sql_conn, snow_conn, table, mapping, metadata):
+def validate_uniqueness(sql_conn, snow_conn, table, mapping, metadata, defer_explain=False):
     keys = metadata[table].get("unique_keys", [])
     if not keys:
         return {"status": "SKIPPED"}
@@ -21,8 +23,7 @@ def validate_uniqueness(sql_conn, snow_conn, table, mapping, metadata):
         FROM {snow_table}
     """
 
-    sql_dupes = sql_conn.fetch_one(sql_q)
-    snow_dupes = snow_conn.fetch_one(snow_q)
+    sql_dupes, snow_dupes = run_pair(sql_conn, snow_conn, sql_q, snow_q)
 
     status = "FAIL" if sql_dupes or snow_dupes else "PASS"
 
@@ -50,15 +51,15 @@ def validate_uniqueness(sql_conn, snow_conn, table, mapping, metadata):
             LIMIT 20
         """
 
-        sql_dupe_samples = sql_conn.fetch_dicts(sql_dupe_query) if sql_dupes > 0 else []
-        snow_dupe_samples = snow_conn.fetch_dicts(snow_dupe_query) if snow_dupes > 0 else []
+        sql_dupe_samples, snow_dupe_samples = dispatch_pair(
+            lambda: sql_conn.fetch_dicts(sql_dupe_query) if sql_dupes > 0 else [],
+            lambda: snow_conn.fetch_dicts(snow_dupe_query) if snow_dupes > 0 else [],
+            concurrent=sql_conn is not snow_conn
+        )
 
         # Get sample unique rows for context
         sql_sample_query = f"SELECT TOP 20 * FROM {sql_table}"
         snow_sample_query = f"SELECT * FROM {snow_table} LIMIT 20"
-        sql_samples = sql_conn.fetch_dicts(sql_sample_query)
-        snow_samples = snow_conn.fetch_dicts(snow_sample_query)
-
         if status == "PASS":
             interpretation = f"No duplicate rows found in either database based on key(s): {', '.join(keys)}"
         else:
@@ -70,8 +71,6 @@ def validate_uniqueness(sql_conn, snow_conn, table, mapping, metadata):
             "snow_duplicate_count": snow_dupes,
             "sql_duplicate_samples": sql_dupe_samples[:20],
             "snow_duplicate_samples": snow_dupe_samples[:20],
-            "sql_samples": sql_samples[:20],
-            "snow_samples": snow_samples[:20],
             "interpretation": interpretation,
             "queries": {
                 "sql_duplicate_count": f"SELECT COUNT(*) - COUNT(DISTINCT {key_expr}) FROM {sql_table}",
@@ -82,6 +81,8 @@ def validate_uniqueness(sql_conn, snow_conn, table, mapping, metadata):
                 "snow_samples": snow_sample_query
             }
         }
+        explain_pair(explain_data, "sql_samples", "snow_samples", sql_conn, snow_conn,
+                     sql_sample_query, snow_sample_query, defer=defer_explain)
     except Exception as e:
         # If explain fails, provide basic info
         if status == "PASS":
@@ -0,0 +1,147 @@
+# src/ombudsman/validation/explain.py
+'''
+Deferred explain data.
+
+Validators attach sample rows and value distributions to their "explain"
+payload. Fetching them costs extra queries on both engines for every step,
+although they are only looked at when a step fails or someone opens it.
+
+With defer=True, explain_pair records the two queries under a
+"deferred_queries" list in the explain node instead of running them.
+resolve_explain later runs every recorded query (after a failure, or when
+the step details are requested), writes the rows where explain_pair would
+have put them and drops the specs, so the payload ends up identical to
+eager collection and is only fetched once.
+'''
+
+from ombudsman.core.dispatch import dispatch_pair
+
+DEFERRED_KEY = "deferred_queries"
+
+
+def explain_pair(node, sql_key, snow_key, sql_conn, snow_conn, sql_query, snow_query,
+                 defer=False, method="fetch_dicts", limit=20, map_columns=None, empty_on_error=False):
+    """
+    Fill node[sql_key] / node[snow_key] with rows from both engines, now or later.
+
+    Args:
+        node: Explain dict to fill
+        sql_key: Key for the SQL Server rows (None to skip that side)
+        snow_key: Key for the Snowflake rows (None to skip that side)
+        sql_query: SQL Server query
+        snow_query: Snowflake query
+        defer: Record the queries instead of running them
+        method: Connection method (fetch_dicts, fetch_many)
+        limit: Keep at most this many rows per side (None for all)
+        map_columns: (key, value) columns turning fetch_dicts rows into
+                     a {key: value} dict, e.g. bucket counts
+        empty_on_error: On a failing query fill both keys with no rows
+                        ({} with map_columns) instead of raising, deferred
+                        or not
+    """
+    spec = {
+        "sql_key": sql_key,
+        "snow_key": snow_key,
+        "sql_query": sql_query if sql_key else None,
+        "snow_query": snow_query if snow_key else None,
+        "method": method,
+        "limit": limit,
+        "map_columns": list(map_columns) if map_columns else None,
+        "empty_on_error": empty_on_error
+    }
+    if defer:
+        node.setdefault(DEFERRED_KEY, []).append(spec)
+        return
+    try:
+        _run_spec(node, spec, sql_conn, snow_conn)
+    except Exception:
+        if not empty_on_error:
+            raise
+        _fill_empty(node, spec)
+
+
+def _fill_empty(node, spec):
+    """Fill a spec's keys with no rows, the same deferred or not"""
+    for key in (spec["sql_key"], spec["snow_key"]):
+        if key:
+            node[key] = {} if spec.get("map_columns") else []
+
+
+def _run_spec(node, spec, sql_conn, snow_conn):
+    method = spec["method"]
+    limit = spec.get("limit")
+    map_columns = spec.get("map_columns")
+
+    def fetch(conn, query):
+        if not query:
+            return None
+        rows = getattr(conn, method)(query)
+        if map_columns:
+            return {row[map_columns[0]]: row[map_columns[1]] for row in rows}
+        return rows[:limit] if limit is not None else rows
+
+    sql_rows, snow_rows = dispatch_pair(
+        lambda: fetch(sql_conn, spec["sql_query"]),
+        lambda: fetch(snow_conn, spec["snow_query"]),
+        concurrent=sql_conn is not snow_conn
+    )
+    if spec["sql_key"]:
+        node[spec["sql_key"]] = sql_rows
+    if spec["snow_key"]:
+        node[spec["snow_key"]] = snow_rows
+
+
+def has_deferred(explain):
+    """True if any node of the explain payload still holds deferred queries."""
+    if isinstance(explain, dict):
+        return DEFERRED_KEY in explain or any(has_deferred(v) for v in explain.values())
+    if isinstance(explain, list):
+        return any(has_deferred(v) for v in explain)
+    return False
+
+
+def resolve_explain(explain, sql_conn, snow_conn):
+    """
+    Run all deferred queries in an explain payload, in place.
+
+    A failing query leaves an "error" on its node instead of failing the
+    rest, matching how validators report explain errors, or empty rows
+    if it was recorded with empty_on_error.
+
+    Returns:
+        Number of query pairs run
+    """
+    resolved = 0
+    if isinstance(explain, list):
+        for item in explain:
+            resolved += resolve_explain(item, sql_conn, snow_conn)
+        return resolved
+    if not isinstance(explain, dict):
+        return 0
+
+    for spec in explain.pop(DEFERRED_KEY, []):
+        try:
+            _run_spec(explain, spec, sql_conn, snow_conn)
+            resolved += 1
+        except Exception as e:
+            if spec.get("empty_on_error"):
+                _fill_empty(explain, spec)
+            else:
+                explain["error"] = f"Could not fetch sample data: {str(e)}"
+    for value in explain.values():
+        resolved += resolve_explain(value, sql_conn, snow_conn)
+    return resolved
+
+
+def without_deferred(payload):
+    """
+    Copy of a payload with the deferred query specs removed.
+
+    For responses that show explain data as it is, so unresolved specs
+    (raw SQL text) are not served in place of the samples.
+    """
+    if isinstance(payload, dict):
+        return {k: without_deferred(v) for k, v in payload.items() if k != DEFERRED_KEY}
+    if isinstance(payload, list):
+        return [without_deferred(v) for v in payload]
+    return payload
@@ -1,5 +1,12 @@
 # src/ombudsman/validation/facts/validate_fact_dim_conformance.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.partitioning import (
+    partitioner_for,
+    where_clause,
+    DEFAULT_PARTITIONS,
+    DEFAULT_PARTITION_WORKERS,
+)
+from ombudsman.core.dispatch import run_pair
 from collections import Counter
 
 
@@ -18,9 +25,15 @@ def _get_orphan_issue_description(sql_count, snow_count, exists_in_sql_dim, exis
     return "; ".join(issues)
 
 
-def validate_fact_dim_conformance(sql_conn, snow_conn, fact, dim, mapping, metadata, **kwargs):
+def validate_fact_dim_conformance(sql_conn, snow_conn, fact, dim, mapping, metadata, partition_column=None,
+                                  partitions=DEFAULT_PARTITIONS, partition_workers=DEFAULT_PARTITION_WORKERS,
+                                  lease_connections=None, **kwargs):
     """Validate fact-dimension conformance (no orphaned foreign keys)
 
+    Foreign keys are counted server-side (GROUP BY) rather than fetched row
+    by row. With a partition_column (argument or fact metadata) the fact
+    scan is split into ranges that run concurrently on leased connections.
+
     Extra kwargs like 'table' are accepted but ignored for compatibility with pipeline executor.
     """
     # Check if required metadata exists
@@ -67,25 +80,40 @@ def validate_fact_dim_conformance(sql_conn, snow_conn, fact, dim, mapping, metad
     dim_sql = escape_sql_server_identifier(mapping[dim]["sql"])
     dim_snow = escape_snowflake_identifier(mapping[dim]["snow"])
 
-    # Get all foreign keys from fact tables
-    sql_fkeys_all = [r[0] for r in sql_conn.fetch_many(f"SELECT [{fk}] FROM {fact_sql}")]
-    snow_fkeys_all = [r[0] for r in snow_conn.fetch_many(f"SELECT {fk} FROM {fact_snow}")]
+    # Count fact rows per foreign key, one range of the fact table at a time
+    partition_column = partition_column or metadata[fact].get("partition_column")
+    partitioner = partitioner_for(sql_conn, snow_conn, fact_sql, partition_column, partitions,
+                                  lease_connections, partition_workers)
+    sql_fk_rows, snow_fk_rows = partitioner.fetch_many(
+        lambda where: f"SELECT [{fk}], COUNT(*) FROM {fact_sql}{where_clause(where)} GROUP BY [{fk}]",
+        lambda where: f"SELECT {fk}, COUNT(*) FROM {fact_snow}{where_clause(where)} GROUP BY {fk}"
+    )
+
+    # A key can appear in several ranges, so counts are added up
+    sql_fkey_counts = Counter()
+    for key, count in sql_fk_rows:
+        sql_fkey_counts[key] += count
+    snow_fkey_counts = Counter()
+    for key, count in snow_fk_rows:
+        snow_fkey_counts[key] += count
 
     # Get unique foreign keys
-    sql_fkeys = set(sql_fkeys_all)
-    snow_fkeys = set(snow_fkeys_all)
+    sql_fkeys = set(sql_fkey_counts)
+    snow_fkeys = set(snow_fkey_counts)
 
     # Get dimension keys
-    sql_dim_keys = {r[0] for r in sql_conn.fetch_many(f"SELECT [{dim_bk}] FROM {dim_sql}")}
-    snow_dim_keys = {r[0] for r in snow_conn.fetch_many(f"SELECT {dim_bk} FROM {dim_snow}")}
+    sql_dim_rows, snow_dim_rows = run_pair(sql_conn, snow_conn, f"SELECT [{dim_bk}] FROM {dim_sql}",
+                                           f"SELECT {dim_bk} FROM {dim_snow}", method="fetch_many")
+    sql_dim_keys = {r[0] for r in sql_dim_rows}
+    snow_dim_keys = {r[0] for r in snow_dim_rows}
 
     # Calculate orphans
     sql_orphans = list(sql_fkeys - sql_dim_keys)
     snow_orphans = list(snow_fkeys - snow_dim_keys)
 
     # Count occurrences of each orphaned key
-    sql_orphan_counts = Counter([k for k in sql_fkeys_all if k in sql_orphans])
-    snow_orphan_counts = Counter([k for k in snow_fkeys_all if k in snow_orphans])
+    sql_orphan_counts = Counter({k: sql_fkey_counts[k] for k in sql_orphans})
+    snow_orphan_counts = Counter({k: snow_fkey_counts[k] for k in snow_orphans})
 
     # Build comparison table with detailed information about each orphaned key
     comparison_table = []
@@ -131,8 +159,8 @@ def validate_fact_dim_conformance(sql_conn, snow_conn, fact, dim, mapping, metad
             })
 
     # Calculate statistics
-    total_sql_facts = len(sql_fkeys_all)
-    total_snow_facts = len(snow_fkeys_all)
+    total_sql_facts = sum(sql_fkey_counts.values())
+    total_snow_facts = sum(snow_fkey_counts.values())
 
     sql_orphan_count = sum(sql_orphan_counts.values())
     snow_orphan_count = sum(snow_orphan_counts.values())
@@ -187,5 +215,7 @@ def validate_fact_dim_conformance(sql_conn, snow_conn, fact, dim, mapping, metad
         "recommendations": recommendations,
         "message": f"Fact-Dimension Conformance: SQL {sql_conformance_rate:.2f}%, Snowflake {snow_conformance_rate:.2f}%"
     }
+    if len(partitioner.partitions) > 1:
+        result["partitioning"] = partitioner.stats
 
     return result
\ No newline at end of file
@@ -1,5 +1,6 @@
 # src/ombudsman/validation/facts/validate_late_arriving_facts.py
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 def validate_late_arriving_facts(sql_conn, snow_conn, fact, dim, mapping, metadata, **kwargs):
     """Validate late-arriving facts (facts with transaction dates before dimension effective dates)
@@ -75,8 +76,7 @@ def validate_late_arriving_facts(sql_conn, snow_conn, fact, dim, mapping, metada
         WHERE f.transaction_date < d.{eff}
     """
 
-    sql_issues = sql_conn.fetch_many(sql_q)
-    snow_issues = snow_conn.fetch_many(snow_q)
+    sql_issues, snow_issues = run_pair(sql_conn, snow_conn, sql_q, snow_q, method="fetch_many")
 
     status = "FAIL" if sql_issues or snow_issues else "PASS"
 
@@ -0,0 +1,309 @@
+# src/ombudsman/validation/hashing.py
+'''
+Server-side row hashing shared by SQL Server and Snowflake.
+
+Every row is rendered to a canonical string and hashed with MD5 on the
+server. Canonicalization is driven by the column's data type so that the
+same value produces the same text on both engines:
+
+- integers        plain digits
+- decimals        fixed scale (from the type, else decimal_scale)
+- floats          rounded to float_scale decimals
+- booleans / bit  '1' / '0'
+- dates           YYYY-MM-DD
+- timestamps      YYYY-MM-DD HH:MI:SS.f..., truncated to timestamp_precision,
+                  offsets normalized to UTC
+- strings         trailing spaces trimmed (CHAR padding)
+- binary          upper-case hex
+- NULL            NULL_MARKER
+
+Columns are joined with SEPARATOR. SQL Server builds the string as NVARCHAR
+and converts it to UTF-8 (a *_UTF8 collation, SQL Server 2019+) before
+hashing, so the digest matches Snowflake's MD5 over UTF-8 text.
+
+Slices of the digest are turned into 32-bit unsigned integers so they can be
+bucketed with a modulus and summed without overflow:
+
+- SQL Server: CAST(SUBSTRING(HASHBYTES('MD5', s), 1, 4) AS BIGINT)
+- Snowflake:  TO_NUMBER(SUBSTR(MD5(s), 1, 8), 'XXXXXXXX')
+
+Both read the same digest bytes big-endian, so equal strings give equal
+integers on both engines. Summing the slices over all rows is an
+order-independent combiner, which makes a whole-table fingerprint a single
+aggregate scan per side.
+'''
+
+import re
+
+from ombudsman.validation.sql_utils import SQLSERVER, escape_column_identifier
+
+# No backslashes: Snowflake treats them as escapes in string literals
+NULL_MARKER = "#NULL#"
+SEPARATOR = "|"
+
+# Number of 32-bit slices available in an MD5 digest
+MD5_SLICES = 4
+
+SQLSERVER_UTF8_COLLATION = "Latin1_General_100_BIN2_UTF8"
+
+DEFAULT_DECIMAL_SCALE = 6
+DEFAULT_FLOAT_SCALE = 6
+DEFAULT_TIMESTAMP_PRECISION = 3
+
+INTEGER_TYPES = {"int", "integer", "bigint", "smallint", "tinyint", "byteint"}
+DECIMAL_TYPES = {"decimal", "numeric", "number", "money", "smallmoney"}
+FLOAT_TYPES = {"float", "real", "double", "double precision", "float4", "float8"}
+BOOLEAN_TYPES = {"bit", "boolean", "bool"}
+DATE_TYPES = {"date"}
+TIMESTAMP_TYPES = {"datetime", "datetime2", "smalldatetime", "timestamp", "timestamp_ntz"}
+TIMESTAMP_TZ_TYPES = {"datetimeoffset", "timestamp_tz", "timestamp_ltz"}
+TIME_TYPES = {"time"}
+BINARY_TYPES = {"binary", "varbinary", "image"}
+GUID_TYPES = {"uniqueidentifier"}
+STRING_TYPES = {"char", "nchar", "varchar", "nvarchar", "text", "ntext", "string", "character"}
+
+_TYPE_PATTERN = re.compile(r"^\s*([a-z_][a-z0-9_ ]*?)\s*(?:\(\s*(\w+)\s*(?:,\s*(\d+)\s*)?\))?\s*$")
+
+
+def parse_type(data_type):
+    """
+    Split a type name into (base, precision, scale).
+
+    "DECIMAL(18, 2)" -> ("decimal", "18", 2); "VARCHAR" -> ("varchar", None, None)
+    """
+    if not data_type:
+        return None, None, None
+    match = _TYPE_PATTERN.match(str(data_type).lower())
+    if not match:
+        return str(data_type).lower(), None, None
+    base, precision, scale = match.groups()
+    return base, precision, int(scale) if scale is not None else None
+
+
+def type_category(data_type):
+    """Canonicalization category for a SQL Server or Snowflake type name."""
+    base, _, scale = parse_type(data_type)
+    if base is None:
+        return "text"
+    if base in INTEGER_TYPES:
+        return "integer"
+    if base in DECIMAL_TYPES:
+        return "decimal"
+    if base in FLOAT_TYPES:
+        return "float"
+    if base in BOOLEAN_TYPES:
+        return "boolean"
+    if base in DATE_TYPES:
+        return "date"
+    if base in TIMESTAMP_TZ_TYPES:
+        return "timestamp_tz"
+    if base in TIMESTAMP_TYPES:
+        return "timestamp"
+    if base in TIME_TYPES:
+        return "time"
+    if base in BINARY_TYPES:
+        return "binary"
+    if base in GUID_TYPES:
+        return "guid"
+    if base in STRING_TYPES:
+        return "string"
+    return "text"
+
+
+def _decimal_scale(data_type, default_scale):
+    base, _, scale = parse_type(data_type)
+    if scale is not None:
+        return scale
+    if base in ("money", "smallmoney"):
+        return 4
+    return default_scale
+
+
+def _timestamp_length(precision):
+    """Characters kept of 'YYYY-MM-DD HH:MI:SS.fffffffff'."""
+    return 19 if precision <= 0 else 20 + min(precision, 7)
+
+
+def _sqlserver_canonical(ref, category, data_type, decimal_scale, float_scale, timestamp_precision, trim_strings):
+    if category == "integer":
+        return f"CAST({ref} AS NVARCHAR(40))"
+    if category == "decimal":
+        return f"CAST(CAST({ref} AS DECIMAL(38, {_decimal_scale(data_type, decimal_scale)})) AS NVARCHAR(50))"
+    if category == "float":
+        return f"CAST(CAST({ref} AS DECIMAL(38, {float_scale})) AS NVARCHAR(50))"
+    if category == "boolean":
+        return f"CAST(CAST({ref} AS INT) AS NVARCHAR(1))"
+    if category == "date":
+        return f"CONVERT(NVARCHAR(10), {ref}, 23)"
+    if category == "timestamp":
+        return f"LEFT(CONVERT(NVARCHAR(27), CAST({ref} AS DATETIME2(7)), 121), {_timestamp_length(timestamp_precision)})"
+    if category == "timestamp_tz":
+        return (
+            f"LEFT(CONVERT(NVARCHAR(27), CAST(SWITCHOFFSET({ref}, '+00:00') AS DATETIME2(7)), 121), "
+            f"{_timestamp_length(timestamp_precision)})"
+        )
+    if category == "time":
+        length = 8 if timestamp_precision <= 0 else 9 + min(timestamp_precision, 7)
+        return f"LEFT(CAST(CAST({ref} AS TIME(7)) AS NVARCHAR(16)), {length})"
+    if category == "binary":
+        return f"CONVERT(NVARCHAR(MAX), {ref}, 2)"
+    if category == "guid":
+        return f"UPPER(CAST({ref} AS NVARCHAR(36)))"
+    if category == "string" and trim_strings:
+        return f"RTRIM(CAST({ref} AS NVARCHAR(MAX)))"
+    return f"CAST({ref} AS NVARCHAR(MAX))"
+
+
+def _snowflake_canonical(ref, category, data_type, decimal_scale, float_scale, timestamp_precision, trim_strings):
+    if category == "integer":
+        return f"TO_VARCHAR(CAST({ref} AS NUMBER(38, 0)))"
+    if category == "decimal":
+        return f"TO_VARCHAR(CAST({ref} AS NUMBER(38, {_decimal_scale(data_type, decimal_scale)})))"
+    if category == "float":
+        return f"TO_VARCHAR(CAST({ref} AS NUMBER(38, {float_scale})))"
+    if category == "boolean":
+        return f"CASE WHEN CAST({ref} AS BOOLEAN) THEN '1' WHEN NOT CAST({ref} AS BOOLEAN) THEN '0' END"
+    if category == "date":
+        return f"TO_VARCHAR(CAST({ref} AS DATE), 'YYYY-MM-DD')"
+    if category == "timestamp":
+        return (
+            f"LEFT(TO_VARCHAR(CAST({ref} AS TIMESTAMP_NTZ(9)), 'YYYY-MM-DD HH24:MI:SS.FF9'), "
+            f"{_timestamp_length(timestamp_precision)})"
+        )
+    if category == "timestamp_tz":
+        return (
+            f"LEFT(TO_VARCHAR(CAST(CONVERT_TIMEZONE('UTC', {ref}) AS TIMESTAMP_NTZ(9)), 'YYYY-MM-DD HH24:MI:SS.FF9'), "
+            f"{_timestamp_length(timestamp_precision)})"
+        )
+    if category == "time":
+        length = 8 if timestamp_precision <= 0 else 9 + min(timestamp_precision, 7)
+        return f"LEFT(TO_VARCHAR(CAST({ref} AS TIME(9)), 'HH24:MI:SS.FF9'), {length})"
+    if category == "binary":
+        return f"HEX_ENCODE({ref})"
+    if category == "guid":
+        return f"UPPER(CAST({ref} AS VARCHAR))"
+    if category == "string" and trim_strings:
+        return f"RTRIM(CAST({ref} AS VARCHAR))"
+    return f"CAST({ref} AS VARCHAR)"
+
+
+def canonical_expression(col, dialect, data_type=None, decimal_scale=DEFAULT_DECIMAL_SCALE,
+                         float_scale=DEFAULT_FLOAT_SCALE, timestamp_precision=DEFAULT_TIMESTAMP_PRECISION,
+                         trim_strings=True):
+    """
+    Column rendered as canonical text, with NULL replaced by NULL_MARKER.
+
+    Args:
+        col: Column name
+        dialect: SQLSERVER or SNOWFLAKE
+        data_type: Column type from metadata (either engine's spelling);
+                   None falls back to a plain cast to text
+        decimal_scale: Scale for decimals whose type carries none
+        float_scale: Decimal places floats are rounded to
+        timestamp_precision: Fractional-second digits kept (truncated)
+        trim_strings: Strip trailing spaces from character columns
+    """
+    ref = escape_column_identifier(col, dialect)
+    render = _sqlserver_canonical if dialect == SQLSERVER else _snowflake_canonical
+    text = render(ref, type_category(data_type), data_type, decimal_scale, float_scale,
+                  timestamp_precision, trim_strings)
+    return f"COALESCE({text}, '{NULL_MARKER}')"
+
+
+def row_string_expression(columns, dialect, types=None, **options):
+    """
+    Canonical string for a list of columns, in the given order.
+
+    Args:
+        columns: Column names
+        dialect: SQLSERVER or SNOWFLAKE
+        types: Optional {column: data_type}
+        **options: Passed to canonical_expression
+    """
+    types = types or {}
+    parts = [canonical_expression(col, dialect, types.get(col), **options) for col in columns]
+    if len(parts) == 1:
+        return parts[0]
+    return f"CONCAT_WS('{SEPARATOR}', {', '.join(parts)})"
+
+
+def hash_slice_expression(string_expr, dialect, index=0):
+    """
+    32-bit unsigned integer taken from the MD5 digest of string_expr.
+
+    Args:
+        string_expr: SQL expression producing the canonical string
+        dialect: SQLSERVER or SNOWFLAKE
+        index: Which 4-byte slice of the digest to use (0-3)
+    """
+    if not 0 <= index < MD5_SLICES:
+        raise ValueError(f"MD5 slice index must be between 0 and {MD5_SLICES - 1}")
+    if dialect == SQLSERVER:
+        utf8 = f"CAST(({string_expr}) COLLATE {SQLSERVER_UTF8_COLLATION} AS VARCHAR(MAX))"
+        return f"CAST(SUBSTRING(HASHBYTES('MD5', {utf8}), {index * 4 + 1}, 4) AS BIGINT)"
+    return f"TO_NUMBER(SUBSTR(MD5({string_expr}), {index * 8 + 1}, 8), 'XXXXXXXX')"
+
+
+def sum_expression(expr):
+    """Overflow-safe SUM of 32-bit hash values (works on both engines)."""
+    return f"SUM(CAST({expr} AS DECIMAL(38, 0)))"
+
+
+def sql_string_literal(value, dialect=None):
+    """Quote a Python string as a SQL literal (N'' on SQL Server)."""
+    quoted = "'" + str(value).replace("'", "''") + "'"
+    return f"N{quoted}" if dialect == SQLSERVER else quoted
+
+
+def table_fingerprint(conn, dialect, table, columns, types=None, where=None, **options):
+    """
+    Order-independent fingerprint of a whole table in one scan.
+
+    The 128-bit MD5 of every canonical row is split into four 32-bit slices
+    and each slice is summed over all rows, so only five numbers come back.
+
+    Returns:
+        {"row_count": int, "fingerprint": str, "query": str}
+    """
+    row_string = row_string_expression(columns, dialect, types, **options)
+    slices = ", ".join(
+        f"{hash_slice_expression(row_string, dialect, i)} AS h{i}" for i in range(MD5_SLICES)
+    )
+    sums = ", ".join(sum_expression(f"h{i}") for i in range(MD5_SLICES))
+    where_clause = f" WHERE {where}" if where else ""
+    query = f"SELECT COUNT(*), {sums} FROM (SELECT {slices} FROM {table}{where_clause}) r"
+
+    row = conn.fetch_many(query)[0]
+    row_count = int(row[0] or 0)
+    sums = [int(v or 0) for v in row[1:]]
+    return {
+        "row_count": row_count,
+        "fingerprint": f"{row_count}:" + "-".join(f"{s:x}" for s in sums),
+        "query": query
+    }
+
+
+def column_fingerprints(conn, dialect, table, columns, types=None, where=None, **options):
+    """
+    Per-column order-independent fingerprints in one scan.
+
+    Used to narrow a table fingerprint mismatch down to columns.
+
+    Returns:
+        ({column: str}, query)
+    """
+    types = types or {}
+    aggregates = []
+    for col in columns:
+        value = canonical_expression(col, dialect, types.get(col), **options)
+        for i in (0, 1):
+            aggregates.append(sum_expression(hash_slice_expression(value, dialect, i)))
+    where_clause = f" WHERE {where}" if where else ""
+    query = f"SELECT {', '.join(aggregates)} FROM {table}{where_clause}"
+
+    row = conn.fetch_many(query)[0]
+    fingerprints = {
+        col: f"{int(row[2 * i] or 0):x}-{int(row[2 * i + 1] or 0):x}"
+        for i, col in enumerate(columns)
+    }
+    return fingerprints, query
@@ -5,8 +5,10 @@ Supports optional date dimension for time-based grouping.
 '''
 from datetime import date, datetime
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
-def validate_metric_averages(sql_conn, snow_conn, table, metric_cols, mapping, date_col=None, group_by=None):
+def validate_metric_averages(sql_conn, snow_conn, table, metric_cols, mapping, date_col=None, group_by=None,
+                             scan_plan=None):
     """
     Validate metric averages with optional time-based grouping.
 
@@ -18,6 +20,7 @@ def validate_metric_averages(sql_conn, snow_conn, table, metric_cols, mapping, d
         mapping: Table mapping
         date_col: Optional date column for time-based grouping
         group_by: Optional grouping level: 'day', 'week', 'month', 'year', 'quarter'
+        scan_plan: Fused table scans planned for the pipeline (injected)
     """
     sql_table = escape_sql_server_identifier(mapping[table]["sql"])
     snow_table = escape_snowflake_identifier(mapping[table]["snow"])
@@ -26,9 +29,18 @@ def validate_metric_averages(sql_conn, snow_conn, table, metric_cols, mapping, d
 
     # If no date column, do overall average (original behavior)
     if not date_col:
+        fused = None
+        if scan_plan:
+            fused = scan_plan.profiles(table, sql_conn, snow_conn, sql_table, snow_table, metric_cols, ("avg",))
         for col in metric_cols:
-            sql_avg = sql_conn.fetch_one(f"SELECT AVG([{col}]) FROM {sql_table}")
-            snow_avg = snow_conn.fetch_one(f"SELECT AVG({col}) FROM {snow_table}")
+            if fused:
+                sql_avg, snow_avg = fused[0]["columns"][col]["avg"], fused[1]["columns"][col]["avg"]
+            else:
+                sql_avg, snow_avg = run_pair(
+                    sql_conn, snow_conn,
+                    f"SELECT AVG([{col}]) FROM {sql_table}",
+                    f"SELECT AVG({col}) FROM {snow_table}"
+                )
 
             if sql_avg is None or snow_avg is None:
                 continue
@@ -99,8 +111,12 @@ def validate_metric_averages(sql_conn, snow_conn, table, metric_cols, mapping, d
                 """
 
             try:
-                sql_results = sql_conn.fetch_many(sql_query)
-                snow_results = snow_conn.fetch_many(snow_query)
+                sql_results, snow_results = run_pair(
+                    sql_conn, snow_conn,
+                    sql_query,
+                    snow_query,
+                    method="fetch_many"
+                )
             except Exception as e:
                 return {
                     "status": "ERROR",
@@ -176,12 +192,19 @@ def validate_metric_averages(sql_conn, snow_conn, table, metric_cols, mapping, d
                 col = issue["column"]
 
                 # Get sample rows for this column
-                sql_samples = sql_conn.fetch_dicts(f"SELECT TOP 20 * FROM {sql_table} ORDER BY [{col}] DESC")
-                snow_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} ORDER BY {col} DESC LIMIT 20")
+                sql_samples, snow_samples = run_pair(
+                    sql_conn, snow_conn,
+                    f"SELECT TOP 20 * FROM {sql_table} ORDER BY [{col}] DESC",
+                    f"SELECT * FROM {snow_table} ORDER BY {col} DESC LIMIT 20",
+                    method="fetch_dicts"
+                )
 
                 # Get counts for context
-                sql_count = sql_conn.fetch_one(f"SELECT COUNT(*) FROM {sql_table} WHERE [{col}] IS NOT NULL")
-                snow_count = snow_conn.fetch_one(f"SELECT COUNT(*) FROM {snow_table} WHERE {col} IS NOT NULL")
+                sql_count, snow_count = run_pair(
+                    sql_conn, snow_conn,
+                    f"SELECT COUNT(*) FROM {sql_table} WHERE [{col}] IS NOT NULL",
+                    f"SELECT COUNT(*) FROM {snow_table} WHERE {col} IS NOT NULL"
+                )
 
                 key = f"{col}" if "period" not in issue else f"{col}_{issue['period']}"
 
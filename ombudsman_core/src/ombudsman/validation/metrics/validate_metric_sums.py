@@ -5,9 +5,27 @@ Supports optional date dimension for time-based grouping.
 '''
 from decimal import Decimal
 from datetime import date, datetime
-from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.core.incremental import incremental_run, merge_aggregates
+from ombudsman.core.partitioning import (
+    partitioner_for,
+    sum_rows_by_key,
+    where_clause,
+    DEFAULT_PARTITIONS,
+    DEFAULT_PARTITION_WORKERS,
+)
+from ombudsman.core.dispatch import run_pair
 
-def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_col=None, group_by=None):
+
+def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_col=None, group_by=None,
+                         metadata=None, watermark_store=None, incremental=False, watermark_column=None,
+                         full_refresh=False, partition_column=None, partitions=DEFAULT_PARTITIONS,
+                         partition_workers=DEFAULT_PARTITION_WORKERS, lease_connections=None, scan_plan=None):
     """
     Validate metric sums with optional time-based grouping.
 
@@ -19,22 +37,95 @@ def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_
         mapping: Table mapping
         date_col: Optional date column for time-based grouping
         group_by: Optional grouping level: 'day', 'week', 'month', 'year', 'quarter'
+        metadata: Table metadata (may name the watermark_column)
+        watermark_store: WatermarkStore for incremental runs (injected)
+        incremental: Only sum rows past the stored watermark and add the
+                     cached sums of earlier runs
+        watermark_column: Column bounding incremental runs
+        full_refresh: Ignore cached sums and rescan the table
+        partition_column: Numeric or date column to split the scan on
+                          (default: metadata partition_column); the sums
+                          of each range run concurrently and are added up
+        partitions: Number of ranges
+        partition_workers: Ranges queried at the same time
+        lease_connections: Connection pair lease for partition workers (injected)
+        scan_plan: Fused table scans planned for the pipeline (injected)
     """
     sql_table = escape_sql_server_identifier(mapping[table]["sql"])
     snow_table = escape_snowflake_identifier(mapping[table]["snow"])
 
     issues = []
 
+    run = incremental_run(
+        watermark_store, "validate_metric_sums", table, metadata, incremental, watermark_column,
+        scope={"metric_cols": sorted(metric_cols), "date_col": date_col, "group_by": group_by},
+        full_refresh=full_refresh
+    )
+    sql_filter = snow_filter = None
+    if run:
+        run.start(sql_conn, sql_table)
+        sql_filter, snow_filter = run.where(SQLSERVER), run.where(SNOWFLAKE)
+    previous = run.previous_aggregates if run else {}
+    totals = {"sql": {}, "snow": {}}
+
+    partition_column = partition_column or ((metadata or {}).get(table) or {}).get("partition_column")
+    partitioner = None
+    if partition_column:
+        partitioner = partitioner_for(sql_conn, snow_conn, sql_table, partition_column, partitions,
+                                      lease_connections, partition_workers, where=sql_filter)
+        print(f"[validate_metric_sums] table={table}, {len(partitioner.partitions)} partitions on {partition_column}")
+
+    def fetch_both(build_sql, build_snow, key_width):
+        """Rows of both queries, summed across partitions when partitioned"""
+        if not partitioner:
+            return run_pair(sql_conn, snow_conn, build_sql(where_clause(sql_filter)),
+                            build_snow(where_clause(snow_filter)), method="fetch_many")
+        sql_rows, snow_rows = partitioner.fetch_many(
+            lambda p: build_sql(where_clause(sql_filter, p)),
+            lambda p: build_snow(where_clause(snow_filter, p))
+        )
+        return sum_rows_by_key(sql_rows, key_width), sum_rows_by_key(snow_rows, key_width)
+
+    partitioned_sums = None
+    if partitioner and not date_col:
+        # One query per range for all columns instead of one per column
+        sum_list = ", ".join(f"SUM({col})" for col in metric_cols)
+        sql_rows, snow_rows = fetch_both(
+            lambda where: f"SELECT {sum_list} FROM {sql_table}{where}",
+            lambda where: f"SELECT {sum_list} FROM {snow_table}{where}",
+            key_width=0
+        )
+        partitioned_sums = (sql_rows[0], snow_rows[0])
+
+    # Overall sums may come from a fused scan shared with other steps
+    fused = None
+    if scan_plan and not run and not partitioner and not date_col:
+        fused = scan_plan.profiles(table, sql_conn, snow_conn, sql_table, snow_table, metric_cols, ("sum",))
+
     # If no date column, do overall sum (original behavior)
     if not date_col:
-        for col in metric_cols:
-            sql_sum = sql_conn.fetch_one(f"SELECT SUM({col}) FROM {sql_table}")
-            snow_sum = snow_conn.fetch_one(f"SELECT SUM({col}) FROM {snow_table}")
+        for i, col in enumerate(metric_cols):
+            if partitioned_sums:
+                sql_sum, snow_sum = partitioned_sums[0][i], partitioned_sums[1][i]
+            elif fused:
+                sql_sum, snow_sum = fused[0]["columns"][col]["sum"], fused[1]["columns"][col]["sum"]
+            else:
+                sql_sum, snow_sum = run_pair(
+                    sql_conn, snow_conn,
+                    f"SELECT SUM({col}) FROM {sql_table}{where_clause(sql_filter)}",
+                    f"SELECT SUM({col}) FROM {snow_table}{where_clause(snow_filter)}"
+                )
 
             # Convert Decimal to float for JSON serialization
             sql_sum_val = float(sql_sum) if sql_sum is not None else 0
             snow_sum_val = float(snow_sum) if snow_sum is not None else 0
 
+            # Add the cached sums of earlier incremental runs
+            sql_sum_val += previous.get("sql", {}).get(col, 0)
+            snow_sum_val += previous.get("snow", {}).get(col, 0)
+            totals["sql"][col] = sql_sum_val
+            totals["snow"][col] = snow_sum_val
+
             if abs(sql_sum_val - snow_sum_val) > 0.01:
                 issues.append({
                     "column": col,
@@ -69,36 +160,37 @@ def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_
         for col in metric_cols:
             # Build queries with grouping
             if group_by == 'day':
-                sql_query = f"""
+                sql_query = lambda where: f"""
                     SELECT {sql_group_expr} as period, SUM({col}) as total
-                    FROM {sql_table}
+                    FROM {sql_table}{where}
                     GROUP BY {sql_group_expr}
                     ORDER BY period
                 """
-                snow_query = f"""
+                snow_query = lambda where: f"""
                     SELECT {snow_group_expr} as period, SUM({col}) as total
-                    FROM {snow_table}
+                    FROM {snow_table}{where}
                     GROUP BY {snow_group_expr}
                     ORDER BY period
                 """
             else:
                 # For week/month/quarter/year, format as string
-                sql_query = f"""
+                sql_query = lambda where: f"""
                     SELECT {sql_group_expr}, SUM({col}) as total
-                    FROM {sql_table}
+                    FROM {sql_table}{where}
                     GROUP BY {sql_group_expr}
                     ORDER BY {sql_group_expr}
                 """
-                snow_query = f"""
+                snow_query = lambda where: f"""
                     SELECT {snow_group_expr}, SUM({col}) as total
-                    FROM {snow_table}
+                    FROM {snow_table}{where}
                     GROUP BY {snow_group_expr}
                     ORDER BY {snow_group_expr}
                 """
 
             try:
-                sql_results = sql_conn.fetch_many(sql_query)
-                snow_results = snow_conn.fetch_many(snow_query)
+                # Periods can span ranges, so partial rows are summed per period
+                key_width = 2 if group_by in ('week', 'month', 'quarter') else 1
+                sql_results, snow_results = fetch_both(sql_query, snow_query, key_width)
             except Exception as e:
                 return {
                     "status": "ERROR",
@@ -145,6 +237,12 @@ def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_
                         key = str(row[0])
                         snow_map[key] = safe_convert_value(row[1])
 
+            # Add the cached per-period sums of earlier incremental runs
+            sql_map = merge_aggregates(previous.get("sql", {}).get(col), sql_map)
+            snow_map = merge_aggregates(previous.get("snow", {}).get(col), snow_map)
+            totals["sql"][col] = sql_map
+            totals["snow"][col] = snow_map
+
             # Compare periods
             all_periods = set(sql_map.keys()) | set(snow_map.keys())
             for period in sorted(all_periods):
@@ -170,8 +268,12 @@ def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_
                 col = issue["column"]
 
                 # Get sample rows for this column
-                sql_samples = sql_conn.fetch_dicts(f"SELECT TOP 20 * FROM {sql_table} ORDER BY {col} DESC")
-                snow_samples = snow_conn.fetch_dicts(f"SELECT * FROM {snow_table} ORDER BY {col} DESC LIMIT 20")
+                sql_samples, snow_samples = run_pair(
+                    sql_conn, snow_conn,
+                    f"SELECT TOP 20 * FROM {sql_table} ORDER BY {col} DESC",
+                    f"SELECT * FROM {snow_table} ORDER BY {col} DESC LIMIT 20",
+                    method="fetch_dicts"
+                )
 
                 key = f"{col}" if "period" not in issue else f"{col}_{issue['period']}"
 
@@ -195,9 +297,18 @@ def validate_metric_sums(sql_conn, snow_conn, table, metric_cols, mapping, date_
             # If explain fails, at least log the error
             pass
 
-    return {
+    result = {
         "status": "FAIL" if issues else "PASS",
         "severity": "HIGH" if issues else "NONE",
         "issues": issues,
         "explain": explain_data
-    }
\ No newline at end of file
+    }
+    if run:
+        if not issues:
+            run.commit(totals)
+        result["incremental"] = run.describe()
+    if partitioner:
+        result["partitioning"] = partitioner.stats
+    if fused:
+        result["fused_scan"] = True
+    return result
\ No newline at end of file
@@ -0,0 +1,209 @@
+# src/ombudsman/validation/pushdown.py
+'''
+Server-side aggregate pushdown for numeric column validators.
+
+Computes moments, z-score outlier counts and fixed-width histograms inside
+SQL Server / Snowflake so only a handful of numbers cross the wire, and
+provides a two-sample KS test that works on the returned binned counts.
+Client-side sampling helpers are provided as a fallback.
+'''
+
+import numpy as np
+from scipy.stats import distributions
+
+from ombudsman.validation.sql_utils import SQLSERVER, SNOWFLAKE, escape_column_identifier
+
+# Population standard deviation, to match numpy's default ndarray.std()
+STDDEV_POP = {
+    SQLSERVER: "STDEVP",
+    SNOWFLAKE: "STDDEV_POP",
+}
+
+DEFAULT_BINS = 100
+DEFAULT_SAMPLE_SIZE = 100000
+
+
+def _as_float(col, dialect):
+    return f"CAST({escape_column_identifier(col, dialect)} AS FLOAT)"
+
+
+def _to_float(value):
+    return float(value) if value is not None else None
+
+
+def fetch_moments(conn, dialect, table, col):
+    """
+    Fetch count, mean, population stddev, min and max of a column in one query.
+
+    Returns:
+        {"count": int, "mean": float, "std": float, "min": float, "max": float}
+    """
+    val = _as_float(col, dialect)
+    query = (
+        f"SELECT COUNT({val}), AVG({val}), {STDDEV_POP[dialect]}({val}), MIN({val}), MAX({val}) "
+        f"FROM {table}"
+    )
+    row = conn.fetch_many(query)[0]
+    return {
+        "count": int(row[0] or 0),
+        "mean": _to_float(row[1]),
+        "std": _to_float(row[2]),
+        "min": _to_float(row[3]),
+        "max": _to_float(row[4]),
+        "query": query
+    }
+
+
+def outlier_predicate(col, dialect, mean, std, z_threshold=3):
+    """Predicate selecting rows more than z_threshold stddevs from the mean."""
+    return f"ABS({_as_float(col, dialect)} - ({float(mean)!r})) > {float(z_threshold)!r} * ({float(std)!r})"
+
+
+def count_outliers(conn, dialect, table, col, mean, std, z_threshold=3, limit=10):
+    """
+    Count z-score outliers server-side and return the most extreme values.
+
+    Returns:
+        {"count": int, "values": [float, ...], "query": str}
+    """
+    if not std:
+        return {"count": 0, "values": [], "query": None}
+
+    predicate = outlier_predicate(col, dialect, mean, std, z_threshold)
+    val = _as_float(col, dialect)
+
+    count_query = f"SELECT COUNT(*) FROM {table} WHERE {predicate}"
+    count = int(conn.fetch_one(count_query) or 0)
+
+    mean = float(mean)
+    values = []
+    if count:
+        if dialect == SQLSERVER:
+            top_query = f"SELECT TOP {limit} {val} FROM {table} WHERE {predicate} ORDER BY ABS({val} - ({mean!r})) DESC"
+        else:
+            top_query = f"SELECT {val} FROM {table} WHERE {predicate} ORDER BY ABS({val} - ({mean!r})) DESC LIMIT {limit}"
+        values = [float(r[0]) for r in conn.fetch_many(top_query)]
+
+    return {"count": count, "values": values, "query": count_query}
+
+
+def histogram_edges(lo, hi, bins=DEFAULT_BINS):
+    """Common bin edges covering [lo, hi] on both sides."""
+    if lo is None or hi is None:
+        return None
+    if hi <= lo:
+        return np.array([lo, lo + 1.0])
+    return np.linspace(lo, hi, bins + 1)
+
+
+def fetch_histogram(conn, dialect, table, col, edges):
+    """
+    Count non-null values per fixed-width bin, computed server-side.
+
+    Values outside [edges[0], edges[-1]] are clamped into the first/last bin.
+
+    Returns:
+        numpy array of counts, one per bin
+    """
+    bins = len(edges) - 1
+    lo = float(edges[0])
+    width = float(edges[1] - edges[0])
+    val = _as_float(col, dialect)
+
+    bucket = (
+        f"CASE WHEN {val} >= {float(edges[-1])!r} THEN {bins - 1} "
+        f"WHEN {val} < {lo!r} THEN 0 "
+        f"ELSE FLOOR(({val} - ({lo!r})) / {width!r}) END"
+    )
+    query = (
+        f"SELECT bucket, COUNT(*) FROM ("
+        f"SELECT {bucket} AS bucket FROM {table} WHERE {escape_column_identifier(col, dialect)} IS NOT NULL"
+        f") b GROUP BY bucket"
+    )
+
+    counts = np.zeros(bins, dtype=np.int64)
+    for bucket_id, cnt in conn.fetch_many(query):
+        idx = min(max(int(bucket_id), 0), bins - 1)
+        counts[idx] += int(cnt)
+    return counts
+
+
+def binned_ks_2samp(counts1, counts2):
+    """
+    Two-sample Kolmogorov-Smirnov test on binned counts.
+
+    The statistic is the largest CDF gap evaluated at the bin edges, which is
+    a lower bound of the exact statistic on the raw values (the gap can only
+    be underestimated inside a bin). The p-value uses the same asymptotic
+    distribution as scipy's ks_2samp(method="asymp").
+
+    Returns:
+        (ks_statistic, p_value)
+    """
+    n1 = int(np.sum(counts1))
+    n2 = int(np.sum(counts2))
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+
+    cdf1 = np.cumsum(counts1) / n1
+    cdf2 = np.cumsum(counts2) / n2
+    d = float(np.max(np.abs(cdf1 - cdf2)))
+
+    en = n1 * n2 / (n1 + n2)
+    p_value = float(np.clip(distributions.kstwo.sf(d, np.round(en)), 0, 1))
+    return d, p_value
+
+
+def histogram_quantiles(counts, edges, quantiles=(0.25, 0.5, 0.75)):
+    """Approximate quantiles by linear interpolation inside histogram bins."""
+    total = np.sum(counts)
+    if total == 0:
+        return {}
+    cdf = np.concatenate([[0.0], np.cumsum(counts) / total])
+    return {q: float(np.interp(q, cdf, edges)) for q in quantiles}
+
+
+def value_quantiles(values, quantiles=(0.25, 0.5, 0.75)):
+    """Quantiles of values held in memory, interpolated like PERCENTILE_CONT."""
+    if len(values) == 0:
+        return {}
+    return {q: float(np.quantile(values, q)) for q in quantiles}
+
+
+def fetch_sample(conn, dialect, table, col, sample_size=DEFAULT_SAMPLE_SIZE):
+    """
+    Fetch a random sample of non-null values for client-side fallback.
+
+    Returns:
+        numpy array of floats
+    """
+    col_ref = escape_column_identifier(col, dialect)
+    if dialect == SQLSERVER:
+        query = f"SELECT TOP {int(sample_size)} {col_ref} FROM {table} WHERE {col_ref} IS NOT NULL ORDER BY NEWID()"
+    else:
+        # SAMPLE applies before WHERE, so filter first to get sample_size non-null values
+        query = (
+            f"SELECT {col_ref} FROM (SELECT {col_ref} FROM {table} WHERE {col_ref} IS NOT NULL) "
+            f"SAMPLE ({int(sample_size)} ROWS)"
+        )
+    return np.array([float(r[0]) for r in conn.fetch_many(query)])
+
+
+def fetch_values(conn, dialect, table, col):
+    """
+    Fetch every non-null value of a column (original client-side mode).
+
+    Streams the column in NumPy chunks when the connection supports
+    iter_batches, so no per-row tuples are held in memory.
+    """
+    col_ref = escape_column_identifier(col, dialect)
+    query = f"SELECT {col_ref} FROM {table} WHERE {col_ref} IS NOT NULL"
+
+    if not hasattr(conn, "iter_batches"):
+        return np.array([float(r[0]) for r in conn.fetch_many(query)])
+
+    chunks = [
+        np.asarray(next(iter(batch.values())), dtype=np.float64)
+        for batch in conn.iter_batches(query, output="numpy")
+    ]
+    return np.concatenate(chunks) if chunks else np.array([], dtype=np.float64)
@@ -0,0 +1,217 @@
+# src/ombudsman/validation/row_diff.py
+'''
+Hash-bucketed row-level diff between two tables.
+
+Rows are hashed server-side on both engines (see hashing.py) and grouped
+into buckets by a hash of their key. Only per-bucket digests (row count and
+two 32-bit hash sums) cross the wire at first. Buckets whose digests differ
+are split with a larger modulus (kh % (m * k) refines kh % m) until they are
+small enough, and only then are the (key, row hash) pairs of those buckets
+fetched and compared. Network transfer therefore grows with the number of
+differences, not with the size of the table.
+'''
+
+from collections import namedtuple
+
+from ombudsman.validation.hashing import (
+    row_string_expression,
+    hash_slice_expression,
+    sum_expression,
+    sql_string_literal,
+)
+from ombudsman.validation.sql_utils import SQLSERVER
+from ombudsman.core.dispatch import dispatch_pair
+
+DEFAULT_BUCKETS = 256
+DEFAULT_SPLIT_FACTOR = 16
+DEFAULT_MAX_ROWS_PER_BUCKET = 10000
+DEFAULT_MAX_DEPTH = 4
+
+Bucket = namedtuple("Bucket", ["modulus", "id"])
+
+
+class HashedTable:
+    """One side of a row diff: a table plus its key and row hash expressions."""
+
+    def __init__(self, conn, dialect, table, key_columns, columns, types=None, **options):
+        """
+        Args:
+            conn: Connection for this side
+            dialect: SQLSERVER or SNOWFLAKE
+            table: Escaped table name
+            key_columns: Columns identifying a row
+            columns: Columns included in the row hash
+            types: Optional {column: data_type} for canonicalization
+            **options: Canonicalization options (see hashing.canonical_expression)
+        """
+        self.conn = conn
+        self.dialect = dialect
+        self.table = table
+        self.key_string = row_string_expression(key_columns, dialect, types, **options)
+        row_string = row_string_expression(columns, dialect, types, **options)
+        self.key_hash = hash_slice_expression(self.key_string, dialect, 0)
+        self.row_hashes = [hash_slice_expression(row_string, dialect, i) for i in (0, 1)]
+        self.queries = []
+
+    def _hashed_rows(self):
+        return (
+            f"SELECT {self.key_hash} AS kh, {self.key_string} AS k, "
+            f"{self.row_hashes[0]} AS h0, {self.row_hashes[1]} AS h1 FROM {self.table}"
+        )
+
+    @staticmethod
+    def _bucket_filter(buckets):
+        by_modulus = {}
+        for bucket in buckets:
+            by_modulus.setdefault(bucket.modulus, []).append(bucket.id)
+        clauses = [
+            f"kh % {modulus} IN ({', '.join(str(i) for i in sorted(ids))})"
+            for modulus, ids in sorted(by_modulus.items())
+        ]
+        return " OR ".join(clauses)
+
+    def bucket_digests(self, modulus, within=None):
+        """
+        Row count and hash sums per bucket.
+
+        Args:
+            modulus: Number of buckets at this level
+            within: Optional list of coarser Buckets to restrict the scan to
+
+        Returns:
+            {bucket_id: (count, sum_h0, sum_h1)}
+        """
+        where = f" WHERE {self._bucket_filter(within)}" if within else ""
+        query = (
+            f"SELECT kh % {modulus}, COUNT(*), {sum_expression('h0')}, {sum_expression('h1')} "
+            f"FROM ({self._hashed_rows()}) r{where} GROUP BY kh % {modulus}"
+        )
+        self.queries.append(query)
+        return {
+            int(bucket): (int(count), int(s0 or 0), int(s1 or 0))
+            for bucket, count, s0, s1 in self.conn.fetch_many(query)
+        }
+
+    def bucket_rows(self, buckets):
+        """
+        Key string and row hashes for every row in the given buckets.
+
+        Returns:
+            {key_string: sorted list of (h0, h1)} - a list so duplicate keys survive
+        """
+        if not buckets:
+            return {}
+        query = f"SELECT k, h0, h1 FROM ({self._hashed_rows()}) r WHERE {self._bucket_filter(buckets)}"
+        self.queries.append(query)
+        rows = {}
+        for key, h0, h1 in self.conn.fetch_many(query):
+            rows.setdefault(key, []).append((int(h0), int(h1)))
+        for hashes in rows.values():
+            hashes.sort()
+        return rows
+
+    def rows_for_keys(self, keys, limit=20):
+        """Full rows for a handful of key strings (for explain output)."""
+        if not keys:
+            return []
+        key_list = ", ".join(sql_string_literal(k, self.dialect) for k in list(keys)[:limit])
+        if self.dialect == SQLSERVER:
+            query = f"SELECT TOP {int(limit)} * FROM {self.table} WHERE {self.key_string} IN ({key_list})"
+        else:
+            query = f"SELECT * FROM {self.table} WHERE {self.key_string} IN ({key_list}) LIMIT {int(limit)}"
+        return self.conn.fetch_dicts(query)
+
+
+def _mismatched(source_digests, target_digests):
+    """Bucket ids whose digests differ, with each side's row count."""
+    mismatched = []
+    for bucket in sorted(set(source_digests) | set(target_digests)):
+        src = source_digests.get(bucket, (0, 0, 0))
+        tgt = target_digests.get(bucket, (0, 0, 0))
+        if src != tgt:
+            mismatched.append((bucket, src[0], tgt[0]))
+    return mismatched
+
+
+def diff_tables(source, target, buckets=DEFAULT_BUCKETS, split_factor=DEFAULT_SPLIT_FACTOR,
+                max_rows_per_bucket=DEFAULT_MAX_ROWS_PER_BUCKET, max_depth=DEFAULT_MAX_DEPTH):
+    """
+    Compare two HashedTables bucket by bucket.
+
+    Args:
+        source: HashedTable for the reference side (SQL Server)
+        target: HashedTable for the migrated side (Snowflake)
+        buckets: Number of top-level buckets
+        split_factor: How many children a mismatched bucket is split into
+        max_rows_per_bucket: Buckets at most this large are fetched row by row
+        max_depth: Maximum number of split levels
+
+    Returns:
+        dict with missing (source only), extra (target only) and changed key
+        strings, total row counts and scan statistics
+    """
+    # Both sides are queried at once unless they share a connection
+    concurrent = getattr(source, "conn", source) is not getattr(target, "conn", target)
+    modulus = buckets
+    source_digests, target_digests = dispatch_pair(
+        lambda: source.bucket_digests(modulus),
+        lambda: target.bucket_digests(modulus),
+        concurrent
+    )
+
+    totals = {
+        "source_rows": sum(d[0] for d in source_digests.values()),
+        "target_rows": sum(d[0] for d in target_digests.values()),
+    }
+    stats = {"levels": 1, "buckets_compared": len(set(source_digests) | set(target_digests))}
+
+    mismatched = _mismatched(source_digests, target_digests)
+    leaves = []
+    depth = 0
+
+    while mismatched:
+        large = []
+        for bucket_id, src_count, tgt_count in mismatched:
+            entry = (Bucket(modulus, bucket_id), src_count, tgt_count)
+            if max(src_count, tgt_count) > max_rows_per_bucket and depth < max_depth:
+                large.append(entry)
+            else:
+                leaves.append(entry)
+
+        if not large:
+            break
+
+        # Split every large bucket into split_factor children and re-digest only those
+        parents = [bucket for bucket, _, _ in large]
+        modulus *= split_factor
+        depth += 1
+        source_digests, target_digests = dispatch_pair(
+            lambda: source.bucket_digests(modulus, within=parents),
+            lambda: target.bucket_digests(modulus, within=parents),
+            concurrent
+        )
+        stats["levels"] += 1
+        stats["buckets_compared"] += len(set(source_digests) | set(target_digests))
+        mismatched = _mismatched(source_digests, target_digests)
+
+    # Only query a side for buckets that actually hold rows there
+    source_rows, target_rows = dispatch_pair(
+        lambda: source.bucket_rows([b for b, src_count, _ in leaves if src_count]),
+        lambda: target.bucket_rows([b for b, _, tgt_count in leaves if tgt_count]),
+        concurrent
+    )
+
+    missing = sorted(k for k in source_rows if k not in target_rows)
+    extra = sorted(k for k in target_rows if k not in source_rows)
+    changed = sorted(k for k in source_rows if k in target_rows and source_rows[k] != target_rows[k])
+
+    stats["mismatched_buckets"] = len(leaves)
+    stats["rows_fetched"] = sum(len(v) for v in source_rows.values()) + sum(len(v) for v in target_rows.values())
+
+    return {
+        **totals,
+        "missing": missing,
+        "extra": extra,
+        "changed": changed,
+        "stats": stats,
+    }
@@ -26,7 +26,10 @@ def main():
     results = {
         "schema": validate_schema(tables["sql"], tables["snow"]),
         "rowcounts": validate_rowcounts(sql, snow, tables["sql"].keys()),
-        "checksums": validate_checksums(sql, snow, tables["sql"].keys()),
+        "checksums": {
+            t: validate_checksums(sql, snow, t, {t: {"sql": t, "snow": t}}, tables["sql"])
+            for t in tables["sql"].keys()
+        },
         "fk": validate_fk(sql, snow, fks),
         "metrics": validate_metrics(sql, snow, "ombudsman/config/validation_rules.yaml"),
         "rules": validate_rules(sql, snow, "ombudsman/config/validation_rules.yaml"),
@@ -158,3 +158,27 @@ def escape_snowflake_identifier(identifier):
         return f"{snow_database}.{default_schema}.{parts[0]}"
 
     return identifier
+
+
+SQLSERVER = "sqlserver"
+SNOWFLAKE = "snowflake"
+
+
+def escape_column_identifier(column, dialect):
+    """
+    Escape a column name for the given dialect.
+
+    SQL Server columns are wrapped in square brackets. Snowflake columns are
+    left unquoted so they keep resolving case-insensitively, which matches
+    how the validators have always referenced them.
+
+    Args:
+        column: Column name
+        dialect: SQLSERVER or SNOWFLAKE
+
+    Returns:
+        Column reference usable in a SELECT list or predicate
+    """
+    if dialect == SQLSERVER:
+        return f"[{column}]"
+    return column
@@ -4,6 +4,7 @@ WoW / MoM / YoY comparisons.
 '''
 from datetime import timedelta, date, datetime
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 def validate_period_over_period(sql_conn, snow_conn, table, metric_col, date_col, mapping):
     sql_table = escape_sql_server_identifier(mapping[table]["sql"])
@@ -16,8 +17,7 @@ def validate_period_over_period(sql_conn, snow_conn, table, metric_col, date_col
     """
 
     try:
-        sql = sql_conn.fetch_many(q(sql_table))
-        snow = snow_conn.fetch_many(q(snow_table))
+        sql, snow = run_pair(sql_conn, snow_conn, q(sql_table), q(snow_table), method="fetch_many")
     except Exception as e:
         return {
             "status": "ERROR",
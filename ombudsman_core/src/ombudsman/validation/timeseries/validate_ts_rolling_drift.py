@@ -5,6 +5,7 @@ Rolling 7‑day and 30‑day window drift.
 '''
 from datetime import date, datetime
 from ombudsman.validation.sql_utils import escape_sql_server_identifier, escape_snowflake_identifier
+from ombudsman.core.dispatch import run_pair
 
 
 def validate_ts_rolling_drift(sql_conn, snow_conn, table, metric_col, date_col, mapping):
@@ -26,8 +27,12 @@ def validate_ts_rolling_drift(sql_conn, snow_conn, table, metric_col, date_col,
     issues = []
 
     for win in windows:
-        sql_vals = sql_conn.fetch_many(q_tmpl(sql_table, win))
-        snow_vals = snow_conn.fetch_many(q_tmpl(snow_table, win))
+        sql_vals, snow_vals = run_pair(
+            sql_conn, snow_conn,
+            q_tmpl(sql_table, win),
+            q_tmpl(snow_table, win),
+            method="fetch_many"
+        )
 
         # Helper to safely convert dates and values
         def safe_convert_date(d):
@@ -1,7 +1,112 @@
-def validate_checksums(sql_conn, snow_conn, tables):
-    results = {}
-    for t in tables:
-        sql = sql_conn.fetch_one(f"SELECT SUM(CHECKSUM(*)) FROM {t}")
-        snow = snow_conn.fetch_one(f"SELECT SUM(CHECKSUM(*)) FROM {t}")
-        results[t] = {"sql": sql, "snow": snow, "match": sql == snow}
-    return results
\ No newline at end of file
+# src/ombudsman/validation/validate_checksums.py
+'''
+Portable whole-table checksum between SQL Server and Snowflake.
+
+Each side renders every row to a type-aware canonical string, hashes it
+with MD5 and sums the digest slices (see hashing.py), so one scan per side
+returns a row count plus four numbers. Equal fingerprints mean the tables
+hold the same multiset of rows.
+
+On a mismatch, per-column fingerprints are computed (one more scan per
+side) to show which columns differ. Use validate_row_diff to find the rows.
+'''
+
+from ombudsman.validation.sql_utils import (
+    escape_sql_server_identifier,
+    escape_snowflake_identifier,
+    SQLSERVER,
+    SNOWFLAKE,
+)
+from ombudsman.validation.hashing import (
+    table_fingerprint,
+    column_fingerprints,
+    type_category,
+    DEFAULT_DECIMAL_SCALE,
+    DEFAULT_FLOAT_SCALE,
+    DEFAULT_TIMESTAMP_PRECISION,
+)
+from ombudsman.core.dispatch import dispatch_pair
+
+
+def validate_checksums(sql_conn, snow_conn, table, mapping, metadata, columns=None,
+                       decimal_scale=DEFAULT_DECIMAL_SCALE, float_scale=DEFAULT_FLOAT_SCALE,
+                       timestamp_precision=DEFAULT_TIMESTAMP_PRECISION, trim_strings=True):
+    table_metadata = metadata.get(table, {})
+    table_columns = table_metadata.get("columns", [])
+    types = dict(table_columns) if isinstance(table_columns, dict) else {}
+
+    if not columns:
+        columns = list(table_columns.keys()) if isinstance(table_columns, dict) else list(table_columns)
+    if not columns:
+        return {"status": "SKIPPED", "reason": f"No columns known for table '{table}'"}
+
+    sql_table = escape_sql_server_identifier(mapping[table]["sql"])
+    snow_table = escape_snowflake_identifier(mapping[table]["snow"])
+
+    options = {
+        "decimal_scale": decimal_scale,
+        "float_scale": float_scale,
+        "timestamp_precision": timestamp_precision,
+        "trim_strings": trim_strings
+    }
+
+    sql_fp, snow_fp = dispatch_pair(
+        lambda: table_fingerprint(sql_conn, SQLSERVER, sql_table, columns, types, **options),
+        lambda: table_fingerprint(snow_conn, SNOWFLAKE, snow_table, columns, types, **options),
+        concurrent=sql_conn is not snow_conn
+    )
+
+    match = sql_fp["fingerprint"] == snow_fp["fingerprint"]
+    status = "PASS" if match else "FAIL"
+
+    explain_data = {
+        "columns": columns,
+        "canonicalization": {col: type_category(types.get(col)) for col in columns},
+        "options": options,
+        "queries": {
+            "sql_fingerprint": sql_fp["query"],
+            "snow_fingerprint": snow_fp["query"]
+        }
+    }
+
+    issues = []
+    if match:
+        explain_data["interpretation"] = (
+            f"Table fingerprints match over {len(columns)} columns and {sql_fp['row_count']} rows"
+        )
+    else:
+        explain_data["interpretation"] = (
+            f"Table fingerprints differ (SQL Server {sql_fp['row_count']} rows, "
+            f"Snowflake {snow_fp['row_count']} rows). Run validate_row_diff to locate the rows."
+        )
+        try:
+            (sql_cols, sql_q), (snow_cols, snow_q) = dispatch_pair(
+                lambda: column_fingerprints(sql_conn, SQLSERVER, sql_table, columns, types, **options),
+                lambda: column_fingerprints(snow_conn, SNOWFLAKE, snow_table, columns, types, **options),
+                concurrent=sql_conn is not snow_conn
+            )
+            explain_data["queries"]["sql_columns"] = sql_q
+            explain_data["queries"]["snow_columns"] = snow_q
+
+            for col in columns:
+                if sql_cols[col] != snow_cols[col]:
+                    issues.append({
+                        "column": col,
+                        "canonical_type": type_category(types.get(col)),
+                        "sql_fingerprint": sql_cols[col],
+                        "snow_fingerprint": snow_cols[col]
+                    })
+            explain_data["mismatched_columns"] = [i["column"] for i in issues]
+        except Exception as e:
+            explain_data["error"] = f"Could not compute column fingerprints: {str(e)}"
+
+    return {
+        "status": status,
+        "severity": "HIGH" if status == "FAIL" else "NONE",
+        "sql_row_count": sql_fp["row_count"],
+        "snowflake_row_count": snow_fp["row_count"],
+        "sql_fingerprint": sql_fp["fingerprint"],
+        "snow_fingerprint": snow_fp["fingerprint"],
+        "issues": issues,
+        "explain": explain_data
+    }